@@ -0,0 +1,71 @@
+"""Benchmark Article memory and dedup key cost.
+
+Builds feed-like articles (tracking query strings, a summary, tags, a few
+dozen sources and categories), reports memory per article, the time to read
+each article's dedup key and fingerprint the way dedup, history and the
+cache do (three times each), and times :func:`clawler.dedup.deduplicate`.
+
+    python benchmarks/bench_articles.py              # 100k articles, dedup on 10k
+    python benchmarks/bench_articles.py 50000 --dedup 50000
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_dedup import headlines  # noqa: E402
+from clawler.dedup import deduplicate  # noqa: E402
+from clawler.models import Article  # noqa: E402
+
+SOURCES = [f"Feed {i}" for i in range(40)]
+CATEGORIES = ["tech", "world", "science", "business", "security", "culture"]
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def articles(titles):
+    # Source and category strings are built per article, as parsers do
+    return [Article(title=t, url=f"https://www.example.com/news/{i}/?utm_source=rss&id={i % 97}",
+                    source="".join(SOURCES[i % len(SOURCES)]), summary=t * 3,
+                    timestamp=NOW, category="".join(CATEGORIES[i % len(CATEGORIES)]),
+                    tags=["rss"]) for i, t in enumerate(titles)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("n", nargs="?", type=int, default=100_000)
+    parser.add_argument("--dedup", type=int, default=10_000, help="articles to run deduplicate on")
+    args = parser.parse_args()
+
+    titles = headlines(args.n)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    batch = articles(titles)
+    built = tracemalloc.get_traced_memory()[0]
+    for a in batch:
+        a.dedup_key, a.title_fingerprint
+    keyed = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{args.n:>7} articles  {(built - before) / args.n:6.0f} B/article built, "
+          f"{(keyed - before) / args.n:6.0f} B/article with keys")
+
+    start = time.perf_counter()
+    for _ in range(3):
+        for a in batch:
+            a.dedup_key, a.title_fingerprint
+    print(f"{'':>7} keys      {time.perf_counter() - start:6.2f}s for 3 reads of {args.n} articles")
+
+    batch = articles(titles[:args.dedup])
+    start = time.perf_counter()
+    deduplicate(batch)
+    print(f"{args.dedup:>7} dedup     {time.perf_counter() - start:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
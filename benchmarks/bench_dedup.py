@@ -0,0 +1,135 @@
+"""Benchmark fuzzy dedup on synthetic headlines.
+
+Generates a feed-like mix of titles — distinct headlines plus reworded
+copies (a word swapped, added or dropped, a " - Source" suffix, changed
+case) — and times :func:`clawler.dedup.deduplicate` at several sizes.
+``--compare`` also runs the old full scan (slow: quadratic) and reports how
+many titles the two disagree on.
+
+    python benchmarks/bench_dedup.py                 # 1k, 10k, 100k
+    python benchmarks/bench_dedup.py 2000 --compare
+    python benchmarks/bench_dedup.py 10000 --backend vector   # needs numpy
+    python benchmarks/bench_dedup.py 100000 --workers 8       # blocked, 8 processes
+    python benchmarks/bench_dedup.py 2000 --workers 1 --compare
+"""
+import argparse
+import itertools
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from clawler.dedup import DedupStats, deduplicate  # noqa: E402
+from clawler.dedup_blocks import deduplicate_blocked  # noqa: E402
+from clawler.models import Article  # noqa: E402
+
+OUTLETS = ["Reuters", "The Verge", "Ars Technica", "BBC News"]
+
+
+def _vocabulary(rng, size=20_000):
+    """Pronounceable made-up words, fixed by the seed."""
+    onsets = ["", "b", "c", "d", "f", "g", "h", "j", "k", "l", "m", "n", "p", "r", "s", "t", "v", "w",
+              "z", "br", "ch", "cl", "dr", "fl", "gr", "pl", "sh", "st", "th", "tr"]
+    codas = ["", "", "", "n", "r", "s", "t", "l", "m", "ck", "nd", "st"]
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(onsets) + rng.choice("aeiouy") + rng.choice(codas)
+                          for _ in range(rng.choice([1, 1, 2, 2, 3]))))
+    return sorted(words)
+
+
+def headlines(n, seed=1, dup_rate=0.25):
+    """``n`` titles, about ``dup_rate`` of them reworded copies of earlier ones."""
+    rng = random.Random(seed)
+    vocab = _vocabulary(rng)
+    rng.shuffle(vocab)
+    zipf = list(itertools.accumulate(1 / (i + 1) for i in range(len(vocab))))
+
+    def word():
+        return rng.choices(vocab, cum_weights=zipf)[0]
+
+    out = []
+    for _ in range(n):
+        if out and rng.random() < dup_rate:
+            words = rng.choice(out).split()
+            for op in (rng.randrange(5) for _ in range(rng.choice([1, 1, 2, 3]))):
+                if op == 0:
+                    words = words + ["-", rng.choice(OUTLETS)]
+                elif op == 1 and len(words) > 4:
+                    del words[rng.randrange(len(words))]
+                elif op == 2:
+                    words[rng.randrange(len(words))] = word()
+                elif op == 3:
+                    words.insert(rng.randrange(len(words)), word())
+                else:
+                    words = [w.capitalize() if rng.random() < 0.5 else w for w in words]
+            out.append(" ".join(words))
+        else:
+            out.append(" ".join(word() for _ in range(rng.randint(5, 13))).capitalize())
+    return out
+
+
+def full_scan(articles, threshold=0.75):
+    """The three tiers with tier 3 scanning every kept title: the reference answer."""
+    keys, fingerprints, kept, dupes = set(), set(), [], []
+    for article in articles:
+        fp = article.title_fingerprint
+        if article.dedup_key in keys or (fp and fp in fingerprints):
+            dupes.append(True)
+            continue
+        t = article.title.lower().strip()
+        for prev in kept:
+            if abs(len(t) - len(prev)) > max(len(t), len(prev)) * (1 - threshold):
+                continue
+            if SequenceMatcher(None, t, prev).ratio() > threshold:
+                dupes.append(True)
+                break
+        else:
+            keys.add(article.dedup_key)
+            fingerprints.add(fp)
+            kept.append(t)
+            dupes.append(False)
+    return dupes
+
+
+def _dedup(articles, stats=None, backend="difflib", workers=0):
+    if workers:  # blocked even below PARALLEL_MIN_ARTICLES
+        return deduplicate_blocked(articles, stats=stats, workers=workers, backend=backend)
+    return deduplicate(articles, stats=stats, backend=backend)
+
+
+def run(n, compare=False, backend="difflib", workers=0):
+    titles = headlines(n)
+    articles = [Article(title=t, url=f"https://example.com/{i}", source="bench") for i, t in enumerate(titles)]
+    stats = DedupStats()
+    start = time.perf_counter()
+    _dedup(articles, stats, backend, workers)
+    elapsed = time.perf_counter() - start
+    line = f"{n:>7} titles  {backend:>7}  {workers or 1:>2} proc  {elapsed:8.2f}s  {stats.fuzzy_dupes:>6} fuzzy dupes"
+    if compare:
+        start = time.perf_counter()
+        reference = full_scan(articles)
+        scan = time.perf_counter() - start
+        kept = {a.url for a in _dedup(articles, backend=backend, workers=workers)}
+        ours = [f"https://example.com/{i}" not in kept for i in range(n)]
+        diff = sum(a != b for a, b in zip(ours, reference))
+        line += f"  | full scan {scan:8.2f}s, {diff} titles differ"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=[1_000, 10_000, 100_000])
+    parser.add_argument("--compare", action="store_true", help="also run the quadratic full scan")
+    parser.add_argument("--backend", choices=["difflib", "vector"], default="difflib")
+    parser.add_argument("--workers", type=int, default=0, help="blocked dedup on this many processes (1: blocks inline)")
+    args = parser.parse_args()
+    for n in args.sizes:
+        run(n, args.compare, args.backend, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,13 @@ Profile-based relevance scoring:
     for a in articles:
         print(f"[{a.relevance:.0%}] {a.title}")
 
+Streaming — articles arrive as each source finishes:
+
+    from clawler.api import crawl_stream
+
+    for a in crawl_stream(category="tech"):
+        print(a.title, a.url)
+
 Interest-based filtering (no file needed):
 
     articles = crawl(interests="AI, skateboarding, rust")
@@ -40,10 +47,11 @@ Disable any with disabled={"flipboard", "bbc"} or no_<source>=True.
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Set, Union
+from typing import Callable, Dict, Iterator, List, Optional, Set, Union
 
-from clawler.engine import CrawlEngine
+from clawler.engine import AsyncCrawlEngine, CrawlEngine
 from clawler.models import Article
+from clawler.pushdown import CrawlFilter
 from clawler.registry import build_sources, get_all_keys
 
 
@@ -52,6 +60,75 @@ def _parse_since(value: str) -> datetime:
     return parse_since(value)
 
 
+def _build_api_sources(disabled: Optional[Set[str]], only: Optional[str], timeout: int,
+                       kwargs: dict) -> list:
+    """Resolve disabled/only/legacy no_<key> flags and build the source list."""
+    # Build disabled set from multiple input methods
+    skip: set = set(disabled or set())
+
+    # Legacy no_<key>=True kwargs
+    all_keys = get_all_keys()
+    for key in all_keys:
+        if kwargs.get(f"no_{key}", False):
+            skip.add(key)
+
+    # --only: enable only specified sources
+    if only:
+        enabled = set(s.strip().lower() for s in only.split(",") if s.strip())
+        for key in all_keys:
+            if key not in enabled:
+                skip.add(key)
+
+    return build_sources(disabled=skip, timeout=timeout)
+
+
+def _article_filter(
+    *,
+    category: Optional[str] = None,
+    source: Optional[str] = None,
+    exclude_source: Optional[str] = None,
+    exclude_category: Optional[str] = None,
+    search: Optional[str] = None,
+    exclude: Optional[str] = None,
+    since: Optional[str] = None,
+    min_quality: float = 0.0,
+) -> Callable[[Article], bool]:
+    """Build a per-article predicate for the simple (non-ranking) filters."""
+    checks: List[Callable[[Article], bool]] = []
+    if category:
+        cats = set(c.strip().lower() for c in category.split(","))
+        checks.append(lambda a: a.category in cats)
+    if source:
+        q = source.lower()
+        checks.append(lambda a: q in a.source.lower())
+    if exclude_source:
+        eq = exclude_source.lower()
+        checks.append(lambda a: eq not in a.source.lower())
+    if exclude_category:
+        excl = set(c.strip().lower() for c in exclude_category.split(","))
+        checks.append(lambda a: a.category not in excl)
+    if search:
+        kw = search.lower()
+        checks.append(lambda a: kw in a.title.lower() or kw in a.summary.lower())
+    if exclude:
+        ekw = exclude.lower()
+        checks.append(lambda a: ekw not in a.title.lower() and ekw not in a.summary.lower())
+    if since:
+        cutoff = _parse_since(since)
+        checks.append(lambda a: a.timestamp is not None and a.timestamp >= cutoff)
+    if min_quality > 0:
+        checks.append(lambda a: a.quality_score >= min_quality)
+    return lambda a: all(check(a) for check in checks)
+
+
+def _crawl_filter(category: Optional[str], exclude_category: Optional[str], source: Optional[str],
+                  exclude_source: Optional[str], since: Optional[str]) -> CrawlFilter:
+    """Predicates pushed down to the engine so non-matching sources/feeds aren't fetched."""
+    return CrawlFilter.from_options(category=category, exclude_category=exclude_category,
+                                    source=source, exclude_source=exclude_source,
+                                    since=_parse_since(since) if since else None)
+
+
 def crawl(
     *,
     category: Optional[str] = None,
@@ -69,6 +146,10 @@ def crawl(
     timeout: int = 15,
     max_workers: int = 6,
     source_timeout: Optional[float] = 60,
+    crawl_timeout: Optional[float] = None,
+    auto_workers: bool = False,
+    prewarm: bool = False,
+    breaker_threshold: int = 3,
     profile: Optional[Union[str, dict]] = None,
     interests: Optional[str] = None,
     min_relevance: float = 0.0,
@@ -76,6 +157,7 @@ def crawl(
     sample: int = 0,
     strategy: str | None = None,
     strategy_min_score: float = 0.3,
+    async_engine: bool = False,
     # Legacy no_<source> kwargs accepted for backward compatibility
     **kwargs,
 ) -> List[Article]:
@@ -97,6 +179,10 @@ def crawl(
         timeout: HTTP timeout in seconds.
         max_workers: Max parallel workers for crawling (default: 6).
         source_timeout: Per-source crawl timeout in seconds (default: 60).
+        crawl_timeout: Overall crawl budget in seconds, retries included (default: none).
+        auto_workers: Size the worker pool from past source timings (max_workers is the minimum).
+        prewarm: Open connections to the sources' hosts in parallel before crawling.
+        breaker_threshold: Skip a source, feed or host for a while after this many consecutive failures (0 = off).
         profile: Path to a YAML profile file, or a dict with 'interests' key.
         interests: Comma-separated interest keywords (e.g. "AI,skateboarding").
         min_relevance: Minimum relevance score (0.0-1.0) when profile is used.
@@ -104,59 +190,31 @@ def crawl(
         sample: Randomly sample N articles from results (0 = disabled).
         strategy: Sourcing strategy text for LLM-based relevance filtering.
         strategy_min_score: Minimum strategy relevance score (0.0-1.0, default 0.3).
+        async_engine: Crawl with AsyncCrawlEngine (one asyncio loop; aiohttp if installed).
         **kwargs: Legacy no_<source>=True flags (e.g. no_hn=True, no_reddit=True).
 
     Returns:
         List of Article objects, sorted by time (or relevance if profile given).
     """
-    # Build disabled set from multiple input methods
-    skip: set = set(disabled or set())
-
-    # Legacy no_<key>=True kwargs
-    all_keys = get_all_keys()
-    for key in all_keys:
-        if kwargs.get(f"no_{key}", False):
-            skip.add(key)
-
-    # --only: enable only specified sources
-    if only:
-        enabled = set(s.strip().lower() for s in only.split(",") if s.strip())
-        for key in all_keys:
-            if key not in enabled:
-                skip.add(key)
-
-    sources = build_sources(disabled=skip, timeout=timeout)
+    sources = _build_api_sources(disabled, only, timeout, kwargs)
     if not sources:
         return []
 
-    engine = CrawlEngine(sources=sources, max_workers=max_workers, source_timeout=source_timeout)
+    engine_cls = AsyncCrawlEngine if async_engine else CrawlEngine
+    engine = engine_cls(sources=sources, max_workers=max_workers, source_timeout=source_timeout,
+                        crawl_timeout=crawl_timeout, auto_workers=auto_workers, prewarm=prewarm,
+                        breaker_threshold=breaker_threshold,
+                        crawl_filter=_crawl_filter(category, exclude_category, source, exclude_source, since))
     articles, _stats, _dedup_stats = engine.crawl(
         dedupe_threshold=dedupe_threshold,
         dedupe_enabled=dedupe_enabled,
     )
 
     # Filters
-    if category:
-        cats = set(c.strip().lower() for c in category.split(","))
-        articles = [a for a in articles if a.category in cats]
-    if source:
-        q = source.lower()
-        articles = [a for a in articles if q in a.source.lower()]
-    if exclude_source:
-        eq = exclude_source.lower()
-        articles = [a for a in articles if eq not in a.source.lower()]
-    if exclude_category:
-        excl = set(c.strip().lower() for c in exclude_category.split(","))
-        articles = [a for a in articles if a.category not in excl]
-    if search:
-        kw = search.lower()
-        articles = [a for a in articles if kw in a.title.lower() or kw in a.summary.lower()]
-    if exclude:
-        ekw = exclude.lower()
-        articles = [a for a in articles if ekw not in a.title.lower() and ekw not in a.summary.lower()]
-    if since:
-        cutoff = _parse_since(since)
-        articles = [a for a in articles if a.timestamp and a.timestamp >= cutoff]
+    keep = _article_filter(category=category, source=source, exclude_source=exclude_source,
+                           exclude_category=exclude_category, search=search, exclude=exclude,
+                           since=since)
+    articles = [a for a in articles if keep(a)]
 
     # Filter by quality score
     if min_quality > 0:
@@ -186,3 +244,66 @@ def crawl(
         result = random.sample(result, sample)
 
     return result
+
+
+def crawl_stream(
+    *,
+    category: Optional[str] = None,
+    source: Optional[str] = None,
+    search: Optional[str] = None,
+    exclude: Optional[str] = None,
+    since: Optional[str] = None,
+    limit: int = 0,
+    exclude_source: Optional[str] = None,
+    exclude_category: Optional[str] = None,
+    only: Optional[str] = None,
+    disabled: Optional[Set[str]] = None,
+    dedupe_threshold: float = 0.75,
+    dedupe_enabled: bool = True,
+    timeout: int = 15,
+    max_workers: int = 6,
+    source_timeout: Optional[float] = 60,
+    crawl_timeout: Optional[float] = None,
+    auto_workers: bool = False,
+    prewarm: bool = False,
+    breaker_threshold: int = 3,
+    min_quality: float = 0.0,
+    **kwargs,
+) -> Iterator[Article]:
+    """Like :func:`crawl`, but yield articles as each source finishes.
+
+    Articles are deduplicated incrementally against those already yielded,
+    so the first copy of a story wins. Results are not globally sorted, and
+    options that need the full result set (profile/interests scoring,
+    strategy filtering, sampling) are not available here — use ``crawl``.
+
+        for a in crawl_stream(category="tech", limit=20):
+            print(a.title)
+
+    Args:
+        limit: Stop after this many articles (0 = no limit).
+        Other arguments are the same as for :func:`crawl`.
+    """
+    sources = _build_api_sources(disabled, only, timeout, kwargs)
+    if not sources:
+        return
+
+    engine = CrawlEngine(sources=sources, max_workers=max_workers, source_timeout=source_timeout,
+                         crawl_timeout=crawl_timeout, auto_workers=auto_workers, prewarm=prewarm,
+                         breaker_threshold=breaker_threshold,
+                         crawl_filter=_crawl_filter(category, exclude_category, source, exclude_source, since))
+    keep = _article_filter(category=category, source=source, exclude_source=exclude_source,
+                           exclude_category=exclude_category, search=search, exclude=exclude,
+                           since=since, min_quality=min_quality)
+    stream = engine.crawl_iter(dedupe_threshold=dedupe_threshold, dedupe_enabled=dedupe_enabled)
+    emitted = 0
+    try:
+        for article in stream:
+            if not keep(article):
+                continue
+            yield article
+            emitted += 1
+            if limit and emitted >= limit:
+                return
+    finally:
+        stream.close()
@@ -70,9 +70,11 @@ def _dict_to_article(d: dict) -> Article:
     )
 
 
-def cache_key(source_names: List[str], dedupe_threshold: float) -> str:
-    """Generate a cache key from source config."""
+def cache_key(source_names: List[str], dedupe_threshold: float, extra: str = "") -> str:
+    """Generate a cache key from source config (``extra``: anything else that changes the crawl)."""
     raw = f"{sorted(source_names)}|{dedupe_threshold}"
+    if extra:
+        raw += f"|{extra}"
     return hashlib.md5(raw.encode()).hexdigest()[:12]
 
 
@@ -0,0 +1,206 @@
+"""Circuit breakers for sources, feed URLs and hosts.
+
+A source or feed that is down costs its full timeout, times every retry, on
+every run. The breaker remembers consecutive failures per key:
+
+* ``source:<name>`` — a whole source failed (the engine records these)
+* ``url:<url>``     — a fetch failed after all its retries
+* ``host:<netloc>`` — a host couldn't be reached (connection error/timeout)
+
+After ``threshold`` consecutive failures the circuit *opens* and the key is
+skipped without a request for a cooldown (``base_cooldown`` seconds, doubled
+each time it re-opens, up to ``max_cooldown``). When the cooldown is over the
+circuit is *half-open*: one probe is let through, without retries. A
+successful probe closes it; a failed one re-opens it with the longer
+cooldown.
+
+State is owned by ``HealthTracker`` and persisted next to the health data, so
+a feed that has been dead for weeks costs one quick probe a day instead of a
+full timeout every run.
+"""
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+# Outcomes logged by RecordingCircuitBreaker
+SUCCESS = "success"
+FAILURE = "failure"
+SKIPPED = "skipped"
+
+DEFAULT_THRESHOLD = 3
+DEFAULT_COOLDOWN = 1800.0      # 30 minutes after the circuit first opens
+MAX_COOLDOWN = 86400.0         # never wait more than a day between probes
+
+
+@dataclass
+class Circuit:
+    """Breaker state for one key. Times are wall-clock (``time.time()``) so they survive restarts."""
+    failures: int = 0          # consecutive
+    open_until: float = 0.0    # 0 = closed
+    cooldown: float = 0.0      # length of the current/last open period
+    skipped: int = 0           # requests/runs skipped while open, in total
+
+    def state(self, now: float) -> str:
+        if not self.open_until:
+            return CLOSED
+        return OPEN if now < self.open_until else HALF_OPEN
+
+
+def source_key(name: str) -> str:
+    return f"source:{name}"
+
+
+def url_key(url: str) -> str:
+    return f"url:{url}"
+
+
+def host_key(url: str) -> str:
+    return f"host:{urlsplit(url).netloc.lower()}"
+
+
+class CircuitBreaker:
+    """Thread-safe set of circuits keyed by ``source:``/``url:``/``host:`` strings."""
+
+    def __init__(self, threshold: int = DEFAULT_THRESHOLD, base_cooldown: float = DEFAULT_COOLDOWN,
+                 max_cooldown: float = MAX_COOLDOWN, circuits: Optional[Dict[str, Circuit]] = None):
+        self.threshold = threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.circuits: Dict[str, Circuit] = circuits or {}
+        self._probing: set = set()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def admit(self, key: str) -> str:
+        """Decide whether ``key`` may be tried now.
+
+        Returns ``CLOSED`` (go ahead), ``HALF_OPEN`` (go ahead as the probe:
+        don't retry) or ``OPEN`` (skip it). While a probe is in flight other
+        callers for the same key are turned away.
+        """
+        if not self.enabled:
+            return CLOSED
+        with self._lock:
+            circuit = self.circuits.get(key)
+            if circuit is None:
+                return CLOSED
+            state = circuit.state(time.time())
+            if state == HALF_OPEN and key not in self._probing:
+                self._probing.add(key)
+                return HALF_OPEN
+            if state == CLOSED:
+                return CLOSED
+            circuit.skipped += 1
+            return OPEN
+
+    def record_success(self, key: str):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._probing.discard(key)
+            self.circuits.pop(key, None)
+
+    def record_failure(self, key: str):
+        if not self.enabled:
+            return
+        with self._lock:
+            probe = key in self._probing
+            self._probing.discard(key)
+            circuit = self.circuits.setdefault(key, Circuit())
+            circuit.failures += 1
+            if probe or circuit.open_until:
+                circuit.cooldown = min(self.max_cooldown, max(self.base_cooldown, circuit.cooldown * 2))
+            elif circuit.failures >= self.threshold:
+                circuit.cooldown = self.base_cooldown
+            else:
+                return
+            circuit.open_until = time.time() + circuit.cooldown
+
+    def replay(self, events: Iterable[Sequence[str]]):
+        """Apply ``(key, outcome)`` events logged by a ``RecordingCircuitBreaker`` in another process."""
+        for key, outcome in events:
+            if outcome == SUCCESS:
+                self.record_success(key)
+            elif outcome == FAILURE:
+                self.record_failure(key)
+            elif outcome == SKIPPED:
+                with self._lock:
+                    circuit = self.circuits.get(key)
+                    if circuit is not None:
+                        circuit.skipped += 1
+
+    def clear_probes(self):
+        """Forget probes that never reported back (e.g. cut off by the crawl budget)."""
+        with self._lock:
+            self._probing.clear()
+
+    def reset(self, key: Optional[str] = None):
+        """Close one circuit, or all of them."""
+        with self._lock:
+            if key is None:
+                self.circuits.clear()
+                self._probing.clear()
+            else:
+                self.circuits.pop(key, None)
+                self._probing.discard(key)
+
+    def open_circuits(self) -> List[tuple]:
+        """``(key, circuit, state)`` for every circuit that is open or half-open, soonest retry first."""
+        now = time.time()
+        with self._lock:
+            entries = [(key, c, c.state(now)) for key, c in self.circuits.items() if c.open_until]
+        return sorted(entries, key=lambda e: e[1].open_until)
+
+    def to_dict(self) -> Dict[str, dict]:
+        with self._lock:
+            return {key: asdict(c) for key, c in self.circuits.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, dict], **kwargs) -> "CircuitBreaker":
+        circuits = {}
+        for key, fields in (data or {}).items():
+            try:
+                circuits[key] = Circuit(**fields)
+            except TypeError:
+                continue  # written by another version
+        return cls(circuits=circuits, **kwargs)
+
+
+class RecordingCircuitBreaker(CircuitBreaker):
+    """A ``CircuitBreaker`` that also logs every outcome as ``(key, outcome)`` in ``events``.
+
+    Shard workers crawl with one, so the coordinator can ``replay`` their
+    outcomes into the breaker it saves.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.events: List[tuple] = []
+
+    def _log(self, key: str, outcome: str):
+        if self.enabled:
+            with self._lock:
+                self.events.append((key, outcome))
+
+    def admit(self, key: str) -> str:
+        state = super().admit(key)
+        if state == OPEN:
+            self._log(key, SKIPPED)
+        return state
+
+    def record_success(self, key: str):
+        super().record_success(key)
+        self._log(key, SUCCESS)
+
+    def record_failure(self, key: str):
+        super().record_failure(key)
+        self._log(key, FAILURE)
@@ -80,6 +80,12 @@ def main(argv=None):
                         help="Import feeds from OPML file (replaces default RSS feeds)")
     parser.add_argument("--dedupe-threshold", type=float, default=0.75, dest="dedupe_threshold",
                         help="Fuzzy title similarity threshold for dedup (0.0-1.0, default: 0.75)")
+    parser.add_argument("--dedupe-backend", choices=["difflib", "vector"], default="difflib", dest="dedupe_backend",
+                        help="Title similarity backend for dedup and --stories: difflib, or vector "
+                             "(bulk NumPy cosine; needs clawler[vector]) (default: difflib)")
+    parser.add_argument("--dedupe-workers", type=int, default=0, dest="dedupe_workers",
+                        help="Worker processes for deduplicating large batches, e.g. backfills "
+                             "(default: 0 = in the main process)")
     parser.add_argument("--discover", type=str, default=None, metavar="URL",
                         help="Discover RSS/Atom feeds on a webpage and exit")
     parser.add_argument("--no-config", action="store_true",
@@ -98,7 +104,9 @@ def main(argv=None):
     parser.add_argument("--cache-ttl", type=int, default=300, dest="cache_ttl",
                         help="Cache TTL in seconds (default: 300)")
     parser.add_argument("--clear-cache", action="store_true", dest="clear_cache",
-                        help="Clear all cached results and exit")
+                        help="Clear all cached results (and stored HTTP responses) and exit")
+    parser.add_argument("--no-http-cache", action="store_true", dest="no_http_cache",
+                        help="Always download feeds in full (no ETag/Last-Modified conditional requests)")
     parser.add_argument("--cache-info", action="store_true", dest="cache_info",
                         help="Show cache directory stats (file count, total size, oldest/newest) and exit")
     parser.add_argument("--history", action="store_true",
@@ -109,8 +117,18 @@ def main(argv=None):
                         help="Clear persistent dedup history and exit")
     parser.add_argument("--history-stats", action="store_true", dest="history_stats",
                         help="Show persistent dedup history statistics and exit")
+    parser.add_argument("--dedup-index", action="store_true", dest="dedup_index",
+                        help="Dedup against stories from recent runs too (cross-run copies merge, source_count grows)")
+    parser.add_argument("--dedup-window", type=str, default="24h", dest="dedup_window",
+                        help="How long --dedup-index keeps a story after it was last seen (e.g. 6h, 2d; default: 24h)")
+    parser.add_argument("--clear-dedup-index", action="store_true", dest="clear_dedup_index",
+                        help="Clear the persistent dedup index and exit")
     parser.add_argument("--health", action="store_true",
                         help="Show per-source health report and exit")
+    parser.add_argument("--breaker-threshold", type=int, default=3, dest="breaker_threshold",
+                        help="Skip a source, feed or host after N consecutive failures (default: 3, 0 = off)")
+    parser.add_argument("--reset-circuits", action="store_true", dest="reset_circuits",
+                        help="Close all circuit breakers (retry everything on the next crawl) and exit")
     parser.add_argument("--json-pretty", action="store_true", dest="json_pretty",
                         help="Pretty-print JSON output (implies -f json)")
     parser.add_argument("--dry-run", action="store_true", dest="dry_run",
@@ -167,6 +185,48 @@ def main(argv=None):
                         help="Show domain breakdown statistics after output")
     parser.add_argument("--workers", type=int, default=6,
                         help="Max parallel workers for crawling (default: 6)")
+    parser.add_argument("--auto-workers", action="store_true", dest="auto_workers",
+                        help="Size the worker pool from sources' past crawl times (--workers is the minimum)")
+    parser.add_argument("--async-engine", action="store_true", dest="async_engine",
+                        help="Crawl on a single asyncio event loop (uses aiohttp when installed)")
+    parser.add_argument("--max-connections", type=int, default=200, dest="max_connections",
+                        help="Max concurrent HTTP connections for --async-engine (default: 200)")
+    parser.add_argument("--rss-workers", type=int, default=16, dest="rss_workers",
+                        help="Max RSS feeds fetched in parallel (default: 16)")
+    parser.add_argument("--rss-per-host", type=int, default=2, dest="rss_per_host",
+                        help="Max concurrent RSS fetches per host (default: 2)")
+    parser.add_argument("--fetch-workers", type=int, default=32, dest="fetch_workers",
+                        help="Max concurrent sub-fetches across multi-URL sources like Reddit or HN (default: 32)")
+    parser.add_argument("--fetch-per-host", type=int, default=4, dest="fetch_per_host",
+                        help="Max concurrent sub-fetches per host (default: 4)")
+    parser.add_argument("--shards", type=int, default=0,
+                        help="Split the crawl into N shards, each crawled by its own process, then merge")
+    parser.add_argument("--shard-workers", type=str, default=None, dest="shard_workers", metavar="ADDRS",
+                        help="Comma-separated --shard-serve addresses (host:port or socket path) to crawl shards on")
+    parser.add_argument("--shard-serve", type=str, default=None, dest="shard_serve", metavar="ADDR",
+                        help="Run as a shard worker listening on ADDR (host:port or Unix socket path); "
+                             "non-loopback addresses need CLAWLER_SHARD_TOKEN")
+    parser.add_argument("--parse-workers", type=int, default=0, dest="parse_workers",
+                        help="Worker processes for feed/HTML parsing (default: 0 = parse on the fetch threads)")
+    parser.add_argument("--max-response-mb", type=int, default=10, dest="max_response_mb",
+                        help="Stop reading a response after this many MB (default: 10, 0 = no cap)")
+    parser.add_argument("--record", type=str, default=None, metavar="DIR",
+                        help="Save every HTTP response of this crawl to DIR (for --replay)")
+    parser.add_argument("--replay", type=str, default=None, metavar="DIR",
+                        help="Crawl offline, serving every HTTP response from a --record archive in DIR")
+    parser.add_argument("--replay-latency", type=float, default=0.0, dest="replay_latency", metavar="SCALE",
+                        help="With --replay, delay each response by its recorded time x SCALE (default: 0)")
+    parser.add_argument("--http2", action="store_true",
+                        help="Multiplex requests to each host over one HTTP/2 connection (needs clawler[http2])")
+    parser.add_argument("--prewarm", action="store_true",
+                        help="Open connections to the sources' hosts in parallel before crawling")
+    parser.add_argument("--dns-ttl", type=int, default=300, dest="dns_ttl",
+                        help="Cache DNS lookups for this many seconds (default: 300, 0 = off)")
+    parser.add_argument("--egress", type=str, default=None, metavar="ROUTES",
+                        help="Spread requests across these proxies / local IPs (comma-separated, "
+                             "e.g. http://10.0.0.2:3128,192.0.2.7)")
+    parser.add_argument("--egress-hosts", type=str, default=None, dest="egress_hosts", metavar="DOMAINS",
+                        help="Only use --egress for these domains (comma-separated; default: all hosts)")
     parser.add_argument("--exclude", type=str, default=None,
                         help="Exclude articles matching keyword in title or summary (case-insensitive)")
     parser.add_argument("--author", type=str, default=None,
@@ -212,6 +272,8 @@ def main(argv=None):
                         help="Per-source crawl timeout in seconds (default: 60, 0 to disable)")
     parser.add_argument("--no-source-timeout", action="store_true", dest="no_source_timeout",
                         help="Disable per-source timeout (allow sources to run indefinitely)")
+    parser.add_argument("--crawl-timeout", type=float, default=0, dest="crawl_timeout",
+                        help="Overall crawl budget in seconds, including retries (default: 0 = no limit)")
     parser.add_argument("--export-health", type=str, default=None, metavar="FILE",
                         dest="export_health",
                         help="Export source health data as JSON to FILE")
@@ -220,6 +282,9 @@ def main(argv=None):
                              "wikipedia,lobsters,devto,arxiv,techmeme,producthunt,bluesky)")
     parser.add_argument("--json-lines", action="store_true", dest="json_lines",
                         help="Alias for -f jsonl (JSON Lines output)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Write articles as each source finishes (jsonl/csv only; "
+                             "incremental dedup, no global sort)")
     parser.add_argument("--tone", choices=["positive", "negative", "neutral"], default=None,
                         help="Filter articles by tone (positive, negative, neutral)")
     parser.add_argument("--no-doom", action="store_true", dest="no_doom",
@@ -334,7 +399,9 @@ def main(argv=None):
     if args.clear_cache:
         from clawler.cache import clear_cache
         n = clear_cache()
-        print(f"🧹 Cleared {n} cached file(s)")
+        from clawler.http_cache import HttpCache
+        n_http = HttpCache().clear()
+        print(f"🧹 Cleared {n} cached file(s) and {n_http} stored HTTP response(s)")
         return
 
     # Cache info
@@ -356,6 +423,13 @@ def main(argv=None):
         print("🧹 Cleared dedup history" if removed else "ℹ️  No history to clear")
         return
 
+    # Clear dedup index
+    if args.clear_dedup_index:
+        from clawler.dedup_index import clear_dedup_index
+        removed = clear_dedup_index()
+        print("🧹 Cleared dedup index" if removed else "ℹ️  No dedup index to clear")
+        return
+
     # ═══════════════════════════════════════════════════════════════════════════
     # Podcast early-exit handlers
     # ═══════════════════════════════════════════════════════════════════════════
@@ -545,10 +619,22 @@ def main(argv=None):
             print("ℹ️  No timing data yet. Run a crawl first.")
             return
         print("🐢 Sources by Average Response Time:\n")
-        print(f"   {'Source':<25} {'Avg ms':>8} {'Min ms':>8} {'Max ms':>8} {'Samples':>8}")
-        print(f"   {'─'*25} {'─'*8} {'─'*8} {'─'*8} {'─'*8}")
+        print(f"   {'Source':<25} {'Avg ms':>8} {'Min ms':>8} {'Max ms':>8} {'Samples':>8} {'TTFB ms':>8} {'KB/art':>8}")
+        print(f"   {'─'*25} {'─'*8} {'─'*8} {'─'*8} {'─'*8} {'─'*8} {'─'*8}")
         for entry in timing:
-            print(f"   {entry['source']:<25} {entry['avg_ms']:>8.0f} {entry['min_ms']:>8.0f} {entry['max_ms']:>8.0f} {entry['samples']:>8}")
+            ttfb = f"{entry['avg_ttfb_ms']:.0f}" if "avg_ttfb_ms" in entry else "-"
+            per_article = entry.get("bytes_per_article")
+            kb = f"{per_article / 1024:.1f}" if per_article is not None else "-"
+            print(f"   {entry['source']:<25} {entry['avg_ms']:>8.0f} {entry['min_ms']:>8.0f} {entry['max_ms']:>8.0f} "
+                  f"{entry['samples']:>8} {ttfb:>8} {kb:>8}")
+        traffic = tracker.get_traffic_report()
+        if traffic:
+            from clawler.sources.bandwidth import format_bytes
+            print("\n📦 Costliest URLs (wire bytes, all runs):\n")
+            for entry in traffic[:5]:
+                for url, t in tracker.top_urls(entry["source"], 3):
+                    statuses = ", ".join(f"{code}×{n}" for code, n in sorted(t.statuses.items()))
+                    print(f"   {format_bytes(t.wire_bytes):>9}  x{t.compression_ratio:<5} {statuses:<14} {url}")
         return
 
     # History stats
@@ -640,6 +726,23 @@ def main(argv=None):
             rate = info["success_rate"]
             emoji = "✅" if rate >= 0.9 else "⚠️" if rate >= 0.7 else "❌"
             print(f"  {emoji} {source:25s}  success={rate:.0%}  crawls={info['total_crawls']}  avg_articles={info['avg_articles']}  last={info['last_success'] or 'never'}")
+        circuits = tracker.breaker.open_circuits()
+        if circuits:
+            import time as _time
+            print("\n⛔ Open circuits (skipped until retry; --reset-circuits to retry now)\n")
+            for key, circuit, state in circuits:
+                wait_min = (circuit.open_until - _time.time()) / 60
+                retry = "probe on next crawl" if state == "half-open" else f"retry in {wait_min:.0f}m"
+                print(f"  {key:60s}  failures={circuit.failures}  skipped={circuit.skipped}  {retry}")
+        return
+
+    if args.reset_circuits:
+        from clawler.health import HealthTracker
+        tracker = HealthTracker()
+        count = len(tracker.breaker.circuits)
+        tracker.breaker.reset()
+        tracker.save()
+        print(f"✅ Closed {count} circuit(s)")
         return
 
     # Load custom feeds from OPML or feeds file (before --dry-run so it can report correct feed count)
@@ -745,6 +848,15 @@ def main(argv=None):
         format="%(asctime)s [%(levelname)s] %(message)s",
     )
 
+    if args.shard_serve:
+        from clawler.shard import SHARD_TOKEN_ENV, serve_shards
+        try:
+            serve_shards(args.shard_serve, token=os.environ.get(SHARD_TOKEN_ENV))
+        except ValueError as e:
+            print(f"Error: --shard-serve: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+
     # Load podcast feeds if podcasts are enabled
     podcast_feeds = None
     if args.podcasts or args.only_podcasts:
@@ -774,25 +886,153 @@ def main(argv=None):
             src = cls()
         src.timeout = args.timeout
         src.max_retries = args.retries
+        src.max_response_bytes = args.max_response_mb * 1024 * 1024 if args.max_response_mb > 0 else None
+        if entry.key == "rss":
+            src.max_workers = args.rss_workers
+            src.per_host_limit = args.rss_per_host
         sources.append(src)
 
     if not sources:
         print("Error: All sources disabled!", file=sys.stderr)
         sys.exit(1)
 
+    from clawler.sources.scheduler import configure_scheduler
+    configure_scheduler(max_workers=args.fetch_workers, per_host=args.fetch_per_host)
+    from clawler.sources.parse_pool import configure_parse_pool
+    configure_parse_pool(workers=args.parse_workers)
+    from clawler.http_archive import configure_http_archive
+    try:
+        archive = configure_http_archive(record=args.record, replay=args.replay,
+                                         latency_scale=args.replay_latency)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    from clawler.http_cache import configure_http_cache
+    # Archives hold full responses: no conditional requests while recording or replaying
+    http_cache = configure_http_cache(enabled=not args.no_http_cache and archive is None)
+    if args.http2:
+        from clawler.sources.base import configure_transport
+        if not configure_transport(http2=True) and not args.quiet:
+            print("⚠️  --http2 needs httpx with h2 (pip install 'clawler[http2]'); using HTTP/1.1", file=sys.stderr)
+    from clawler.sources.connections import install_dns_cache
+    install_dns_cache(args.dns_ttl)
+    from clawler.title_index import configure_dedup_backend
+    try:
+        backend_ok = configure_dedup_backend(args.dedupe_backend)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not backend_ok and not args.quiet:
+        print("⚠️  --dedupe-backend vector needs numpy (pip install 'clawler[vector]'); using difflib", file=sys.stderr)
+    from clawler.dedup import configure_dedup_workers
+    configure_dedup_workers(args.dedupe_workers)
+    egress_pool = None
+    if args.egress:
+        from clawler.sources.egress import configure_egress
+        hosts = args.egress_hosts.split(",") if args.egress_hosts else None
+        try:
+            egress_pool = configure_egress([e for e in args.egress.split(",") if e.strip()], hosts=hosts)
+        except ValueError as e:
+            print(f"Error: --egress: {e}", file=sys.stderr)
+            sys.exit(1)
+    rate_limits = None
+    if not args.no_config:
+        from clawler.config import load_rate_limits
+        from clawler.sources.rate_limit import configure_rate_limits
+        try:
+            rate_limits = load_rate_limits()
+            configure_rate_limits(rate_limits)
+        except (TypeError, ValueError) as e:
+            print(f"Error: invalid rate_limits in config: {e}", file=sys.stderr)
+            sys.exit(1)
+
     retries = 0 if args.no_retry else args.source_retries
     source_timeout = None if args.no_source_timeout else (None if args.source_timeout == 0 else args.source_timeout)
-    engine = CrawlEngine(sources=sources, max_workers=args.workers, retries=retries, source_timeout=source_timeout)
+    crawl_timeout = args.crawl_timeout or None
+    from clawler.pushdown import CrawlFilter
+    crawl_filter = CrawlFilter.from_options(
+        category=args.category, exclude_category=args.exclude_category,
+        source=args.source, exclude_source=args.exclude_source,
+        since=max((_parse_since(v) for v in (args.since, args.max_age) if v), default=None),
+    )
+    if args.shards or args.shard_workers:
+        from clawler.shard import SHARD_TOKEN_ENV, LocalProcessTransport, ShardedCrawlEngine, SocketTransport
+        addresses = [a.strip() for a in (args.shard_workers or "").split(",") if a.strip()]
+        if args.async_engine:
+            print("Error: --async-engine can't be used with --shards/--shard-workers "
+                  "(shards crawl with the threaded engine)", file=sys.stderr)
+            sys.exit(1)
+        if addresses and (args.record or args.replay):
+            print("Error: --record/--replay can't be used with --shard-workers "
+                  "(workers don't accept paths over the network)", file=sys.stderr)
+            sys.exit(1)
+        transport = (SocketTransport(addresses, token=os.environ.get(SHARD_TOKEN_ENV)) if addresses
+                     else LocalProcessTransport())
+        # Shard workers start unconfigured: send them this crawl's process-wide settings
+        task_settings = dict(
+            max_response_mb=args.max_response_mb,
+            breaker_threshold=0 if args.replay else args.breaker_threshold,
+            http_cache=http_cache is not None,
+            # Remote workers keep their own cache directory
+            http_cache_dir=str(http_cache.cache_dir) if http_cache is not None and not addresses else None,
+            record=args.record, replay=args.replay, replay_latency=args.replay_latency,
+            rate_limits=rate_limits, http2=args.http2,
+            egress=[e for e in args.egress.split(",") if e.strip()] if args.egress else None,
+            egress_hosts=args.egress_hosts.split(",") if args.egress_hosts else None,
+            parse_workers=args.parse_workers, fetch_workers=args.fetch_workers,
+            fetch_per_host=args.fetch_per_host, dns_ttl=args.dns_ttl,
+        )
+        engine = ShardedCrawlEngine(shards=args.shards or len(addresses),
+                                    keys=[e.key for e in _REG_SOURCES if not getattr(args, f"no_{e.key}", False)],
+                                    transport=transport, rss_feeds=custom_feeds, timeout=args.timeout,
+                                    max_workers=args.workers, retries=retries,
+                                    source_timeout=source_timeout, crawl_timeout=crawl_timeout,
+                                    fetch_retries=args.retries, rss_workers=args.rss_workers,
+                                    rss_per_host=args.rss_per_host, crawl_filter=crawl_filter,
+                                    podcast_feeds=podcast_feeds, prewarm=args.prewarm,
+                                    task_settings=task_settings)
+    elif args.async_engine:
+        from clawler.engine import AsyncCrawlEngine
+        engine = AsyncCrawlEngine(sources=sources, max_workers=args.workers, retries=retries,
+                                  source_timeout=source_timeout, crawl_timeout=crawl_timeout,
+                                  max_connections=args.max_connections, auto_workers=args.auto_workers,
+                                  crawl_filter=crawl_filter, prewarm=args.prewarm,
+                                  breaker_threshold=0 if args.replay else args.breaker_threshold)
+    else:
+        engine = CrawlEngine(sources=sources, max_workers=args.workers, retries=retries,
+                             source_timeout=source_timeout, crawl_timeout=crawl_timeout,
+                             auto_workers=args.auto_workers, crawl_filter=crawl_filter, prewarm=args.prewarm,
+                             breaker_threshold=0 if args.replay else args.breaker_threshold)
+    if not engine.sources and engine.pushdown.sources_skipped:
+        print("Error: No enabled source can match the category/source filters!", file=sys.stderr)
+        sys.exit(1)
+    if args.dedup_index and not args.no_dedup:
+        from clawler.dedup_index import open_dedup_index
+        from clawler.utils import parse_since_seconds
+        try:
+            window = parse_since_seconds(args.dedup_window)
+        except ValueError as e:
+            print(f"Error: --dedup-window: {e}", file=sys.stderr)
+            sys.exit(1)
+        engine.dedup_index = open_dedup_index(window=window, similarity_threshold=args.dedupe_threshold)
     if not args.quiet:
         print("🕷️  Crawling news sources...", file=sys.stderr)
 
+    if args.stream:
+        _stream_output(engine, args)
+        return
+
     # Check cache first
     articles = None
     stats = None
     _dedup_stats = None
     if args.cache:
         from clawler.cache import cache_key, load_cache, save_cache
-        ckey = cache_key([s.name for s in sources], args.dedupe_threshold)
+        filters = ""
+        if crawl_filter.active:
+            filters = "|".join(str(v) for v in (args.category, args.exclude_category, args.source,
+                                                args.exclude_source, args.since, args.max_age))
+        ckey = cache_key([s.name for s in sources], args.dedupe_threshold, extra=filters)
         cached = load_cache(ckey, ttl=args.cache_ttl)
         if cached:
             articles, stats = cached
@@ -1038,6 +1278,47 @@ def main(argv=None):
         avg_quality = sum(a.quality_score for a in articles) / len(articles) if articles else 0
         print(f"📊 Clawler Crawl Statistics")
         print(f"   Sources crawled: {len(stats)} ({failed} failed)")
+        if getattr(engine, "circuit_skipped", None):
+            print(f"   Skipped (circuit open): {', '.join(engine.circuit_skipped)}")
+        pushdown = getattr(engine, "pushdown", None)
+        if pushdown and (pushdown.sources_skipped or pushdown.feeds_skipped):
+            print(f"   Skipped by filters (not fetched): {len(pushdown.sources_skipped)} sources, "
+                  f"{pushdown.feeds_skipped} RSS feeds")
+        coalescer = getattr(engine, "coalescer", None)
+        if coalescer and coalescer.requests:
+            print(f"   Shared fetches (not re-requested): {coalescer.saved} of {coalescer.requests}")
+        if archive is not None:
+            action = f"replayed {archive.replayed} ({archive.missing} not recorded)" if archive.replaying \
+                else f"recorded {archive.recorded}"
+            print(f"   HTTP archive: {action} responses in {archive.archive_dir}")
+        warm = getattr(engine, "prewarm_stats", None)
+        if warm and warm.hosts:
+            print(f"   Pre-warmed connections: {warm.connections} to {warm.hosts} hosts "
+                  f"({warm.handshake_ms:.0f}ms of handshakes, ~{warm.saved_ms:.0f}ms saved)")
+        if egress_pool is not None and egress_pool.sent:
+            print(f"   Egress: {', '.join(f'{name} ({n})' for name, n in egress_pool.sent.most_common())}")
+        metered = [(src.name, src.traffic.total) for src in getattr(engine, "sources", None) or []
+                   if getattr(src, "traffic", None) is not None and src.traffic.urls]
+        if metered:
+            from clawler.sources.bandwidth import UrlTraffic, format_bytes
+            traffic = UrlTraffic()
+            for _, t in metered:
+                traffic.merge(t)
+            print(f"   Transferred: {format_bytes(traffic.wire_bytes)} on the wire, "
+                  f"{format_bytes(traffic.decoded_bytes)} decoded (x{traffic.compression_ratio} compression), "
+                  f"{traffic.requests} requests, avg TTFB {traffic.avg_ttfb_ms:.0f}ms")
+            per_article = sorted(((name, t.wire_bytes / stats[name]) for name, t in metered if stats.get(name, 0) > 0),
+                                 key=lambda x: x[1], reverse=True)[:5]
+            if per_article:
+                print(f"   Costliest per article: {', '.join(f'{n} ({format_bytes(b)})' for n, b in per_article)}")
+        rss_sources = [src for src in getattr(engine, "sources", None) or [] if getattr(src, "feed_timings", None)]
+        if rss_sources:
+            feed_count = sum(len(src.feed_timings) for src in rss_sources)
+            failed_feeds = sum(1 for src in rss_sources for t in src.feed_timings.values() if not t["ok"])
+            slowest = sorted((f for src in rss_sources for f in src.slowest_feeds(5)),
+                             key=lambda f: f["elapsed_ms"], reverse=True)[:5]
+            print(f"   RSS feeds: {feed_count} ({failed_feeds} failed), slowest: "
+                  + ", ".join(f"{f['source']} ({f['elapsed_ms']:.0f}ms)" for f in slowest))
         print(f"   Total raw articles: {total}")
         print(f"   After dedup + filters: {len(articles)}")
         print(f"   Avg quality score: {avg_quality:.3f}")
@@ -1440,6 +1721,59 @@ def main(argv=None):
         _watch_loop(args)
 
 
+def _stream_output(engine, args):
+    """--stream: write jsonl/csv records as sources complete.
+
+    Only per-article filters apply here (category, source, keyword, --since,
+    --min-quality, --limit); sorting and whole-result options are skipped.
+    """
+    from clawler.api import _article_filter
+    from clawler.dedup import DedupStats
+
+    if args.format not in ("jsonl", "csv"):
+        print("Error: --stream requires -f jsonl or -f csv", file=sys.stderr)
+        sys.exit(1)
+
+    keep = _article_filter(
+        category=None if args.category == "all" else args.category,
+        source=args.source, exclude_source=args.exclude_source,
+        exclude_category=args.exclude_category, search=args.search, exclude=args.exclude,
+        since=args.since, min_quality=args.min_quality,
+    )
+    stats: dict = {}
+    dedup_stats = DedupStats()
+    stream = engine.crawl_iter(dedupe_threshold=args.dedupe_threshold, dedupe_enabled=not args.no_dedup,
+                               stats=stats, dedup_stats=dedup_stats)
+
+    def _selected():
+        emitted = 0
+        for a in stream:
+            if not keep(a):
+                continue
+            yield a
+            emitted += 1
+            if args.limit and emitted >= args.limit:
+                return
+
+    formatter = JSONLFormatter() if args.format == "jsonl" else CSVFormatter()
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        count = formatter.write_stream(_selected(), out)
+    finally:
+        stream.close()
+        if args.output:
+            out.close()
+
+    if not args.quiet:
+        for name, n in stats.items():
+            status = f"{n} articles" if n >= 0 else "FAILED"
+            print(f"   {'✓' if n >= 0 else '✗'} {name}: {status}", file=sys.stderr)
+        if args.output:
+            print(f"✅ Wrote {count} articles to {args.output}", file=sys.stderr)
+    if args.dedupe_stats:
+        print(f"\n📊 {dedup_stats.summary()}", file=sys.stderr)
+
+
 def _watch_loop(args):
     """Continuously re-run crawl at the specified interval.
 
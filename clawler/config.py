@@ -14,6 +14,11 @@ Example config file:
     quiet: true
     no_reddit: true
     dedupe_threshold: 0.8
+
+    # Per-domain request pace: requests/second, or {rate, burst}
+    rate_limits:
+      default: 2
+      hnrss.org: {rate: 5, burst: 10}
 """
 import logging
 import os
@@ -30,14 +35,19 @@ _BOOL_FIELDS = {"verbose", "quiet", "no_reddit", "no_hn", "no_rss", "no_github",
                 "stats", "check_feeds", "list_sources", "cache", "history",
                 "digest", "fresh", "no_dedup", "dedupe_stats", "urls_only",
                 "titles_only", "domains", "trending", "no_color", "show_read_time",
-                "show_discussions", "json_compact", "json_pretty"}
+                "show_discussions", "json_compact", "json_pretty", "async_engine",
+                "stream", "auto_workers", "no_http_cache", "prewarm", "http2", "dedup_index"}
 _INT_FIELDS = {"limit", "timeout", "workers", "retries", "cache_ttl", "sample",
-               "min_read", "max_read"}
-_FLOAT_FIELDS = {"dedupe_threshold", "min_relevance", "min_quality"}
+               "min_read", "max_read", "rss_workers", "rss_per_host",
+               "max_connections", "fetch_workers", "fetch_per_host",
+               "parse_workers", "shards", "max_response_mb", "dns_ttl", "breaker_threshold",
+               "dedupe_workers"}
+_FLOAT_FIELDS = {"dedupe_threshold", "min_relevance", "min_quality", "crawl_timeout"}
 _STR_FIELDS = {"format", "category", "since", "output", "source", "search", "sort",
                "exclude_source", "exclude_category", "exclude_domain", "feeds",
                "export_opml", "import_opml", "profile", "interests", "tag", "lang",
-               "exclude_lang", "tone", "watch", "group_by"}
+               "exclude_lang", "tone", "watch", "group_by", "shard_workers",
+               "egress", "egress_hosts", "dedupe_backend", "dedup_window"}
 
 
 def load_config() -> Dict[str, Any]:
@@ -68,6 +78,17 @@ def load_config() -> Dict[str, Any]:
     return config
 
 
+def load_rate_limits(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """The ``rate_limits`` mapping (domain → rate or {rate, burst}) from the config files."""
+    if config is None:
+        config = load_config()
+    limits = config.get("rate_limits") or {}
+    if not isinstance(limits, dict):
+        logger.warning("[Config] rate_limits must be a mapping of domain to rate; ignoring it")
+        return {}
+    return {str(k): v for k, v in limits.items()}
+
+
 def load_env_config() -> Dict[str, Any]:
     """Load config from CLAWLER_* environment variables.
 
@@ -160,11 +181,27 @@ _STARTER_CONFIG = """\
 # Fuzzy dedup threshold (0.0-1.0, higher = stricter)
 # dedupe_threshold: 0.75
 
+# Title similarity backend for dedup and --stories: difflib or vector (needs numpy)
+# dedupe_backend: difflib
+
+# Worker processes for deduplicating large batches (0 = in the main process)
+# dedupe_workers: 0
+
+# Dedup against stories from earlier runs within a window (source_count grows across runs)
+# dedup_index: false
+# dedup_window: 24h
+
 # Max parallel workers
 # workers: 6
 
 # HTTP request timeout (seconds)
 # timeout: 15
+
+# Per-domain request pace (requests/second, or rate + burst); a 429/503
+# from a host slows it down automatically
+# rate_limits:
+#   default: 2
+#   hnrss.org: {rate: 5, burst: 10}
 """
 
 
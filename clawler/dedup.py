@@ -1,9 +1,9 @@
 """Deduplication engine for Clawler."""
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 from clawler.models import Article
-from difflib import SequenceMatcher
+from clawler.title_index import title_index_for
 
 
 @dataclass
@@ -29,18 +29,43 @@ class DedupStats:
         )
 
 
+_workers = 0  # processes for blocked dedup (see configure_dedup_workers)
+
+
+def configure_dedup_workers(workers: int = 0):
+    """Dedup large batches in ``workers`` processes (0 or 1: in this one).
+
+    See :mod:`clawler.dedup_blocks`.
+    """
+    global _workers
+    _workers = max(0, workers)
+
+
+def get_dedup_workers() -> int:
+    """The process count :func:`deduplicate` uses for large batches."""
+    return _workers
+
+
 def deduplicate(articles: List[Article], similarity_threshold: float = 0.75,
-                stats: DedupStats | None = None, enabled: bool = True) -> List[Article]:
+                stats: DedupStats | None = None, enabled: bool = True,
+                backend: str | None = None, workers: int | None = None) -> List[Article]:
     """Remove duplicate articles using exact key + fingerprint + fuzzy title matching.
 
     Three-tier dedup strategy:
     1. Exact key match (title+url hash) — O(1) lookup
     2. Title fingerprint match (sorted significant words) — O(1) lookup, catches
        obvious cross-source duplicates cheaply
-    3. Fuzzy SequenceMatcher — O(n) per article, only reached if tiers 1-2 miss
+    3. Fuzzy SequenceMatcher — only reached if tiers 1-2 miss; compared against
+       the kept titles a :class:`~clawler.title_index.TitleIndex` proposes
+       (all of them for small sets, MinHash LSH candidates for large ones)
 
     Pass a DedupStats instance to collect per-tier statistics.
     Set enabled=False to skip dedup entirely (pass-through).
+    ``backend`` picks the tier 3 similarity backend ("difflib" or "vector",
+    default: :func:`~clawler.title_index.configure_dedup_backend`'s choice).
+    With ``workers`` > 1 (default: :func:`configure_dedup_workers`'s choice),
+    batches of ``PARALLEL_MIN_ARTICLES`` or more are split into blocks that
+    are deduplicated in parallel processes (:mod:`clawler.dedup_blocks`).
     """
     if stats is None:
         stats = DedupStats()
@@ -50,12 +75,38 @@ def deduplicate(articles: List[Article], similarity_threshold: float = 0.75,
         stats.unique_output = len(articles)
         return list(articles)
 
+    workers = _workers if workers is None else workers
+    if workers > 1:
+        from clawler.dedup_blocks import PARALLEL_MIN_ARTICLES, deduplicate_blocked
+        if len(articles) >= PARALLEL_MIN_ARTICLES:
+            return deduplicate_blocked(articles, similarity_threshold, stats, workers=workers, backend=backend)
+
+    unique, _ = _deduplicate(articles, similarity_threshold, stats, backend)
+    stats.unique_output = len(unique)
+    return unique
+
+
+def _deduplicate(articles: list, similarity_threshold: float, stats: DedupStats,
+                 backend: str | None = None, titles=None, weighted: bool = False) -> Tuple[list, List[int]]:
+    """The three tiers of :func:`deduplicate`, counted into ``stats``.
+
+    Returns the kept articles and, for each, the position in ``articles`` of
+    the first article of its story. :mod:`clawler.dedup_blocks` merges block
+    survivors with its own ``titles`` index, and ``weighted`` so a dropped
+    article adds its ``source_count`` to the kept one instead of 1.
+    """
     seen_keys: set = set()
     seen_fingerprints: dict = {}  # fingerprint -> index in unique
-    seen_titles: List[tuple] = []  # (title_lower, title_len, index in unique)
-    unique: List[Article] = []
+    if titles is None:
+        titles = title_index_for(similarity_threshold, backend)
+    seen_titles = titles  # slot == index in unique
+    seen_titles.prepare(a.normalized_title for a in articles)
+    unique: list = []
+    firsts: List[int] = []  # index in unique -> position of the story's first article
+
+    for pos, article in enumerate(articles):
+        count = article.source_count if weighted else 1
 
-    for article in articles:
         # Tier 1: exact dedup
         if article.dedup_key in seen_keys:
             stats.exact_dupes += 1
@@ -67,50 +118,112 @@ def deduplicate(articles: List[Article], similarity_threshold: float = 0.75,
             stats.fingerprint_dupes += 1
             # Keep the one with higher quality_score
             idx = seen_fingerprints[fp]
-            unique[idx].source_count += 1
+            unique[idx].source_count += count
             if article.quality_score > unique[idx].quality_score:
                 seen_keys.discard(unique[idx].dedup_key)
                 seen_keys.add(article.dedup_key)
                 unique[idx] = article
                 # Update title entry
-                for i, (t, tl, tidx) in enumerate(seen_titles):
-                    if tidx == idx:
-                        seen_titles[i] = (article.title.lower().strip(), len(article.title.lower().strip()), idx)
-                        break
+                seen_titles.replace(idx, article.normalized_title)
             continue
 
         # Tier 3: fuzzy title dedup
-        title_lower = article.title.lower().strip()
-        title_len = len(title_lower)
-        is_dupe = False
-        for i, (prev_title, prev_len, prev_idx) in enumerate(seen_titles):
-            if abs(title_len - prev_len) > max(title_len, prev_len) * (1 - similarity_threshold):
-                continue
-            if SequenceMatcher(None, title_lower, prev_title).ratio() > similarity_threshold:
-                stats.fuzzy_dupes += 1
-                # Keep higher quality
-                unique[prev_idx].source_count += 1
-                if article.quality_score > unique[prev_idx].quality_score:
-                    seen_keys.discard(unique[prev_idx].dedup_key)
-                    seen_keys.add(article.dedup_key)
-                    unique[prev_idx] = article
-                    # Update title entry for future comparisons
-                    seen_titles[i] = (title_lower, title_len, prev_idx)
-                    # Update fingerprint map if new article has one
-                    if fp:
-                        seen_fingerprints[fp] = prev_idx
-                is_dupe = True
-                break
-
-        if is_dupe:
+        title_lower = article.normalized_title
+        prev_idx = seen_titles.find(title_lower)
+        if prev_idx is not None:
+            stats.fuzzy_dupes += 1
+            # Keep higher quality
+            unique[prev_idx].source_count += count
+            if article.quality_score > unique[prev_idx].quality_score:
+                seen_keys.discard(unique[prev_idx].dedup_key)
+                seen_keys.add(article.dedup_key)
+                unique[prev_idx] = article
+                # Update title entry for future comparisons
+                seen_titles.replace(prev_idx, title_lower)
+                # Update fingerprint map if new article has one
+                if fp:
+                    seen_fingerprints[fp] = prev_idx
             continue
 
         idx = len(unique)
         seen_keys.add(article.dedup_key)
         if fp:
             seen_fingerprints[fp] = idx
-        seen_titles.append((title_lower, title_len, idx))
+        seen_titles.add(title_lower)
         unique.append(article)
+        firsts.append(pos)
 
-    stats.unique_output = len(unique)
-    return unique
+    return unique, firsts
+
+
+class Deduplicator:
+    """Incremental deduplicator for streamed articles.
+
+    Same three tiers and threshold as :func:`deduplicate`, but articles are
+    checked one at a time against everything already accepted. Accepted
+    articles have typically been emitted already, so the first version of a
+    story wins; later duplicates only bump its ``source_count``.
+
+        dd = Deduplicator(similarity_threshold=0.75)
+        for article in incoming:
+            if dd.add(article):
+                emit(article)
+    """
+
+    def __init__(self, similarity_threshold: float = 0.75, stats: DedupStats | None = None,
+                 enabled: bool = True, backend: str | None = None):
+        self.similarity_threshold = similarity_threshold
+        self.stats = stats if stats is not None else DedupStats()
+        self.enabled = enabled
+        self._keys: set = set()
+        self._fingerprints: dict = {}  # fingerprint -> accepted article
+        self._titles = title_index_for(similarity_threshold, backend)
+        self._accepted: List[Article] = []  # by title slot
+
+    def add(self, article: Article) -> bool:
+        """Return True if ``article`` is new (and remember it), False if it's a duplicate."""
+        stats = self.stats
+        stats.total_input += 1
+        if not self.enabled:
+            stats.unique_output += 1
+            return True
+
+        # Tier 1: exact dedup
+        key = article.dedup_key
+        if key in self._keys:
+            stats.exact_dupes += 1
+            return False
+
+        # Tier 2: fingerprint dedup
+        fp = article.title_fingerprint
+        if fp and fp in self._fingerprints:
+            stats.fingerprint_dupes += 1
+            self._fingerprints[fp].source_count += 1
+            return False
+
+        # Tier 3: fuzzy title dedup
+        title_lower = article.normalized_title
+        slot = self._titles.find(title_lower)
+        if slot is not None:
+            stats.fuzzy_dupes += 1
+            self._accepted[slot].source_count += 1
+            return False
+
+        self._keys.add(key)
+        if fp:
+            self._fingerprints[fp] = article
+        self._titles.add(title_lower)
+        self._accepted.append(article)
+        stats.unique_output += 1
+        return True
+
+    def prepare(self, articles: Iterable[Article]):
+        """Hint that ``articles`` are about to be added, so a bulk backend can index them at once."""
+        if self.enabled:
+            self._titles.prepare(a.normalized_title for a in articles)
+
+    def filter(self, articles: Iterable[Article]) -> Iterator[Article]:
+        """Yield only the new articles from ``articles``."""
+        for article in articles:
+            if self.add(article):
+                yield article
@@ -0,0 +1,205 @@
+"""Blocked dedup across processes, for large batches (``--dedupe-workers``).
+
+:func:`~clawler.dedup.deduplicate` is a single Python loop, so a large
+backfill (a week of archived feeds, say) runs on one core however many the
+machine has. :func:`deduplicate_blocked` splits the work in three steps:
+
+1. **Blocking.** Each article's block comes from a cheap key: the rarest
+   significant title word (longer than 3 letters, as in fingerprints) that
+   at least one other title in the batch also has. A word no other title
+   has can't bring two copies together. Copies of a story share most of
+   their words, so they usually share that one and land together.
+   Titles without such a word are blocked by their whole normalized title.
+2. **Blocks in parallel.** Blocks are hashed into ``workers * CHUNKS_PER_WORKER``
+   chunks, and each chunk is deduplicated with the usual three tiers in a
+   process pool. Workers receive each article's keys, title and quality,
+   not the article itself.
+3. **Merge.** The chunks' survivors run through the same tiers once more,
+   in the order their stories first appeared, to catch copies that landed
+   in different chunks. Only pairs from different chunks that share one of
+   their ``RARE_WORDS`` rarest shared words are compared; pairs from the
+   same chunk were compared there. The same rules as within a chunk apply:
+   the higher-quality article is kept, and a dropped survivor adds the
+   sources it had already gathered to the kept one's ``source_count``.
+
+Smaller chunks also mean fewer look-alike candidates per title, so blocked
+dedup is faster than a single pass even in one process. The kept stories
+match single-process dedup except for the odd title that sits near the
+threshold of two stories and joins the other one, because the greedy order
+differs (``benchmarks/bench_dedup.py --workers N --compare`` counts them).
+Only the merge is serial. If the pool can't start, the chunks are
+deduplicated in this process instead.
+"""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import pickle
+import string
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, List, Optional, Tuple
+
+from clawler.dedup import DedupStats, _deduplicate
+from clawler.models import Article
+from clawler.title_index import TitleIndex, get_dedup_backend
+
+logger = logging.getLogger(__name__)
+
+PARALLEL_MIN_ARTICLES = 5000  # smaller batches aren't worth starting processes for
+CHUNKS_PER_WORKER = 4  # more chunks than workers evens out uneven blocks
+RARE_WORDS = 3  # rarest shared words relating survivors of different chunks
+
+_PUNCTUATION = string.punctuation + "‘’“”—–…"
+
+
+class _Entry:
+    """The fields the dedup tiers read, shipped to a worker instead of the article."""
+    __slots__ = ("position", "dedup_key", "title_fingerprint", "normalized_title", "quality_score",
+                 "source_count")
+
+    def __init__(self, position: int, dedup_key: str, title_fingerprint: str, normalized_title: str,
+                 quality_score: float):
+        self.position = position
+        self.dedup_key = dedup_key
+        self.title_fingerprint = title_fingerprint
+        self.normalized_title = normalized_title
+        self.quality_score = quality_score
+        self.source_count = 1
+
+
+def _words(title: str) -> set:
+    return {w for w in (w.strip(_PUNCTUATION) for w in title.split()) if len(w) > 3}
+
+
+class _Blocking:
+    """Blocking keys for one batch: each title's rarest words shared with another."""
+
+    def __init__(self, titles: List[str], n_chunks: int):
+        self.n_chunks = n_chunks
+        self.df = Counter(w for t in titles for w in _words(t))
+
+    def rare(self, words: set) -> List[str]:
+        """The ``RARE_WORDS`` rarest of ``words`` that another title also has, rarest first."""
+        df = self.df
+        return sorted((w for w in words if df[w] > 1), key=lambda w: (df[w], w))[:RARE_WORDS]
+
+    def key(self, title: str, words: set) -> str:
+        rare = self.rare(words)
+        return rare[0] if rare else title
+
+    def chunk(self, key: str) -> int:
+        return zlib.crc32(key.encode()) % self.n_chunks
+
+
+def blocking_keys(articles: List[Article]) -> List[str]:
+    """Each article's blocking key: its rarest title word shared with another title."""
+    blocking = _Blocking([a.normalized_title for a in articles], 1)
+    return [blocking.key(a.normalized_title, _words(a.normalized_title)) for a in articles]
+
+
+class _MergeIndex(TitleIndex):
+    """Title index for merging chunk survivors.
+
+    Pairs from the same chunk were compared there. Copies that landed in
+    different chunks have different rarest words but still share most of
+    their words, so a candidate from another chunk must also contain one of
+    the title's ``RARE_WORDS`` rarest shared words, or the other way round.
+    """
+
+    def __init__(self, threshold: float, blocking: _Blocking):
+        super().__init__(threshold)
+        self.blocking = blocking
+        self._blocks: List[Tuple[int, List[str], set]] = []  # slot -> (chunk, rarest words, words)
+
+    def _block(self, title: str) -> Tuple[int, List[str], set]:
+        words = _words(title)
+        rare = self.blocking.rare(words)
+        return self.blocking.chunk(rare[0] if rare else title), rare, words
+
+    def find(self, title: str, admit: Optional[Callable[[int], bool]] = None) -> Optional[int]:
+        chunk, rare, words = self._block(title)
+        blocks = self._blocks
+
+        def related(slot: int) -> bool:
+            other_chunk, other_rare, other_words = blocks[slot]
+            return (other_chunk != chunk
+                    and (not other_words.isdisjoint(rare) or not words.isdisjoint(other_rare))
+                    and (admit is None or admit(slot)))
+
+        return super().find(title, related)
+
+    def add(self, title: str) -> int:
+        self._blocks.append(self._block(title))
+        return super().add(title)
+
+    def replace(self, slot: int, title: str):
+        self._blocks[slot] = self._block(title)
+        super().replace(slot, title)
+
+
+def _dedup_chunk(entries: List[_Entry], similarity_threshold: float,
+                 backend: str) -> Tuple[List[Tuple[int, int, int]], Tuple[int, int, int]]:
+    """Dedup one chunk in a worker.
+
+    Returns ``(position, source_count, first position)`` per survivor and the
+    per-tier duplicate counts.
+    """
+    stats = DedupStats()
+    unique, firsts = _deduplicate(entries, similarity_threshold, stats, backend)
+    survivors = [(e.position, e.source_count, entries[first].position) for e, first in zip(unique, firsts)]
+    return survivors, (stats.exact_dupes, stats.fingerprint_dupes, stats.fuzzy_dupes)
+
+
+def _run_chunks(chunks: List[List[_Entry]], similarity_threshold: float, backend: str, workers: int) -> list:
+    if workers > 1:
+        try:
+            # spawn: forking a process full of crawl threads can deadlock
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                return list(pool.map(_dedup_chunk, chunks, [similarity_threshold] * len(chunks),
+                                     [backend] * len(chunks)))
+        except (pickle.PicklingError, BrokenProcessPool, OSError) as e:
+            logger.warning(f"[Dedup] Process pool unavailable ({e}); deduplicating blocks inline")
+    return [_dedup_chunk(chunk, similarity_threshold, backend) for chunk in chunks]
+
+
+def deduplicate_blocked(articles: List[Article], similarity_threshold: float = 0.75,
+                        stats: DedupStats | None = None, workers: int = 2,
+                        backend: Optional[str] = None) -> List[Article]:
+    """Same contract as :func:`~clawler.dedup.deduplicate`, with blocks deduplicated in ``workers`` processes.
+
+    ``workers`` <= 1 deduplicates the blocks one after another in this process.
+    """
+    if stats is None:
+        stats = DedupStats()
+    stats.total_input = len(articles)
+    backend = backend or get_dedup_backend()  # spawned workers don't inherit the setting
+
+    n_chunks = max(1, workers) * CHUNKS_PER_WORKER
+    blocking = _Blocking([a.normalized_title for a in articles], n_chunks)
+    chunks: List[List[_Entry]] = [[] for _ in range(n_chunks)]
+    for pos, article in enumerate(articles):
+        title = article.normalized_title
+        chunks[blocking.chunk(blocking.key(title, _words(title)))].append(
+            _Entry(pos, article.dedup_key, article.title_fingerprint, title, article.quality_score))
+    chunks = [c for c in chunks if c]
+
+    survivors = []  # (first position of the story, position of its best article)
+    for found, (exact, fingerprint, fuzzy) in _run_chunks(chunks, similarity_threshold, backend, workers):
+        for pos, count, first in found:
+            articles[pos].source_count += count - 1
+            survivors.append((first, pos))
+        stats.exact_dupes += exact
+        stats.fingerprint_dupes += fingerprint
+        stats.fuzzy_dupes += fuzzy
+    survivors.sort()
+
+    kept = [articles[pos] for _, pos in survivors]
+    unique, _ = _deduplicate(kept, similarity_threshold, stats,
+                             titles=_MergeIndex(similarity_threshold, blocking), weighted=True)
+    stats.unique_output = len(unique)
+    logger.info(f"[Dedup] {len(articles)} articles in {len(chunks)} blocks on {workers} process(es): "
+                f"{len(kept)} block survivors → {len(unique)} after merge")
+    return unique
@@ -0,0 +1,277 @@
+"""Persistent dedup index: stories from recent runs, merged into incrementally.
+
+Each run normally dedups its own crawl from scratch, and ``--history`` can
+only drop exact repeats. With ``--dedup-index`` a run's articles are checked
+against the stories kept over the last ``--dedup-window`` (default 24h) as
+well: a new cross-source copy of a story first seen an hour ago joins that
+story, and the story's ``source_count`` grows across runs.
+
+A story remembers the dedup key and title fingerprint of every article that
+joined it and the title it is matched by (its best article's). Articles seen
+again in later runs — most of any crawl — are recognized by key in O(1), so
+only genuinely new items reach the fuzzy tier, which compares them against
+the window's titles through a :class:`~clawler.title_index.TitleIndex`.
+``source_count`` is the number of distinct articles a story has gathered,
+so re-crawling the same feeds never inflates it.
+
+The index lives in ``~/.cache/clawler/dedup_index.json``. Within one process
+(``--watch``) it stays loaded between runs; stories that age out of the
+window are skipped until the next compaction rather than re-indexed every run.
+
+Usage:
+    clawler --dedup-index                       # 24h window
+    clawler --dedup-index --dedup-window 6h --watch 5m
+    clawler --clear-dedup-index
+"""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from clawler.dedup import DedupStats
+from clawler.models import Article
+from clawler.title_index import title_index_for
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_DIR = Path.home() / ".cache" / "clawler"
+INDEX_FILE = "dedup_index.json"
+DEFAULT_WINDOW = 86400  # 24 hours
+
+
+@dataclass
+class Story:
+    """One kept story: its best article's identity plus everything that joined it."""
+    title: str  # normalized title fuzzy matches compare against
+    key: str  # dedup key of the best article so far
+    quality: float
+    first_seen: float
+    last_seen: float
+    members: List[str] = field(default_factory=list)  # dedup keys of every article in the story
+    fingerprints: List[str] = field(default_factory=list)
+
+    @property
+    def source_count(self) -> int:
+        return len(self.members)
+
+    def to_dict(self) -> dict:
+        return {"title": self.title, "key": self.key, "quality": self.quality,
+                "first_seen": self.first_seen, "last_seen": self.last_seen,
+                "members": self.members, "fingerprints": self.fingerprints}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Story":
+        return cls(title=d["title"], key=d["key"], quality=float(d.get("quality", 0.5)),
+                   first_seen=float(d["first_seen"]), last_seen=float(d["last_seen"]),
+                   members=list(d.get("members", [])), fingerprints=list(d.get("fingerprints", [])))
+
+
+class DedupIndex:
+    """Stories kept within ``window`` seconds, for deduplicating run after run."""
+
+    def __init__(self, path: Optional[Path] = None, window: float = DEFAULT_WINDOW,
+                 similarity_threshold: float = 0.75):
+        self.path = path
+        self.window = window
+        self.similarity_threshold = similarity_threshold
+        self.stories: List[Story] = []  # by title slot
+        self._by_key: Dict[str, int] = {}  # member dedup key -> story
+        self._by_fingerprint: Dict[str, int] = {}
+        self._titles = title_index_for(similarity_threshold)
+        self._expired = 0  # stories past the window still in the in-memory index
+        self._mtime: Optional[float] = None  # of the file as we last read or wrote it
+
+    def __len__(self) -> int:
+        return len(self.stories) - self._expired
+
+    # -- matching -----------------------------------------------------------
+
+    def _live(self, slot: int, now: float) -> bool:
+        return now - self.stories[slot].last_seen < self.window
+
+    def _add_story(self, story: Story) -> int:
+        slot = self._titles.add(story.title)
+        self.stories.append(story)
+        for key in story.members:
+            self._by_key[key] = slot
+        for fp in story.fingerprints:
+            self._by_fingerprint[fp] = slot
+        return slot
+
+    def deduplicate(self, articles: List[Article], stats: DedupStats | None = None,
+                    now: Optional[float] = None) -> List[Article]:
+        """Dedup ``articles`` against the index and each other, updating the index.
+
+        Returns one article per story touched by this batch — its best one
+        from this batch, in order of first appearance — with ``source_count``
+        set to the story's total across runs. Call :meth:`save` to persist.
+        """
+        if stats is None:
+            stats = DedupStats()
+        stats.total_input = len(articles)
+        now = time.time() if now is None else now
+        self._expire(now)
+
+        def live(slot: int) -> bool:
+            return self._live(slot, now)
+
+        self._titles.prepare(a.normalized_title for a in articles)
+        best: Dict[int, Article] = {}  # story slot -> best article from this batch (insertion = output order)
+        carried = 0
+        for article in articles:
+            key = article.dedup_key
+            slot = self._by_key.get(key)
+            if slot is not None and live(slot):
+                if slot in best:
+                    stats.exact_dupes += 1
+            else:
+                fp = article.title_fingerprint
+                slot = self._by_fingerprint.get(fp) if fp else None
+                if slot is not None and live(slot):
+                    if slot in best:
+                        stats.fingerprint_dupes += 1
+                else:
+                    title = article.normalized_title
+                    slot = self._titles.find(title, admit=live)
+                    if slot is None:
+                        slot = self._add_story(Story(title=title, key=key, quality=article.quality_score,
+                                                     first_seen=now, last_seen=now))
+                    elif slot in best:
+                        stats.fuzzy_dupes += 1
+                self._join(slot, article, key, fp)
+            story = self.stories[slot]
+            story.last_seen = now
+            if slot not in best:
+                if story.first_seen < now:
+                    carried += 1
+                best[slot] = article
+            elif article.quality_score > best[slot].quality_score:
+                best[slot] = article
+
+        unique = []
+        for slot, article in best.items():
+            article.source_count = self.stories[slot].source_count
+            unique.append(article)
+        stats.unique_output = len(unique)
+        logger.info(f"[DedupIndex] {len(articles)} input → {len(unique)} stories "
+                    f"({carried} from earlier runs, {len(self)} in window)")
+        return unique
+
+    def _join(self, slot: int, article: Article, key: str, fp: str):
+        """Add a not-yet-seen article to story ``slot``; the better article leads."""
+        story = self.stories[slot]
+        story.members.append(key)
+        self._by_key[key] = slot
+        if fp and self._by_fingerprint.get(fp) != slot:  # unmapped, or mapped to an expired story
+            story.fingerprints.append(fp)
+            self._by_fingerprint[fp] = slot
+        if len(story.members) > 1 and article.quality_score > story.quality:
+            story.key, story.quality = key, article.quality_score
+            story.title = article.normalized_title
+            self._titles.replace(slot, story.title)
+
+    def _expire(self, now: float):
+        self._expired = sum(1 for slot in range(len(self.stories)) if not self._live(slot, now))
+        # Rebuild once most of the index is dead weight
+        if self._expired and self._expired * 2 >= len(self.stories):
+            live = [s for slot, s in enumerate(self.stories) if self._live(slot, now)]
+            self._reset()
+            for story in live:
+                self._add_story(story)
+
+    def _reset(self):
+        self.stories = []
+        self._by_key = {}
+        self._by_fingerprint = {}
+        self._titles = title_index_for(self.similarity_threshold)
+        self._expired = 0
+
+    # -- persistence --------------------------------------------------------
+
+    def load(self):
+        """(Re)read the index file, dropping stories outside the window."""
+        self._reset()
+        self._mtime = None
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            mtime = self.path.stat().st_mtime
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            now = time.time()
+            for d in data.get("stories", []):
+                story = Story.from_dict(d)
+                if now - story.last_seen < self.window:
+                    self._add_story(story)
+            self._mtime = mtime
+        except Exception as e:
+            logger.warning(f"[DedupIndex] Failed to load: {e}")
+            self._reset()
+
+    def save(self):
+        """Write the stories still inside the window."""
+        if self.path is None:
+            return
+        now = time.time()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            stories = [s.to_dict() for slot, s in enumerate(self.stories) if self._live(slot, now)]
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"stories": stories, "updated_at": now}, ensure_ascii=False),
+                           encoding="utf-8")
+            tmp.replace(self.path)
+            self._mtime = self.path.stat().st_mtime
+        except Exception as e:
+            logger.warning(f"[DedupIndex] Failed to save: {e}")
+
+    @property
+    def stale(self) -> bool:
+        """True if the file changed since we last read or wrote it (another process ran)."""
+        try:
+            mtime = self.path.stat().st_mtime if self.path is not None and self.path.exists() else None
+        except OSError:
+            mtime = None
+        return mtime != self._mtime
+
+
+_indexes: Dict[Path, DedupIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def _index_path(index_dir: Path = DEFAULT_INDEX_DIR) -> Path:
+    return index_dir / INDEX_FILE
+
+
+def open_dedup_index(window: float = DEFAULT_WINDOW, similarity_threshold: float = 0.75,
+                     index_dir: Path = DEFAULT_INDEX_DIR) -> DedupIndex:
+    """The dedup index in ``index_dir``, kept loaded for later calls in this process.
+
+    It is re-read only when the file was changed by someone else, or the
+    threshold changed.
+    """
+    path = _index_path(index_dir)
+    with _indexes_lock:
+        index = _indexes.get(path)
+        if index is None or index.similarity_threshold != similarity_threshold:
+            index = _indexes[path] = DedupIndex(path, window, similarity_threshold)
+            index.load()
+        else:
+            index.window = window
+            if index.stale:
+                index.load()
+        return index
+
+
+def clear_dedup_index(index_dir: Path = DEFAULT_INDEX_DIR) -> bool:
+    """Remove the index file. Returns True if a file was removed."""
+    path = _index_path(index_dir)
+    with _indexes_lock:
+        _indexes.pop(path, None)
+    if path.exists():
+        path.unlink()
+        return True
+    return False
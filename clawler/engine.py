@@ -1,46 +1,319 @@
 """Core crawl engine."""
+import asyncio
+import heapq
 import logging
+import math
 import time
-from typing import Dict, List, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import threading
+from concurrent.futures import Future, FIRST_COMPLETED, wait
 from clawler.models import Article
-from clawler.sources.base import BaseSource
+from clawler.sources.base import BaseSource, FetchCoalescer
 from clawler.registry import build_sources
 # Re-export all source classes for backward compatibility
 from clawler.sources import *  # noqa: F401,F403
-from clawler.dedup import deduplicate, DedupStats
+from clawler.dedup import deduplicate, DedupStats, Deduplicator
+from clawler.dedup_index import DedupIndex
 from clawler.weights import get_quality_score
 from clawler.health import HealthTracker
+from clawler.circuit import DEFAULT_THRESHOLD, HALF_OPEN, OPEN, source_key
+from clawler.pool import DaemonThreadPool
+from clawler.pushdown import CrawlFilter, PushdownStats
+from clawler.prewarm import PREWARM_BUDGET, PrewarmStats, plan_hosts, prewarm
 
 logger = logging.getLogger(__name__)
 
 # Default per-source crawl timeout in seconds (None = no limit)
 DEFAULT_SOURCE_TIMEOUT = 60
 
+# Seconds a source may run past its deadline to hand back partial results
+# before it is abandoned (capped at half the source timeout)
+DEADLINE_GRACE = 2.0
+
+_POLL_SECONDS = 0.5
+
+# Upper bound on the pool size chosen by ``auto_workers``
+AUTO_WORKERS_CAP = 32
+
 
 class CrawlEngine:
     """Orchestrates crawling across all sources."""
 
     def __init__(self, sources: Optional[List[BaseSource]] = None, max_workers: int = 6,
-                 retries: int = 1, source_timeout: Optional[float] = DEFAULT_SOURCE_TIMEOUT):
+                 retries: int = 1, source_timeout: Optional[float] = DEFAULT_SOURCE_TIMEOUT,
+                 crawl_timeout: Optional[float] = None, auto_workers: bool = False,
+                 crawl_filter: Optional[CrawlFilter] = None, prewarm: bool = False,
+                 breaker_threshold: int = DEFAULT_THRESHOLD):
         self.sources = sources or self._default_sources()
         self.max_workers = max_workers
         self.retries = retries
         self.source_timeout = source_timeout
+        self.crawl_timeout = crawl_timeout
+        self.auto_workers = auto_workers
         self.health = HealthTracker()
+        self.health.breaker.threshold = breaker_threshold
+        self.circuit_skipped: List[str] = []  # sources skipped last crawl because their circuit was open
+        self._probes: set = set()  # sources running as a half-open probe (no retries)
+        self.timings: Dict[str, float] = {}  # source name -> ms of its last successful run
+        self.coalescer: Optional[FetchCoalescer] = None  # fetches shared between sources, last crawl
+        self.prewarm = prewarm
+        self.prewarm_stats: Optional[PrewarmStats] = None  # last crawl's pre-warm phase, if run
+        self.dedup_index: Optional[DedupIndex] = None  # dedup against earlier runs too (see clawler.dedup_index)
+        # Drop sources/feeds that can't match the query before any network I/O
+        self.pushdown = PushdownStats()
+        if crawl_filter is not None and crawl_filter.active:
+            self.sources, self.pushdown = crawl_filter.prune(self.sources)
 
     @staticmethod
     def _default_sources() -> List[BaseSource]:
         """Instantiate all registered sources via the central registry."""
         return build_sources()
 
+    def _schedule(self) -> Tuple[List[BaseSource], int]:
+        """Return sources in start order and the worker count to run them with.
+
+        Sources start longest-expected-first (p95 of their recorded crawl
+        times), so a slow source never gets picked up at the tail of the
+        crawl. Sources with no timing history go first, in registry order.
+
+        With ``auto_workers`` the pool is sized so the expected work fits
+        in about the time of the slowest source: total expected time over
+        the longest, plus one worker per unknown source, never below
+        ``max_workers`` and capped at ``AUTO_WORKERS_CAP``.
+        """
+        expected = {id(src): self.health.expected_ms(src.name) for src in self.sources}
+        unknown = [src for src in self.sources if expected[id(src)] is None]
+        known = sorted((src for src in self.sources if expected[id(src)] is not None),
+                       key=lambda src: expected[id(src)], reverse=True)
+        workers = self.max_workers
+        if self.auto_workers:
+            needed = len(unknown)
+            if known:
+                longest = expected[id(known[0])]
+                total = sum(expected[id(src)] for src in known)
+                needed += math.ceil(total / longest) if longest > 0 else len(known)
+            workers = min(max(workers, needed), AUTO_WORKERS_CAP)
+        return unknown + known, workers
+
+    def _admit_sources(self, ordered: List[BaseSource]) -> List[BaseSource]:
+        """Drop sources whose circuit is open; note the ones running as a half-open probe."""
+        breaker = self.health.breaker
+        admitted: List[BaseSource] = []
+        self.circuit_skipped, self._probes = [], set()
+        for src in ordered:
+            state = breaker.admit(source_key(src.name))
+            if state == OPEN:
+                self.circuit_skipped.append(src.name)
+                continue
+            if state == HALF_OPEN:
+                self._probes.add(src)
+            admitted.append(src)
+        if self.circuit_skipped:
+            logger.warning(f"[Engine] Circuit open, skipping: {', '.join(self.circuit_skipped)}")
+        return admitted
+
+    def _prepare_sources(self):
+        """Hand every source this crawl's ``FetchCoalescer`` and circuit breaker; meter the hosts and bytes it fetches."""
+        self.coalescer = FetchCoalescer()
+        for src in self.sources:
+            if isinstance(src, BaseSource):
+                src.set_coalescer(self.coalescer)
+                src.set_breaker(self.health.breaker)
+                src.track_hosts()
+                src.track_traffic()
+
+    def _release_sources(self):
+        for src in self.sources:
+            if isinstance(src, BaseSource):
+                src.set_coalescer(None)
+                src.set_breaker(None)
+        self.health.breaker.clear_probes()
+        if self.coalescer is not None and (self.coalescer.saved or self.coalescer.parses_saved):
+            logger.info(f"[Engine] Coalescing saved {self.coalescer.saved} of {self.coalescer.requests} "
+                        f"fetches and {self.coalescer.parses_saved} feed parses")
+
+    def _prewarm(self):
+        """Open connections to the hosts the sources are about to hit (see ``clawler.prewarm``)."""
+        if not self.prewarm:
+            return
+        budget = PREWARM_BUDGET
+        if self.crawl_timeout is not None:
+            budget = min(budget, self.crawl_timeout / 4)
+        try:
+            self.prewarm_stats = prewarm(plan_hosts(self.sources, self.health), budget=budget)
+        except Exception as e:  # an optimization only; the crawl connects as usual
+            logger.warning(f"[Engine] Pre-warming connections failed: {e}")
+
+    def _deadline_grace(self) -> float:
+        """Extra time a source gets after its deadline to return partial results."""
+        budget = min(t for t in (self.source_timeout, self.crawl_timeout) if t is not None)
+        return min(DEADLINE_GRACE, budget / 2)
+
+    def _source_deadline(self, start: float, crawl_deadline: Optional[float]) -> Optional[float]:
+        """Deadline for a source attempt starting at ``start``: its own timeout, capped by the crawl's."""
+        own = start + self.source_timeout if self.source_timeout is not None else None
+        if own is None or crawl_deadline is None:
+            return own if crawl_deadline is None else crawl_deadline
+        return min(own, crawl_deadline)
+
     @staticmethod
-    def _timed_crawl(src: BaseSource):
-        """Run a source's crawl and return (articles, elapsed_ms)."""
+    def _retry_delay(attempt: int) -> float:
+        """Backoff before retry number ``attempt`` (1-based)."""
+        return 2.0 * attempt
+
+    def _run_budgeted(self, src: BaseSource, starts: Optional[Dict[BaseSource, float]] = None,
+                      crawl_deadline: Optional[float] = None,
+                      on_start: Optional[Callable[[float], None]] = None):
+        """Worker body: give ``src`` its deadline and crawl it.
+
+        The start time is reported through ``starts`` and/or ``on_start``
+        before the crawl begins, so callers can time the attempt from when
+        it actually got a worker rather than from when it was queued.
+
+        Returns (articles, elapsed_ms, partial) where ``partial`` is True if the
+        source's budget ran out and it returned what it had collected so far.
+        """
         t0 = time.monotonic()
-        articles = src.crawl()
+        if starts is not None:
+            starts[src] = t0
+        if on_start is not None:
+            on_start(t0)
+        deadline = self._source_deadline(t0, crawl_deadline)
+        budgeted = isinstance(src, BaseSource) and deadline is not None
+        if budgeted:
+            src.set_deadline(deadline)
+        try:
+            articles = src.crawl()
+            partial = budgeted and src.budget_expired
+        finally:
+            if budgeted:
+                src.set_deadline(None)
         elapsed_ms = (time.monotonic() - t0) * 1000
-        return articles, elapsed_ms
+        return articles, elapsed_ms, partial
+
+    def _record_success(self, src: BaseSource, articles: List[Article], elapsed_ms: float,
+                        partial: bool, stats: Dict[str, int], retries_used: int = 0):
+        label = f"retry {retries_used} succeeded:" if retries_used else "returned"
+        note = " (partial: budget expired)" if partial else ""
+        logger.info(f"[Engine] {src.name} {label} {len(articles)} articles in {elapsed_ms:.0f}ms{note}")
+        stats[src.name] = len(articles)
+        self.timings[src.name] = elapsed_ms
+        hosts = src.hosts_contacted if isinstance(src, BaseSource) else None
+        traffic = src.traffic if isinstance(src, BaseSource) else None
+        self.health.record_success(src.name, len(articles), response_ms=elapsed_ms, retries_used=retries_used,
+                                   hosts=hosts, traffic=traffic)
+        self.health.breaker.record_success(source_key(src.name))
+
+    def _record_failure(self, src: BaseSource, stats: Dict[str, int]):
+        stats[src.name] = -1
+        self.health.record_failure(src.name, traffic=src.traffic if isinstance(src, BaseSource) else None)
+        self.health.breaker.record_failure(source_key(src.name))
+
+    def _iter_results(self, stats: Dict[str, int]) -> Iterator[Tuple[BaseSource, List[Article]]]:
+        """Run all sources and yield (source, articles) as each one succeeds.
+
+        Every source gets ``source_timeout`` seconds from when it starts
+        running, and nothing runs past ``crawl_timeout`` seconds from the
+        start of the crawl. Sources see their deadline through
+        ``BaseSource.set_deadline`` and wind down on their own, returning
+        partial results; one that is still running ``_deadline_grace()``
+        seconds after its deadline is abandoned and marked failed. Workers are
+        daemon threads and the pool is shut down without waiting, so a stuck
+        source never holds up the end of the crawl.
+
+        Sources start in the order chosen by ``_schedule``. A failed source
+        is retried up to ``retries`` times. Each retry is put
+        back on the same pool once its backoff has elapsed, so retries of
+        different sources overlap with each other and with sources still
+        running. A retry that could not start before the crawl deadline is
+        not attempted. Fills ``stats`` and health data as it goes.
+        """
+        crawl_start = time.monotonic()
+        crawl_deadline = crawl_start + self.crawl_timeout if self.crawl_timeout is not None else None
+        bounded = self.source_timeout is not None or crawl_deadline is not None
+        grace = self._deadline_grace() if bounded else 0.0
+        ordered, workers = self._schedule()
+        ordered = self._admit_sources(ordered)
+        self._prepare_sources()
+        self._prewarm()
+
+        pool = DaemonThreadPool(max_workers=workers, thread_name_prefix="clawler-worker")
+        starts: Dict[BaseSource, float] = {}
+        running: Dict[Future, Tuple[BaseSource, int]] = {}
+        delayed: List[Tuple[float, int, BaseSource, int]] = []  # heap of (ready_at, seq, src, attempt)
+        seq = 0
+        wakeup = threading.Event()
+        abandoned = 0
+
+        def submit(src: BaseSource, attempt: int):
+            starts.pop(src, None)
+            future = pool.submit(self._run_budgeted, src, starts, crawl_deadline)
+            running[future] = (src, attempt)
+
+        def cutoff(src: BaseSource) -> Optional[float]:
+            deadline = self._source_deadline(starts[src], crawl_deadline)
+            return None if deadline is None else deadline + grace
+
+        for src in ordered:
+            submit(src, 0)
+        try:
+            while running or delayed:
+                now = time.monotonic()
+                while delayed and delayed[0][0] <= now:
+                    _ready, _seq, src, attempt = heapq.heappop(delayed)
+                    submit(src, attempt)
+
+                # Sleep until the next event: a result, a retry becoming due,
+                # or a running source passing its cutoff.
+                wake_at = [delayed[0][0]] if delayed else []
+                if bounded:
+                    for src, _attempt in running.values():
+                        if src in starts:
+                            wake_at.append(cutoff(src))
+                        else:
+                            # Queued: gets its deadline when it starts; re-check soon
+                            wake_at.append(now + _POLL_SECONDS)
+                wait_timeout = max(0.0, min(wake_at) - now) if wake_at else None
+                if running:
+                    done, _ = wait(list(running), timeout=wait_timeout, return_when=FIRST_COMPLETED)
+                else:
+                    done = set()
+                    wakeup.wait(wait_timeout)
+
+                for future in done:
+                    src, attempt = running.pop(future)
+                    try:
+                        articles, elapsed_ms, partial = future.result()
+                    except Exception as e:
+                        label = f"retry {attempt}" if attempt else "crawl"
+                        logger.error(f"[Engine] {src.name} {label} failed: {e}")
+                        if attempt >= self.retries or src in self._probes:
+                            self._record_failure(src, stats)
+                            continue
+                        ready_at = time.monotonic() + self._retry_delay(attempt + 1)
+                        if crawl_deadline is not None and ready_at >= crawl_deadline:
+                            logger.error(f"[Engine] {src.name} not retried: crawl budget exhausted")
+                            self._record_failure(src, stats)
+                            continue
+                        seq += 1
+                        heapq.heappush(delayed, (ready_at, seq, src, attempt + 1))
+                        continue
+                    self._record_success(src, articles, elapsed_ms, partial, stats, retries_used=attempt)
+                    yield src, articles
+
+                if bounded:
+                    now = time.monotonic()
+                    for future, (src, _attempt) in list(running.items()):
+                        if src in starts and now >= cutoff(src):
+                            logger.error(f"[Engine] {src.name} timed out after {(now - starts[src]):.1f}s")
+                            self._record_failure(src, stats)
+                            del running[future]
+                            abandoned += 1
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._release_sources()
+        if abandoned:
+            logger.warning(f"[Engine] Abandoned {abandoned} unresponsive source thread(s)")
 
     def crawl(self, dedupe_threshold: float = 0.75, dedupe_enabled: bool = True) -> Tuple[List[Article], Dict[str, int], DedupStats]:
         """Run all sources in parallel, deduplicate, and return sorted articles + per-source stats + dedup stats."""
@@ -48,69 +321,59 @@ class CrawlEngine:
         stats: Dict[str, int] = {}
         dedup_stats = DedupStats()
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
-            futures = {pool.submit(self._timed_crawl, src): src for src in self.sources}
-            failed_sources = []
-            timed_out_futures = set()
+        for _src, articles in self._iter_results(stats):
+            all_articles.extend(articles)
 
-            # Use as_completed with an overall timeout if source_timeout is set.
-            # This handles the case where sources hang: after the timeout window,
-            # any futures still pending are marked as timed-out.
-            if self.source_timeout is not None:
-                done_iter = as_completed(futures, timeout=self.source_timeout)
-            else:
-                done_iter = as_completed(futures)
+        unique = self._finalize(all_articles, dedupe_threshold, dedupe_enabled, dedup_stats)
+        return unique, stats, dedup_stats
 
-            try:
-                for future in done_iter:
-                    src = futures[future]
-                    try:
-                        articles, elapsed_ms = future.result(timeout=0)
-                        logger.info(f"[Engine] {src.name} returned {len(articles)} articles in {elapsed_ms:.0f}ms")
-                        stats[src.name] = len(articles)
-                        self.health.record_success(src.name, len(articles), response_ms=elapsed_ms)
-                        all_articles.extend(articles)
-                    except Exception as e:
-                        logger.error(f"[Engine] {src.name} failed: {e}")
-                        failed_sources.append(src)
-            except FuturesTimeoutError:
-                # Some futures didn't complete within the timeout window
-                for future, src in futures.items():
-                    if not future.done():
-                        logger.error(f"[Engine] {src.name} timed out after {self.source_timeout}s")
-                        stats[src.name] = -1
-                        self.health.record_failure(src.name)
-                        future.cancel()
-                        timed_out_futures.add(future)
-
-            # Retry failed sources (sequential, with backoff)
-            for src in failed_sources:
-                retried = False
-                for attempt in range(1, self.retries + 1):
-                    time.sleep(2 * attempt)
-                    try:
-                        articles, elapsed_ms = self._timed_crawl(src)
-                        logger.info(f"[Engine] {src.name} retry {attempt} succeeded: {len(articles)} articles in {elapsed_ms:.0f}ms")
-                        stats[src.name] = len(articles)
-                        self.health.record_success(src.name, len(articles), response_ms=elapsed_ms)
-                        all_articles.extend(articles)
-                        retried = True
-                        break
-                    except Exception as e:
-                        logger.error(f"[Engine] {src.name} retry {attempt} failed: {e}")
-                if not retried:
-                    stats[src.name] = -1
-                    self.health.record_failure(src.name)
+    def _apply_quality(self, articles: List[Article]):
+        """Inject quality scores with health modifier."""
+        for article in articles:
+            base_score = get_quality_score(article.source)
+            modifier = self.health.get_health_modifier(article.source)
+            article.quality_score = base_score * modifier
+
+    def crawl_iter(self, dedupe_threshold: float = 0.75, dedupe_enabled: bool = True,
+                   stats: Optional[Dict[str, int]] = None,
+                   dedup_stats: Optional[DedupStats] = None) -> Iterator[Article]:
+        """Yield articles as each source completes, deduplicated incrementally.
+
+        Unlike ``crawl`` nothing waits for the slowest source: each finished
+        source's articles are scored and checked against everything already
+        yielded (first version of a story wins), then yielded immediately.
+        Within a source, articles come highest quality first; there is no
+        global sort. Pass ``stats``/``dedup_stats`` to have them filled in.
 
+        Closing the generator early stops waiting on outstanding sources.
+        """
+        if stats is None:
+            stats = {}
+        dedup = Deduplicator(similarity_threshold=dedupe_threshold, stats=dedup_stats, enabled=dedupe_enabled)
+        results = self._iter_results(stats)
+        try:
+            for _src, articles in results:
+                self._apply_quality(articles)
+                articles = sorted(articles, key=lambda a: a.quality_score, reverse=True)
+                dedup.prepare(articles)
+                yield from [a for a in articles if dedup.add(a)]
+        finally:
+            results.close()
+            self.health.save()
+
+    def _finalize(self, all_articles: List[Article], dedupe_threshold: float, dedupe_enabled: bool,
+                  dedup_stats: DedupStats) -> List[Article]:
+        """Deduplicate, score and rank raw articles; persist health data."""
         logger.info(f"[Engine] Total raw: {len(all_articles)}")
-        unique = deduplicate(all_articles, similarity_threshold=dedupe_threshold, stats=dedup_stats, enabled=dedupe_enabled)
+        if self.dedup_index is not None and dedupe_enabled:
+            unique = self.dedup_index.deduplicate(all_articles, stats=dedup_stats)
+            self.dedup_index.save()
+        else:
+            unique = deduplicate(all_articles, similarity_threshold=dedupe_threshold, stats=dedup_stats,
+                                 enabled=dedupe_enabled)
         logger.info(f"[Engine] After dedup: {len(unique)}")
 
-        # Inject quality scores with health modifier
-        for article in unique:
-            base_score = get_quality_score(article.source)
-            modifier = self.health.get_health_modifier(article.source)
-            article.quality_score = base_score * modifier
+        self._apply_quality(unique)
 
         # Sort by blended score: 0.6 * recency + 0.4 * quality_score
         from datetime import datetime, timezone
@@ -128,4 +391,143 @@ class CrawlEngine:
         unique.sort(key=blended_key, reverse=True)
 
         self.health.save()
+        return unique
+
+
+class AsyncCrawlEngine(CrawlEngine):
+    """Crawl engine driven by a single asyncio event loop.
+
+    Sources that implement ``acrawl`` natively (e.g. Hacker News) issue their
+    requests on the loop through ``afetch_url``/``afetch_json`` and a shared
+    aiohttp connection pool, so hundreds of requests can be in flight at once
+    while per-domain rate limits still apply. Thread-based sources run
+    unchanged on a pool of ``max_workers`` threads. Per-source deadlines work
+    as in ``CrawlEngine``.
+
+    Without aiohttp installed the async fetch methods fall back to worker
+    threads, so the engine still works — just without the extra concurrency.
+    """
+
+    def __init__(self, sources: Optional[List[BaseSource]] = None, max_workers: int = 6,
+                 retries: int = 1, source_timeout: Optional[float] = DEFAULT_SOURCE_TIMEOUT,
+                 crawl_timeout: Optional[float] = None, max_connections: int = 200,
+                 auto_workers: bool = False, crawl_filter: Optional[CrawlFilter] = None,
+                 prewarm: bool = False, breaker_threshold: int = DEFAULT_THRESHOLD):
+        super().__init__(sources=sources, max_workers=max_workers, retries=retries,
+                         source_timeout=source_timeout, crawl_timeout=crawl_timeout,
+                         auto_workers=auto_workers, crawl_filter=crawl_filter, prewarm=prewarm,
+                         breaker_threshold=breaker_threshold)
+        self.max_connections = max_connections
+        self._crawl_deadline: Optional[float] = None
+
+    async def _acrawl_budgeted(self, src: BaseSource):
+        """Async counterpart of ``_run_budgeted`` for sources with a native ``acrawl``."""
+        t0 = time.monotonic()
+        deadline = self._source_deadline(t0, self._crawl_deadline)
+        if deadline is not None:
+            src.set_deadline(deadline)
+        try:
+            articles = await src.acrawl()
+            partial = deadline is not None and src.budget_expired
+        finally:
+            if deadline is not None:
+                src.set_deadline(None)
+        return articles, (time.monotonic() - t0) * 1000, partial
+
+    async def _run_source(self, src: BaseSource):
+        loop = asyncio.get_running_loop()
+        if isinstance(src, BaseSource) and type(src).acrawl is not BaseSource.acrawl:
+            # Runs on the loop right away, so its clock starts now
+            now = time.monotonic()
+            deadline = self._source_deadline(now, self._crawl_deadline)
+            if deadline is None:
+                return await self._acrawl_budgeted(src)
+            return await asyncio.wait_for(self._acrawl_budgeted(src), timeout=deadline - now + self._deadline_grace())
+
+        # Thread-based (and duck-typed) sources run on the daemon pool and may
+        # queue for a worker first; their timeout counts from when they start.
+        started = loop.create_future()
+
+        def on_start(t0: float):
+            try:
+                loop.call_soon_threadsafe(lambda: started.done() or started.set_result(t0))
+            except RuntimeError:  # loop already closed; nobody is waiting
+                pass
+
+        work = loop.run_in_executor(self._pool, self._run_budgeted, src, None, self._crawl_deadline, on_start)
+        try:
+            await asyncio.wait({work, started}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            work.cancel()
+            raise
+        if work.done():
+            return work.result()
+        deadline = self._source_deadline(started.result(), self._crawl_deadline)
+        if deadline is None:
+            return await work
+        cutoff = deadline + self._deadline_grace()
+        return await asyncio.wait_for(work, timeout=max(0.0, cutoff - time.monotonic()))
+
+    async def _crawl_one(self, src: BaseSource, stats: Dict[str, int]) -> Tuple[BaseSource, Optional[List[Article]]]:
+        """Crawl a source with retries; return (source, articles or None on failure).
+
+        Each source's retries wait on the loop, so they overlap with every
+        other source; a retry that couldn't start before the crawl deadline
+        is skipped.
+        """
+        retries = 0 if src in self._probes else self.retries
+        for attempt in range(retries + 1):
+            if attempt:
+                delay = self._retry_delay(attempt)
+                if self._crawl_deadline is not None and time.monotonic() + delay >= self._crawl_deadline:
+                    logger.error(f"[Engine] {src.name} not retried: crawl budget exhausted")
+                    return src, None
+                await asyncio.sleep(delay)
+            try:
+                articles, elapsed_ms, partial = await self._run_source(src)
+            except asyncio.TimeoutError:
+                logger.error(f"[Engine] {src.name} timed out after {self.source_timeout}s")
+                return src, None
+            except Exception as e:
+                label = f"retry {attempt}" if attempt else "crawl"
+                logger.error(f"[Engine] {src.name} {label} failed: {e}")
+                continue
+            self._record_success(src, articles, elapsed_ms, partial, stats, retries_used=attempt)
+            return src, articles
+        return src, None
+
+    async def acrawl(self, dedupe_threshold: float = 0.75, dedupe_enabled: bool = True) -> Tuple[List[Article], Dict[str, int], DedupStats]:
+        """Run all sources concurrently on the running loop; same result shape as ``crawl``."""
+        from clawler.sources.base import open_async_session, close_async_session
+
+        all_articles: List[Article] = []
+        stats: Dict[str, int] = {}
+        dedup_stats = DedupStats()
+
+        if self.crawl_timeout is not None:
+            self._crawl_deadline = time.monotonic() + self.crawl_timeout
+        ordered, workers = self._schedule()
+        ordered = self._admit_sources(ordered)
+        self._prepare_sources()
+        await asyncio.get_running_loop().run_in_executor(None, self._prewarm)
+        self._pool = DaemonThreadPool(max_workers=workers, thread_name_prefix="clawler-worker")
+        open_async_session(max_connections=self.max_connections)
+        try:
+            results = await asyncio.gather(*(self._crawl_one(src, stats) for src in ordered))
+        finally:
+            await close_async_session()
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._release_sources()
+
+        for src, articles in results:
+            if articles is None:
+                self._record_failure(src, stats)
+            else:
+                all_articles.extend(articles)
+
+        unique = self._finalize(all_articles, dedupe_threshold, dedupe_enabled, dedup_stats)
         return unique, stats, dedup_stats
+
+    def crawl(self, dedupe_threshold: float = 0.75, dedupe_enabled: bool = True) -> Tuple[List[Article], Dict[str, int], DedupStats]:
+        """Blocking entry point: run ``acrawl`` on a fresh event loop."""
+        return asyncio.run(self.acrawl(dedupe_threshold=dedupe_threshold, dedupe_enabled=dedupe_enabled))
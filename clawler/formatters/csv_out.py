@@ -1,24 +1,45 @@
 """CSV output — handy for spreadsheets and data pipelines."""
 import csv
 import io
-from typing import List
+from typing import IO, Iterable, List
 from clawler.models import Article
 
+CSV_HEADER = ["title", "url", "source", "author", "summary", "timestamp", "category", "discussion_url"]
+
+
+def _row(a: Article) -> list:
+    return [
+        a.title,
+        a.url,
+        a.source,
+        a.author,
+        a.summary,
+        a.timestamp.isoformat() if a.timestamp else "",
+        a.category,
+        a.discussion_url,
+    ]
+
 
 class CSVFormatter:
     def format(self, articles: List[Article]) -> str:
         buf = io.StringIO()
         writer = csv.writer(buf)
-        writer.writerow(["title", "url", "source", "author", "summary", "timestamp", "category", "discussion_url"])
+        writer.writerow(CSV_HEADER)
         for a in articles:
-            writer.writerow([
-                a.title,
-                a.url,
-                a.source,
-                a.author,
-                a.summary,
-                a.timestamp.isoformat() if a.timestamp else "",
-                a.category,
-                a.discussion_url,
-            ])
+            writer.writerow(_row(a))
         return buf.getvalue()
+
+    def write_stream(self, articles: Iterable[Article], out: IO[str]) -> int:
+        """Write the header, then one row per article as it arrives (flushed).
+
+        Returns the number of rows written, excluding the header.
+        """
+        writer = csv.writer(out)
+        writer.writerow(CSV_HEADER)
+        out.flush()
+        count = 0
+        for a in articles:
+            writer.writerow(_row(a))
+            out.flush()
+            count += 1
+        return count
@@ -1,32 +1,45 @@
 """JSON Lines (JSONL) formatter — one JSON object per line, ideal for streaming and piping."""
 import json
-from typing import List
+from typing import IO, Iterable, List
 from clawler.models import Article
 
 
 class JSONLFormatter:
     """Output articles as newline-delimited JSON (JSON Lines / JSONL)."""
 
+    def format_article(self, a: Article) -> str:
+        """Serialize a single article as one JSON line (no trailing newline)."""
+        obj = {
+            "title": a.title,
+            "url": a.url,
+            "source": a.source,
+            "summary": a.summary,
+            "timestamp": a.timestamp.isoformat() if a.timestamp else None,
+            "category": a.category,
+            "quality_score": round(a.quality_score, 4),
+            "source_count": a.source_count,
+        }
+        if a.tags:
+            obj["tags"] = a.tags
+        if a.author:
+            obj["author"] = a.author
+        if a.discussion_url:
+            obj["discussion_url"] = a.discussion_url
+        if a.relevance is not None:
+            obj["relevance"] = round(a.relevance, 4)
+        return json.dumps(obj, ensure_ascii=False)
+
     def format(self, articles: List[Article]) -> str:
-        lines = []
+        return "\n".join(self.format_article(a) for a in articles)
+
+    def write_stream(self, articles: Iterable[Article], out: IO[str]) -> int:
+        """Write each article to ``out`` as soon as it arrives, flushing per line.
+
+        Returns the number of records written.
+        """
+        count = 0
         for a in articles:
-            obj = {
-                "title": a.title,
-                "url": a.url,
-                "source": a.source,
-                "summary": a.summary,
-                "timestamp": a.timestamp.isoformat() if a.timestamp else None,
-                "category": a.category,
-                "quality_score": round(a.quality_score, 4),
-                "source_count": a.source_count,
-            }
-            if a.tags:
-                obj["tags"] = a.tags
-            if a.author:
-                obj["author"] = a.author
-            if a.discussion_url:
-                obj["discussion_url"] = a.discussion_url
-            if a.relevance is not None:
-                obj["relevance"] = round(a.relevance, 4)
-            lines.append(json.dumps(obj, ensure_ascii=False))
-        return "\n".join(lines)
+            out.write(self.format_article(a) + "\n")
+            out.flush()
+            count += 1
+        return count
@@ -3,11 +3,15 @@ import json
 import logging
 import os
 from datetime import datetime, timezone
-from typing import Dict
+from typing import Dict, Optional
+
+from clawler.circuit import CircuitBreaker
+from clawler.sources.bandwidth import TrafficMeter, UrlTraffic
 
 logger = logging.getLogger(__name__)
 
 HEALTH_PATH = os.path.expanduser("~/.clawler/health.json")
+TOP_TRAFFIC_URLS = 20  # costliest URLs kept per source
 
 
 class HealthTracker:
@@ -15,8 +19,13 @@ class HealthTracker:
 
     def __init__(self):
         self.data: Dict[str, dict] = {}
+        self.breaker = CircuitBreaker()
         self._load()
 
+    @staticmethod
+    def _circuits_path() -> str:
+        return os.path.join(os.path.dirname(HEALTH_PATH), "circuits.json")
+
     def _load(self):
         try:
             if os.path.exists(HEALTH_PATH):
@@ -24,12 +33,20 @@ class HealthTracker:
                     self.data = json.load(f)
         except Exception as e:
             logger.debug(f"[Health] Could not load health data: {e}")
+        try:
+            if os.path.exists(self._circuits_path()):
+                with open(self._circuits_path()) as f:
+                    self.breaker = CircuitBreaker.from_dict(json.load(f))
+        except Exception as e:
+            logger.debug(f"[Health] Could not load circuit breaker state: {e}")
 
     def save(self):
         try:
             os.makedirs(os.path.dirname(HEALTH_PATH), exist_ok=True)
             with open(HEALTH_PATH, "w") as f:
                 json.dump(self.data, f, indent=2)
+            with open(self._circuits_path(), "w") as f:
+                json.dump(self.breaker.to_dict(), f, indent=2)
         except Exception as e:
             logger.debug(f"[Health] Could not save health data: {e}")
 
@@ -42,11 +59,13 @@ class HealthTracker:
                 "last_success": None,
             }
 
-    def record_success(self, source: str, article_count: int, response_ms: float = 0, retries_used: int = 0):
+    def record_success(self, source: str, article_count: int, response_ms: float = 0, retries_used: int = 0,
+                       hosts: Optional[Dict[str, int]] = None, traffic: Optional[TrafficMeter] = None):
         self._ensure(source)
         d = self.data[source]
         d["total_crawls"] += 1
         d["total_articles"] += article_count
+        self._record_traffic(d, traffic, article_count)
         d["last_success"] = datetime.now(tz=timezone.utc).isoformat()
         if retries_used > 0:
             d["retries_used"] = d.get("retries_used", 0) + retries_used
@@ -56,12 +75,31 @@ class HealthTracker:
             # Keep last 50 samples to avoid unbounded growth
             if len(timings) > 50:
                 d["response_times_ms"] = timings[-50:]
+        if hosts:
+            # Hosts contacted this run (busiest 50), used to pre-warm connections next time
+            top = sorted(hosts.items(), key=lambda kv: kv[1], reverse=True)[:50]
+            d["hosts"] = dict(top)
 
-    def record_failure(self, source: str):
+    def record_failure(self, source: str, traffic: Optional[TrafficMeter] = None):
         self._ensure(source)
         d = self.data[source]
         d["total_crawls"] += 1
         d["failures"] += 1
+        self._record_traffic(d, traffic, 0)
+
+    @staticmethod
+    def _record_traffic(d: dict, traffic: Optional[TrafficMeter], article_count: int):
+        """Add a run's byte/timing totals to the source's running totals and costliest URLs."""
+        if traffic is None or not traffic.urls:
+            return
+        total = UrlTraffic.from_dict(d.get("traffic") or {})
+        total.merge(traffic.total)
+        d["traffic"] = {**total.to_dict(), "articles": (d.get("traffic") or {}).get("articles", 0) + article_count}
+        urls = {url: UrlTraffic.from_dict(t) for url, t in (d.get("traffic_urls") or {}).items()}
+        for url, t in traffic.urls.items():
+            urls.setdefault(url, UrlTraffic()).merge(t)
+        top = sorted(urls.items(), key=lambda kv: kv[1].wire_bytes, reverse=True)[:TOP_TRAFFIC_URLS]
+        d["traffic_urls"] = {url: t.to_dict() for url, t in top}
 
     def get_health_modifier(self, source: str) -> float:
         """Return a modifier (0.5-1.0) based on source health."""
@@ -132,6 +170,13 @@ class HealthTracker:
         d = k - f
         return sorted_vals[f] + d * (sorted_vals[c] - sorted_vals[f])
 
+    def expected_ms(self, source: str, percentile: float = 95) -> Optional[float]:
+        """Expected crawl time for ``source`` from its recorded timings, or None if unknown."""
+        timings = self.data.get(source, {}).get("response_times_ms")
+        if not timings:
+            return None
+        return self._percentile(sorted(timings), percentile)
+
     def get_timing_report(self):
         """Return sources sorted by average response time (slowest first).
 
@@ -152,6 +197,44 @@ class HealthTracker:
                 "p95_ms": round(self._percentile(sorted_t, 95), 1),
                 "p99_ms": round(self._percentile(sorted_t, 99), 1),
                 "samples": len(timings),
+                **self._traffic_summary(d),
             })
         entries.sort(key=lambda e: e["avg_ms"], reverse=True)
         return entries
+
+    @staticmethod
+    def _traffic_summary(d: dict) -> dict:
+        t = d.get("traffic")
+        if not t:
+            return {}
+        traffic = UrlTraffic.from_dict(t)
+        articles = t.get("articles", 0)
+        return {
+            "requests": traffic.requests,
+            "wire_bytes": traffic.wire_bytes,
+            "decoded_bytes": traffic.decoded_bytes,
+            "compression_ratio": traffic.compression_ratio,
+            "avg_ttfb_ms": traffic.avg_ttfb_ms,
+            "bytes_per_article": round(traffic.wire_bytes / articles) if articles else None,
+            "statuses": dict(traffic.statuses),
+        }
+
+    def get_traffic_report(self):
+        """Return sources with recorded traffic, costliest wire bytes per article first.
+
+        Sources that transferred bytes without yielding any article sort first.
+        """
+        entries = [{"source": source, **self._traffic_summary(d)}
+                   for source, d in self.data.items() if d.get("traffic")]
+        entries.sort(key=lambda e: (e["bytes_per_article"] is None, e["bytes_per_article"] or 0, e["wire_bytes"]),
+                     reverse=True)
+        return entries
+
+    def top_urls(self, source: str, n: int = 10):
+        """``(url, UrlTraffic)`` for the URLs of ``source`` that cost the most wire bytes."""
+        urls = self.data.get(source, {}).get("traffic_urls") or {}
+        return [(url, UrlTraffic.from_dict(t)) for url, t in list(urls.items())[:n]]
+
+    def expected_hosts(self, source: str) -> Dict[str, int]:
+        """Origins ``source`` contacted in its last recorded run, with request counts."""
+        return dict(self.data.get(source, {}).get("hosts") or {})
@@ -0,0 +1,148 @@
+"""Record and replay the HTTP traffic of a crawl.
+
+``clawler --record DIR`` stores every response the shared session receives —
+URL, status, headers, body and how long it took — as one gzip-compressed
+JSON file per URL in ``DIR``. ``clawler --replay DIR`` then serves the same
+crawl entirely from those files, without touching the network: URLs that
+weren't recorded fail like an unreachable host. ``--replay-latency SCALE``
+sleeps for the recorded response time times ``SCALE`` before each response
+(default 0: instant), so engine changes can be benchmarked against
+production-sized payloads with realistic or no network delay.
+
+The archive hooks in at the transport adapter of the shared
+``requests.Session`` (``ArchiveAdapter`` in ``clawler.sources.connections``),
+so retries, rate limiting, streaming and parsing all run exactly as in a
+live crawl.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+
+# Describe the wire encoding, not the decoded body that is stored
+_DROP_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "connection"}
+
+
+class NotRecorded(requests.ConnectionError):
+    """Replay asked for a URL that isn't in the archive."""
+
+
+class HttpArchive:
+    """A directory of recorded responses, keyed by method and URL."""
+
+    def __init__(self, archive_dir: Path, mode: str = REPLAY, latency_scale: float = 0.0):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"mode must be {RECORD!r} or {REPLAY!r}, not {mode!r}")
+        self.archive_dir = Path(archive_dir)
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self.recorded = 0
+        self.replayed = 0
+        self.missing = 0
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    def _path(self, method: str, url: str) -> Path:
+        key = hashlib.sha1(f"{method.upper()} {url}".encode("utf-8")).hexdigest()
+        return self.archive_dir / f"{key}.json.gz"
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response,
+               elapsed_ms: float) -> requests.Response:
+        """Store ``response`` (reading its body in full) and return it, still readable."""
+        body = response.content
+        entry = {
+            "method": request.method,
+            "url": request.url,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() not in _DROP_HEADERS},
+            "elapsed_ms": round(elapsed_ms, 1),
+            "body": body.decode("latin-1"),  # lossless for any bytes
+        }
+        try:
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.archive_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f, gzip.GzipFile(fileobj=f, mode="wb", mtime=0) as gz:
+                    gz.write(json.dumps(entry).encode("utf-8"))
+                os.replace(tmp, self._path(request.method, request.url))
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.warning(f"[Archive] Could not record {request.url}: {e}")
+            return response
+        with self._lock:
+            self.recorded += 1
+        return response
+
+    def replay(self, request: requests.PreparedRequest) -> requests.Response:
+        """Build the recorded response to ``request``; raise ``NotRecorded`` if there is none."""
+        try:
+            with gzip.open(self._path(request.method, request.url), "rb") as f:
+                entry = json.loads(f.read().decode("utf-8"))
+        except (OSError, ValueError, EOFError):
+            with self._lock:
+                self.missing += 1
+            raise NotRecorded(f"Not in archive: {request.url}", request=request)
+        if self.latency_scale > 0 and entry.get("elapsed_ms"):
+            time.sleep(entry["elapsed_ms"] / 1000 * self.latency_scale)
+        resp = requests.Response()
+        resp.status_code = entry["status"]
+        resp.reason = entry.get("reason")
+        resp.headers = CaseInsensitiveDict(entry["headers"])
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp.raw = io.BytesIO(entry["body"].encode("latin-1"))
+        resp.url = request.url
+        resp.request = request
+        with self._lock:
+            self.replayed += 1
+        return resp
+
+
+_http_archive: Optional[HttpArchive] = None
+_http_archive_lock = threading.Lock()
+
+
+def get_http_archive() -> Optional[HttpArchive]:
+    """Return the archive being recorded or replayed, or None for live crawls."""
+    return _http_archive
+
+
+def configure_http_archive(record: Optional[Path] = None, replay: Optional[Path] = None,
+                           latency_scale: float = 0.0) -> Optional[HttpArchive]:
+    """Start recording to ``record`` or replaying from ``replay`` (neither = live)."""
+    global _http_archive
+    if record is not None and replay is not None:
+        raise ValueError("Cannot record and replay at the same time")
+    with _http_archive_lock:
+        if record is not None:
+            _http_archive = HttpArchive(record, RECORD)
+        elif replay is not None:
+            if not Path(replay).is_dir():
+                raise ValueError(f"No archive at {replay}")
+            _http_archive = HttpArchive(replay, REPLAY, latency_scale=latency_scale)
+        else:
+            _http_archive = None
+        return _http_archive
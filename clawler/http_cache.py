@@ -0,0 +1,233 @@
+"""Conditional-GET cache for source fetches (ETag / Last-Modified).
+
+Most feed endpoints send an ``ETag`` or ``Last-Modified`` header and answer
+``304 Not Modified`` when asked with the matching ``If-None-Match`` /
+``If-Modified-Since``. ``BaseSource.fetch_url``/``fetch_json`` store each
+cacheable response body with its validators here. The next request for the
+same URL sends the validators, and on a 304 the stored body is returned
+instead of downloading it again.
+
+Bodies returned from the cache are ``NotModified`` strings, so a source can
+tell that nothing changed (e.g. to reuse what it parsed last time).
+
+Stored in ``~/.cache/clawler/http/`` by default; on unless configured off
+(``clawler --no-http-cache``). The store is kept under ``max_bytes``:
+entries not used for ``max_age`` go first, then the least recently used.
+It is pruned on its first store in a process and whenever it grows past
+the limit.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HTTP_CACHE_DIR = Path.home() / ".cache" / "clawler" / "http"
+DEFAULT_HTTP_CACHE_MAX_BYTES = 200 * 1024 * 1024
+DEFAULT_HTTP_CACHE_MAX_AGE = 30 * 24 * 3600  # seconds since an entry was last stored or served
+
+
+def cache_key(url: str, max_items: Optional[int] = None) -> str:
+    """The cache key for a fetch of ``url``, optionally capped at ``max_items`` feed items.
+
+    A capped body is only the head of the feed, so it is kept apart from the
+    full one. Fragments are never sent to the server, so the key can't clash
+    with a real URL.
+    """
+    return f"{url}#max_items={max_items}" if max_items else url
+
+
+class NotModified(str):
+    """A response body served from the cache after a 304."""
+    not_modified = True
+
+
+def _header(headers, name: str) -> Optional[str]:
+    value = headers.get(name) if headers is not None else None
+    return value if isinstance(value, str) and value else None
+
+
+class HttpCache:
+    """On-disk store of response bodies and their validators, keyed by URL."""
+
+    def __init__(self, cache_dir: Path = DEFAULT_HTTP_CACHE_DIR,
+                 max_bytes: int = DEFAULT_HTTP_CACHE_MAX_BYTES, max_age: float = DEFAULT_HTTP_CACHE_MAX_AGE):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._prune_lock = threading.Lock()
+        self._size: Optional[int] = None  # bytes on disk, counted by the first prune
+        self.hits = 0
+        self.stores = 0
+        self.evicted = 0
+
+    def _paths(self, url: str):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def _meta(self, url: str) -> Optional[dict]:
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url or not body_path.exists():
+            return None
+        return meta
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for ``url`` (empty if nothing is stored)."""
+        meta = self._meta(url)
+        if meta is None:
+            return {}
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def load(self, url: str) -> Optional[NotModified]:
+        """The stored body for ``url`` after the server said it hasn't changed."""
+        if self._meta(url) is None:
+            return None
+        meta_path, body_path = self._paths(url)
+        try:
+            body = body_path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        try:
+            os.utime(meta_path)  # still in use: keep it through the next prune
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return NotModified(body)
+
+    def store(self, url: str, headers, body) -> bool:
+        """Keep ``body`` if the response carried a validator; return whether it was stored."""
+        etag, last_modified = _header(headers, "ETag"), _header(headers, "Last-Modified")
+        if not isinstance(body, str) or not (etag or last_modified):
+            return False
+        meta_path, body_path = self._paths(url)
+        meta = {"url": url, "etag": etag, "last_modified": last_modified, "stored_at": time.time()}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Body first, then metadata: validators never point at a missing body
+            self._write(body_path, body)
+            self._write(meta_path, json.dumps(meta))
+        except OSError as e:
+            logger.debug(f"[HTTPCache] Could not store {url}: {e}")
+            return False
+        with self._lock:
+            self.stores += 1
+            if self._size is not None:
+                self._size += len(body.encode("utf-8")) + len(json.dumps(meta))
+            due = self._size is None or self._size > self.max_bytes
+        if due:
+            self.prune()
+        return True
+
+    def prune(self) -> int:
+        """Drop entries unused for ``max_age``, then the least recently used until under ``max_bytes``.
+
+        Returns the number of URLs removed. A prune already running in
+        another thread is not waited for.
+        """
+        if not self._prune_lock.acquire(blocking=False):
+            return 0
+        try:
+            entries: Dict[str, list] = {}  # key -> [last used, bytes, paths]
+            try:
+                files = [f for f in self.cache_dir.iterdir() if f.suffix in (".json", ".body")]
+            except OSError:
+                files = []
+            for f in files:
+                try:
+                    st = f.stat()
+                except OSError:
+                    continue
+                entry = entries.setdefault(f.stem, [0.0, 0, []])
+                entry[0] = max(entry[0], st.st_mtime)
+                entry[1] += st.st_size
+                entry[2].append(f)
+            total = sum(size for _, size, _ in entries.values())
+            cutoff = time.time() - self.max_age
+            removed = 0
+            for used, size, paths in sorted(entries.values(), key=lambda e: e[0]):
+                if used >= cutoff and total <= self.max_bytes:
+                    break
+                for path in paths:
+                    path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+            with self._lock:
+                self._size = total
+                self.evicted += removed
+            if removed:
+                logger.debug(f"[HTTPCache] Pruned {removed} stored response(s), {total} bytes left")
+            return removed
+        finally:
+            self._prune_lock.release()
+
+    def _write(self, path: Path, text: str):
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def clear(self) -> int:
+        """Remove every stored response. Returns the number of URLs removed."""
+        if not self.cache_dir.exists():
+            return 0
+        count = 0
+        for f in self.cache_dir.iterdir():
+            if f.suffix == ".json":
+                count += 1
+            if f.suffix in (".json", ".body", ".tmp"):
+                f.unlink(missing_ok=True)
+        with self._lock:
+            self._size = 0
+        return count
+
+
+_http_cache: Optional[HttpCache] = None
+_http_cache_enabled = True
+_http_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """Return the shared HTTP cache, or None when it is turned off."""
+    global _http_cache
+    with _http_cache_lock:
+        if not _http_cache_enabled:
+            return None
+        if _http_cache is None:
+            _http_cache = HttpCache()
+        return _http_cache
+
+
+def configure_http_cache(enabled: bool = True, cache_dir: Optional[Path] = None) -> Optional[HttpCache]:
+    """Turn the shared HTTP cache on or off, optionally in another directory."""
+    global _http_cache, _http_cache_enabled
+    with _http_cache_lock:
+        _http_cache_enabled = enabled
+        if enabled and (_http_cache is None or (cache_dir is not None and Path(cache_dir) != _http_cache.cache_dir)):
+            _http_cache = HttpCache(cache_dir or DEFAULT_HTTP_CACHE_DIR)
+        return _http_cache if enabled else None
@@ -1,9 +1,10 @@
 """Data models for Clawler."""
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from urllib.parse import urlparse, parse_qs, urlencode
 import hashlib
+import sys
 
 # Query parameters known to be tracking/analytics noise (case-insensitive prefix match)
 _TRACKING_PREFIXES = (
@@ -40,7 +41,11 @@ def _normalize_url(url: str) -> str:
         return url
 
 
-@dataclass
+# No per-instance __dict__ where dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Article:
     title: str
     url: str
@@ -55,21 +60,50 @@ class Article:
     author: str = ""  # article author (when available from source)
     discussion_url: str = ""  # URL to discussion thread (HN, Lobsters, Reddit, etc.)
 
+    # Derived keys, computed together on first use: (title, url, normalized
+    # title, fingerprint, normalized URL, dedup key). Assigning a new title or
+    # URL invalidates them.
+    _keys: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # A crawl repeats a few dozen source and category names across every article
+        if type(self.source) is str:
+            self.source = sys.intern(self.source)
+        if type(self.category) is str:
+            self.category = sys.intern(self.category)
+
+    def _derived(self) -> Tuple[str, ...]:
+        keys = self._keys
+        if keys is None or keys[0] is not self.title or keys[1] is not self.url:
+            normalized = self.title.lower().strip()
+            words = sorted(set(w.lower() for w in self.title.split() if len(w) > 3))
+            # Not enough signal for fingerprint dedup below two words (avoids false matches)
+            fingerprint = hashlib.md5(" ".join(words).encode()).hexdigest() if len(words) >= 2 else ""
+            norm_url = _normalize_url(self.url)
+            key = hashlib.md5(f"{normalized}|{norm_url}".encode()).hexdigest()
+            keys = self._keys = (self.title, self.url, normalized, fingerprint, norm_url, key)
+        return keys
+
+    @property
+    def normalized_title(self) -> str:
+        """Lowercased, stripped title, as dedup compares it."""
+        return self._derived()[2]
+
+    @property
+    def normalized_url(self) -> str:
+        """URL without www., trailing slash, fragment or tracking parameters."""
+        return self._derived()[4]
+
     @property
     def dedup_key(self) -> str:
         """Generate a deduplication key from normalized title + URL."""
-        normalized = self.title.lower().strip()
-        norm_url = _normalize_url(self.url)
-        return hashlib.md5(f"{normalized}|{norm_url}".encode()).hexdigest()
+        return self._derived()[5]
 
     @property
     def title_fingerprint(self) -> str:
         """Fuzzy fingerprint based on title words for cross-source dedup.
         Returns empty string if insufficient significant words (avoids false matches)."""
-        words = sorted(set(w.lower() for w in self.title.split() if len(w) > 3))
-        if len(words) < 2:
-            return ""  # Not enough signal for fingerprint dedup
-        return hashlib.md5(" ".join(words).encode()).hexdigest()
+        return self._derived()[3]
 
 
 @dataclass
@@ -0,0 +1,76 @@
+"""Daemon-thread worker pool shared by the crawl engine and the fetch scheduler."""
+import queue
+import threading
+from concurrent.futures import Executor, Future
+from typing import List
+
+
+class DaemonThreadPool(Executor):
+    """Minimal thread pool on daemon threads.
+
+    ``ThreadPoolExecutor`` workers are joined at interpreter exit, so a source
+    stuck in a blocking call would hold the process open long after the crawl
+    is over. Workers here are daemon threads, and ``shutdown(wait=False)``
+    simply stops handing them new work.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "clawler-pool"):
+        self._max_workers = max(1, max_workers)
+        self._prefix = thread_name_prefix
+        self._work: queue.SimpleQueue = queue.SimpleQueue()
+        self._threads: List[threading.Thread] = []
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            future: Future = Future()
+            self._work.put((future, fn, args, kwargs))
+            if not self._idle.acquire(blocking=False) and len(self._threads) < self._max_workers:
+                t = threading.Thread(target=self._worker, daemon=True,
+                                     name=f"{self._prefix}-{len(self._threads)}")
+                t.start()
+                self._threads.append(t)
+            return future
+
+    def _worker(self):
+        while True:
+            item = self._work.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            del item, future
+            self._idle.release()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+        if cancel_futures:
+            while True:
+                try:
+                    item = self._work.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[0].cancel()
+        for _ in self._threads:
+            self._work.put(None)
+        if wait:
+            for t in self._threads:
+                t.join()
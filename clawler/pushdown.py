@@ -0,0 +1,118 @@
+"""Filter pushdown: skip sources and feeds that cannot satisfy the query.
+
+Category and source filters are normally applied to the crawled articles.
+Where a source's output is known up front — registry entries with static
+``categories``, RSS feeds with a fixed ``category`` and ``source`` — the
+same predicates can rule it out before any request is made. A ``--since``
+cutoff is handed to the sources, which may drop older entries before
+parsing them. The article-level filters still run on whatever is crawled.
+"""
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, List, Optional, Set, Tuple
+
+from clawler.sources.base import BaseSource
+
+logger = logging.getLogger(__name__)
+
+
+def _split(value: Optional[str]) -> Set[str]:
+    return set(c.strip().lower() for c in (value or "").split(",") if c.strip())
+
+
+@dataclass
+class PushdownStats:
+    """What pushdown skipped in one crawl."""
+    sources_skipped: List[str] = field(default_factory=list)
+    feeds_skipped: int = 0
+
+
+@dataclass
+class CrawlFilter:
+    """Query predicates that can be checked before crawling."""
+    categories: Optional[Set[str]] = None  # None = any category
+    exclude_categories: Set[str] = field(default_factory=set)
+    source: Optional[str] = None           # lower-cased substring of the article source
+    exclude_source: Optional[str] = None
+    since: Optional[datetime] = None
+
+    @classmethod
+    def from_options(cls, category: Optional[str] = None, exclude_category: Optional[str] = None,
+                     source: Optional[str] = None, exclude_source: Optional[str] = None,
+                     since: Optional[datetime] = None) -> "CrawlFilter":
+        """Build from CLI/API style options (comma-separated categories, "all" = any)."""
+        cats = _split(category)
+        return cls(
+            categories=None if not cats or "all" in cats else cats,
+            exclude_categories=_split(exclude_category),
+            source=source.lower() if source else None,
+            exclude_source=exclude_source.lower() if exclude_source else None,
+            since=since,
+        )
+
+    def to_dict(self) -> dict:
+        """JSON-safe form, e.g. to hand the filter to a shard worker."""
+        return {
+            "categories": sorted(self.categories) if self.categories is not None else None,
+            "exclude_categories": sorted(self.exclude_categories),
+            "source": self.source,
+            "exclude_source": self.exclude_source,
+            "since": self.since.isoformat() if self.since else None,
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "CrawlFilter":
+        categories = d.get("categories")
+        return cls(
+            categories=set(categories) if categories is not None else None,
+            exclude_categories=set(d.get("exclude_categories") or ()),
+            source=d.get("source"),
+            exclude_source=d.get("exclude_source"),
+            since=datetime.fromisoformat(d["since"]) if d.get("since") else None,
+        )
+
+    @property
+    def active(self) -> bool:
+        return bool(self.categories is not None or self.exclude_categories or self.source
+                    or self.exclude_source or self.since)
+
+    def category_may_match(self, categories: Iterable[str]) -> bool:
+        """Could a source emitting only ``categories`` produce a matching article?"""
+        possible = set(categories) - self.exclude_categories
+        if self.categories is not None:
+            possible &= self.categories
+        return bool(possible)
+
+    def feed_matches(self, category: str, source: str) -> bool:
+        """Does a feed whose articles all have this category and source match?"""
+        if not self.category_may_match([category]):
+            return False
+        name = source.lower()
+        if self.source and self.source not in name:
+            return False
+        if self.exclude_source and self.exclude_source in name:
+            return False
+        return True
+
+    def prune(self, sources: List[BaseSource]) -> Tuple[List[BaseSource], PushdownStats]:
+        """Return the sources still worth crawling, each configured with this filter."""
+        from clawler.registry import entry_for_source
+
+        stats = PushdownStats()
+        kept: List[BaseSource] = []
+        for src in sources:
+            entry = entry_for_source(src)
+            if entry is not None and entry.categories is not None and not self.category_may_match(entry.categories):
+                stats.sources_skipped.append(src.name)
+                continue
+            keep = src.apply_filter(self) if isinstance(src, BaseSource) else True
+            stats.feeds_skipped += getattr(src, "skipped_feeds", 0)
+            if keep:
+                kept.append(src)
+            else:
+                stats.sources_skipped.append(src.name)
+        if stats.sources_skipped or stats.feeds_skipped:
+            logger.info(f"[Pushdown] Skipped {len(stats.sources_skipped)} sources and "
+                        f"{stats.feeds_skipped} feeds that can't match the query")
+        return kept, stats
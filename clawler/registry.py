@@ -11,17 +11,25 @@ derives from this registry automatically.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Type
+from typing import Dict, FrozenSet, List, Optional, Type
 
 from clawler.sources.base import BaseSource
 
 
 @dataclass(frozen=True)
 class SourceEntry:
-    """Metadata for a registered source."""
+    """Metadata for a registered source.
+
+    ``categories`` lets ``--category`` skip a source before it is crawled, so
+    it is only set for sources whose module hard-codes a single topic. Sources
+    that pick a category per article (keyword detection, per-feed maps,
+    podcast genres) leave it as None and are pruned per feed or filtered per
+    article instead; a wrong set here would silently drop matching articles.
+    """
     key: str                    # CLI flag name, e.g. "hn", "reddit"
     cls_path: str               # Dotted import path, e.g. "clawler.sources.hackernews.HackerNewsSource"
     display_name: str           # Human-friendly name
+    categories: Optional[FrozenSet[str]] = None  # Every category the source emits; None = varies per article
 
     @property
     def flag_name(self) -> str:
@@ -81,7 +89,7 @@ SOURCES: List[SourceEntry] = [
     SourceEntry("infoq",          "clawler.sources.infoq.InfoQSource",                         "InfoQ"),
     SourceEntry("theregister",    "clawler.sources.theregister.TheRegisterSource",             "The Register"),
     SourceEntry("bbc",            "clawler.sources.bbc.BBCNewsSource",                         "BBC News"),
-    SourceEntry("thehackernews",  "clawler.sources.thehackernews.TheHackerNewsSource",         "The Hacker News"),
+    SourceEntry("thehackernews",  "clawler.sources.thehackernews.TheHackerNewsSource",         "The Hacker News", frozenset({"security"})),
     SourceEntry("flipboard",      "clawler.sources.flipboard.FlipboardSource",                 "Flipboard"),
     SourceEntry("techcrunch",    "clawler.sources.techcrunch.TechCrunchSource",               "TechCrunch"),
     SourceEntry("engadget",      "clawler.sources.engadget.EngadgetSource",                   "Engadget"),
@@ -112,13 +120,13 @@ SOURCES: List[SourceEntry] = [
     SourceEntry("cnet",          "clawler.sources.cnet.CNETSource",                           "CNET"),
     SourceEntry("vox",           "clawler.sources.vox.VoxSource",                             "Vox"),
     SourceEntry("salon",         "clawler.sources.salon.SalonSource",                         "Salon"),
-    SourceEntry("statnews",      "clawler.sources.statnews.StatNewsSource",                   "STAT News"),
-    SourceEntry("barstoolsports","clawler.sources.barstoolsports.BarstoolSportsSource",       "Barstool Sports"),
-    SourceEntry("bleacherreport","clawler.sources.bleacherreport.BleacherReportSource",       "Bleacher Report"),
-    SourceEntry("nejm",          "clawler.sources.nejm.NEJMSource",                           "NEJM"),
-    SourceEntry("thelancet",     "clawler.sources.thelancet.TheLancetSource",                 "The Lancet"),
-    SourceEntry("jama",          "clawler.sources.jamanetwork.JAMASource",                    "JAMA"),
-    SourceEntry("medpagetoday",  "clawler.sources.medpagetoday.MedPageTodaySource",           "MedPage Today"),
+    SourceEntry("statnews",      "clawler.sources.statnews.StatNewsSource",                   "STAT News", frozenset({"health"})),
+    SourceEntry("barstoolsports","clawler.sources.barstoolsports.BarstoolSportsSource",       "Barstool Sports", frozenset({"sports"})),
+    SourceEntry("bleacherreport","clawler.sources.bleacherreport.BleacherReportSource",       "Bleacher Report", frozenset({"sports"})),
+    SourceEntry("nejm",          "clawler.sources.nejm.NEJMSource",                           "NEJM", frozenset({"health"})),
+    SourceEntry("thelancet",     "clawler.sources.thelancet.TheLancetSource",                 "The Lancet", frozenset({"health"})),
+    SourceEntry("jama",          "clawler.sources.jamanetwork.JAMASource",                    "JAMA", frozenset({"health"})),
+    SourceEntry("medpagetoday",  "clawler.sources.medpagetoday.MedPageTodaySource",           "MedPage Today", frozenset({"health"})),
     # Podcast sources
     SourceEntry("spotify_podcasts",  "clawler.sources.podcasts.spotify.SpotifyPodcastSource",     "Spotify Podcasts"),
     SourceEntry("apple_podcasts",    "clawler.sources.podcasts.apple.ApplePodcastsSource",        "Apple Podcasts"),
@@ -128,6 +136,10 @@ SOURCES: List[SourceEntry] = [
 
 # Quick lookups
 _BY_KEY: Dict[str, SourceEntry] = {s.key: s for s in SOURCES}
+_BY_CLS_PATH: Dict[str, SourceEntry] = {s.cls_path: s for s in SOURCES}
+
+# Sources built from the podcast feed config (``feeds=`` takes PodcastFeed objects)
+PODCAST_KEYS = frozenset({"spotify_podcasts", "apple_podcasts", "youtube_podcasts", "podcast_rss"})
 
 
 def get_all_keys() -> List[str]:
@@ -140,6 +152,12 @@ def get_entry(key: str) -> Optional[SourceEntry]:
     return _BY_KEY.get(key)
 
 
+def entry_for_source(src: BaseSource) -> Optional[SourceEntry]:
+    """Look up the registry entry a source instance was built from."""
+    cls = type(src)
+    return _BY_CLS_PATH.get(f"{cls.__module__}.{cls.__qualname__}")
+
+
 def build_sources(
     *,
     disabled: Optional[set] = None,
@@ -156,9 +174,6 @@ def build_sources(
     disabled = disabled or set()
     result = []
 
-    # Podcast source keys for special handling
-    podcast_source_keys = {"spotify_podcasts", "apple_podcasts", "youtube_podcasts", "podcast_rss"}
-
     for entry in SOURCES:
         if entry.key in disabled:
             continue
@@ -166,7 +181,7 @@ def build_sources(
         cls = entry.load_class()
 
         # Special handling for podcast sources - pass feeds config
-        if entry.key in podcast_source_keys and podcast_feeds:
+        if entry.key in PODCAST_KEYS and podcast_feeds:
             src = cls(feeds=podcast_feeds)
         else:
             src = cls()
@@ -0,0 +1,550 @@
+"""Sharded crawls: split the sources across worker processes or machines.
+
+Registry sources are assigned to shards by a stable hash of their key, and
+the RSS source's feeds are split individually by feed URL, so a crawl of
+thousands of feeds spreads evenly and every shard index always gets the
+same work. Each worker crawls its shard with a normal ``CrawlEngine`` and
+hands back raw articles; ``ShardedCrawlEngine`` merges, deduplicates and
+ranks them exactly like a single-process crawl.
+
+How shard tasks reach workers is up to a ``ShardTransport``:
+
+* ``LocalProcessTransport`` (default) — one process per shard on this box.
+* ``SocketTransport`` — workers started with ``clawler --shard-serve ADDR``
+  on any machine, reached over TCP (``host:port``) or a Unix socket (a path).
+  Messages are one JSON object per line.
+
+Shard workers are unauthenticated unless given a shared token
+(``CLAWLER_SHARD_TOKEN``), so they only listen beyond loopback with one.
+Tasks from the network can't name filesystem paths (archives, cache dir).
+"""
+import hashlib
+import hmac
+import ipaddress
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import socketserver
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from clawler.cache import _article_to_dict, _dict_to_article
+from clawler.circuit import DEFAULT_THRESHOLD, SKIPPED, RecordingCircuitBreaker, source_key
+from clawler.engine import DEFAULT_SOURCE_TIMEOUT, CrawlEngine
+from clawler.models import Article
+from clawler.prewarm import PrewarmStats
+from clawler.pushdown import CrawlFilter
+from clawler.sources.base import BaseSource
+from clawler.sources.connections import DEFAULT_DNS_TTL
+from clawler.sources.parse_pool import DEFAULT_PARSE_WORKERS
+from clawler.sources.scheduler import DEFAULT_FETCH_PER_HOST, DEFAULT_FETCH_WORKERS
+
+logger = logging.getLogger(__name__)
+
+SHARD_TOKEN_ENV = "CLAWLER_SHARD_TOKEN"
+# ShardTask fields naming paths on the worker; refused from the network
+_PATH_FIELDS = ("record", "replay", "http_cache_dir")
+
+
+def shard_of(key: str, count: int) -> int:
+    """Stable shard index for ``key`` (the same on every machine and run)."""
+    digest = hashlib.sha1(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count
+
+
+def shard_feeds(feeds: List[dict], index: int, count: int) -> List[dict]:
+    """The RSS feed configs that belong to shard ``index`` of ``count``."""
+    return [f for f in feeds if shard_of(f["url"], count) == index]
+
+
+def shard_keys(keys: List[str], index: int, count: int) -> List[str]:
+    """Registry keys crawled by shard ``index``; ``rss`` is in every shard."""
+    return [k for k in keys if k == "rss" or shard_of(k, count) == index]
+
+
+@dataclass
+class ShardTask:
+    """Everything a worker needs to crawl one shard (JSON-serializable)."""
+    index: int
+    count: int
+    keys: List[str]
+    rss_feeds: Optional[List[dict]] = None
+    podcast_feeds: Optional[List[dict]] = None  # asdict(PodcastFeed) for the podcast sources
+    timeout: int = 15
+    max_workers: int = 6
+    retries: int = 1
+    source_timeout: Optional[float] = DEFAULT_SOURCE_TIMEOUT
+    crawl_timeout: Optional[float] = None
+    # Per-source settings; None keeps the source's own default
+    fetch_retries: Optional[int] = None
+    rss_workers: Optional[int] = None
+    rss_per_host: Optional[int] = None
+    crawl_filter: Optional[dict] = None  # CrawlFilter.to_dict()
+    max_response_mb: Optional[int] = None  # 0 = no cap
+    breaker_threshold: int = DEFAULT_THRESHOLD
+    prewarm: bool = False
+    circuits: Optional[Dict[str, dict]] = None  # coordinator's CircuitBreaker.to_dict(); None = this machine's
+    # Process-wide settings, all applied for every task by configure_shard_process
+    http_cache: bool = True
+    http_cache_dir: Optional[str] = None   # None = DEFAULT_HTTP_CACHE_DIR
+    record: Optional[str] = None
+    replay: Optional[str] = None
+    replay_latency: float = 0.0
+    rate_limits: Optional[dict] = None     # None = built-in limits
+    http2: bool = False
+    egress: Optional[List[str]] = None     # None = go out directly
+    egress_hosts: Optional[List[str]] = None
+    parse_workers: int = DEFAULT_PARSE_WORKERS
+    fetch_workers: int = DEFAULT_FETCH_WORKERS
+    fetch_per_host: int = DEFAULT_FETCH_PER_HOST
+    dns_ttl: float = DEFAULT_DNS_TTL
+
+
+@dataclass
+class ShardResult:
+    """Raw output of one shard: articles plus per-source counts and timings."""
+    index: int
+    articles: List[Article] = field(default_factory=list)
+    stats: Dict[str, int] = field(default_factory=dict)
+    timings_ms: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+    sources_skipped: List[str] = field(default_factory=list)  # by filter pushdown
+    feeds_skipped: int = 0
+    archive: Dict[str, int] = field(default_factory=dict)  # recorded/replayed/missing counts
+    circuit_events: List[List[str]] = field(default_factory=list)  # [key, outcome] for the coordinator's breaker
+    prewarm: Dict[str, float] = field(default_factory=dict)  # asdict(PrewarmStats), if the shard pre-warmed
+
+    def to_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "articles": [_article_to_dict(a) for a in self.articles],
+            "stats": self.stats,
+            "timings_ms": self.timings_ms,
+            "error": self.error,
+            "sources_skipped": self.sources_skipped,
+            "feeds_skipped": self.feeds_skipped,
+            "archive": self.archive,
+            "circuit_events": [list(e) for e in self.circuit_events],
+            "prewarm": self.prewarm,
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "ShardResult":
+        return cls(
+            index=d["index"],
+            articles=[_dict_to_article(a) for a in d.get("articles", [])],
+            stats=d.get("stats", {}),
+            timings_ms=d.get("timings_ms", {}),
+            error=d.get("error"),
+            sources_skipped=d.get("sources_skipped", []),
+            feeds_skipped=d.get("feeds_skipped", 0),
+            archive=d.get("archive", {}),
+            circuit_events=d.get("circuit_events", []),
+            prewarm=d.get("prewarm", {}),
+        )
+
+
+def build_shard_sources(task: ShardTask) -> List[BaseSource]:
+    """Instantiate the sources of ``task``'s shard from the registry.
+
+    Each source gets the same per-source settings a single-process crawl
+    would give it (request timeout, fetch retries, response cap, RSS
+    concurrency).
+    """
+    from clawler.models import PodcastFeed
+    from clawler.registry import PODCAST_KEYS, get_entry
+    from clawler.sources.rss import DEFAULT_FEEDS
+
+    sources: List[BaseSource] = []
+    for key in shard_keys(task.keys, task.index, task.count):
+        entry = get_entry(key)
+        if entry is None:
+            logger.warning(f"[Shard] Unknown source key: {key}")
+            continue
+        if key == "rss":
+            feeds = shard_feeds(task.rss_feeds or DEFAULT_FEEDS, task.index, task.count)
+            if not feeds:
+                continue
+            src = entry.load_class()(feeds=feeds)
+        elif key in PODCAST_KEYS and task.podcast_feeds:
+            src = entry.load_class()(feeds=[PodcastFeed(**f) for f in task.podcast_feeds])
+        else:
+            src = entry.load_class()()
+        src.timeout = task.timeout
+        if task.fetch_retries is not None:
+            src.max_retries = task.fetch_retries
+        if task.max_response_mb is not None:
+            src.max_response_bytes = task.max_response_mb * 1024 * 1024 if task.max_response_mb > 0 else None
+        if key == "rss":
+            if task.rss_workers is not None:
+                src.max_workers = task.rss_workers
+            if task.rss_per_host is not None:
+                src.per_host_limit = task.rss_per_host
+        sources.append(src)
+    return sources
+
+
+def configure_shard_process(task: ShardTask):
+    """Apply ``task``'s process-wide settings (archive, HTTP cache, rate limits, transport, ...).
+
+    Shard workers start with this module's defaults, not the coordinator's
+    configuration, so everything ``clawler`` sets up globally for a crawl
+    travels in the task. Every setting is applied, defaults included, so
+    nothing a previous task turned on outlives it in a long-lived worker.
+    Raises ValueError for settings the worker can't use.
+    """
+    from clawler.http_archive import configure_http_archive
+    from clawler.http_cache import DEFAULT_HTTP_CACHE_DIR, configure_http_cache
+    from clawler.sources.base import configure_transport
+    from clawler.sources.connections import install_dns_cache
+    from clawler.sources.egress import configure_egress
+    from clawler.sources.parse_pool import configure_parse_pool
+    from clawler.sources.rate_limit import configure_rate_limits
+    from clawler.sources.scheduler import configure_scheduler
+
+    archive = configure_http_archive(record=task.record, replay=task.replay, latency_scale=task.replay_latency)
+    # Archives hold full responses: no conditional requests while recording or replaying
+    configure_http_cache(enabled=task.http_cache and archive is None,
+                         cache_dir=Path(task.http_cache_dir or DEFAULT_HTTP_CACHE_DIR))
+    configure_rate_limits(task.rate_limits)
+    if not configure_transport(http2=task.http2) and task.http2:
+        logger.warning("[Shard] HTTP/2 needs httpx with h2; using HTTP/1.1")
+    configure_egress(task.egress, hosts=task.egress_hosts)
+    configure_parse_pool(workers=task.parse_workers)
+    configure_scheduler(max_workers=task.fetch_workers, per_host=task.fetch_per_host)
+    install_dns_cache(task.dns_ttl)
+
+
+def crawl_shard(task: ShardTask) -> ShardResult:
+    """Crawl one shard and return its raw, un-deduplicated articles.
+
+    Health data and circuit breakers are not saved here; the shard reports
+    its breaker outcomes and the coordinator records everything once for
+    the whole crawl. A process crawls one shard at a time, since each task
+    reconfigures the whole process.
+    """
+    with _shard_lock:
+        return _crawl_shard(task)
+
+
+def _crawl_shard(task: ShardTask) -> ShardResult:
+    from clawler.http_archive import get_http_archive
+
+    configure_shard_process(task)
+    result = ShardResult(index=task.index)
+    sources = build_shard_sources(task)
+    if not sources:
+        return result
+    crawl_filter = CrawlFilter.from_dict(task.crawl_filter) if task.crawl_filter else None
+    engine = CrawlEngine(sources=sources, max_workers=task.max_workers, retries=task.retries,
+                         source_timeout=task.source_timeout, crawl_timeout=task.crawl_timeout,
+                         crawl_filter=crawl_filter, breaker_threshold=task.breaker_threshold,
+                         prewarm=task.prewarm)
+    circuits = task.circuits if task.circuits is not None else engine.health.breaker.to_dict()
+    breaker = RecordingCircuitBreaker.from_dict(circuits, threshold=task.breaker_threshold)
+    engine.health.breaker = breaker
+    result.sources_skipped = list(engine.pushdown.sources_skipped)
+    result.feeds_skipped = engine.pushdown.feeds_skipped
+    if not engine.sources:
+        return result
+    archive = get_http_archive()
+    before = (archive.recorded, archive.replayed, archive.missing) if archive is not None else None
+    try:
+        for _src, articles in engine._iter_results(result.stats):
+            result.articles.extend(articles)
+    finally:
+        result.circuit_events = [list(e) for e in breaker.events]
+    result.timings_ms = dict(engine.timings)
+    if engine.prewarm_stats is not None:
+        result.prewarm = asdict(engine.prewarm_stats)
+    if archive is not None:
+        after = (archive.recorded, archive.replayed, archive.missing)
+        result.archive = {k: a - b for k, a, b in zip(("recorded", "replayed", "missing"), after, before)}
+    logger.info(f"[Shard] {task.index + 1}/{task.count}: {len(result.articles)} articles "
+                f"from {len(engine.sources)} sources")
+    return result
+
+
+_shard_lock = threading.Lock()
+
+
+def _crawl_shard_safe(task: ShardTask) -> ShardResult:
+    try:
+        return crawl_shard(task)
+    except Exception as e:
+        logger.error(f"[Shard] {task.index + 1}/{task.count} failed: {e}")
+        return ShardResult(index=task.index, error=str(e))
+
+
+class ShardTransport(ABC):
+    """Delivers shard tasks to workers and streams back their results."""
+
+    @abstractmethod
+    def run(self, tasks: List[ShardTask]) -> Iterator[ShardResult]:
+        """Run every task; yield results in completion order. Never raises for one failed shard."""
+        ...
+
+
+class LocalProcessTransport(ShardTransport):
+    """Run each shard in its own process on this machine."""
+
+    def __init__(self, max_processes: Optional[int] = None):
+        self.max_processes = max_processes
+
+    def run(self, tasks: List[ShardTask]) -> Iterator[ShardResult]:
+        if not tasks:
+            return
+        workers = min(len(tasks), self.max_processes or len(tasks))
+        # spawn: forked children would inherit the parent's threads and locks
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = {pool.submit(_crawl_shard_safe, task): task for task in tasks}
+            for future in as_completed(futures):
+                task = futures[future]
+                try:
+                    yield future.result()
+                except Exception as e:
+                    logger.error(f"[Shard] {task.index + 1}/{task.count} worker died: {e}")
+                    yield ShardResult(index=task.index, error=str(e))
+
+
+def _is_unix_address(address: str) -> bool:
+    return os.sep in address or ":" not in address
+
+
+def _connect(address: str, timeout: Optional[float]) -> socket.socket:
+    if _is_unix_address(address):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        sock.connect(address)
+        return sock
+    host, port = address.rsplit(":", 1)
+    return socket.create_connection((host, int(port)), timeout=timeout)
+
+
+class SocketTransport(ShardTransport):
+    """Send shard ``i`` to ``addresses[i % len(addresses)]`` (``clawler --shard-serve``)."""
+
+    def __init__(self, addresses: List[str], timeout: Optional[float] = None, token: Optional[str] = None):
+        if not addresses:
+            raise ValueError("SocketTransport needs at least one worker address")
+        self.addresses = list(addresses)
+        self.timeout = timeout
+        self.token = token
+
+    def _request(self, address: str, task: ShardTask) -> ShardResult:
+        message = asdict(task)
+        if self.token:
+            message["token"] = self.token
+        with _connect(address, self.timeout) as sock:
+            sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+        if not line:
+            raise ConnectionError(f"no reply from {address}")
+        return ShardResult.from_dict(json.loads(line))
+
+    def run(self, tasks: List[ShardTask]) -> Iterator[ShardResult]:
+        if not tasks:
+            return
+        with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+            futures = {
+                pool.submit(self._request, self.addresses[task.index % len(self.addresses)], task): task
+                for task in tasks
+            }
+            for future in as_completed(futures):
+                task = futures[future]
+                try:
+                    yield future.result()
+                except Exception as e:
+                    logger.error(f"[Shard] {task.index + 1}/{task.count} transport failed: {e}")
+                    yield ShardResult(index=task.index, error=str(e))
+
+
+class _ShardRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            message = json.loads(line)
+            token = message.pop("token", None) if isinstance(message, dict) else None
+            task = ShardTask(**message)
+        except (ValueError, TypeError) as e:
+            result = ShardResult(index=-1, error=f"bad shard task: {e}")
+        else:
+            if self.server.token and not (isinstance(token, str) and
+                                          hmac.compare_digest(token.encode("utf-8"), self.server.token.encode("utf-8"))):
+                logger.warning(f"[Shard] Rejected task from {self.client_address or 'local peer'}: bad token")
+                result = ShardResult(index=task.index, error="shard worker rejected the task: bad token")
+            elif any(getattr(task, name) is not None for name in _PATH_FIELDS):
+                result = ShardResult(index=task.index, error="shard worker rejected the task: "
+                                     f"{', '.join(_PATH_FIELDS)} can't be set over the network")
+            else:
+                result = self.server.crawl(task)
+        self.wfile.write(json.dumps(result.to_dict()).encode("utf-8") + b"\n")
+
+
+class _ThreadingUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host.strip("[]")).is_loopback
+    except ValueError:
+        return False
+
+
+def make_shard_server(address: str, crawl: Callable[[ShardTask], ShardResult] = _crawl_shard_safe,
+                      token: Optional[str] = None):
+    """Create (but don't start) a shard worker server bound to ``address``.
+
+    With ``token``, only tasks carrying the same token are crawled. Without
+    one, a TCP server may only bind a loopback address (ValueError otherwise).
+    """
+    if _is_unix_address(address):
+        if os.path.exists(address):
+            os.unlink(address)
+        server = _ThreadingUnixServer(address, _ShardRequestHandler)
+    else:
+        host, port = address.rsplit(":", 1)
+        if not token and not _is_loopback(host):
+            raise ValueError(f"Serving shards on {host} needs a shared token (set {SHARD_TOKEN_ENV})")
+        server = _ThreadingTCPServer((host, int(port)), _ShardRequestHandler)
+    server.crawl = crawl
+    server.token = token
+    return server
+
+
+def serve_shards(address: str, token: Optional[str] = None):
+    """Run a shard worker on ``address`` until interrupted."""
+    with make_shard_server(address, token=token) as server:
+        logger.warning(f"[Shard] Serving shard crawls on {address}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+class ShardedCrawlEngine(CrawlEngine):
+    """Coordinator: crawl ``shards`` shards through a transport, then merge.
+
+    ``crawl`` and ``crawl_iter`` behave as on ``CrawlEngine``: articles from
+    all shards are deduplicated and ranked together, and each shard's
+    articles are available as soon as that shard finishes. Per-source stats
+    are summed across shards (the RSS source runs in all of them) and health
+    data is recorded once, by the coordinator. Shards start from the
+    coordinator's circuit breaker state and report their outcomes back, so
+    the breaker it saves covers the whole crawl.
+
+    Workers don't inherit the coordinator's process-wide configuration;
+    pass it as ``task_settings`` — extra ``ShardTask`` fields such as
+    ``replay``, ``rate_limits`` or ``http2`` sent with every shard (see
+    ``configure_shard_process``).
+    """
+
+    def __init__(self, shards: int, keys: Optional[List[str]] = None,
+                 transport: Optional[ShardTransport] = None, rss_feeds: Optional[List[dict]] = None,
+                 timeout: int = 15, max_workers: int = 6, retries: int = 1,
+                 source_timeout: Optional[float] = DEFAULT_SOURCE_TIMEOUT,
+                 crawl_timeout: Optional[float] = None, fetch_retries: Optional[int] = None,
+                 rss_workers: Optional[int] = None, rss_per_host: Optional[int] = None,
+                 crawl_filter: Optional[CrawlFilter] = None, podcast_feeds: Optional[List] = None,
+                 prewarm: bool = False, task_settings: Optional[Dict[str, Any]] = None):
+        # prewarm is passed on to the shards, which warm the hosts they crawl
+        super().__init__(sources=[], max_workers=max_workers, retries=retries,
+                         source_timeout=source_timeout, crawl_timeout=crawl_timeout, prewarm=prewarm,
+                         breaker_threshold=(task_settings or {}).get("breaker_threshold", DEFAULT_THRESHOLD))
+        from clawler.registry import get_all_keys
+        self.shards = max(1, shards)
+        self.keys = list(keys) if keys is not None else get_all_keys()
+        self.transport = transport or LocalProcessTransport()
+        self.rss_feeds = rss_feeds
+        self.podcast_feeds = podcast_feeds
+        self.timeout = timeout
+        self.fetch_retries = fetch_retries
+        self.rss_workers = rss_workers
+        self.rss_per_host = rss_per_host
+        # Pushdown runs inside each shard; self.pushdown sums what they skipped
+        self.crawl_filter = crawl_filter if crawl_filter is not None and crawl_filter.active else None
+        self.task_settings = dict(task_settings or {})
+        invalid = set(self.task_settings) - ({f.name for f in fields(ShardTask)} - {"index", "count", "keys"})
+        if invalid:
+            raise ValueError(f"Invalid shard task settings: {', '.join(sorted(invalid))}")
+
+    @staticmethod
+    def _default_sources() -> List[BaseSource]:
+        # Sources are built inside the workers
+        return []
+
+    def tasks(self) -> List[ShardTask]:
+        podcast_feeds = [asdict(f) for f in self.podcast_feeds] if self.podcast_feeds else None
+        settings = dict(rss_feeds=self.rss_feeds, podcast_feeds=podcast_feeds,
+                        timeout=self.timeout, max_workers=self.max_workers,
+                        retries=self.retries, source_timeout=self.source_timeout,
+                        crawl_timeout=self.crawl_timeout, fetch_retries=self.fetch_retries,
+                        rss_workers=self.rss_workers, rss_per_host=self.rss_per_host,
+                        crawl_filter=self.crawl_filter.to_dict() if self.crawl_filter else None,
+                        prewarm=self.prewarm, circuits=self.health.breaker.to_dict())
+        settings.update(self.task_settings)
+        return [ShardTask(index=i, count=self.shards, keys=self.keys, **settings) for i in range(self.shards)]
+
+    def _iter_results(self, stats: Dict[str, int]):
+        from clawler.http_archive import get_http_archive
+
+        archive = get_http_archive()
+        timings: Dict[str, float] = {}
+        self.circuit_skipped = []
+        self.prewarm_stats = PrewarmStats() if self.prewarm else None
+        for result in self.transport.run(self.tasks()):
+            if result.error:
+                logger.error(f"[Engine] Shard {result.index + 1}/{self.shards} failed: {result.error}")
+                continue
+            for name, count in result.stats.items():
+                prev = stats.get(name)
+                stats[name] = count if prev is None or prev < 0 else prev + max(count, 0)
+            for name, ms in result.timings_ms.items():
+                timings[name] = max(ms, timings.get(name, 0.0))
+            for name in result.sources_skipped:
+                if name not in self.pushdown.sources_skipped:
+                    self.pushdown.sources_skipped.append(name)
+            self.pushdown.feeds_skipped += result.feeds_skipped
+            self.health.breaker.replay(result.circuit_events)
+            if self.prewarm_stats is not None and result.prewarm:
+                warm = self.prewarm_stats
+                warm.hosts += int(result.prewarm.get("hosts", 0))
+                warm.connections += int(result.prewarm.get("connections", 0))
+                warm.failed += int(result.prewarm.get("failed", 0))
+                warm.handshake_ms += result.prewarm.get("handshake_ms", 0.0)
+                warm.elapsed_ms = max(warm.elapsed_ms, result.prewarm.get("elapsed_ms", 0.0))
+            for key, outcome in result.circuit_events:
+                name = key[len(source_key("")):]
+                if outcome == SKIPPED and key == source_key(name) and name not in self.circuit_skipped:
+                    self.circuit_skipped.append(name)
+            if archive is not None:
+                archive.recorded += result.archive.get("recorded", 0)
+                archive.replayed += result.archive.get("replayed", 0)
+                archive.missing += result.archive.get("missing", 0)
+            logger.info(f"[Engine] Shard {result.index + 1}/{self.shards} returned "
+                        f"{len(result.articles)} articles")
+            yield None, result.articles
+
+        for name, count in stats.items():
+            if count < 0:
+                self.health.record_failure(name)
+            else:
+                self.health.record_success(name, count, response_ms=timings.get(name, 0))
@@ -8,7 +8,6 @@ import logging
 import re
 from typing import List, Optional
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -53,7 +52,7 @@ class AlJazeeraSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles = []
 
         for entry in parsed.entries[:self.limit]:
@@ -18,7 +18,6 @@ import math
 import re
 from typing import Dict, List, Optional, Set
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -217,7 +216,7 @@ class APNewsSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles = []
 
         for position, entry in enumerate(parsed.entries[: self.limit]):
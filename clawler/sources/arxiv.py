@@ -4,7 +4,6 @@ import math
 import re
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Set
-import feedparser
 from dateutil import parser as dateparser
 from clawler.models import Article
 from clawler.sources.base import BaseSource
@@ -136,7 +135,7 @@ class ArXivSource(BaseSource):
 
     def _parse_feed(self, xml_text: str, source_category: str = None) -> List[Article]:
         """Parse ArXiv Atom feed into Articles using feedparser."""
-        feed = feedparser.parse(xml_text)
+        feed = self.parse_feed(xml_text)
         articles: List[Article] = []
 
         for entry in feed.entries:
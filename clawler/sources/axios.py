@@ -18,7 +18,6 @@ import logging
 import re
 from typing import Dict, List, Optional, Set
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -272,7 +271,7 @@ class AxiosSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles = []
 
         for position, entry in enumerate(parsed.entries[: self.limit]):
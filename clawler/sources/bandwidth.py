@@ -0,0 +1,164 @@
+"""Byte-level accounting of source fetches.
+
+Every attempt ``BaseSource._fetch_with_retry`` makes is recorded as a
+``Transfer``: status code, bytes on the wire, bytes after decoding, time to
+first byte and total transfer time. While the engine runs a crawl each
+source has a ``TrafficMeter`` that adds these up per URL; the engine then
+hands the totals to ``HealthTracker``, which keeps them across runs for
+``--stats`` and ``--slow-sources``.
+
+Wire bytes are the response headers plus the body as received (compressed,
+if the server compressed it) — read from urllib3's byte counter, or from
+``Content-Length`` where the transport doesn't expose one (aiohttp, HTTP/2,
+replayed archives). Only what was actually read is counted: a feed cut off
+after its first items costs the bytes up to the cut.
+"""
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+def _header_bytes(headers) -> int:
+    """Approximate size of a response's status line and headers."""
+    try:
+        return 17 + sum(len(k) + len(v) + 4 for k, v in headers.items())
+    except (AttributeError, TypeError):
+        return 0
+
+
+def _declared_length(headers) -> Optional[int]:
+    try:
+        return int(headers.get("Content-Length"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _wire_position(raw) -> Optional[int]:
+    """Bytes read off the socket so far (urllib3 counts them before decoding)."""
+    tell = getattr(raw, "tell", None)
+    if not callable(tell):
+        return None
+    try:
+        position = tell()
+    except (OSError, ValueError):  # closed file (replayed archive)
+        return None
+    return position if isinstance(position, int) else None
+
+
+@dataclass
+class Transfer:
+    """One fetch attempt: a response (``status`` 0 if none arrived) and what it cost."""
+    url: str
+    status: int = 0
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+    ttfb_ms: float = 0.0
+    total_ms: float = 0.0
+    _t0: float = field(default_factory=time.monotonic, repr=False)
+
+    def headers(self, resp):
+        """The response's status line and headers have arrived."""
+        self.ttfb_ms = (time.monotonic() - self._t0) * 1000
+        status = getattr(resp, "status_code", None)
+        if status is None:
+            status = getattr(resp, "status", 0)  # aiohttp
+        self.status = status if isinstance(status, int) else 0
+        self.wire_bytes = _header_bytes(getattr(resp, "headers", None))
+
+    def body(self, resp, decoded: int):
+        """``decoded`` bytes of body were read (0 if the body was skipped)."""
+        self.decoded_bytes = decoded
+        wire = _wire_position(getattr(resp, "raw", None))
+        if not isinstance(wire, int):
+            declared = _declared_length(getattr(resp, "headers", None))
+            wire = min(declared, decoded) if declared is not None and decoded else decoded
+        self.wire_bytes += wire
+        self.done()
+
+    def done(self):
+        """The attempt is over (idempotent: the first call fixes the transfer time)."""
+        if not self.total_ms:
+            self.total_ms = (time.monotonic() - self._t0) * 1000
+
+
+@dataclass
+class UrlTraffic:
+    """Totals over every attempt made for one URL (or one source)."""
+    requests: int = 0
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+    ttfb_ms: float = 0.0    # summed; see avg_ttfb_ms
+    total_ms: float = 0.0   # summed
+    statuses: Counter = field(default_factory=Counter)
+
+    def add(self, t: Transfer):
+        self.requests += 1
+        self.wire_bytes += t.wire_bytes
+        self.decoded_bytes += t.decoded_bytes
+        self.ttfb_ms += t.ttfb_ms
+        self.total_ms += t.total_ms
+        self.statuses[str(t.status)] += 1
+
+    def merge(self, other: "UrlTraffic"):
+        self.requests += other.requests
+        self.wire_bytes += other.wire_bytes
+        self.decoded_bytes += other.decoded_bytes
+        self.ttfb_ms += other.ttfb_ms
+        self.total_ms += other.total_ms
+        self.statuses.update(other.statuses)
+
+    @property
+    def compression_ratio(self) -> float:
+        """Decoded over wire bytes (1.0 = uncompressed)."""
+        return round(self.decoded_bytes / self.wire_bytes, 2) if self.wire_bytes else 1.0
+
+    @property
+    def avg_ttfb_ms(self) -> float:
+        return round(self.ttfb_ms / self.requests, 1) if self.requests else 0.0
+
+    def to_dict(self) -> dict:
+        return {"requests": self.requests, "wire_bytes": self.wire_bytes, "decoded_bytes": self.decoded_bytes,
+                "ttfb_ms": round(self.ttfb_ms, 1), "total_ms": round(self.total_ms, 1),
+                "statuses": dict(self.statuses)}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "UrlTraffic":
+        return cls(requests=d.get("requests", 0), wire_bytes=d.get("wire_bytes", 0),
+                   decoded_bytes=d.get("decoded_bytes", 0), ttfb_ms=d.get("ttfb_ms", 0.0),
+                   total_ms=d.get("total_ms", 0.0), statuses=Counter(d.get("statuses") or {}))
+
+
+class TrafficMeter:
+    """Per-URL ``UrlTraffic`` for one source's crawl (thread-safe)."""
+
+    def __init__(self):
+        self.urls: Dict[str, UrlTraffic] = {}
+        self._lock = threading.Lock()
+
+    def add(self, transfer: Transfer):
+        with self._lock:
+            self.urls.setdefault(transfer.url, UrlTraffic()).add(transfer)
+
+    @property
+    def total(self) -> UrlTraffic:
+        total = UrlTraffic()
+        with self._lock:
+            for traffic in self.urls.values():
+                total.merge(traffic)
+        return total
+
+    def top_urls(self, n: int = 10) -> List[tuple]:
+        """``(url, UrlTraffic)`` for the ``n`` URLs that cost the most wire bytes."""
+        with self._lock:
+            items = list(self.urls.items())
+        return sorted(items, key=lambda kv: kv[1].wire_bytes, reverse=True)[:n]
+
+
+def format_bytes(n: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if abs(n) < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
@@ -1,7 +1,23 @@
 """Base source class."""
 from abc import ABC, abstractmethod
-from typing import List
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, TimeoutError as FutureTimeoutError, wait
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+from clawler.circuit import HALF_OPEN, OPEN, CircuitBreaker, host_key, url_key
+from clawler.http_archive import get_http_archive
+from clawler.http_cache import cache_key, get_http_cache
 from clawler.models import Article
+from clawler.sources.bandwidth import TrafficMeter, Transfer
+from clawler.sources.connections import Http2Adapter, new_session
+from clawler.sources.egress import get_egress_pool
+from clawler.sources.feed_stream import FeedItemScanner
+from clawler.sources.rate_limit import THROTTLE_STATUSES, get_rate_limiter
+import asyncio
+import copy
+import hashlib
+import json
 import random
 import requests
 import logging
@@ -65,6 +81,7 @@ HEADERS = _LazyHeaders()
 # Shared session for connection pooling (TCP keep-alive, connection reuse)
 _session: requests.Session | None = None
 _session_lock = threading.Lock()
+_hosts_lock = threading.Lock()
 
 
 def _get_session() -> requests.Session:
@@ -73,23 +90,360 @@ def _get_session() -> requests.Session:
     if _session is None:
         with _session_lock:
             if _session is None:
-                s = requests.Session()
-                # Increase pool size for parallel crawling
-                adapter = requests.adapters.HTTPAdapter(
-                    pool_connections=20,
-                    pool_maxsize=20,
-                    max_retries=0,  # We handle retries ourselves
-                )
-                s.mount("https://", adapter)
-                s.mount("http://", adapter)
-                _session = s
+                # One pool per host, each sized for that host; records/replays when an archive is set
+                _session = new_session()
     return _session
 
 
-# Per-domain rate limiting — minimum seconds between requests to the same domain
-_domain_last_request: dict = {}  # domain -> last request timestamp
-_rate_limit_lock = threading.Lock()
-_RATE_LIMIT_SECONDS = 0.5
+def _session_for(egress: Optional[str]) -> Tuple[requests.Session, Dict[str, Any]]:
+    """The session that sends through ``egress`` (None = direct) and the extra ``get`` arguments it needs."""
+    pool = get_egress_pool() if egress is not None else None
+    if pool is None:
+        return _get_session(), {}
+    return pool.session(egress), pool.request_kwargs(egress)
+
+
+def _egress_routes(url: str) -> Optional[List[str]]:
+    """The egresses ``url`` may be sent through, or None when it goes out directly."""
+    pool = get_egress_pool()
+    return pool.routes(url) if pool is not None else None
+
+
+_http2_adapter: Optional[Http2Adapter] = None
+
+
+def configure_transport(http2: bool = False, hosts: Optional[Iterable[str]] = None) -> bool:
+    """Choose the transport behind ``fetch_url``/``fetch_json``.
+
+    With ``http2=True`` HTTPS requests (only to ``hosts``, if given) go
+    through an ``Http2Adapter``: one multiplexed connection per host instead
+    of a pool of HTTP/1.1 connections. Retries, rate limits, deadlines, the
+    HTTP cache and archives behave the same on either transport.
+
+    Returns whether HTTP/2 is in use — False when turned off or when httpx/h2
+    isn't installed, in which case the HTTP/1.1 pools stay in place.
+    """
+    global _http2_adapter
+    session = _get_session()
+    with _session_lock:
+        for prefix in [p for p, a in session.adapters.items() if isinstance(a, Http2Adapter)]:
+            del session.adapters[prefix]
+        if "https://" not in session.adapters:
+            session.mount("https://", session.adapters["http://"])
+        if _http2_adapter is not None:
+            _http2_adapter.close()
+            _http2_adapter = None
+        if not http2:
+            return False
+        try:
+            adapter = Http2Adapter()
+        except ImportError as e:
+            logger.warning(f"[Transport] {e}; staying on HTTP/1.1")
+            return False
+        for prefix in ([f"https://{h.lower()}/" for h in hosts] if hosts else ["https://"]):
+            session.mount(prefix, adapter)
+        _http2_adapter = adapter
+        return True
+
+
+# Responses are streamed and never read past this many bytes (per
+# source: ``BaseSource.max_response_bytes``)
+DEFAULT_MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+
+def _detect_encoding(body: bytes) -> str:
+    """Best guess at the charset of a body whose response didn't declare one."""
+    try:
+        from requests.compat import chardet
+        return chardet.detect(body)["encoding"] or "utf-8"
+    except Exception:
+        return "utf-8"
+
+
+def _decode(body: bytes, encoding: Optional[str]) -> str:
+    try:
+        return body.decode(encoding or _detect_encoding(body), errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+class _CappedBody:
+    """Accumulates a streamed body up to ``max_bytes`` or ``max_items`` feed items.
+
+    A feed cut short by either limit is closed after its last complete item
+    (see ``feed_stream.py``). Only the byte cap makes a body incomplete: one
+    stopped at ``max_items`` is exactly what the caller asked for.
+    """
+
+    def __init__(self, url: str, max_bytes: Optional[int] = None, max_items: Optional[int] = None):
+        self.url = url
+        self.max_bytes = max_bytes
+        self.scanner = FeedItemScanner(max_items) if max_items else None
+        self.body = bytearray()
+        self.complete = True
+        self.received = 0  # decoded bytes read, including any past the cap
+
+    def add(self, chunk: bytes) -> bool:
+        """Append ``chunk``; return True when reading should stop."""
+        self.received += len(chunk)
+        self.body.extend(chunk)
+        over_cap = self.max_bytes is not None and len(self.body) >= self.max_bytes
+        if over_cap:
+            del self.body[self.max_bytes:]
+        if self.scanner is not None and self.scanner.feed(self.body):
+            return True
+        if over_cap:
+            logger.info(f"[Fetch] {self.url} is larger than {self.max_bytes} bytes; truncated")
+            if self.scanner is not None:
+                self.scanner.cut_after_last_item()
+            self.complete = False
+            return True
+        return False
+
+    def text(self, encoding: Optional[str]) -> str:
+        data = bytes(self.body)
+        if self.scanner is not None:
+            data = self.scanner.truncate(data)
+        return _decode(data, encoding)
+
+
+def _read_text(resp, url: str, max_bytes: Optional[int] = None, max_items: Optional[int] = None,
+               transfer: Optional[Transfer] = None) -> Tuple[str, bool]:
+    """Read a streamed (``stream=True``) response body as text, within the limits.
+
+    Returns ``(text, complete)``; ``complete`` is False if ``max_bytes`` cut
+    the body short. Decodes like ``resp.text``: the declared charset, else a guess
+    from the bytes. The bytes read are added to ``transfer``, if given.
+    """
+    body = _CappedBody(url, max_bytes, max_items)
+    try:
+        for chunk in resp.iter_content(chunk_size=_STREAM_CHUNK_BYTES):
+            if body.add(chunk):
+                break
+    finally:
+        resp.close()
+        if transfer is not None:
+            transfer.body(resp, body.received)
+    return body.text(resp.encoding), body.complete
+
+
+async def _aread_text(resp, url: str, max_bytes: Optional[int] = None,
+                      max_items: Optional[int] = None, transfer: Optional[Transfer] = None) -> Tuple[str, bool]:
+    """Async ``_read_text`` for an aiohttp response."""
+    body = _CappedBody(url, max_bytes, max_items)
+    async for chunk in resp.content.iter_chunked(_STREAM_CHUNK_BYTES):
+        if body.add(chunk):
+            break
+    if transfer is not None:
+        transfer.body(resp, body.received)
+    return body.text(resp.charset), body.complete
+
+
+# Shared aiohttp session for the async fetch path (optional dependency).
+# Bound to the event loop that created it; AsyncCrawlEngine opens and closes it.
+_async_session = None
+_async_session_loop = None
+
+
+def _aiohttp():
+    """Return the aiohttp module, or None when it isn't installed."""
+    try:
+        import aiohttp
+        return aiohttp
+    except ImportError:
+        return None
+
+
+def open_async_session(max_connections: int = 200, max_per_host: int = 0):
+    """Create the shared aiohttp session for the running event loop.
+
+    Returns None (and async fetches fall back to worker threads) when aiohttp
+    is not installed. ``max_per_host=0`` means no per-host connection cap —
+    per-domain rate limiting still applies.
+    """
+    global _async_session, _async_session_loop
+    aiohttp = _aiohttp()
+    if aiohttp is None:
+        logger.info("[Async] aiohttp not installed; async fetches will use worker threads")
+        return None
+    loop = asyncio.get_running_loop()
+    if _async_session is not None and _async_session_loop is loop and not _async_session.closed:
+        return _async_session
+    connector = aiohttp.TCPConnector(limit=max_connections, limit_per_host=max_per_host)
+    _async_session = aiohttp.ClientSession(connector=connector)
+    _async_session_loop = loop
+    return _async_session
+
+
+async def close_async_session():
+    """Close the shared aiohttp session, if one is open."""
+    global _async_session, _async_session_loop
+    session, _async_session, _async_session_loop = _async_session, None, None
+    if session is not None and not session.closed:
+        await session.close()
+
+
+def _get_async_session():
+    """Return the shared aiohttp session if it belongs to the running loop."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    if _async_session is None or _async_session_loop is not loop or _async_session.closed:
+        return None
+    return _async_session
+
+
+# ── Request coalescing ────────────────────────────────────────────────
+# Many feeds are fetched by more than one source in a crawl (DEFAULT_FEEDS
+# and the dedicated Ars Technica/Lobsters/TechCrunch/... sources, overlapping
+# Reddit and Google News configurations). The engine gives every source of a
+# crawl the same FetchCoalescer: concurrent requests for a URL wait for the
+# first one, and later requests reuse its result.
+
+DEFAULT_COALESCE_BYTES = 64 * 1024 * 1024  # completed results kept per crawl
+_NON_TEXT_RESULT_BYTES = 64 * 1024         # size charged for a parsed JSON/feed result
+
+
+def normalize_fetch_url(url: str) -> str:
+    """``url`` with case-insensitive parts lower-cased, default port and fragment dropped."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    for default_scheme, port in (("http", ":80"), ("https", ":443")):
+        if scheme == default_scheme and netloc.endswith(port):
+            netloc = netloc[:-len(port)]
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+def _failed(result) -> bool:
+    return result is None or (isinstance(result, str) and not result)
+
+
+class FetchCoalescer:
+    """Single-flight table for one crawl: one fetch (or parse) per key.
+
+    The first caller for a key runs it; callers arriving while it runs wait
+    for its result, and callers arriving later get the stored result, until
+    ``max_bytes`` of results are held and the oldest are dropped. Failed
+    results (``""``/``None``) are never shared: a waiting caller then makes
+    its own attempt. Mutable results are copied for every caller but the
+    first, except parsed feeds, which sources share read-only.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_COALESCE_BYTES):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Future]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._bytes = 0
+        self.requests = 0  # fetches asked for
+        self.saved = 0     # of those, answered without a network round-trip
+        self.parses_saved = 0
+
+    def _join(self, key: Hashable) -> Tuple[Future, bool]:
+        """Return the entry for ``key`` and whether the caller must run it."""
+        with self._lock:
+            future = self._entries.get(key)
+            if future is not None:
+                self._entries.move_to_end(key)
+                return future, False
+            future = self._entries[key] = Future()
+            return future, True
+
+    def _settle(self, key: Hashable, future: Future, result):
+        future.set_result(result)
+        with self._lock:
+            if _failed(result):
+                if self._entries.get(key) is future:
+                    del self._entries[key]
+                return
+            size = len(result) if isinstance(result, str) else _NON_TEXT_RESULT_BYTES
+            self._sizes[key] = size
+            self._bytes += size
+            # Evict the oldest completed results (in-flight entries stay)
+            for old in list(self._entries):
+                if self._bytes <= self.max_bytes:
+                    break
+                if old in self._sizes:
+                    del self._entries[old]
+                    self._bytes -= self._sizes.pop(old)
+
+    def _abandon(self, key: Hashable, future: Future, exc: BaseException):
+        with self._lock:
+            if self._entries.get(key) is future:
+                del self._entries[key]
+        future.set_exception(exc)
+
+    def _count(self, parse: bool):
+        with self._lock:
+            if parse:
+                self.parses_saved += 1
+            else:
+                self.saved += 1
+
+    @staticmethod
+    def _share(result, parse: bool):
+        return result if parse or isinstance(result, str) else copy.deepcopy(result)
+
+    def run(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None, parse: bool = False):
+        """``fn()``, or the result of the call already made (or in flight) for ``key``.
+
+        A caller that waits longer than ``timeout`` seconds for another
+        caller's result gets None back.
+        """
+        if not parse:
+            with self._lock:
+                self.requests += 1
+        future, leader = self._join(key)
+        if leader:
+            try:
+                result = fn()
+            except BaseException as e:
+                self._abandon(key, future, e)
+                raise
+            self._settle(key, future, result)
+            return result
+        try:
+            result = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            return None
+        except Exception:
+            return fn()
+        if _failed(result):
+            return fn()
+        self._count(parse)
+        return self._share(result, parse)
+
+    async def arun(self, key: Hashable, fn: Callable[[], Awaitable[Any]], timeout: Optional[float] = None):
+        """Async ``run``: shares entries with threaded callers of the same crawl."""
+        with self._lock:
+            self.requests += 1
+        future, leader = self._join(key)
+        if leader:
+            try:
+                result = await fn()
+            except BaseException as e:
+                self._abandon(key, future, e)
+                raise
+            self._settle(key, future, result)
+            return result
+        try:
+            result = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+        except asyncio.TimeoutError:
+            return None
+        except Exception:
+            return await fn()
+        if _failed(result):
+            return await fn()
+        self._count(False)
+        return self._share(result, False)
+
+
+def _coalesce_key(kind: str, url: str, kwargs: Dict[str, Any]) -> Hashable:
+    extra = tuple(sorted((k, repr(v)) for k, v in kwargs.items()))
+    return kind, normalize_fetch_url(url), extra
 
 
 class BaseSource(ABC):
@@ -101,65 +455,487 @@ class BaseSource(ABC):
     retry_backoff: float = 1.0
     retry_jitter: float = 0.5  # random jitter factor (0-1) added to backoff
     config: dict  # per-source configuration (populated by caller or defaults to {})
+    _deadline: Optional[float] = None  # time.monotonic() budget end, set by the engine
+    since: Optional[datetime] = None  # entries older than this may be dropped early (filter pushdown)
+    _coalescer: Optional[FetchCoalescer] = None  # shared by the sources of one crawl, set by the engine
+    max_response_bytes: Optional[int] = DEFAULT_MAX_RESPONSE_BYTES  # bodies are cut off here (None = no cap)
+    hosts_contacted: Optional[Dict[str, int]] = None  # origin -> requests this crawl, when tracked by the engine
+    _breaker: Optional[CircuitBreaker] = None  # skips dead URLs/hosts, set by the engine
+    traffic: Optional[TrafficMeter] = None  # bytes/timings per URL this crawl, when tracked by the engine
 
     def __init__(self, **kwargs):
         self.config = kwargs
 
+    def apply_filter(self, crawl_filter) -> bool:
+        """Take the query's pushed-down predicates (a ``CrawlFilter``) before crawling.
+
+        Returns False if nothing this source would fetch can match, so the
+        engine can skip it. Sources that fetch several feeds with known
+        categories override this to drop the feeds that can't match.
+        """
+        self.since = crawl_filter.since
+        return True
+
+    # ── Crawl budget ──────────────────────────────────────────────────
+    # The engine gives each running source a deadline. fetch_url/fetch_json
+    # clamp request timeouts to it and return their empty value once it has
+    # passed, so a multi-URL crawl loop winds down by itself and returns
+    # whatever it collected. Loops may also check ``budget_expired`` to stop
+    # early.
+
+    def set_coalescer(self, coalescer: Optional[FetchCoalescer]):
+        """Share fetches with the other sources of a crawl (None = fetch independently)."""
+        self._coalescer = coalescer
+
+    def set_breaker(self, breaker: Optional[CircuitBreaker]):
+        """Skip URLs and hosts whose circuit is open (None = always fetch)."""
+        self._breaker = breaker
+
+    def _admit(self, url: str) -> int:
+        """Attempts ``url`` gets: ``max_retries + 1``, 1 when probing a half-open circuit, 0 while open."""
+        breaker = self._breaker
+        if breaker is None:
+            return self.max_retries + 1
+        states = []
+        for key in (url_key(url), host_key(url)):  # URL first: a skipped URL doesn't take the host's probe
+            state = breaker.admit(key)
+            if state == OPEN:
+                return 0
+            states.append(state)
+        return 1 if HALF_OPEN in states else self.max_retries + 1
+
+    def _circuit_result(self, url: str, ok: bool, reachable: bool = True):
+        """Report a fetch outcome; ``reachable`` is False when the host itself didn't answer."""
+        breaker = self._breaker
+        if breaker is None:
+            return
+        if ok:
+            breaker.record_success(url_key(url))
+        else:
+            breaker.record_failure(url_key(url))
+        if ok or reachable:
+            breaker.record_success(host_key(url))
+        else:
+            breaker.record_failure(host_key(url))
+
+    def track_hosts(self, enabled: bool = True):
+        """Start (or stop) counting requests per origin in ``hosts_contacted``."""
+        self.hosts_contacted = {} if enabled else None
+
+    def _note_request(self, url: str):
+        if self.hosts_contacted is None:
+            return
+        parts = urlsplit(url)
+        origin = f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+        with _hosts_lock:
+            self.hosts_contacted[origin] = self.hosts_contacted.get(origin, 0) + 1
+
+    def track_traffic(self, enabled: bool = True):
+        """Start (or stop) accounting bytes, statuses and timings per URL in ``traffic``."""
+        self.traffic = TrafficMeter() if enabled else None
+
+    def _meter(self, transfer: Transfer):
+        if self.traffic is not None:
+            self.traffic.add(transfer)
+
+    def prewarm_urls(self) -> List[str]:
+        """URLs this source is known to fetch before it runs, for connection pre-warming.
+
+        Defaults to the class's ``FEED_URL``/``API_URL``/``BASE_URL`` when it has
+        one; sources that fetch a fixed list of feeds override it.
+        """
+        return [url for url in (getattr(self, attr, None) for attr in ("FEED_URL", "API_URL", "BASE_URL"))
+                if isinstance(url, str)]
+
+    def set_deadline(self, deadline: Optional[float]):
+        """Set (or clear, with None) the ``time.monotonic()`` deadline for this crawl."""
+        self._deadline = deadline
+
+    def remaining_budget(self) -> Optional[float]:
+        """Seconds left before the deadline (never negative), or None if unbounded."""
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+
+    @property
+    def budget_expired(self) -> bool:
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def _request_timeout(self) -> float:
+        """Per-request timeout: ``self.timeout`` clamped to the remaining budget."""
+        remaining = self.remaining_budget()
+        if remaining is None:
+            return self.timeout
+        return max(0.1, min(self.timeout, remaining))
+
     @staticmethod
-    def _rate_limit(url: str):
-        """Enforce per-domain rate limiting (thread-safe).
+    def _rate_limit(url: str) -> Optional[str]:
+        """Wait for a token from ``url``'s host bucket (thread-safe, see ``rate_limit.py``).
+
+        The wait is computed under the limiter's lock but slept outside it so
+        other hosts are not blocked while one host is being throttled. If the
+        host was paused (429/503) in the meantime, wait for that too, still on
+        the token already reserved.
 
-        Calculates wait time under the lock but sleeps outside it so other
-        domains are not blocked while one domain is being throttled.
+        When ``url`` goes through the egress pool, the token comes from the
+        egress that can send soonest; returns its name (None = direct).
         """
-        from urllib.parse import urlparse
-        domain = urlparse(url).netloc
-        wait_time = 0.0
-        with _rate_limit_lock:
-            if domain in _domain_last_request:
-                elapsed = time.time() - _domain_last_request[domain]
-                if elapsed < _RATE_LIMIT_SECONDS:
-                    wait_time = _RATE_LIMIT_SECONDS - elapsed
-            # Reserve the slot immediately so concurrent requests to the same
-            # domain queue up properly.
-            _domain_last_request[domain] = time.time() + wait_time
-        if wait_time > 0:
+        limiter = get_rate_limiter()
+        egresses = _egress_routes(url)
+        if egresses:
+            egress, wait_time = limiter.reserve_any(url, egresses)
+        else:
+            egress, wait_time = None, limiter.reserve(url)
+        while wait_time > 0:
             time.sleep(wait_time)
-        with _rate_limit_lock:
-            _domain_last_request[domain] = time.time()
+            wait_time = limiter.delay(url, egress)
+        return egress
+
+    @staticmethod
+    async def _async_rate_limit(url: str):
+        """Async twin of ``_rate_limit``: shares the same host buckets."""
+        limiter = get_rate_limiter()
+        wait_time = limiter.reserve(url)
+        while wait_time > 0:
+            await asyncio.sleep(wait_time)
+            wait_time = limiter.delay(url)
+
+    def _throttle_exceeds_budget(self, url: str) -> bool:
+        """True if ``url``'s host is paused for longer than this crawl has left."""
+        remaining = self.remaining_budget()
+        if remaining is None:
+            return False
+        egresses = _egress_routes(url)
+        limiter = get_rate_limiter()
+        return (limiter.delay_any(url, egresses) if egresses else limiter.delay(url)) >= remaining
 
     def _fetch_with_retry(self, url: str, parse_json: bool = False, **kwargs):
         """Shared fetch logic with retries, rate limiting, and error handling.
 
         Returns response text (str) or parsed JSON (dict/list) on success.
-        Returns the appropriate empty value ("" for text, None for JSON) on failure.
+        Returns the appropriate empty value ("" for text, None for JSON) on failure,
+        or straight away once the crawl deadline has passed.
+
+        Requests are conditional when the HTTP cache holds validators for
+        ``url``; on a 304 the stored body is returned (as a ``NotModified``
+        string for text fetches).
+
+        Bodies are streamed and read at most ``max_response_bytes`` deep;
+        ``max_items=N`` also stops a feed download once its first N items
+        have arrived. Bodies cut by the byte cap are not put in the HTTP
+        cache; ones stopped at ``max_items`` are, stored per item count. JSON
+        cut by the cap can't be parsed, so the fetch returns None.
+
+        Each attempt waits for the host's rate-limit token first. A 429/503
+        pauses the host (honouring ``Retry-After``) and the retry waits for
+        the pause instead of the usual backoff.
         """
-        self._rate_limit(url)
         empty = None if parse_json else ""
-        for attempt in range(self.max_retries + 1):
+        if self.budget_expired:
+            logger.debug(f"[{self.name}] Budget expired, skipping {url}")
+            return empty
+        attempts = self._admit(url)
+        if not attempts:
+            logger.info(f"[{self.name}] Circuit open for {url}, skipping")
+            return empty
+        self._note_request(url)
+        cache = get_http_cache()
+        cache_url = cache_key(url, kwargs.get("max_items"))
+        limiter = get_rate_limiter()
+        for attempt in range(attempts):
+            if self.budget_expired:
+                logger.info(f"[{self.name}] Budget expired before fetching {url}")
+                return empty
+            if self._throttle_exceeds_budget(url):
+                logger.warning(f"[{self.name}] Host of {url} is paused past the crawl budget, skipping")
+                return empty
+            egress = self._rate_limit(url)
+            throttled = False
+            transfer = Transfer(url)
+            # Shortened to fit the crawl budget: a timeout then says nothing about the host
+            timeout = self._request_timeout()
+            clamped = timeout < self.timeout
             try:
-                session = _get_session()
-                resp = session.get(url, headers={**HEADERS, **kwargs.get("extra_headers", {})},
-                                     timeout=self.timeout)
+                session, route = _session_for(egress)
+                conditional = cache.validators(cache_url) if cache is not None else {}
+                resp = session.get(url, headers={**HEADERS, **conditional, **kwargs.get("extra_headers", {})},
+                                     timeout=timeout, stream=True, **route)
+                transfer.headers(resp)
+                if resp.status_code == 304 and conditional:
+                    body = cache.load(cache_url)
+                    if body is not None:
+                        logger.debug(f"[{self.name}] Not modified: {url}")
+                        resp.close()
+                        transfer.body(resp, 0)
+                        limiter.succeeded(url, egress=egress)
+                        self._circuit_result(url, ok=True)
+                        return json.loads(body) if parse_json else body
+                    # The stored body is gone: ask again without validators
+                    logger.debug(f"[{self.name}] Not modified but nothing cached, refetching: {url}")
+                    resp.close()
+                    transfer.body(resp, 0)
+                    self._meter(transfer)
+                    transfer = Transfer(url)
+                    resp = session.get(url, headers={**HEADERS, **kwargs.get("extra_headers", {})},
+                                         timeout=timeout, stream=True, **route)
+                    transfer.headers(resp)
+                if resp.status_code == 304:
+                    # Nothing to serve: a 304 body is empty and must never be cached
+                    resp.close()
+                    transfer.body(resp, 0)
+                    raise requests.HTTPError(f"304 Not Modified without a cached body for {url}", response=resp)
+                if resp.status_code in THROTTLE_STATUSES:
+                    throttled = True
+                    limiter.throttled(url, resp.headers.get("Retry-After"), egress=egress)
+                if not resp.ok:
+                    resp.close()  # streamed: release the connection without reading the error page
+                    transfer.body(resp, 0)
                 resp.raise_for_status()
-                return resp.json() if parse_json else resp.text
-            except requests.RequestException as e:
-                if attempt < self.max_retries:
+                limiter.succeeded(url, egress=egress)
+                self._circuit_result(url, ok=True)
+                text, complete = _read_text(resp, url, self.max_response_bytes,
+                                            None if parse_json else kwargs.get("max_items"), transfer=transfer)
+                if parse_json and not complete:
+                    logger.warning(f"[{self.name}] JSON from {url} is over {self.max_response_bytes} bytes, skipped")
+                    return empty
+                result = json.loads(text) if parse_json else text
+                if cache is not None and complete:
+                    cache.store(cache_url, resp.headers, text)
+                return result
+            except (requests.RequestException, ValueError) as e:
+                transfer.done()
+                if attempt < attempts - 1 and throttled:
+                    # The host's pause is the backoff; _rate_limit sleeps it out
+                    logger.info(f"[{self.name}] Retry {attempt+1}/{self.max_retries} for {url} after throttling")
+                elif attempt < attempts - 1:
                     base_wait = self.retry_backoff * (2 ** attempt)
                     wait = base_wait + random.uniform(0, base_wait * self.retry_jitter)
+                    remaining = self.remaining_budget()
+                    if remaining is not None and wait >= remaining:
+                        logger.warning(f"[{self.name}] Failed to fetch {url}, no budget left to retry: {e}")
+                        return empty
                     logger.info(f"[{self.name}] Retry {attempt+1}/{self.max_retries} for {url} in {wait:.1f}s")
                     time.sleep(wait)
+                elif clamped and isinstance(e, requests.Timeout):
+                    logger.warning(f"[{self.name}] Failed to fetch {url}: crawl budget ran out ({e})")
                 else:
-                    logger.warning(f"[{self.name}] Failed to fetch {url} after {self.max_retries+1} attempts: {e}")
+                    logger.warning(f"[{self.name}] Failed to fetch {url} after {attempts} attempts: {e}")
+                    self._circuit_result(url, ok=False,
+                                         reachable=not isinstance(e, (requests.ConnectionError, requests.Timeout)))
+            finally:
+                self._meter(transfer)
         return empty
 
+    def _coalesced_fetch(self, url: str, parse_json: bool, kwargs: Dict[str, Any]):
+        fetch = lambda: self._fetch_with_retry(url, parse_json=parse_json, **kwargs)
+        if self._coalescer is None:
+            return fetch()
+        key = _coalesce_key("json" if parse_json else "text", url, kwargs)
+        result = self._coalescer.run(key, fetch, timeout=self.remaining_budget())
+        return ("" if not parse_json else None) if result is None else result
+
     def fetch_url(self, url: str, **kwargs) -> str:
-        """Fetch URL content with retries, rate limiting, and error handling."""
-        return self._fetch_with_retry(url, parse_json=False, **kwargs)
+        """Fetch URL content with retries, rate limiting, and error handling.
+
+        Within a crawl, a URL already fetched (or being fetched) by any
+        source is not requested again; see ``FetchCoalescer``. For feeds,
+        ``max_items=N`` returns only the first N items (as a well-formed
+        feed) and stops the download there.
+        """
+        return self._coalesced_fetch(url, False, kwargs)
 
     def fetch_json(self, url: str, **kwargs):
         """Fetch URL and parse JSON, with retries and rate limiting. Returns None on failure."""
-        return self._fetch_with_retry(url, parse_json=True, **kwargs)
+        return self._coalesced_fetch(url, True, kwargs)
+
+    def fetch_many(self, urls: Iterable[str], parse_json: bool = False, ordered: bool = False,
+                   max_in_flight: Optional[int] = None, **kwargs) -> Iterator[Tuple[str, Any]]:
+        """Fetch several URLs concurrently, yielding ``(url, result)`` pairs.
+
+        Requests run on the shared fetch scheduler (see ``scheduler.py``), which
+        enforces global and per-host concurrency limits across all sources.
+        Each result is whatever ``fetch_url`` (or ``fetch_json`` with
+        ``parse_json=True``) returned; a fetch that raises yields the empty
+        value instead, so one bad URL never aborts the batch.
+
+        Results arrive in completion order, or in input order with
+        ``ordered=True`` (each as soon as it and all earlier URLs are done).
+        ``max_in_flight`` caps how many of this batch run at once. Extra
+        keyword arguments are passed through to every fetch.
+        """
+        from clawler.sources.scheduler import get_scheduler
+
+        urls = list(urls)
+        fetch = self.fetch_json if parse_json else self.fetch_url
+        empty = None if parse_json else ""
+
+        def fetch_one(url: str):
+            try:
+                return fetch(url, **kwargs)
+            except Exception as e:
+                logger.warning(f"[{self.name}] Failed to fetch {url}: {e}")
+                return empty
+
+        scheduler = get_scheduler()
+        if len(urls) <= 1 or scheduler.in_worker():
+            # Nothing to overlap, or already on a scheduler thread (avoid
+            # waiting on the pool from inside it)
+            for url in urls:
+                yield url, fetch_one(url)
+            return
+
+        limit = max_in_flight or len(urls)
+        in_flight: Dict[Future, int] = {}
+        finished: Dict[int, Any] = {}
+        next_submit = 0
+        next_emit = 0
+        while next_submit < len(urls) or in_flight:
+            while next_submit < len(urls) and len(in_flight) < limit:
+                url = urls[next_submit]
+                in_flight[scheduler.submit(url, fetch_one, url)] = next_submit
+                next_submit += 1
+            done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            for future in done:
+                idx = in_flight.pop(future)
+                if ordered:
+                    finished[idx] = future.result()
+                else:
+                    yield urls[idx], future.result()
+            while next_emit in finished:
+                yield urls[next_emit], finished.pop(next_emit)
+                next_emit += 1
+
+    def parse_feed(self, raw: str):
+        """``feedparser.parse(raw)``, run on the parse process pool when one is configured."""
+        import feedparser
+        from clawler.sources.parse_pool import run_parse
+        if self._coalescer is None or not isinstance(raw, str):
+            return run_parse(feedparser.parse, raw)
+        # Sources fetching the same feed share one (read-only) parse of it
+        key = ("parse", hashlib.sha1(raw.encode("utf-8", "surrogatepass")).hexdigest())
+        return self._coalescer.run(key, lambda: run_parse(feedparser.parse, raw), parse=True)
+
+    async def _async_fetch_with_retry(self, url: str, parse_json: bool = False, **kwargs):
+        """Async twin of ``_fetch_with_retry`` on the shared aiohttp session.
+
+        Without an open session (aiohttp missing, or called outside
+        AsyncCrawlEngine) the blocking fetch runs in a worker thread instead,
+        as it does while an HTTP archive or an egress pool is in use.
+        """
+        session = _get_async_session()
+        if session is None or get_http_archive() is not None or get_egress_pool() is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, lambda: self._fetch_with_retry(url, parse_json=parse_json, **kwargs))
+
+        import aiohttp
+        empty = None if parse_json else ""
+        if self.budget_expired:
+            return empty
+        attempts = self._admit(url)
+        if not attempts:
+            return empty
+        self._note_request(url)
+        cache = get_http_cache()
+        cache_url = cache_key(url, kwargs.get("max_items"))
+        limiter = get_rate_limiter()
+        for attempt in range(attempts):
+            if self.budget_expired or self._throttle_exceeds_budget(url):
+                return empty
+            await self._async_rate_limit(url)
+            throttled = False
+            transfer = Transfer(url)
+            timeout = self._request_timeout()
+            clamped = timeout < self.timeout
+            try:
+                conditional = cache.validators(cache_url) if cache is not None else {}
+                while True:
+                    async with session.get(url, headers={**HEADERS, **conditional, **kwargs.get("extra_headers", {})},
+                                           timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                        transfer.headers(resp)
+                        if resp.status == 304 and conditional:
+                            body = cache.load(cache_url)
+                            transfer.body(resp, 0)
+                            if body is not None:
+                                limiter.succeeded(url)
+                                self._circuit_result(url, ok=True)
+                                return json.loads(body) if parse_json else body
+                            # The stored body is gone: ask again without validators
+                            self._meter(transfer)
+                            transfer = Transfer(url)
+                            conditional = {}
+                            continue
+                        if resp.status == 304:
+                            # Nothing to serve: a 304 body is empty and must never be cached
+                            transfer.body(resp, 0)
+                            raise aiohttp.ClientResponseError(resp.request_info, resp.history, status=304,
+                                                              message="Not Modified without a cached body")
+                        if resp.status in THROTTLE_STATUSES:
+                            throttled = True
+                            limiter.throttled(url, resp.headers.get("Retry-After"))
+                        if resp.status >= 400:
+                            transfer.body(resp, 0)
+                        resp.raise_for_status()
+                        limiter.succeeded(url)
+                        self._circuit_result(url, ok=True)
+                        text, complete = await _aread_text(resp, url, self.max_response_bytes,
+                                                           None if parse_json else kwargs.get("max_items"),
+                                                           transfer=transfer)
+                        if parse_json and not complete:
+                            logger.warning(f"[{self.name}] JSON from {url} is over {self.max_response_bytes} bytes, "
+                                           f"skipped")
+                            return empty
+                        result = json.loads(text) if parse_json else text
+                        if cache is not None and complete:
+                            cache.store(cache_url, resp.headers, text)
+                        return result
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                transfer.done()
+                if attempt < attempts - 1 and throttled:
+                    logger.info(f"[{self.name}] Retry {attempt+1}/{self.max_retries} for {url} after throttling")
+                elif attempt < attempts - 1:
+                    base_wait = self.retry_backoff * (2 ** attempt)
+                    wait = base_wait + random.uniform(0, base_wait * self.retry_jitter)
+                    remaining = self.remaining_budget()
+                    if remaining is not None and wait >= remaining:
+                        logger.warning(f"[{self.name}] Failed to fetch {url}, no budget left to retry: {e}")
+                        return empty
+                    logger.info(f"[{self.name}] Retry {attempt+1}/{self.max_retries} for {url} in {wait:.1f}s")
+                    await asyncio.sleep(wait)
+                elif clamped and isinstance(e, asyncio.TimeoutError):
+                    logger.warning(f"[{self.name}] Failed to fetch {url}: crawl budget ran out ({e})")
+                else:
+                    logger.warning(f"[{self.name}] Failed to fetch {url} after {attempts} attempts: {e}")
+                    self._circuit_result(url, ok=False, reachable=not isinstance(
+                        e, (aiohttp.ClientConnectionError, asyncio.TimeoutError)))
+            finally:
+                self._meter(transfer)
+        return empty
+
+    async def _acoalesced_fetch(self, url: str, parse_json: bool, kwargs: Dict[str, Any]):
+        fetch = lambda: self._async_fetch_with_retry(url, parse_json=parse_json, **kwargs)
+        if self._coalescer is None:
+            return await fetch()
+        key = _coalesce_key("json" if parse_json else "text", url, kwargs)
+        result = await self._coalescer.arun(key, fetch, timeout=self.remaining_budget())
+        return ("" if not parse_json else None) if result is None else result
+
+    async def afetch_url(self, url: str, **kwargs) -> str:
+        """Async ``fetch_url``: same retries, rate limits, coalescing and empty-on-failure contract."""
+        return await self._acoalesced_fetch(url, False, kwargs)
+
+    async def afetch_json(self, url: str, **kwargs):
+        """Async ``fetch_json``. Returns None on failure."""
+        return await self._acoalesced_fetch(url, True, kwargs)
+
+    async def acrawl(self) -> List[Article]:
+        """Async crawl entry point used by AsyncCrawlEngine.
+
+        The default adapter runs the blocking ``crawl()`` on the loop's
+        default executor, so thread-based sources work unchanged. Sources
+        override this to issue their requests natively on the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.crawl)
 
     @abstractmethod
     def crawl(self) -> List[Article]:
@@ -12,7 +12,6 @@ import math
 import re
 from typing import Dict, List, Optional, Set
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -202,7 +201,7 @@ class BBCNewsSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles = []
 
         for position, entry in enumerate(parsed.entries[: self.limit]):
@@ -3,7 +3,6 @@ import logging
 import re
 from typing import List
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -28,7 +27,7 @@ class BleacherReportSource(BaseSource):
             if not content:
                 logger.warning("[bleacherreport] Empty response from feed")
                 return articles
-            parsed = feedparser.parse(content)
+            parsed = self.parse_feed(content)
         except Exception as e:
             logger.error("[bleacherreport] Failed to fetch/parse feed: %s", e)
             return articles
@@ -174,18 +174,18 @@ class BlueskySource(BaseSource):
         seen_urls: Set[str] = set()
 
         # 1. Curated feeds
+        feed_keys: List[str] = []
+        urls: List[str] = []
         for feed_key in self.feeds:
             feed_uri = BSKY_FEEDS.get(feed_key)
             if not feed_uri:
                 logger.warning(f"[Bluesky] Unknown feed key: {feed_key}")
                 continue
-            url = (
+            feed_keys.append(feed_key)
+            urls.append(
                 f"{BSKY_PUBLIC_API}/xrpc/app.bsky.feed.getFeed"
                 f"?feed={quote(feed_uri, safe='')}&limit={min(self.limit, 100)}"
             )
-            data = self.fetch_json(url)
-            if data and "feed" in data:
-                self._extract_posts(data["feed"], articles, seen_urls, source_tag=f"bsky:feed:{feed_key}")
 
         # 2. Search queries
         queries = list(self.search_queries or DEFAULT_SEARCH_QUERIES)
@@ -195,12 +195,19 @@ class BlueskySource(BaseSource):
             trending = self._fetch_trending_topics()
             queries.extend(trending[:5])
 
-        for query in queries:
-            url = (
-                f"{BSKY_PUBLIC_API}/xrpc/app.bsky.feed.searchPosts"
-                f"?q={quote(query)}&limit=25&sort=top"
-            )
-            data = self.fetch_json(url)
+        urls += [
+            f"{BSKY_PUBLIC_API}/xrpc/app.bsky.feed.searchPosts"
+            f"?q={quote(query)}&limit=25&sort=top"
+            for query in queries
+        ]
+        # Feeds and searches are fetched as one batch; results are still
+        # processed feeds-first, in order, so cross-feed dedup is unchanged
+        results = self.fetch_many(urls, parse_json=True, ordered=True)
+        for feed_key, (_, data) in zip(feed_keys, results):
+            if data and "feed" in data:
+                self._extract_posts(data["feed"], articles, seen_urls, source_tag=f"bsky:feed:{feed_key}")
+
+        for query, (_, data) in zip(queries, results):
             if data and "posts" in data:
                 # searchPosts returns posts directly (not wrapped in feed items)
                 feed_items = [{"post": p} for p in data["posts"]]
@@ -77,7 +77,6 @@ class ChangelogSource(BaseSource):
         self.limit = limit
 
     def crawl(self) -> List[Article]:
-        import feedparser
 
         articles: List[Article] = []
         seen_urls: set = set()
@@ -88,7 +87,7 @@ class ChangelogSource(BaseSource):
                 logger.warning(f"[Changelog] Failed to fetch {feed_label} feed")
                 continue
 
-            feed = feedparser.parse(text)
+            feed = self.parse_feed(text)
             if not feed.entries:
                 logger.warning(f"[Changelog] No entries in {feed_label} feed")
                 continue
@@ -20,7 +20,6 @@ import logging
 import re
 from typing import Dict, List, Optional, Set, Tuple
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -235,7 +234,7 @@ class CNBCSource(BaseSource):
         seen: Set[str],
     ) -> List[Article]:
         """Parse a single CNBC RSS feed into articles."""
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles: List[Article] = []
 
         for position, entry in enumerate(parsed.entries[:self.limit]):
@@ -0,0 +1,297 @@
+"""Connection-level plumbing for the shared HTTP session.
+
+* ``DnsCache`` — an in-process cache in front of ``socket.getaddrinfo``, so
+  each host is resolved once per TTL instead of once per new connection.
+  ``install_dns_cache`` puts it in place for the whole process (urllib3 and
+  aiohttp's threaded resolver both go through ``socket.getaddrinfo``).
+* ``HostPoolAdapter`` — a ``requests`` adapter that keeps a connection pool
+  for up to ``POOL_HOSTS`` hosts and sizes each host's pool separately
+  (``set_pool_size``); hosts without a size get ``DEFAULT_POOL_MAXSIZE``.
+  Its connections can be bound to a local ``source_address``.
+* ``open_connections`` — opens (DNS + TCP + TLS) and pools connections to a
+  host ahead of time, without sending a request. See ``clawler.prewarm``.
+* ``ArchiveAdapter`` — the adapter the shared session mounts: a
+  ``HostPoolAdapter`` that records to / replays from ``clawler.http_archive``
+  when one is configured. ``new_session`` builds a session around one.
+* ``Http2Adapter`` — a ``requests`` adapter backed by an HTTP/2 ``httpx``
+  client (optional: ``pip install "clawler[http2]"``), which multiplexes
+  every request to a host over one connection. See
+  ``clawler.sources.base.configure_transport``.
+"""
+import logging
+import socket
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import PoolManager
+
+from clawler.http_archive import get_http_archive
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DNS_TTL = 300.0
+POOL_HOSTS = 256          # host pools kept open at once
+DEFAULT_POOL_MAXSIZE = 10  # connections kept per host without an explicit size
+MAX_POOL_MAXSIZE = 32
+
+
+class DnsCache:
+    """Memoize ``socket.getaddrinfo`` results for ``ttl`` seconds (failures aren't cached)."""
+
+    def __init__(self, ttl: float = DEFAULT_DNS_TTL, resolver=None):
+        self.ttl = ttl
+        self._resolve = resolver or socket.getaddrinfo
+        self._entries: Dict[tuple, Tuple[float, list]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0):
+        key = (host, port, family, type, proto, flags)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return list(entry[1])
+        result = self._resolve(host, port, family, type, proto, flags)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (now + self.ttl, list(result))
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_dns_cache: Optional[DnsCache] = None
+_original_getaddrinfo = socket.getaddrinfo
+_dns_lock = threading.Lock()
+
+
+def install_dns_cache(ttl: float = DEFAULT_DNS_TTL) -> Optional[DnsCache]:
+    """Route this process's DNS lookups through a ``DnsCache`` (``ttl=0`` removes it)."""
+    global _dns_cache
+    with _dns_lock:
+        if ttl <= 0:
+            socket.getaddrinfo = _original_getaddrinfo
+            _dns_cache = None
+            return None
+        if _dns_cache is None:
+            _dns_cache = DnsCache(ttl, resolver=_original_getaddrinfo)
+            socket.getaddrinfo = _dns_cache.getaddrinfo
+        _dns_cache.ttl = ttl
+        return _dns_cache
+
+
+def get_dns_cache() -> Optional[DnsCache]:
+    return _dns_cache
+
+
+class _SizedPoolManager(PoolManager):
+    """PoolManager that gives each host the pool size registered for it."""
+
+    def __init__(self, pool_sizes: Dict[str, int], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool_sizes = pool_sizes
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        size = self.pool_sizes.get(host.lower())
+        if size:
+            request_context = dict(request_context if request_context is not None else self.connection_pool_kw)
+            request_context["maxsize"] = size
+        return super()._new_pool(scheme, host, port, request_context)
+
+
+class HostPoolAdapter(HTTPAdapter):
+    """HTTPAdapter with per-host connection pool sizes."""
+
+    def __init__(self, pool_connections: int = POOL_HOSTS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 source_address: Optional[Tuple[str, int]] = None, **kwargs):
+        self.pool_sizes: Dict[str, int] = {}
+        self.source_address = source_address
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        if not hasattr(self, "pool_sizes"):
+            self.pool_sizes = {}  # unpickled adapter
+        if getattr(self, "source_address", None) is not None:
+            pool_kwargs.setdefault("source_address", self.source_address)
+        self.poolmanager = _SizedPoolManager(self.pool_sizes, num_pools=connections, maxsize=maxsize,
+                                             block=block, **pool_kwargs)
+
+    def set_pool_size(self, host: str, size: int):
+        """Keep up to ``size`` connections to ``host`` (applies to pools created afterwards)."""
+        self.pool_sizes[host.lower()] = max(1, min(size, MAX_POOL_MAXSIZE))
+
+
+def _archived_send(send, request, **kwargs):
+    """Send ``request`` with ``send``, or record/replay it when an HTTP archive is configured."""
+    archive = get_http_archive()
+    if archive is None:
+        return send(request, **kwargs)
+    if archive.replaying:
+        return archive.replay(request)
+    t0 = time.monotonic()
+    resp = send(request, **kwargs)
+    return archive.record(request, resp, (time.monotonic() - t0) * 1000)
+
+
+class ArchiveAdapter(HostPoolAdapter):
+    """``HostPoolAdapter`` that goes through the configured HTTP archive, if any."""
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        return _archived_send(super().send, request, stream=stream, timeout=timeout, verify=verify,
+                              cert=cert, proxies=proxies)
+
+
+def new_session(source_address: Optional[Tuple[str, int]] = None) -> requests.Session:
+    """A ``requests.Session`` with an ``ArchiveAdapter`` for both schemes (connections bound to ``source_address``)."""
+    session = requests.Session()
+    adapter = ArchiveAdapter(
+        pool_connections=POOL_HOSTS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        max_retries=0,  # BaseSource handles retries itself
+        source_address=source_address,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _httpx():
+    """Return the httpx module if it can speak HTTP/2 (needs ``h2``), else None."""
+    try:
+        import h2  # noqa: F401
+        import httpx
+        return httpx
+    except ImportError:
+        return None
+
+
+class _HttpxRaw:
+    """Just enough of urllib3's response interface for ``requests.Response`` to stream an httpx body."""
+
+    def __init__(self, response):
+        self._response = response
+        self._chunks = None
+
+    def stream(self, chunk_size=1024, decode_content=True):
+        import requests
+        try:
+            yield from self._response.iter_bytes(chunk_size)
+        except _httpx().TransportError as e:  # as requests reports urllib3 read errors
+            raise requests.ConnectionError(e)
+
+    def read(self, amt=None):
+        if self._chunks is None:
+            self._chunks = self.stream(amt or 65536)
+        return next(self._chunks, b"")
+
+    def close(self):
+        self._response.close()
+
+    def release_conn(self):
+        self._response.close()
+
+
+class Http2Adapter(HTTPAdapter):
+    """Send ``requests`` traffic through one HTTP/2 ``httpx.Client``.
+
+    Requests to a host share one multiplexed connection instead of one
+    TCP/TLS connection each. Servers without HTTP/2 are spoken to over
+    HTTP/1.1 by the same client. httpx errors are raised as the matching
+    ``requests`` exceptions, so callers' retry handling is unchanged.
+    """
+
+    def __init__(self, max_connections: int = POOL_HOSTS, client=None):
+        super().__init__(max_retries=0)
+        httpx = _httpx()
+        if client is None and httpx is None:
+            raise ImportError("HTTP/2 needs httpx and h2: pip install 'clawler[http2]'")
+        self.client = client or httpx.Client(http2=True, follow_redirects=False,
+                                             limits=httpx.Limits(max_connections=max_connections))
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        return _archived_send(self._send, request, stream=stream, timeout=timeout)
+
+    def _send(self, request, stream=False, timeout=None):
+        import requests
+        httpx = _httpx()
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = httpx.Timeout(read, connect=connect)
+        else:
+            timeout = httpx.Timeout(timeout)  # None = no timeout, as in requests
+        h_request = self.client.build_request(request.method, request.url, headers=dict(request.headers),
+                                              content=request.body, timeout=timeout)
+        try:
+            h_response = self.client.send(h_request, stream=True)
+        except httpx.ConnectTimeout as e:
+            raise requests.ConnectTimeout(e, request=request)
+        except httpx.TimeoutException as e:
+            raise requests.ReadTimeout(e, request=request)
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(e, request=request)
+        return self._build(request, h_response, stream)
+
+    def _build(self, request, h_response, stream: bool):
+        from requests.structures import CaseInsensitiveDict
+        from requests.utils import get_encoding_from_headers
+        import requests
+        resp = requests.Response()
+        resp.status_code = h_response.status_code
+        resp.reason = h_response.reason_phrase
+        # httpx hands back decoded bodies: drop the wire encoding headers
+        resp.headers = CaseInsensitiveDict({k: v for k, v in h_response.headers.items()
+                                            if k.lower() not in ("content-encoding", "content-length")})
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp.raw = _HttpxRaw(h_response)
+        resp.url = request.url
+        resp.request = request
+        resp.connection = self
+        if not stream:
+            resp.content  # read now, like requests does for non-streamed responses
+        return resp
+
+    def close(self):
+        self.client.close()
+
+
+def open_connections(adapter: HTTPAdapter, scheme: str, host: str, port: Optional[int] = None,
+                     count: int = 1, timeout: float = 5.0) -> Tuple[int, float]:
+    """Open ``count`` connections to a host and leave them in the adapter's pool.
+
+    Returns ``(opened, handshake_ms)``: how many connected and the total time
+    their DNS, TCP and TLS setup took. No request is sent.
+    """
+    pool = adapter.poolmanager.connection_from_host(host, port=port, scheme=scheme)
+    conns = []
+    opened, handshake_ms = 0, 0.0
+    try:
+        for _ in range(count):
+            conn = pool._get_conn()
+            conns.append(conn)
+            if getattr(conn, "sock", None) is not None:
+                continue  # already connected
+            conn.timeout = timeout
+            t0 = time.monotonic()
+            try:
+                conn.connect()
+            except Exception as e:
+                logger.debug(f"[Prewarm] {scheme}://{host}: {e}")
+                conn.close()
+                break
+            handshake_ms += (time.monotonic() - t0) * 1000
+            opened += 1
+    finally:
+        for conn in conns:
+            pool._put_conn(conn)
+    return opened, handshake_ms
@@ -248,24 +248,19 @@ class DevToSource(BaseSource):
 
         # If multiple tags requested, fetch each tag separately
         if self.tags:
-            for tag in self.tags:
-                self._fetch_feed("published", seen_urls, articles, tag_filter=tag)
+            feeds = [("published", tag) for tag in self.tags]
         else:
-            for feed_name in self._feeds:
-                self._fetch_feed(feed_name, seen_urls, articles, tag_filter=self.tag)
+            feeds = [(feed_name, self.tag) for feed_name in self._feeds]
+        urls = [self._feed_url(feed_name, tag_filter) for feed_name, tag_filter in feeds]
+        for (feed_name, _), (_, data) in zip(feeds, self.fetch_many(urls, parse_json=True, ordered=True)):
+            self._parse_feed(data, feed_name, seen_urls, articles)
 
         logger.info(f"[Dev.to] Fetched {len(articles)} articles")
         # Sort by quality descending
         articles.sort(key=lambda a: a.quality_score or 0, reverse=True)
         return articles
 
-    def _fetch_feed(
-        self,
-        feed_name: str,
-        seen: Set[str],
-        articles: List[Article],
-        tag_filter: Optional[str] = None,
-    ) -> None:
+    def _feed_url(self, feed_name: str, tag_filter: Optional[str] = None) -> str:
         base_url = DEVTO_FEEDS.get(feed_name, DEVTO_FEEDS["published"])
         sep = "&" if "?" in base_url else "?"
         params = [f"per_page={self.per_page}"]
@@ -275,14 +270,10 @@ class DevToSource(BaseSource):
         if tag_filter:
             params.append(f"tag={tag_filter}")
 
-        url = base_url + sep + "&".join(params) if params else base_url
+        return base_url + sep + "&".join(params) if params else base_url
 
-        try:
-            data = self.fetch_json(url)
-            if not data or not isinstance(data, list):
-                return
-        except Exception as e:
-            logger.warning(f"[Dev.to] Failed to fetch {feed_name}: {e}")
+    def _parse_feed(self, data, feed_name: str, seen: Set[str], articles: List[Article]) -> None:
+        if not data or not isinstance(data, list):
             return
 
         for item in data:
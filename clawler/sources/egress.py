@@ -0,0 +1,135 @@
+"""A pool of egress routes for source fetches.
+
+Some hosts (Reddit, Google News, Medium) throttle per client IP, so a busy
+crawler leaving from one address is held to one address's quota. An egress
+is another way out: a proxy (``http://``, ``https://`` or ``socks5://``
+URL; SOCKS needs ``requests[socks]``) or a local IP address to bind
+outgoing connections to. With a pool configured (``clawler --egress``),
+requests to the pooled hosts are spread across its egresses.
+
+Politeness is kept per egress: the rate limiter holds one token bucket per
+host *and* egress, each at the host's configured pace, and each request
+takes the egress that can send soonest (see
+``HostRateLimiter.reserve_any``). A 429/503 pauses and slows down only the
+egress that received it.
+
+Every egress has its own ``requests.Session`` — its own connection pools,
+going through the HTTP archive like the shared one. The async engine falls
+back to the threaded fetch path while a pool is configured.
+"""
+import ipaddress
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Union
+from urllib.parse import urlsplit
+
+import requests
+
+from clawler.sources.connections import new_session
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Egress:
+    """One way out: a proxy URL or a local address to bind to."""
+    proxy: Optional[str] = None
+    bind: Optional[str] = None
+
+    @classmethod
+    def parse(cls, value: Union[str, "Egress"]) -> "Egress":
+        """From a proxy URL (``scheme://host:port``) or a local IP address."""
+        if isinstance(value, Egress):
+            return value
+        value = str(value).strip()
+        if "://" in value:
+            return cls(proxy=value)
+        try:
+            ipaddress.ip_address(value)
+        except ValueError:
+            raise ValueError(f"egress must be a proxy URL or a local IP address, not {value!r}") from None
+        return cls(bind=value)
+
+    @property
+    def name(self) -> str:
+        return self.proxy or self.bind
+
+
+class EgressPool:
+    """Egresses to spread requests over, and the hosts (domains) they apply to."""
+
+    def __init__(self, egresses: Iterable[Union[str, Egress]], hosts: Optional[Iterable[str]] = None):
+        self.egresses = [Egress.parse(e) for e in egresses]
+        if not self.egresses:
+            raise ValueError("an egress pool needs at least one egress")
+        self.names = [e.name for e in self.egresses]
+        if len(set(self.names)) != len(self.names):
+            raise ValueError("egresses must be unique")
+        self._by_name = {e.name: e for e in self.egresses}
+        # None = every host; a domain also covers its subdomains
+        self.hosts = {h.strip().lower().lstrip(".") for h in hosts if h.strip()} if hosts else None
+        self.sent: Counter = Counter()  # egress -> requests sent through it
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def routes(self, url: str) -> Optional[List[str]]:
+        """The egresses ``url`` may leave through, or None if its host isn't pooled."""
+        if self.hosts is None:
+            return self.names
+        host = (urlsplit(url).hostname or "").lower()
+        while host:
+            if host in self.hosts:
+                return self.names
+            host = host.partition(".")[2]
+        return None
+
+    def session(self, name: str) -> requests.Session:
+        """The session for egress ``name`` (counted as one request sent through it)."""
+        with self._lock:
+            session = self._sessions.get(name)
+            if session is None:
+                bind = self._by_name[name].bind
+                session = self._sessions[name] = new_session(source_address=(bind, 0) if bind else None)
+            self.sent[name] += 1
+            return session
+
+    def request_kwargs(self, name: str) -> Dict[str, Any]:
+        """Extra ``Session.get`` arguments for egress ``name``.
+
+        Proxies go on the request rather than the session so they take
+        precedence over ``HTTP(S)_PROXY`` from the environment.
+        """
+        proxy = self._by_name[name].proxy
+        return {"proxies": {"http": proxy, "https": proxy}} if proxy else {}
+
+    def close(self):
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            session.close()
+
+
+_egress_pool: Optional[EgressPool] = None
+_egress_pool_lock = threading.Lock()
+
+
+def get_egress_pool() -> Optional[EgressPool]:
+    """Return the configured egress pool, or None when every request goes out directly."""
+    return _egress_pool
+
+
+def configure_egress(egresses: Optional[Iterable[Union[str, Egress]]] = None,
+                     hosts: Optional[Iterable[str]] = None) -> Optional[EgressPool]:
+    """Spread requests to ``hosts`` (default: all) across ``egresses`` (None/empty = go out directly)."""
+    global _egress_pool
+    pool = EgressPool(egresses, hosts) if egresses else None
+    with _egress_pool_lock:
+        old, _egress_pool = _egress_pool, pool
+    if old is not None:
+        old.close()
+    if pool is not None:
+        scope = ", ".join(sorted(pool.hosts)) if pool.hosts else "all hosts"
+        logger.info(f"[Egress] {len(pool.names)} egresses for {scope}")
+    return pool
@@ -0,0 +1,70 @@
+"""Stop reading an RSS/Atom/RDF feed after its first N items.
+
+Sources keep only the newest few entries of a feed (20 for the RSS source,
+``limit_per_podcast`` for podcasts), but some feeds carry their whole
+archive — megabytes of XML. ``FeedItemScanner`` watches the body as it is
+streamed and reports when the Nth ``</item>``/``</entry>`` has arrived, so
+the download can stop there; ``truncate`` then cuts the body after that
+item and closes the document's open elements, so feedparser only ever sees
+N items and still gets well-formed XML.
+
+The scan works on raw bytes and assumes an ASCII-compatible encoding
+(UTF-8, Latin-1, ...), which covers practically every feed. Anything else
+simply never matches and is read in full (up to the byte cap).
+"""
+import re
+from typing import Optional
+
+_ITEM_END = re.compile(rb"</(item|entry)\s*>", re.IGNORECASE)
+# Longest closing tag the scanner could see split across two chunks
+_OVERLAP = 16
+# Where to look for the root element
+_HEAD_BYTES = 4096
+
+_CLOSERS = (
+    (re.compile(rb"<rdf:RDF[\s>]", re.IGNORECASE), b"\n</rdf:RDF>\n"),
+    (re.compile(rb"<feed[\s>]", re.IGNORECASE), b"\n</feed>\n"),
+    (re.compile(rb"<rss[\s>]", re.IGNORECASE), b"\n</channel>\n</rss>\n"),
+)
+
+
+class FeedItemScanner:
+    """Count closing item tags in a streamed body; find where item ``max_items`` ends."""
+
+    def __init__(self, max_items: int):
+        self.max_items = max(1, max_items)
+        self.items = 0
+        self.cut_at: Optional[int] = None  # byte offset just past the last wanted item
+        self.last_end: Optional[int] = None  # byte offset just past the last complete item seen
+        self._scanned = 0
+
+    def feed(self, body: bytes) -> bool:
+        """Scan ``body`` (everything received so far); return True once enough items arrived."""
+        if self.cut_at is not None:
+            return True
+        start = max(0, self._scanned - _OVERLAP)
+        for match in _ITEM_END.finditer(body, start):
+            if match.end() <= self._scanned:
+                continue  # already counted in an earlier scan
+            self.items += 1
+            self.last_end = match.end()
+            if self.items >= self.max_items:
+                self.cut_at = match.end()
+                return True
+        self._scanned = len(body)
+        return False
+
+    def cut_after_last_item(self):
+        """The body is being cut short: end it after the last complete item seen."""
+        if self.cut_at is None:
+            self.cut_at = self.last_end
+
+    def truncate(self, body: bytes) -> bytes:
+        """``body`` cut after the last wanted item, with the document's root closed."""
+        if self.cut_at is None:
+            return body
+        head = body[:_HEAD_BYTES]
+        roots = [(m.start(), closer) for pattern, closer in _CLOSERS for m in [pattern.search(head)] if m]
+        if not roots:
+            return body[:self.cut_at]
+        return body[:self.cut_at] + min(roots)[1]
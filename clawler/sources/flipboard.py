@@ -9,7 +9,6 @@ import re
 from datetime import datetime
 from typing import Dict, List, Optional
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -80,7 +79,7 @@ class FlipboardSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles: List[Article] = []
 
         for entry in parsed.entries[: self.limit]:
@@ -24,7 +24,6 @@ import re
 from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -265,7 +264,7 @@ class ForbesSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles = []
 
         for position, entry in enumerate(parsed.entries[:self.limit]):
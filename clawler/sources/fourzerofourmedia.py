@@ -8,7 +8,6 @@ import logging
 import re
 from typing import List, Optional
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -60,7 +59,7 @@ class FourZeroFourMediaSource(BaseSource):
             logger.warning("[404Media] Failed to fetch RSS feed")
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles = []
 
         for entry in parsed.entries[:self.limit]:
@@ -90,14 +90,13 @@ class FreeCodeCampSource(BaseSource):
         self.limit = limit
 
     def crawl(self) -> List[Article]:
-        import feedparser
 
         text = self.fetch_url(FCC_RSS)
         if not text:
             logger.warning("[freeCodeCamp] Failed to fetch RSS feed")
             return []
 
-        feed = feedparser.parse(text)
+        feed = self.parse_feed(text)
         if not feed.entries:
             logger.warning("[freeCodeCamp] No entries in RSS feed")
             return []
@@ -368,6 +368,8 @@ class GoogleNewsSource(BaseSource):
             # Topic feeds
             seen_topics: Set[str] = set()
             for topic_info in self.topics:
+                if self.budget_expired:
+                    break
                 topic_id = topic_info["topic"].split(":")[0]
                 if topic_id in seen_topics:
                     continue
@@ -384,6 +386,8 @@ class GoogleNewsSource(BaseSource):
 
             # Search feeds
             for search_info in self.searches:
+                if self.budget_expired:
+                    break
                 url = self._feed_url_for_search(search_info["query"], geo=geo, lang=self.lang)
                 try:
                     articles = self._parse_feed(
@@ -19,7 +19,6 @@ import math
 import re
 from typing import Dict, List, Optional, Set
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -190,7 +189,7 @@ class GuardianSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles = []
 
         for entry in parsed.entries[: self.limit]:
@@ -10,10 +10,10 @@ Enhanced features:
 - Filters: min_quality, category_filter
 - Quality-sorted output
 """
+import asyncio
 import logging
 import math
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Set
 
@@ -122,7 +122,7 @@ class HackerNewsSource(BaseSource):
     category_filter : list of str or None
         Only return articles matching these categories. Default None (all).
     max_workers : int
-        Concurrent item fetches. Default 10.
+        Item fetches in flight at once (on the shared fetch scheduler). Default 10.
     """
 
     name = "hackernews"
@@ -172,6 +172,23 @@ class HackerNewsSource(BaseSource):
         """Fetch a single HN item and return an Article or None."""
         try:
             item = self.fetch_json(HN_ITEM.format(story_id))
+        except Exception as e:
+            logger.debug(f"[HN] Failed item {story_id}: {e}")
+            return None
+        return self._item_to_article(item, story_id, feed_type, position)
+
+    async def _afetch_item(self, story_id: int, feed_type: str, position: int) -> Optional[Article]:
+        """Async ``_fetch_item``."""
+        try:
+            item = await self.afetch_json(HN_ITEM.format(story_id))
+        except Exception as e:
+            logger.debug(f"[HN] Failed item {story_id}: {e}")
+            return None
+        return self._item_to_article(item, story_id, feed_type, position)
+
+    def _item_to_article(self, item: Optional[dict], story_id: int, feed_type: str, position: int) -> Optional[Article]:
+        """Turn a raw HN item into an Article, applying filters. Returns None if filtered."""
+        try:
             if not item or item.get("type") not in ("story", "job"):
                 return None
 
@@ -232,40 +249,67 @@ class HackerNewsSource(BaseSource):
             logger.debug(f"[HN] Failed item {story_id}: {e}")
             return None
 
-    def crawl(self) -> List[Article]:
-        # Collect story IDs from all requested feeds, deduplicating
-        all_ids: List[tuple] = []  # (id, feed_type, position)
+    def _collect_ids(self, feed_ids: Dict[str, Optional[list]]) -> List[tuple]:
+        """Merge per-feed story ID lists into (id, feed_type, position), deduplicating."""
+        all_ids: List[tuple] = []
         seen: Set[int] = set()
-
+        for feed, ids in feed_ids.items():
+            if not ids:
+                continue
+            for pos, sid in enumerate(ids[: self.limit]):
+                if sid not in seen:
+                    seen.add(sid)
+                    all_ids.append((sid, feed, pos))
+        return all_ids
+
+    def _known_feeds(self) -> List[str]:
+        feeds = []
         for feed in self.feeds:
-            endpoint = FEED_ENDPOINTS.get(feed)
-            if not endpoint:
+            if feed in FEED_ENDPOINTS:
+                feeds.append(feed)
+            else:
                 logger.warning(f"[HN] Unknown feed type: {feed}")
-                continue
+        return feeds
+
+    def _finish(self, results) -> List[Article]:
+        articles = [a for a in results if a]
+        # Sort by quality descending
+        articles.sort(key=lambda a: a.quality_score, reverse=True)
+        logger.info(f"[HN] Fetched {len(articles)} stories from {len(self.feeds)} feed(s)")
+        return articles
+
+    def crawl(self) -> List[Article]:
+        # Collect story IDs from all requested feeds, deduplicating
+        feed_ids: Dict[str, Optional[list]] = {}
+        for feed in self._known_feeds():
             try:
-                ids = self.fetch_json(endpoint)
-                if not ids:
-                    continue
-                for pos, sid in enumerate(ids[: self.limit]):
-                    if sid not in seen:
-                        seen.add(sid)
-                        all_ids.append((sid, feed, pos))
+                feed_ids[feed] = self.fetch_json(FEED_ENDPOINTS[feed])
             except Exception as e:
                 logger.warning(f"[HN] Failed to get {feed} stories: {e}")
-
+        all_ids = self._collect_ids(feed_ids)
         if not all_ids:
             return []
 
-        articles = []
-        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
-            futures = {pool.submit(self._fetch_item, sid, ft, pos): sid for sid, ft, pos in all_ids}
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    articles.append(result)
-
-        # Sort by quality descending
-        articles.sort(key=lambda a: a.quality_score, reverse=True)
-
-        logger.info(f"[HN] Fetched {len(articles)} stories from {len(self.feeds)} feed(s)")
-        return articles
+        urls = [HN_ITEM.format(sid) for sid, _, _ in all_ids]
+        results = self.fetch_many(urls, parse_json=True, ordered=True, max_in_flight=self.max_workers)
+        return self._finish(
+            self._item_to_article(item, sid, ft, pos) for (sid, ft, pos), (_, item) in zip(all_ids, results)
+        )
+
+    async def acrawl(self) -> List[Article]:
+        """Native async crawl: every item request is in flight on the event loop at once."""
+        feeds = self._known_feeds()
+        responses = await asyncio.gather(
+            *(self.afetch_json(FEED_ENDPOINTS[feed]) for feed in feeds), return_exceptions=True
+        )
+        feed_ids: Dict[str, Optional[list]] = {}
+        for feed, ids in zip(feeds, responses):
+            if isinstance(ids, Exception):
+                logger.warning(f"[HN] Failed to get {feed} stories: {ids}")
+                continue
+            feed_ids[feed] = ids
+        all_ids = self._collect_ids(feed_ids)
+        if not all_ids:
+            return []
+        results = await asyncio.gather(*(self._afetch_item(sid, ft, pos) for sid, ft, pos in all_ids))
+        return self._finish(results)
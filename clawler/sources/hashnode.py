@@ -8,7 +8,6 @@ import logging
 from datetime import datetime, timezone
 from typing import Dict, List
 
-import feedparser
 
 from clawler.models import Article
 from clawler.sources.base import BaseSource
@@ -85,7 +84,7 @@ class HashnodeSource(BaseSource):
                 raw = self.fetch_url(feed_url)
                 if not raw:
                     continue
-                feed = feedparser.parse(raw)
+                feed = self.parse_feed(raw)
             except Exception as e:
                 logger.warning(f"[Hashnode] Failed to fetch {feed_name}: {e}")
                 continue
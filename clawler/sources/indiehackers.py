@@ -182,17 +182,11 @@ class IndieHackersSource(BaseSource):
 
     def _crawl_podcast(self) -> List[Article]:
         """Fetch latest podcast episodes via RSS."""
-        try:
-            import feedparser
-        except ImportError:
-            logger.debug("[Indie Hackers] feedparser not available, skipping podcast")
-            return []
-
         text = self.fetch_url(INDIE_HACKERS_FEED)
         if not text:
             return []
 
-        feed = feedparser.parse(text)
+        feed = self.parse_feed(text)
         articles: List[Article] = []
 
         for entry in feed.entries[:10]:
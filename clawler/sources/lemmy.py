@@ -143,12 +143,18 @@ class LemmySource(BaseSource):
         all_articles: List[Article] = []
         seen_urls: Set[str] = set()
 
-        for instance in self.instances:
+        # One listing per instance, or one per (instance, community) pair
+        jobs = [(instance, comm) for instance in self.instances
+                for comm in (self.communities or [None])]
+        urls = [self._post_list_url(instance, comm) for instance, comm in jobs]
+        for (instance, comm), (_, data) in zip(jobs, self.fetch_many(urls, parse_json=True, ordered=True)):
+            if not data or "posts" not in data:
+                continue
             try:
-                articles = self._fetch_instance(instance, seen_urls)
-                all_articles.extend(articles)
+                all_articles.extend(self._parse_posts(data["posts"], instance, seen_urls))
             except Exception as e:
-                logger.warning(f"[Lemmy] Failed to fetch {instance['name']}: {e}")
+                where = f"{comm}@{instance['name']}" if comm else instance["name"]
+                logger.warning(f"[Lemmy] Failed to parse {where}: {e}")
 
         # Sort by quality score descending
         all_articles.sort(key=lambda a: a.quality_score or 0, reverse=True)
@@ -159,39 +165,12 @@ class LemmySource(BaseSource):
         logger.info(f"[Lemmy] Fetched {len(all_articles)} posts across {len(self.instances)} instances")
         return all_articles
 
-    def _fetch_instance(self, instance: dict, seen_urls: Set[str]) -> List[Article]:
-        """Fetch posts from a single Lemmy instance."""
-        if self.communities:
-            # Fetch specific communities
-            articles: List[Article] = []
-            for comm in self.communities:
-                try:
-                    arts = self._fetch_community(instance, comm, seen_urls)
-                    articles.extend(arts)
-                except Exception as e:
-                    logger.debug(f"[Lemmy] Failed community {comm}@{instance['name']}: {e}")
-            return articles
-        else:
-            return self._fetch_all(instance, seen_urls)
-
-    def _fetch_all(self, instance: dict, seen_urls: Set[str]) -> List[Article]:
-        """Fetch posts from all communities on an instance."""
+    def _post_list_url(self, instance: dict, community: Optional[str] = None) -> str:
+        """Post listing URL for an instance, optionally restricted to one community."""
         api_url = f"{instance['url']}/api/v3/post/list?sort={self.sort}&limit={self.limit}&type_=All"
-        data = self.fetch_json(api_url)
-        if not data or "posts" not in data:
-            return []
-        return self._parse_posts(data["posts"], instance, seen_urls)
-
-    def _fetch_community(self, instance: dict, community: str, seen_urls: Set[str]) -> List[Article]:
-        """Fetch posts from a specific community."""
-        api_url = (
-            f"{instance['url']}/api/v3/post/list?sort={self.sort}&limit={self.limit}"
-            f"&type_=All&community_name={community}"
-        )
-        data = self.fetch_json(api_url)
-        if not data or "posts" not in data:
-            return []
-        return self._parse_posts(data["posts"], instance, seen_urls)
+        if community:
+            api_url += f"&community_name={community}"
+        return api_url
 
     def _parse_posts(self, posts: list, instance: dict, seen_urls: Set[str]) -> List[Article]:
         """Parse Lemmy API post views into Articles."""
@@ -159,14 +159,9 @@ class LobstersSource(BaseSource):
         seen_urls: Set[str] = set()
         articles: List[Article] = []
 
-        for feed_name in self._feeds:
-            url = LOBSTERS_FEEDS[feed_name]
-            try:
-                data = self.fetch_json(url)
-                if not data or not isinstance(data, list):
-                    continue
-            except Exception as e:
-                logger.warning(f"[Lobsters] Failed to fetch {feed_name}: {e}")
+        urls = [LOBSTERS_FEEDS[feed_name] for feed_name in self._feeds]
+        for feed_name, (_, data) in zip(self._feeds, self.fetch_many(urls, parse_json=True, ordered=True)):
+            if not data or not isinstance(data, list):
                 continue
 
             for item in data[: self.limit]:
@@ -18,7 +18,6 @@ import re
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Set
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -132,7 +131,7 @@ class MarketWatchSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         entries = parsed.entries[:self.limit]
         total = len(entries)
         articles = []
@@ -176,13 +176,17 @@ class MastodonSource(BaseSource):
         articles: List[Article] = []
         seen_urls: set = set()
 
-        for instance in self.instances:
-            if self.include_links:
-                articles.extend(self._crawl_links(instance, seen_urls))
-            if self.include_statuses:
-                articles.extend(self._crawl_statuses(instance, seen_urls))
-            if self.include_hashtags:
-                articles.extend(self._crawl_hashtags(instance, seen_urls))
+        parsers = []
+        if self.include_links:
+            parsers.append(("links", self._crawl_links))
+        if self.include_statuses:
+            parsers.append(("statuses", self._crawl_statuses))
+        if self.include_hashtags:
+            parsers.append(("tags", self._crawl_hashtags))
+        jobs = [(instance, kind, parse) for instance in self.instances for kind, parse in parsers]
+        urls = [f"https://{instance}/api/v1/trends/{kind}?limit={self.limit}" for instance, kind, _ in jobs]
+        for (instance, _, parse), (_, data) in zip(jobs, self.fetch_many(urls, parse_json=True, ordered=True)):
+            articles.extend(parse(instance, data, seen_urls))
 
         # Filter by category if requested
         if self.category_filter:
@@ -202,11 +206,9 @@ class MastodonSource(BaseSource):
         logger.info(f"[Mastodon] Collected {len(articles)} items from {len(self.instances)} instances")
         return articles
 
-    def _crawl_links(self, instance: str, seen_urls: set) -> List[Article]:
-        """Fetch trending links (external articles being shared)."""
+    def _crawl_links(self, instance: str, data, seen_urls: set) -> List[Article]:
+        """Parse trending links (external articles being shared)."""
         articles = []
-        url = f"https://{instance}/api/v1/trends/links?limit={self.limit}"
-        data = self.fetch_json(url)
         if not data or not isinstance(data, list):
             logger.info(f"[Mastodon] No trending links from {instance}")
             return articles
@@ -265,11 +267,9 @@ class MastodonSource(BaseSource):
             ))
         return articles
 
-    def _crawl_statuses(self, instance: str, seen_urls: set) -> List[Article]:
-        """Fetch trending statuses (popular posts on the instance)."""
+    def _crawl_statuses(self, instance: str, data, seen_urls: set) -> List[Article]:
+        """Parse trending statuses (popular posts on the instance)."""
         articles = []
-        url = f"https://{instance}/api/v1/trends/statuses?limit={self.limit}"
-        data = self.fetch_json(url)
         if not data or not isinstance(data, list):
             logger.info(f"[Mastodon] No trending statuses from {instance}")
             return articles
@@ -347,11 +347,9 @@ class MastodonSource(BaseSource):
             ))
         return articles
 
-    def _crawl_hashtags(self, instance: str, seen_urls: set) -> List[Article]:
-        """Fetch trending hashtags and create summary articles for each."""
+    def _crawl_hashtags(self, instance: str, data, seen_urls: set) -> List[Article]:
+        """Parse trending hashtags into one summary article each."""
         articles = []
-        url = f"https://{instance}/api/v1/trends/tags?limit={self.limit}"
-        data = self.fetch_json(url)
         if not data or not isinstance(data, list):
             logger.info(f"[Mastodon] No trending hashtags from {instance}")
             return articles
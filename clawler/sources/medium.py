@@ -349,8 +349,8 @@ class MediumSource(BaseSource):
         all_articles: List[Article] = []
         seen_urls = set()
 
-        for url, label, feed_type in feed_urls:
-            xml_text = self.fetch_url(url)
+        results = self.fetch_many([url for url, _, _ in feed_urls], ordered=True)
+        for (_, label, feed_type), (_, xml_text) in zip(feed_urls, results):
             articles = self._parse_feed(xml_text, label, feed_type)
             for a in articles:
                 if a.url not in seen_urls:
@@ -257,8 +257,7 @@ class MetaFilterSource(BaseSource):
                 logger.warning(f"[MetaFilter] Failed to fetch {subsite}: {e}")
                 continue
 
-            import feedparser
-            feed = feedparser.parse(text)
+            feed = self.parse_feed(text)
 
             for entry in feed.entries[: self.limit]:
                 try:
@@ -276,8 +276,9 @@ class NatureSource(BaseSource):
         self.exclude_sections = set(exclude_sections) if exclude_sections else set()
         self.global_limit = global_limit
 
-    def _parse_feed(self, feed_url: str, section: str, tier: int) -> List[Article]:
-        xml = self.fetch_url(feed_url)
+    def _parse_feed(self, feed_url: str, section: str, tier: int, xml: Optional[str] = None) -> List[Article]:
+        if xml is None:
+            xml = self.fetch_url(feed_url)
         if not xml:
             return []
 
@@ -376,12 +377,12 @@ class NatureSource(BaseSource):
         all_articles: List[Article] = []
         seen_urls: Set[str] = set()
 
-        for feed in self.feeds:
+        feeds = [f for f in self.feeds if f["section"] not in self.exclude_sections]
+        results = self.fetch_many([f["url"] for f in feeds], ordered=True)
+        for feed, (url, xml) in zip(feeds, results):
             section = feed["section"]
-            if section in self.exclude_sections:
-                continue
             try:
-                articles = self._parse_feed(feed["url"], section, feed.get("tier", 3))
+                articles = self._parse_feed(url, section, feed.get("tier", 3), xml)
                 for a in articles:
                     if a.url not in seen_urls:
                         seen_urls.add(a.url)
@@ -3,7 +3,6 @@ import logging
 import re
 from typing import List
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -28,7 +27,7 @@ class NEJMSource(BaseSource):
             if not content:
                 logger.warning("[nejm] Empty response from feed")
                 return articles
-            parsed = feedparser.parse(content)
+            parsed = self.parse_feed(content)
         except Exception as e:
             logger.error("[nejm] Failed to fetch/parse feed: %s", e)
             return articles
@@ -8,7 +8,6 @@ import re
 from datetime import datetime
 from typing import Dict, List, Optional, Set
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -196,7 +195,7 @@ class NPRSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles = []
         entries = parsed.entries[: self.limit]
         total = len(entries)
@@ -18,7 +18,6 @@ import math
 import re
 from typing import Dict, List, Optional, Set
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -193,7 +192,7 @@ class NYTimesSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles = []
 
         for idx, entry in enumerate(parsed.entries[:self.limit]):
@@ -0,0 +1,113 @@
+"""Process pool for the CPU-bound parse stage of a crawl.
+
+Fetching is I/O and runs on threads (the engine's workers and the fetch
+scheduler). Parsing — ``feedparser.parse``, BeautifulSoup HTML stripping,
+building ``Article`` objects — is CPU work that serializes on the GIL, so
+beyond a handful of threads extra workers stop helping. ``run_parse`` hands
+that work to a shared ``ProcessPoolExecutor`` so a crawl can use every core.
+
+``submit_parse`` returns a future instead of waiting, so a fetch thread can
+hand off a body and go on to its next fetch while the parse runs.
+
+The pool is off by default (``workers=0``) and parsing then runs inline on
+the calling thread. Parse functions must be module-level and their arguments
+and results picklable; a job that can't be shipped to a worker process, or a
+pool that has broken, is parsed inline instead. Errors raised by the parse
+itself are passed on to the caller.
+"""
+import logging
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARSE_WORKERS = 0
+
+
+class ParsePool:
+    """Lazily started process pool; ``workers=0`` parses on the calling thread."""
+
+    def __init__(self, workers: int = DEFAULT_PARSE_WORKERS):
+        self.workers = max(0, workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers == 0:
+            return None
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process full of crawl threads can deadlock
+                self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                     mp_context=multiprocessing.get_context("spawn"))
+            return self._executor
+
+    def submit(self, fn: Callable, *args) -> Future:
+        """Start ``fn(*args)`` and return its future (already done when parsing inline)."""
+        executor = self._get_executor()
+        if executor is not None:
+            try:
+                # Pickle up front: the executor would only report a failure
+                # through the future, mixed up with errors from the parse
+                pickle.dumps((fn, args), protocol=pickle.HIGHEST_PROTOCOL)
+                return executor.submit(fn, *args)
+            except (pickle.PicklingError, AttributeError, TypeError, BrokenProcessPool, RuntimeError) as e:
+                # Unpicklable callable/arguments (e.g. a patched function) or a
+                # dead pool: parse here instead of losing the source's results
+                logger.debug(f"[Parse] {getattr(fn, '__name__', fn)} ran inline: {e}")
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def run(self, fn: Callable, *args) -> Any:
+        """Return ``fn(*args)``, computed in a worker process when the pool is on."""
+        return self.submit(fn, *args).result()
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_parse_pool: Optional[ParsePool] = None
+_parse_pool_lock = threading.Lock()
+
+
+def get_parse_pool() -> ParsePool:
+    """Return the shared parse pool (inline parsing until configured)."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ParsePool()
+        return _parse_pool
+
+
+def configure_parse_pool(workers: int = DEFAULT_PARSE_WORKERS) -> ParsePool:
+    """Replace the shared parse pool with one of ``workers`` processes (0 = inline)."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None and _parse_pool.workers == max(0, workers):
+            return _parse_pool
+        old, _parse_pool = _parse_pool, ParsePool(workers)
+        logger.debug(f"[Parse] {workers} parse worker process(es)")
+    if old is not None:
+        old.shutdown()
+    return _parse_pool
+
+
+def run_parse(fn: Callable, *args) -> Any:
+    """Run a module-level parse function on the shared parse pool."""
+    return get_parse_pool().run(fn, *args)
+
+
+def submit_parse(fn: Callable, *args) -> Future:
+    """Start a module-level parse function on the shared parse pool; return its future."""
+    return get_parse_pool().submit(fn, *args)
@@ -159,13 +159,14 @@ class PinboardSource(BaseSource):
         )
 
         seen_urls: Set[str] = set()
+        save_counts: Dict[str, int] = {}  # bookmark URL -> saves
         all_articles: List[Article] = []
 
         for page in pages:
             page_type = page.split("/")[0] if "/" in page else page
             url = self._page_url(page)
             try:
-                articles = self._scrape_page(url, page_type, seen_urls)
+                articles = self._scrape_page(url, page_type, seen_urls, save_counts)
                 all_articles.extend(articles)
             except Exception as e:
                 logger.error(f"[Pinboard] Failed to scrape {url}: {e}")
@@ -180,7 +181,7 @@ class PinboardSource(BaseSource):
             if exclude_tags_set and (tags_lower & exclude_tags_set):
                 continue
 
-            save_count = getattr(a, "_save_count", 0)
+            save_count = save_counts.get(a.url, 0)
             if save_count < min_saves:
                 continue
 
@@ -209,7 +210,8 @@ class PinboardSource(BaseSource):
         return f"{PINBOARD_BASE}/{page}/"
 
     def _scrape_page(
-        self, url: str, page_type: str, seen_urls: Set[str]
+        self, url: str, page_type: str, seen_urls: Set[str],
+        save_counts: Optional[Dict[str, int]] = None,
     ) -> List[Article]:
         articles: List[Article] = []
         html = self.fetch_url(url)
@@ -285,8 +287,9 @@ class PinboardSource(BaseSource):
                 tags=prov_tags,
                 quality_score=quality,
             )
-            # Stash save_count for filtering
-            article._save_count = save_count  # type: ignore[attr-defined]
+            # Keep save_count for filtering
+            if save_counts is not None:
+                save_counts[bm_url] = save_count
             articles.append(article)
 
         logger.info(f"[Pinboard] Fetched {len(articles)} bookmarks from {url}")
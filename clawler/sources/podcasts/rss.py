@@ -3,7 +3,6 @@ import logging
 import re
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
-import feedparser
 
 from clawler.models import Episode, PodcastFeed
 from clawler.sources.podcasts.base import PodcastBaseSource, parse_duration
@@ -61,11 +60,12 @@ class PodcastRSSSource(PodcastBaseSource):
 
     def _fetch_feed(self, podcast_name: str, feed_url: str) -> List[Episode]:
         """Fetch and parse a single RSS feed."""
-        xml_text = self.fetch_url(feed_url)
+        # Stop downloading (and parsing) once the episodes we keep have arrived
+        xml_text = self.fetch_url(feed_url, max_items=self.limit_per_podcast)
         if not xml_text:
             return []
 
-        feed = feedparser.parse(xml_text)
+        feed = self.parse_feed(xml_text)
         episodes: List[Episode] = []
 
         # Extract podcast-level metadata
@@ -19,7 +19,6 @@ import re
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Set
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -125,7 +124,7 @@ class PoliticoSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         entries = parsed.entries[:self.limit]
         total = len(entries)
         articles = []
@@ -14,7 +14,6 @@ import re
 from datetime import datetime
 from typing import Dict, List, Optional, Set
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -187,7 +186,7 @@ class ProductHuntSource(BaseSource):
         if not text:
             return []
 
-        feed = feedparser.parse(text)
+        feed = self.parse_feed(text)
         articles: List[Article] = []
         seen_urls: Set[str] = set()
         total = len(feed.entries)
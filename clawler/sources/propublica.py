@@ -17,7 +17,6 @@ import logging
 import re
 from typing import Dict, List, Optional, Set
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -152,7 +151,7 @@ class ProPublicaSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles = []
 
         for position, entry in enumerate(parsed.entries[:self.limit]):
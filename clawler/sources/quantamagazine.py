@@ -42,13 +42,7 @@ class QuantaMagazineSource(BaseSource):
         if not text:
             return []
 
-        try:
-            import feedparser
-        except ImportError:
-            logger.warning("[QuantaMagazine] feedparser not installed")
-            return []
-
-        feed = feedparser.parse(text)
+        feed = self.parse_feed(text)
         articles: List[Article] = []
 
         for entry in feed.entries[: self.limit]:
@@ -0,0 +1,267 @@
+"""Per-host token-bucket rate limiting for source fetches.
+
+Every request made through ``BaseSource`` takes a token from its host's
+bucket first. A bucket refills at ``rate`` tokens per second and holds at
+most ``burst``, so a host can be hit ``burst`` times at once and then
+``rate`` times per second. Rates are set per domain (a domain entry also
+covers its subdomains); hosts without an entry get the default of one
+request every 0.5 s.
+
+Servers are listened to: a 429 or 503 response pauses the host — for its
+``Retry-After`` if one was sent — and halves its rate. Each later success
+wins back a tenth of the configured rate, so a host that throttled us is
+approached slowly until it stops complaining.
+
+Tokens are reserved under a lock and the wait happens outside it, so the
+same limiter serves worker threads (``time.sleep``) and the async engine
+(``asyncio.sleep``) without blocking other hosts.
+
+With an egress pool (``clawler.sources.egress``) a host gets one bucket per
+egress: the limits apply per source address, which is how strict hosts
+count them. ``reserve_any`` takes the next request's token from whichever
+egress can send it soonest.
+"""
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE = 2.0  # requests per second
+DEFAULT_BURST = 1
+THROTTLE_STATUSES = (429, 503)
+DEFAULT_THROTTLE_PAUSE = 5.0   # seconds, when no Retry-After is given
+MAX_THROTTLE_PAUSE = 300.0
+MIN_RATE_FRACTION = 1 / 16     # adaptive slow-down never goes below this share of the configured rate
+RECOVERY_FRACTION = 0.1
+
+# Hosts that serve many of the built-in feeds and tolerate a faster pace
+DEFAULT_HOST_LIMITS: Dict[str, Dict[str, float]] = {
+    "hnrss.org": {"rate": 4.0, "burst": 4},
+    "feeds.feedburner.com": {"rate": 5.0, "burst": 5},
+    "news.google.com": {"rate": 3.0, "burst": 3},
+}
+
+
+@dataclass(frozen=True)
+class HostLimit:
+    """Configured pace for one domain."""
+    rate: float = DEFAULT_RATE
+    burst: int = DEFAULT_BURST
+
+    def __post_init__(self):
+        if not math.isfinite(self.rate) or self.rate <= 0:
+            raise ValueError(f"rate must be a positive number of requests per second, not {self.rate!r}")
+        if self.burst < 1:
+            raise ValueError(f"burst must be at least 1, not {self.burst!r}")
+
+    @classmethod
+    def parse(cls, value: Union[float, int, Mapping, "HostLimit"]) -> "HostLimit":
+        """From a number (requests/second) or a ``{rate, burst}`` mapping.
+
+        Raises ValueError unless ``rate > 0`` and ``burst >= 1``.
+        """
+        if isinstance(value, HostLimit):
+            return value
+        if isinstance(value, (int, float)):
+            return cls(rate=float(value))
+        if isinstance(value, Mapping):
+            return cls(rate=float(value.get("rate", DEFAULT_RATE)), burst=int(value.get("burst", DEFAULT_BURST)))
+        raise ValueError(f"invalid rate limit: {value!r}")
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class TokenBucket:
+    """Token bucket for one host. Not locked itself; ``HostRateLimiter`` serializes access."""
+
+    def __init__(self, limit: HostLimit):
+        self.limit = limit
+        self.rate = limit.rate
+        self.tokens = float(limit.burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.throttled = 0
+
+    def _projected(self, now: float) -> Tuple[float, float]:
+        """Tokens and last refill time as of ``now``."""
+        if now < self.paused_until:
+            # Nothing refills while paused; start counting again once it ends
+            return self.tokens, max(self.updated, self.paused_until)
+        if now > self.updated:
+            return min(float(self.limit.burst), self.tokens + (now - self.updated) * self.rate), now
+        return self.tokens, self.updated
+
+    def _wait(self, now: float, tokens: float, updated: float) -> float:
+        start = max(now, self.paused_until, updated)
+        if tokens >= 0:
+            return start - now
+        return start - now + (-tokens) / self.rate
+
+    def reserve(self, now: float) -> float:
+        """Take a token; return how long to wait before using it.
+
+        Tokens may go negative: each caller queues behind the ones before it.
+        """
+        self.tokens, self.updated = self._projected(now)
+        self.tokens -= 1
+        return self._wait(now, self.tokens, self.updated)
+
+    def peek(self, now: float) -> float:
+        """How long ``reserve`` would wait, without taking the token."""
+        tokens, updated = self._projected(now)
+        return self._wait(now, tokens - 1, updated)
+
+    def delay(self, now: float) -> float:
+        """Seconds until the host's pause ends (0 when not paused)."""
+        return max(0.0, self.paused_until - now)
+
+    def throttle(self, now: float, retry_after: Optional[float]):
+        pause = min(MAX_THROTTLE_PAUSE, retry_after if retry_after is not None else DEFAULT_THROTTLE_PAUSE)
+        self.paused_until = max(self.paused_until, now + pause)
+        self.rate = max(self.limit.rate * MIN_RATE_FRACTION, self.rate / 2)
+        self.tokens = min(self.tokens, 0.0)
+        self.throttled += 1
+
+    def recover(self):
+        if self.rate < self.limit.rate:
+            self.rate = min(self.limit.rate, self.rate + self.limit.rate * RECOVERY_FRACTION)
+
+
+class HostRateLimiter:
+    """Token buckets for every host, created on first use."""
+
+    def __init__(self, limits: Optional[Mapping[str, object]] = None,
+                 default: Optional[Union[float, Mapping, HostLimit]] = None):
+        self.default = HostLimit.parse(default) if default is not None else HostLimit()
+        self.limits: Dict[str, HostLimit] = {}
+        for domain, value in {**DEFAULT_HOST_LIMITS, **(limits or {})}.items():
+            if domain == "default":
+                self.default = HostLimit.parse(value)
+            else:
+                self.limits[domain.lower().lstrip(".")] = HostLimit.parse(value)
+        self.buckets: Dict[str, TokenBucket] = {}
+        self._rotation: Dict[str, int] = {}  # host -> egress to try first next time
+        self._lock = threading.Lock()
+
+    def limit_for(self, host: str) -> HostLimit:
+        """The configured limit for ``host``: its own entry, else its closest parent domain's."""
+        host = host.lower()
+        while host:
+            if host in self.limits:
+                return self.limits[host]
+            host = host.partition(".")[2]
+        return self.default
+
+    def _bucket(self, host: str, egress: Optional[str] = None) -> TokenBucket:
+        bucket = self.buckets.get(self._key(host, egress))
+        if bucket is None:
+            bucket = self.buckets[self._key(host, egress)] = TokenBucket(self.limit_for(host))
+        return bucket
+
+    @staticmethod
+    def _key(host: str, egress: Optional[str]) -> str:
+        return host if egress is None else f"{host} via {egress}"
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def reserve(self, url: str, egress: Optional[str] = None) -> float:
+        """Reserve the next request slot for ``url``'s host (through ``egress``); return seconds to wait."""
+        with self._lock:
+            return self._bucket(self.host_of(url), egress).reserve(time.monotonic())
+
+    def reserve_any(self, url: str, egresses: Sequence[str]) -> Tuple[str, float]:
+        """Reserve a slot for ``url``'s host through the egress that can send soonest.
+
+        Returns ``(egress, seconds to wait)``. Egresses that are equally ready
+        take turns, so requests to a host are spread across the pool.
+        """
+        host = self.host_of(url)
+        with self._lock:
+            start = self._rotation.get(host, 0) % len(egresses)
+            buckets = {e: self._bucket(host, e) for e in list(egresses[start:]) + list(egresses[:start])}
+            now = time.monotonic()
+            egress = min(buckets, key=lambda e: buckets[e].peek(now))
+            self._rotation[host] = egresses.index(egress) + 1
+            return egress, buckets[egress].reserve(now)
+
+    def delay(self, url: str, egress: Optional[str] = None) -> float:
+        """Seconds until ``url``'s host may be contacted again (through ``egress``) after throttling."""
+        with self._lock:
+            bucket = self.buckets.get(self._key(self.host_of(url), egress))
+            return bucket.delay(time.monotonic()) if bucket is not None else 0.0
+
+    def delay_any(self, url: str, egresses: Sequence[str]) -> float:
+        """Seconds until ``url``'s host may be contacted through any of ``egresses``."""
+        return min(self.delay(url, egress) for egress in egresses)
+
+    def throttled(self, url: str, retry_after=None, egress: Optional[str] = None):
+        """Record a 429/503 (with the raw ``Retry-After`` header, if any) for ``url``'s host."""
+        seconds = parse_retry_after(retry_after)
+        host = self.host_of(url)
+        with self._lock:
+            bucket = self._bucket(host, egress)
+            bucket.throttle(time.monotonic(), seconds)
+            rate = bucket.rate
+        via = f" via {egress}" if egress is not None else ""
+        logger.info(f"[RateLimit] {host} throttled us{via}; pausing "
+                    f"{seconds if seconds is not None else DEFAULT_THROTTLE_PAUSE:.0f}s, now {rate:.2f} req/s")
+
+    def succeeded(self, url: str, egress: Optional[str] = None):
+        """Record a successful response, letting a slowed-down host speed back up."""
+        with self._lock:
+            bucket = self.buckets.get(self._key(self.host_of(url), egress))
+            if bucket is not None:
+                bucket.recover()
+
+    def reset(self):
+        with self._lock:
+            self.buckets.clear()
+            self._rotation.clear()
+
+
+_rate_limiter: Optional[HostRateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Return the shared rate limiter (built-in limits until configured)."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = HostRateLimiter()
+        return _rate_limiter
+
+
+def configure_rate_limits(limits: Optional[Mapping[str, object]] = None) -> HostRateLimiter:
+    """Replace the shared rate limiter with one using ``limits`` (domain → rate or {rate, burst}).
+
+    A ``default`` key sets the pace for hosts without an entry.
+    """
+    global _rate_limiter
+    with _rate_limiter_lock:
+        _rate_limiter = HostRateLimiter(limits)
+        return _rate_limiter
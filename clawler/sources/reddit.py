@@ -236,13 +236,15 @@ class RedditSource(BaseSource):
         articles: List[Article] = []
         seen_urls: Set[str] = set()
 
-        for sub in self.subreddits:
-            if sub.lower() in self.exclude_subreddits:
-                continue
-
-            url = self._build_url(sub)
+        subs = [s for s in self.subreddits if s.lower() not in self.exclude_subreddits]
+        urls = [self._build_url(sub) for sub in subs]
+        results = self.fetch_many(urls, parse_json=True, ordered=True,
+                                  extra_headers={"Accept": "application/json"})
+        for sub, (url, data) in zip(subs, results):
+            if self.budget_expired:
+                logger.info(f"[Reddit] Budget expired, returning {len(articles)} articles collected so far")
+                break
             try:
-                data = self.fetch_json(url, extra_headers={"Accept": "application/json"})
                 if not data:
                     continue
                 children = data.get("data", {}).get("children", [])
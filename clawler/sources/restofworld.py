@@ -7,7 +7,6 @@ import logging
 import re
 from typing import List, Optional
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -57,7 +56,7 @@ class RestOfWorldSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles = []
 
         for entry in parsed.entries[:self.limit]:
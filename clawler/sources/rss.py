@@ -1,14 +1,26 @@
 """RSS/Atom feed source — the workhorse of Clawler."""
+import copy
+import dataclasses
+import hashlib
 import logging
-from datetime import datetime
-from typing import List, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 import feedparser
 from dateutil import parser as dateparser
 from clawler.models import Article
 from clawler.sources.base import BaseSource, HEADERS
+from clawler.sources.parse_pool import submit_parse
 
 logger = logging.getLogger(__name__)
 
+# Entries kept per feed; the download stops once this many have arrived
+MAX_ENTRIES_PER_FEED = 20
+
 # Curated list of high-quality RSS feeds
 DEFAULT_FEEDS = [
     {"url": "https://feeds.arstechnica.com/arstechnica/index", "source": "Ars Technica", "category": "tech"},
@@ -1076,64 +1088,277 @@ DEFAULT_FEEDS = [
 ]
 
 
+def _interleave_by_host(feeds: List[dict]) -> List[dict]:
+    """Reorder feeds round-robin across hosts so one busy host can't hog the pool."""
+    by_host: Dict[str, List[dict]] = {}
+    for cfg in feeds:
+        by_host.setdefault(urlparse(cfg["url"]).netloc.lower(), []).append(cfg)
+    queues = list(by_host.values())
+    ordered: List[dict] = []
+    depth = 0
+    while len(ordered) < len(feeds):
+        for q in queues:
+            if depth < len(q):
+                ordered.append(q[depth])
+        depth += 1
+    return ordered
+
+
+def _parse_date(entry) -> Optional[datetime]:
+    for field in ("published", "updated", "created"):
+        val = getattr(entry, field, None)
+        if val:
+            try:
+                return dateparser.parse(val)
+            except (ValueError, TypeError):
+                pass
+    struct = getattr(entry, "published_parsed", None) or getattr(entry, "updated_parsed", None)
+    if struct:
+        try:
+            return datetime(*struct[:6])
+        except Exception:
+            pass
+    return None
+
+
+def _get_summary(entry) -> str:
+    summary = getattr(entry, "summary", "") or getattr(entry, "description", "") or ""
+    # Strip HTML tags simply
+    from bs4 import BeautifulSoup
+    text = BeautifulSoup(summary, "html.parser").get_text(separator=" ", strip=True)
+    return text[:300] + "..." if len(text) > 300 else text
+
+
+def _entry_older_than(entry, cutoff: datetime) -> bool:
+    """Cheap pre-check on feedparser's own parsed date; False when it has none."""
+    struct = getattr(entry, "published_parsed", None) or getattr(entry, "updated_parsed", None)
+    if not struct:
+        return False
+    try:
+        return datetime(*struct[:6], tzinfo=timezone.utc) < cutoff
+    except (TypeError, ValueError):
+        return False
+
+
+def _parse_feed(raw: str, source: str, category: str,
+                since: Optional[datetime] = None) -> Tuple[int, List[Article]]:
+    """Parse a fetched feed into articles; return (entry count, articles).
+
+    Entries dated before ``since`` are dropped before their summary and date
+    are parsed. Module-level so it can run on the parse process pool.
+    """
+    d = feedparser.parse(raw)
+    articles: List[Article] = []
+    for entry in d.entries[:MAX_ENTRIES_PER_FEED]:
+        title = getattr(entry, "title", "").strip()
+        link = getattr(entry, "link", "").strip()
+        if not title or not link:
+            continue
+        if since is not None and _entry_older_than(entry, since):
+            continue
+        articles.append(Article(
+            title=title,
+            url=link,
+            source=source,
+            summary=_get_summary(entry),
+            timestamp=_parse_date(entry),
+            category=category,
+        ))
+    return len(d.entries), articles
+
+
+# Last parse of each feed in this process, reused when the HTTP cache says
+# the feed is unchanged (e.g. between --watch refreshes). Least recently
+# used feeds are dropped past MAX_PARSED_FEEDS.
+MAX_PARSED_FEEDS = 2048
+_parsed_feeds: "OrderedDict[Tuple[str, str, str], Tuple[str, int, List[Article]]]" = OrderedDict()
+_parsed_feeds_lock = threading.Lock()
+
+
+def _body_digest(raw: str) -> str:
+    return hashlib.sha1(raw.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _remember_parsed(url: str, source: str, category: str, raw: str, entries: int, articles: List[Article]):
+    key = (url, source, category)
+    with _parsed_feeds_lock:
+        _parsed_feeds[key] = (_body_digest(raw), entries, [copy.copy(a) for a in articles])
+        _parsed_feeds.move_to_end(key)
+        while len(_parsed_feeds) > MAX_PARSED_FEEDS:
+            _parsed_feeds.popitem(last=False)
+
+
+def _reuse_parsed(url: str, source: str, category: str, raw: str) -> Optional[Tuple[int, List[Article]]]:
+    """Copies of the articles parsed from this exact body before, if it came back unchanged."""
+    if not getattr(raw, "not_modified", False):
+        return None
+    key = (url, source, category)
+    with _parsed_feeds_lock:
+        hit = _parsed_feeds.get(key)
+        if hit is not None:
+            _parsed_feeds.move_to_end(key)
+    if hit is None or hit[0] != _body_digest(raw):
+        return None
+    return hit[1], [dataclasses.replace(a, tags=list(a.tags)) for a in hit[2]]
+
+
 class RSSSource(BaseSource):
-    """Crawl multiple RSS/Atom feeds."""
+    """Crawl multiple RSS/Atom feeds concurrently.
+
+    Parameters
+    ----------
+    feeds : list of dict
+        Feed configs (``url``, ``source``, ``category``). Default ``DEFAULT_FEEDS``.
+    max_workers : int
+        Max feeds fetched in parallel. Default 16.
+    per_host_limit : int
+        Max concurrent fetches against a single host. Default 2.
+
+    After ``crawl()``, ``feed_timings`` maps each feed URL to
+    ``{"source", "elapsed_ms", "entries", "ok"}``, where ``ok`` means the feed
+    was fetched and parsed, even if it had no articles.
+    """
 
     name = "rss"
 
-    def __init__(self, feeds: Optional[List[dict]] = None):
+    def __init__(self, feeds: Optional[List[dict]] = None, max_workers: int = 16,
+                 per_host_limit: int = 2):
         self.feeds = feeds or DEFAULT_FEEDS
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.feed_timings: Dict[str, dict] = {}
+        self.skipped_feeds = 0
+
+    def apply_filter(self, crawl_filter) -> bool:
+        """Drop feeds whose fixed category/source can't match the query."""
+        super().apply_filter(crawl_filter)
+        before = len(self.feeds)
+        self.feeds = [f for f in self.feeds
+                      if crawl_filter.feed_matches(f.get("category", "general"), f.get("source", f["url"]))]
+        self.skipped_feeds = before - len(self.feeds)
+        return bool(self.feeds)
+
+    def prewarm_urls(self) -> List[str]:
+        return [f["url"] for f in self.feeds]
 
     def _parse_date(self, entry) -> Optional[datetime]:
-        for field in ("published", "updated", "created"):
-            val = getattr(entry, field, None)
-            if val:
-                try:
-                    return dateparser.parse(val)
-                except (ValueError, TypeError):
-                    pass
-        struct = getattr(entry, "published_parsed", None) or getattr(entry, "updated_parsed", None)
-        if struct:
-            try:
-                return datetime(*struct[:6])
-            except Exception:
-                pass
-        return None
+        return _parse_date(entry)
 
     def _get_summary(self, entry) -> str:
-        summary = getattr(entry, "summary", "") or getattr(entry, "description", "") or ""
-        # Strip HTML tags simply
-        from bs4 import BeautifulSoup
-        text = BeautifulSoup(summary, "html.parser").get_text(separator=" ", strip=True)
-        return text[:300] + "..." if len(text) > 300 else text
+        return _get_summary(entry)
+
+    def _fetch_feed(self, feed_cfg: dict) -> Optional[Future]:
+        """Fetch a single feed and start parsing it.
+
+        Returns a future of ``(entries, articles)`` without waiting for the
+        parse, so the calling fetch thread can move on to its next feed, or
+        None if nothing was fetched. Never raises.
+        """
+        url = feed_cfg["url"]
+        source = feed_cfg.get("source", url)
+        category = feed_cfg.get("category", "general")
+        if self.budget_expired:
+            return None
+        try:
+            # Fetch through base class for rate limiting + retries
+            raw = self.fetch_url(url, max_items=MAX_ENTRIES_PER_FEED)
+            if not raw:
+                logger.warning(f"[RSS] Empty response from {source}")
+                return None
+            reused = _reuse_parsed(url, source, category, raw) if self.since is None else None
+            if reused is not None:
+                logger.info(f"[RSS] {source}: not modified, reused {len(reused[1])} parsed articles")
+                future: Future = Future()
+                future.set_result(reused)
+                return future
+            future = submit_parse(_parse_feed, raw, source, category, self.since)
+        except Exception as e:
+            logger.warning(f"[RSS] Failed {source}: {e}")
+            return None
+        if self.since is None and not getattr(raw, "not_modified", False):
+            future.add_done_callback(
+                lambda f: f.exception() is None and _remember_parsed(url, source, category, raw, *f.result()))
+        return future
+
+    @staticmethod
+    def _feed_articles(feed_cfg: dict, future: Optional[Future]) -> Optional[List[Article]]:
+        """Wait for a feed's parse; None if the fetch or parse failed."""
+        if future is None:
+            return None
+        source = feed_cfg.get("source", feed_cfg["url"])
+        try:
+            entries, articles = future.result()
+        except Exception as e:
+            logger.warning(f"[RSS] Failed {source}: {e}")
+            return None
+        logger.info(f"[RSS] {source}: {entries} entries")
+        return articles
+
+    def _timed_fetch(self, feed_cfg: dict, host_slots: Dict[str, threading.Semaphore]) -> Tuple[Optional[Future], float]:
+        """Fetch thread body: fetch under the host's slot, hand the parse off; return (parse future, start)."""
+        with host_slots[urlparse(feed_cfg["url"]).netloc.lower()]:
+            t0 = time.monotonic()
+            future = self._fetch_feed(feed_cfg)
+        if future is not None:
+            # Stamp when the parse finishes, not when crawl() gets round to it
+            future.add_done_callback(lambda f: setattr(f, "finished_at", time.monotonic()))
+        return future, t0
+
+    def _record_timing(self, feed_cfg: dict, future: Optional[Future], t0: float,
+                       articles: Optional[List[Article]]):
+        url = feed_cfg["url"]
+        finished = getattr(future, "finished_at", None) or time.monotonic()
+        self.feed_timings[url] = {
+            "source": feed_cfg.get("source", url),
+            "elapsed_ms": round((finished - t0) * 1000, 1),
+            "entries": len(articles or []),
+            # A feed that fetched and parsed but has nothing new is still ok
+            "ok": articles is not None,
+        }
 
     def crawl(self) -> List[Article]:
-        articles = []
-        for feed_cfg in self.feeds:
-            url = feed_cfg["url"]
-            source = feed_cfg.get("source", url)
-            category = feed_cfg.get("category", "general")
-            try:
-                # Fetch through base class for rate limiting + retries
-                raw = self.fetch_url(url)
-                if not raw:
-                    logger.warning(f"[RSS] Empty response from {source}")
-                    continue
-                d = feedparser.parse(raw)
-                for entry in d.entries[:20]:  # cap per feed
-                    title = getattr(entry, "title", "").strip()
-                    link = getattr(entry, "link", "").strip()
-                    if not title or not link:
-                        continue
-                    articles.append(Article(
-                        title=title,
-                        url=link,
-                        source=source,
-                        summary=self._get_summary(entry),
-                        timestamp=self._parse_date(entry),
-                        category=category,
-                    ))
-                logger.info(f"[RSS] {source}: {len(d.entries)} entries")
-            except Exception as e:
-                logger.warning(f"[RSS] Failed {source}: {e}")
+        self.feed_timings = {}
+        unique: Dict[str, dict] = {}
+        for cfg in self.feeds:
+            unique.setdefault(cfg["url"], cfg)
+        feeds = _interleave_by_host(list(unique.values()))
+        host_slots = {
+            urlparse(cfg["url"]).netloc.lower(): threading.Semaphore(max(1, self.per_host_limit))
+            for cfg in feeds
+        }
+        # Fetch threads only fetch: each body goes to the parse stage (see
+        # parse_pool.py) and the thread moves on; parses are collected here
+        parses: Dict[str, Tuple[Optional[Future], float]] = {}
+        t0 = time.monotonic()
+        workers = max(1, min(self.max_workers, len(feeds)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(self._timed_fetch, cfg, host_slots): cfg for cfg in feeds}
+            for future in as_completed(futures):
+                parses[futures[future]["url"]] = future.result()
+
+        results: Dict[str, List[Article]] = {}
+        for cfg in feeds:
+            parse, started = parses[cfg["url"]]
+            feed_articles = self._feed_articles(cfg, parse)
+            self._record_timing(cfg, parse, started, feed_articles)
+            results[cfg["url"]] = feed_articles or []
+
+        # Reassemble in configured feed order so output is deterministic
+        articles: List[Article] = []
+        for cfg in self.feeds:
+            articles.extend(results.pop(cfg["url"], []))
+
+        ok = sum(1 for t in self.feed_timings.values() if t["ok"])
+        slowest = max(self.feed_timings.values(), key=lambda t: t["elapsed_ms"], default=None)
+        if slowest:
+            logger.info(
+                f"[RSS] {ok}/{len(feeds)} feeds fetched in {time.monotonic() - t0:.1f}s "
+                f"(slowest: {slowest['source']} {slowest['elapsed_ms']:.0f}ms)"
+            )
         return articles
+
+    def slowest_feeds(self, n: int = 10) -> List[dict]:
+        """Return the ``n`` slowest feeds from the last crawl, slowest first."""
+        entries = [{"url": url, **t} for url, t in self.feed_timings.items()]
+        entries.sort(key=lambda e: e["elapsed_ms"], reverse=True)
+        return entries[:n]
@@ -6,7 +6,6 @@ import logging
 import re
 from typing import List, Optional
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -56,7 +55,7 @@ class SalonSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles = []
 
         for entry in parsed.entries[:self.limit]:
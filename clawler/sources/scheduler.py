@@ -0,0 +1,116 @@
+"""Shared fetch scheduler for sources that fetch many URLs per crawl.
+
+One process-wide pool runs every sub-fetch submitted through
+``BaseSource.fetch_many``. ``max_workers`` caps requests in flight across all
+sources, and ``per_host`` caps them per host, so a source with 30 Reddit
+subreddits or 20 Medium feeds gets parallelism without each source keeping
+its own thread pool, and without one source swamping one server. The
+per-domain rate limiter in ``base.py`` still applies to each request.
+"""
+import logging
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import Future
+from typing import Callable, Deque, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from clawler.pool import DaemonThreadPool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FETCH_WORKERS = 32
+DEFAULT_FETCH_PER_HOST = 4
+
+
+class FetchScheduler:
+    """Run fetch callables on a shared pool under global and per-host limits.
+
+    ``submit`` never blocks: a fetch whose host is at its limit waits in that
+    host's queue and starts as soon as an earlier fetch to the same host
+    finishes.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_FETCH_WORKERS, per_host: int = DEFAULT_FETCH_PER_HOST):
+        self.max_workers = max(1, max_workers)
+        self.per_host = max(1, per_host)
+        self._pool = DaemonThreadPool(self.max_workers, thread_name_prefix="clawler-fetch")
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, int] = defaultdict(int)
+        self._waiting: Dict[str, Deque[Tuple[Future, Callable, tuple]]] = defaultdict(deque)
+        self._local = threading.local()
+        self._running = 0
+        self.peak_in_flight = 0
+        self.peak_per_host: Dict[str, int] = defaultdict(int)
+
+    def in_worker(self) -> bool:
+        """True when called from one of this scheduler's worker threads."""
+        return getattr(self._local, "active", False)
+
+    def submit(self, url: str, fn: Callable, *args) -> Future:
+        """Schedule ``fn(*args)`` as a fetch of ``url``; return a Future for its result."""
+        host = urlparse(url).netloc.lower()
+        future: Future = Future()
+        with self._lock:
+            if self._in_flight[host] >= self.per_host:
+                self._waiting[host].append((future, fn, args))
+                return future
+            self._in_flight[host] += 1
+        self._start(host, future, fn, args)
+        return future
+
+    def _start(self, host: str, future: Future, fn: Callable, args: tuple):
+        with self._lock:
+            self.peak_per_host[host] = max(self.peak_per_host[host], self._in_flight[host])
+        inner = self._pool.submit(self._run, fn, args)
+        inner.add_done_callback(lambda f: self._finish(host, future, f))
+
+    def _run(self, fn: Callable, args: tuple):
+        self._local.active = True
+        with self._lock:
+            self._running += 1
+            self.peak_in_flight = max(self.peak_in_flight, self._running)
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+            self._local.active = False
+
+    def _finish(self, host: str, future: Future, inner: Future):
+        with self._lock:
+            waiting = self._waiting[host]
+            nxt = waiting.popleft() if waiting else None
+            if nxt is None:
+                self._in_flight[host] -= 1
+        if nxt is not None:
+            self._start(host, *nxt)
+        exc = inner.exception()
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(inner.result())
+
+
+_scheduler: Optional[FetchScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> FetchScheduler:
+    """Return the shared scheduler, creating it with default limits on first use."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = FetchScheduler()
+        return _scheduler
+
+
+def configure_scheduler(max_workers: int = DEFAULT_FETCH_WORKERS,
+                        per_host: int = DEFAULT_FETCH_PER_HOST) -> FetchScheduler:
+    """Replace the shared scheduler with one using the given limits."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is not None and (_scheduler.max_workers, _scheduler.per_host) == (max_workers, per_host):
+            return _scheduler
+        _scheduler = FetchScheduler(max_workers=max_workers, per_host=per_host)
+        logger.debug(f"[Scheduler] {max_workers} workers, {per_host} per host")
+        return _scheduler
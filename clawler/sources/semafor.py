@@ -7,7 +7,6 @@ import logging
 import re
 from typing import List, Optional
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -59,7 +58,7 @@ class SemaforSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles = []
 
         for entry in parsed.entries[:self.limit]:
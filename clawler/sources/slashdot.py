@@ -205,8 +205,7 @@ class SlashdotSource(BaseSource):
                 logger.warning(f"[Slashdot] Failed to fetch {section}: {e}")
                 continue
 
-            import feedparser
-            feed = feedparser.parse(text)
+            feed = self.parse_feed(text)
 
             for entry in feed.entries[: self.limit]:
                 try:
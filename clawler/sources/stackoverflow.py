@@ -140,10 +140,10 @@ class StackOverflowSource(BaseSource):
         all_articles: List[Article] = []
         seen_urls: Set[str] = set()
 
-        for site, site_default_cat in self.sites.items():
-            url = (f"{SE_API}?order=desc&sort={self.sort}&site={site}"
-                   f"&pagesize={self.limit}&filter=!nNPvSNdWme")
-            data = self.fetch_json(url)
+        sites = list(self.sites.items())
+        urls = [f"{SE_API}?order=desc&sort={self.sort}&site={site}"
+                f"&pagesize={self.limit}&filter=!nNPvSNdWme" for site, _ in sites]
+        for (site, site_default_cat), (url, data) in zip(sites, self.fetch_many(urls, parse_json=True, ordered=True)):
             if not data or "items" not in data:
                 logger.warning(f"[StackOverflow] No data from {site}")
                 continue
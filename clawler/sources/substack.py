@@ -58,14 +58,17 @@ class SubstackSource(BaseSource):
         self.feeds = feeds or SUBSTACK_FEEDS
         self.max_per_feed = max_per_feed
 
-    def _parse_feed(self, feed_info: dict) -> List[Article]:
-        """Parse a single Substack RSS feed."""
+    @staticmethod
+    def _feed_url(feed_info: dict) -> str:
+        return f"https://{feed_info['slug']}.substack.com/feed"
+
+    def _parse_feed(self, feed_info: dict, text: Optional[str] = None) -> List[Article]:
+        """Parse a single Substack RSS feed, fetching it unless ``text`` is given."""
         slug = feed_info["slug"]
         source_name = feed_info.get("source", slug)
         category = feed_info.get("category", "general")
-        url = f"https://{slug}.substack.com/feed"
-
-        text = self.fetch_url(url)
+        if text is None:
+            text = self.fetch_url(self._feed_url(feed_info))
         if not text:
             return []
 
@@ -130,9 +133,10 @@ class SubstackSource(BaseSource):
     def crawl(self) -> List[Article]:
         """Crawl all configured Substack feeds."""
         all_articles: List[Article] = []
-        for feed_info in self.feeds:
+        urls = [self._feed_url(feed_info) for feed_info in self.feeds]
+        for feed_info, (_, text) in zip(self.feeds, self.fetch_many(urls, ordered=True)):
             try:
-                articles = self._parse_feed(feed_info)
+                articles = self._parse_feed(feed_info, text)
                 all_articles.extend(articles)
             except Exception as e:
                 logger.warning(f"[Substack] Error crawling {feed_info.get('slug', '?')}: {e}")
@@ -16,7 +16,6 @@ import re
 from datetime import datetime
 from math import log10
 from typing import Dict, List, Optional, Set
-import feedparser
 from dateutil import parser as dateparser
 from clawler.models import Article
 from clawler.sources.base import BaseSource
@@ -189,7 +188,7 @@ class TechMemeSource(BaseSource):
         if not text:
             return []
 
-        feed = feedparser.parse(text)
+        feed = self.parse_feed(text)
         articles: List[Article] = []
         seen_urls: Set[str] = set()
 
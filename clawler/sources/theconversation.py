@@ -7,7 +7,6 @@ import logging
 import re
 from typing import List, Optional, Set
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -60,7 +59,7 @@ class TheConversationSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles: List[Article] = []
 
         for entry in parsed.entries[: self.limit]:
@@ -14,7 +14,6 @@ import logging
 import re
 from typing import Dict, List, Set
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -120,7 +119,7 @@ class TheHackerNewsSource(BaseSource):
             logger.warning("[TheHackerNews] Empty response from feed")
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles = []
 
         for entry in parsed.entries[:self.limit]:
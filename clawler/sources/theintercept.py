@@ -6,7 +6,6 @@ import logging
 import re
 from typing import List, Optional
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -54,7 +53,7 @@ class TheInterceptSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles: List[Article] = []
 
         for entry in parsed.entries[: self.limit]:
@@ -16,7 +16,6 @@ import math
 import re
 from typing import Dict, List, Optional, Set
 
-import feedparser
 from dateutil import parser as dateparser
 
 from clawler.models import Article
@@ -186,7 +185,7 @@ class WashingtonPostSource(BaseSource):
         if not content:
             return []
 
-        parsed = feedparser.parse(content)
+        parsed = self.parse_feed(content)
         articles: List[Article] = []
 
         for i, entry in enumerate(parsed.entries[:self.limit]):
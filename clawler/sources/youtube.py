@@ -157,29 +157,22 @@ class YouTubeSource(BaseSource):
         seen_urls: Set[str] = set()
         articles: List[Article] = []
 
-        # Channels
-        for channel_id, channel_name in self.channels.items():
+        # Channels first, then playlists
+        feeds = [(YOUTUBE_FEED_URL.format(channel_id=channel_id), channel_name, False)
+                 for channel_id, channel_name in self.channels.items()]
+        feeds += [(YOUTUBE_PLAYLIST_FEED_URL.format(playlist_id=playlist_id), playlist_name, True)
+                  for playlist_id, playlist_name in self.playlists.items()]
+        results = self.fetch_many([url for url, _, _ in feeds], ordered=True)
+        for (_, feed_name, is_playlist), (_, xml_text) in zip(feeds, results):
             try:
-                url = YOUTUBE_FEED_URL.format(channel_id=channel_id)
-                arts = self._fetch_feed(url, channel_name)
+                arts = self._parse_feed(xml_text, feed_name, is_playlist)
                 for a in arts:
                     if a.url not in seen_urls:
                         seen_urls.add(a.url)
                         articles.append(a)
             except Exception as e:
-                logger.debug(f"[YouTube] Error fetching {channel_name}: {e}")
-
-        # Playlists
-        for playlist_id, playlist_name in self.playlists.items():
-            try:
-                url = YOUTUBE_PLAYLIST_FEED_URL.format(playlist_id=playlist_id)
-                arts = self._fetch_feed(url, playlist_name, is_playlist=True)
-                for a in arts:
-                    if a.url not in seen_urls:
-                        seen_urls.add(a.url)
-                        articles.append(a)
-            except Exception as e:
-                logger.debug(f"[YouTube] Error fetching playlist {playlist_name}: {e}")
+                kind = "playlist " if is_playlist else ""
+                logger.debug(f"[YouTube] Error fetching {kind}{feed_name}: {e}")
 
         # Apply category filter
         if self.category_filter:
@@ -192,8 +185,7 @@ class YouTubeSource(BaseSource):
         logger.info(f"[YouTube] Fetched {len(articles)} videos from {len(self.channels)} channels + {len(self.playlists)} playlists")
         return articles
 
-    def _fetch_feed(self, feed_url: str, feed_name: str, is_playlist: bool = False) -> List[Article]:
-        xml_text = self.fetch_url(feed_url)
+    def _parse_feed(self, xml_text: str, feed_name: str, is_playlist: bool = False) -> List[Article]:
         if not xml_text:
             return []
 
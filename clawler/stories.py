@@ -24,10 +24,10 @@ API:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from difflib import SequenceMatcher
 from typing import List, Optional
 
 from clawler.models import Article
+from clawler.title_index import title_index_for
 
 
 @dataclass
@@ -82,6 +82,7 @@ class Story:
 def cluster_stories(
     articles: List[Article],
     similarity_threshold: float = 0.65,
+    backend: Optional[str] = None,
 ) -> List[Story]:
     """Cluster articles into stories using fuzzy title matching.
 
@@ -93,35 +94,33 @@ def cluster_stories(
         similarity_threshold: Title similarity threshold for clustering (0.0-1.0).
             Lower than dedup threshold since we want to catch related (not just
             duplicate) articles.
+        backend: Title similarity backend, "difflib" or "vector" (default: the
+            one set with ``clawler.title_index.configure_dedup_backend``).
 
     Returns:
         List of Story objects, sorted by story_score (most significant first).
     """
     stories: List[Story] = []
-    # Index: (title_lower, title_len, story_index, title_words)
-    title_index: List[tuple] = []
+    # One entry per story (slot == story index), plus its significant words
+    title_index = title_index_for(similarity_threshold, backend)
+    title_index.prepare(a.normalized_title for a in articles)
+    story_words: List[frozenset] = []
 
     def _significant_words(text: str) -> frozenset:
         """Extract significant words (len>3) for fast overlap check."""
         return frozenset(w for w in text.split() if len(w) > 3)
 
     for article in articles:
-        title_lower = article.title.lower().strip()
-        title_len = len(title_lower)
+        title_lower = article.normalized_title
         title_words = _significant_words(title_lower)
-        matched_idx: Optional[int] = None
+
+        # Quick word-overlap filter: require at least 1 shared significant word
+        def _shares_a_word(slot: int) -> bool:
+            prev_words = story_words[slot]
+            return not (title_words and prev_words) or bool(title_words & prev_words)
 
         # Try to match against existing stories
-        for i, (prev_title, prev_len, story_idx, prev_words) in enumerate(title_index):
-            # Quick length filter
-            if abs(title_len - prev_len) > max(title_len, prev_len) * (1 - similarity_threshold):
-                continue
-            # Quick word-overlap filter: require at least 1 shared significant word
-            if title_words and prev_words and not (title_words & prev_words):
-                continue
-            if SequenceMatcher(None, title_lower, prev_title).ratio() > similarity_threshold:
-                matched_idx = story_idx
-                break
+        matched_idx: Optional[int] = title_index.find(title_lower, admit=_shares_a_word)
 
         if matched_idx is not None:
             stories[matched_idx].articles.append(article)
@@ -130,16 +129,17 @@ def cluster_stories(
             if article.quality_score > story.best_article.quality_score:
                 story.headline = article.title
                 # Update title index entry for better future matching
-                title_index[matched_idx] = (title_lower, title_len, matched_idx, title_words)
+                title_index.replace(matched_idx, title_lower)
+                story_words[matched_idx] = title_words
         else:
-            idx = len(stories)
             story = Story(
                 headline=article.title,
                 articles=[article],
                 category=article.category,
             )
             stories.append(story)
-            title_index.append((title_lower, title_len, idx, title_words))
+            title_index.add(title_lower)
+            story_words.append(title_words)
 
     # Sort by story score (most significant first)
     stories.sort(key=lambda s: s.story_score, reverse=True)
@@ -0,0 +1,259 @@
+"""Candidate index for fuzzy title matching (tier 3 of dedup).
+
+The fuzzy tier asks whether any already-kept title has a
+``SequenceMatcher`` ratio above the threshold with a new one. Checking every
+kept title makes dedup quadratic: ~150µs per pair is fine for a few hundred
+articles and minutes for tens of thousands.
+
+:class:`TitleIndex` keeps the exact answer while narrowing who gets checked:
+
+- Every pair first goes through the existing length filter and an exact
+  upper bound on the ratio from the two titles' character counts (what
+  ``SequenceMatcher.quick_ratio`` computes). Neither can drop a real match.
+- Below ``LSH_MIN_TITLES`` kept titles every title is a candidate, so results
+  are identical to a full scan.
+- From then on candidates come from MinHash LSH over character 3-grams: a
+  one-permutation sketch of ``BANDS * ROWS`` values, split into ``BANDS``
+  bands of ``ROWS``; titles sharing any band are candidates, and those whose
+  sketches agree on less than ``MIN_SHARED`` of their values are skipped.
+  Pairs above a 0.7 ratio share most 3-grams and almost always collide, so
+  this is a (very rarely) missed duplicate traded for work that grows with
+  the number of look-alike titles instead of all of them. Thresholds below
+  ``LSH_MIN_THRESHOLD`` keep the full scan, as looser matches share too few
+  3-grams for banding to find them reliably.
+
+Candidates are checked in the order titles were added, so the first match
+is the same one a full scan would report.
+
+``configure_dedup_backend("vector")`` swaps in the NumPy index from
+:mod:`clawler.vector_index` wherever :func:`title_index_for` builds one.
+"""
+from __future__ import annotations
+
+import zlib
+from array import array
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+SHINGLE = 3  # characters per shingle
+BANDS = 32
+ROWS = 3
+SKETCH_SIZE = BANDS * ROWS
+MIN_SHARED = 0.3  # sketch agreement below this is never a duplicate at LSH thresholds
+LSH_MIN_TITLES = 100  # full scan below this many titles
+LSH_MIN_THRESHOLD = 0.7  # full scan for looser thresholds
+
+BACKENDS = ("difflib", "vector")
+
+_EMPTY = 1 << 32  # above any crc32
+
+
+def title_sketch(title: str) -> array:
+    """One-permutation MinHash sketch of ``title``'s character 3-grams.
+
+    Each 3-gram hash goes to bin ``hash % SKETCH_SIZE``, which keeps its
+    minimum. Empty bins borrow the next filled bin's value (offset by the
+    distance) so short titles still compare bin for bin.
+    """
+    data = " ".join(title.split()).encode()
+    mins = [_EMPTY] * SKETCH_SIZE
+    for i in range(max(1, len(data) - SHINGLE + 1)):
+        h = zlib.crc32(data[i:i + SHINGLE])
+        b = h % SKETCH_SIZE
+        if h < mins[b]:
+            mins[b] = h
+    if _EMPTY in mins:  # at least one bin is filled: even "" hashes once
+        out = list(mins)
+        for i, v in enumerate(mins):
+            if v == _EMPTY:
+                j, d = (i + 1) % SKETCH_SIZE, 1
+                while mins[j] == _EMPTY:
+                    j, d = (j + 1) % SKETCH_SIZE, d + 1
+                out[i] = (mins[j] + d * 0x9E3779B1) & 0xFFFFFFFF
+        mins = out
+    return array("I", mins)
+
+
+def _band_keys(sketch: array) -> List[int]:
+    # Strided bands: band i takes values i, i+BANDS, ... — neighbouring bins
+    # share borrowed values after densifying, so contiguous bands would collide
+    # far more often for unrelated short titles.
+    return [hash(tuple(sketch[i::BANDS])) for i in range(BANDS)]
+
+
+class TitleIndex:
+    """Kept titles, answering "which is the first one similar to this?".
+
+    Titles are normalized by the caller (dedup uses ``title.lower().strip()``)
+    and identified by slot — the order they were added in.
+
+        index = TitleIndex(0.75)
+        slot = index.find(title)
+        if slot is None:
+            index.add(title)
+    """
+
+    def __init__(self, threshold: float = 0.75, lsh_min_titles: int = LSH_MIN_TITLES):
+        self.threshold = threshold
+        self.lsh_min_titles = lsh_min_titles
+        self.comparisons = 0  # SequenceMatcher runs
+        self._titles: List[str] = []
+        self._sketches: List[array] = []
+        self._bands: Optional[List[Dict[int, object]]] = None  # band key -> slot or [slots]
+        self._last: Optional[Tuple[str, array, List[int]]] = None  # sketch of the last lookup
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def __getitem__(self, slot: int) -> str:
+        return self._titles[slot]
+
+    @property
+    def uses_lsh(self) -> bool:
+        return self._bands is not None
+
+    def prepare(self, titles: Iterable[str]):
+        """Batch hint for indexes that work in bulk; nothing to do here."""
+
+    def find(self, title: str, admit: Optional[Callable[[int], bool]] = None) -> Optional[int]:
+        """The first slot whose title's ratio with ``title`` is above the threshold.
+
+        ``admit(slot)``, if given, can veto a candidate before it's compared
+        (it runs before the sketch check, so keep it cheap).
+        """
+        threshold = self.threshold
+        title_len = len(title)
+        counts: Optional[Counter] = None
+        if self._bands is None:
+            candidates = range(len(self._titles))
+            sketch = None
+        else:
+            sketch, keys = self._sketch(title)
+            found = set()
+            for band, key in zip(self._bands, keys):
+                hit = band.get(key)
+                if hit is None:
+                    continue
+                if type(hit) is int:
+                    found.add(hit)
+                else:
+                    found.update(hit)
+            candidates = sorted(found)
+            min_shared = MIN_SHARED * SKETCH_SIZE
+
+        for slot in candidates:
+            prev = self._titles[slot]
+            prev_len = len(prev)
+            if abs(title_len - prev_len) > max(title_len, prev_len) * (1 - threshold):
+                continue
+            if admit is not None and not admit(slot):
+                continue
+            if sketch is not None and sum(map(int.__eq__, sketch, self._sketches[slot])) < min_shared:
+                continue
+            if counts is None:
+                counts = Counter(title)
+            if 2.0 * sum((counts & Counter(prev)).values()) / (title_len + prev_len) <= threshold:
+                continue
+            self.comparisons += 1
+            if SequenceMatcher(None, title, prev).ratio() > threshold:
+                return slot
+        return None
+
+    def add(self, title: str) -> int:
+        """Keep ``title``; returns its slot."""
+        slot = len(self._titles)
+        self._titles.append(title)
+        if self._bands is not None:
+            sketch, keys = self._sketch(title)
+            self._sketches.append(sketch)
+            self._post(slot, keys)
+        elif len(self._titles) >= self.lsh_min_titles and self.threshold >= LSH_MIN_THRESHOLD:
+            self._build()
+        return slot
+
+    def replace(self, slot: int, title: str):
+        """Swap the title kept at ``slot`` (a better article won the duplicate)."""
+        self._titles[slot] = title
+        if self._bands is None:
+            return
+        for band, key in zip(self._bands, _band_keys(self._sketches[slot])):
+            hit = band[key]
+            if type(hit) is int:
+                del band[key]
+            else:
+                hit.remove(slot)
+        sketch, keys = self._sketch(title)
+        self._sketches[slot] = sketch
+        self._post(slot, keys)
+
+    def _sketch(self, title: str) -> Tuple[array, List[int]]:
+        last = self._last
+        if last is not None and last[0] == title:
+            return last[1], last[2]
+        sketch = title_sketch(title)
+        keys = _band_keys(sketch)
+        self._last = (title, sketch, keys)
+        return sketch, keys
+
+    def _post(self, slot: int, keys: List[int]):
+        for band, key in zip(self._bands, keys):
+            hit = band.get(key)
+            if hit is None:
+                band[key] = slot
+            elif type(hit) is int:
+                band[key] = [hit, slot]
+            else:
+                hit.append(slot)
+
+    def _build(self):
+        self._bands = [{} for _ in range(BANDS)]
+        self._sketches = []
+        for slot, title in enumerate(self._titles):
+            sketch = title_sketch(title)
+            self._sketches.append(sketch)
+            self._post(slot, _band_keys(sketch))
+
+
+_backend = "difflib"
+
+
+def _numpy():
+    """Return the numpy module, or None when it isn't installed."""
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        return None
+
+
+def get_dedup_backend() -> str:
+    """The similarity backend new title indexes use: ``"difflib"`` or ``"vector"``."""
+    return _backend
+
+
+def configure_dedup_backend(backend: str = "difflib") -> bool:
+    """Choose the similarity backend for dedup and story clustering.
+
+    Returns False (and keeps ``difflib``) when ``vector`` is asked for but
+    numpy isn't installed.
+    """
+    global _backend
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown dedup backend {backend!r} (choose from {', '.join(BACKENDS)})")
+    if backend == "vector" and _numpy() is None:
+        _backend = "difflib"
+        return False
+    _backend = backend
+    return True
+
+
+def title_index_for(threshold: float, backend: Optional[str] = None):
+    """A title index for ``threshold`` on ``backend`` (default: the configured one)."""
+    backend = backend or _backend
+    if backend == "vector" and _numpy() is not None:
+        from clawler.vector_index import VectorTitleIndex
+        return VectorTitleIndex(threshold)
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown dedup backend {backend!r} (choose from {', '.join(BACKENDS)})")
+    return TitleIndex(threshold)
@@ -0,0 +1,139 @@
+"""NumPy title-similarity backend (``clawler --dedupe-backend vector``).
+
+A drop-in for :class:`~clawler.title_index.TitleIndex` that finds look-alike
+titles with matrix products instead of per-pair Python. Each distinct title
+becomes a unit vector of its character 3-grams, hashed into ``DIMENSIONS``
+columns with a random sign per 3-gram (so hash collisions cancel out on
+average instead of inflating similarity). :meth:`VectorTitleIndex.prepare`
+takes a whole batch of titles at once and multiplies it block by block
+against every title seen so far, keeping the pairs whose cosine is within
+``CANDIDATE_MARGIN`` of the threshold.
+
+Cosine over 3-grams and ``SequenceMatcher`` ratio track each other closely but
+aren't the same measure, so candidates are still confirmed with
+``SequenceMatcher`` (first kept title first, after the same length filter):
+the vector backend keeps the difflib backend's duplicates, and only a pair
+whose 3-gram cosine is ``CANDIDATE_MARGIN`` below its ratio is missed.
+
+Needs ``numpy`` (``pip install 'clawler[vector]'``).
+"""
+from __future__ import annotations
+
+from difflib import SequenceMatcher
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+DIMENSIONS = 512
+CANDIDATE_MARGIN = 0.2  # candidates: cosine above threshold - margin
+BLOCK_CELLS = 1 << 24  # similarity-matrix cells computed at once (64 MB of float32)
+
+
+def title_vectors(titles: List[str]) -> np.ndarray:
+    """Unit rows of signed, hashed character 3-gram presence, one per title."""
+    # Padded so every title has a 3-gram, and its first and last words get edge 3-grams
+    data = [b" " + " ".join(t.split()).encode() + b"  " for t in titles]
+    lengths = np.fromiter(map(len, data), dtype=np.int64, count=len(data))
+    buf = np.frombuffer(b"".join(data), dtype=np.uint8).astype(np.uint64)
+    # 3-grams as 24-bit ints, minus the ones straddling two titles
+    grams = buf[:-2] << np.uint64(16) | buf[1:-1] << np.uint64(8) | buf[2:]
+    owner = np.repeat(np.arange(len(data), dtype=np.uint64), lengths)
+    offset = np.arange(len(buf)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    inside = (offset <= np.repeat(lengths, lengths) - 3)[:-2]
+    owner = owner[:-2]
+    keys = np.unique(owner[inside] << np.uint64(24) | grams[inside])  # presence, not counts
+    hashed = (keys & np.uint64(0xFFFFFF)) * np.uint64(0x9E3779B1) & np.uint64(0xFFFFFFFF)
+    cols = (hashed >> np.uint64(16)) % np.uint64(DIMENSIONS)
+    signs = np.where(hashed & np.uint64(0x8000), 1.0, -1.0)
+    flat = (keys >> np.uint64(24)) * np.uint64(DIMENSIONS) + cols
+    vectors = np.bincount(flat.astype(np.int64), weights=signs, minlength=len(titles) * DIMENSIONS)
+    vectors = vectors.reshape(len(titles), DIMENSIONS).astype(np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class VectorTitleIndex:
+    """Same interface and answers as ``TitleIndex``; candidates from cosine similarity."""
+
+    def __init__(self, threshold: float = 0.75):
+        self.threshold = threshold
+        self.comparisons = 0  # SequenceMatcher runs
+        self._titles: List[str] = []  # by slot
+        self._rows: Dict[str, int] = {}  # distinct title -> vector row
+        self._vectors = np.zeros((0, DIMENSIONS), dtype=np.float32)  # grown by doubling
+        self._near: List[List[int]] = []  # row -> rows with cosine above the candidate bound
+        self._holders: Dict[int, List[int]] = {}  # row -> slots currently keeping that title
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def __getitem__(self, slot: int) -> str:
+        return self._titles[slot]
+
+    def prepare(self, titles: Iterable[str]):
+        """Index a batch of titles that are about to be looked up, in bulk."""
+        new = list(dict.fromkeys(t for t in titles if t not in self._rows))
+        if not new:
+            return
+        start = len(self._rows)
+        end = start + len(new)
+        if end > len(self._vectors):
+            grown = np.zeros((max(end, 2 * len(self._vectors)), DIMENSIONS), dtype=np.float32)
+            grown[:start] = self._vectors[:start]
+            self._vectors = grown
+        self._vectors[start:end] = title_vectors(new)
+        for row, title in enumerate(new, start):
+            self._rows[title] = row
+            self._near.append([])
+
+        bound = self.threshold - CANDIDATE_MARGIN
+        block = max(1, BLOCK_CELLS // end)
+        for lo in range(start, end, block):
+            hi = min(lo + block, end)
+            # Each pair once: new rows against every row before them
+            rows, others = np.nonzero(self._vectors[lo:hi] @ self._vectors[:hi].T > bound)
+            rows += lo
+            before = others < rows
+            for row, other in zip(rows[before].tolist(), others[before].tolist()):
+                self._near[row].append(other)
+                self._near[other].append(row)
+
+    def find(self, title: str, admit: Optional[Callable[[int], bool]] = None) -> Optional[int]:
+        """The first slot whose title's ratio with ``title`` is above the threshold."""
+        if title not in self._rows:
+            self.prepare((title,))
+        row = self._rows[title]
+        slots = list(self._holders.get(row, ()))
+        for other in self._near[row]:
+            slots.extend(self._holders.get(other, ()))
+        threshold = self.threshold
+        title_len = len(title)
+        for slot in sorted(slots):
+            prev = self._titles[slot]
+            prev_len = len(prev)
+            if abs(title_len - prev_len) > max(title_len, prev_len) * (1 - threshold):
+                continue
+            if admit is not None and not admit(slot):
+                continue
+            self.comparisons += 1
+            if SequenceMatcher(None, title, prev).ratio() > threshold:
+                return slot
+        return None
+
+    def add(self, title: str) -> int:
+        """Keep ``title``; returns its slot."""
+        if title not in self._rows:
+            self.prepare((title,))
+        slot = len(self._titles)
+        self._titles.append(title)
+        self._holders.setdefault(self._rows[title], []).append(slot)
+        return slot
+
+    def replace(self, slot: int, title: str):
+        """Swap the title kept at ``slot`` (a better article won the duplicate)."""
+        if title not in self._rows:
+            self.prepare((title,))
+        self._holders[self._rows[self._titles[slot]]].remove(slot)
+        self._titles[slot] = title
+        self._holders.setdefault(self._rows[title], []).append(slot)
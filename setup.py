@@ -14,6 +14,11 @@ setup(
         "rich>=13.0.0",
         "pyyaml>=6.0.0",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.9.0"],
+        "http2": ["httpx[http2]>=0.24.0"],
+        "vector": ["numpy>=1.22"],
+    },
     entry_points={
         "console_scripts": [
             "clawler=clawler.cli:main",
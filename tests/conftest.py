@@ -1,5 +1,8 @@
 """Shared test fixtures and configuration."""
 import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 
 
@@ -17,3 +20,67 @@ requires_network = pytest.mark.skipif(
     not _has_network(),
     reason="No network access available",
 )
+
+
+@pytest.fixture(autouse=True)
+def _isolated_http_cache(tmp_path, monkeypatch):
+    """Keep conditional-GET state out of ~/.cache and separate per test."""
+    from clawler import http_cache
+    monkeypatch.setattr(http_cache, "_http_cache", http_cache.HttpCache(tmp_path / "http"))
+    monkeypatch.setattr(http_cache, "_http_cache_enabled", True)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_rate_limiter(monkeypatch):
+    """Start each test with empty host buckets (no pauses left over from other tests)."""
+    from clawler.sources import rate_limit
+    monkeypatch.setattr(rate_limit, "_rate_limiter", rate_limit.HostRateLimiter())
+
+
+@pytest.fixture(autouse=True)
+def _isolated_health(tmp_path, monkeypatch):
+    """Keep health data and circuit breaker state out of ~/.clawler (open circuits would leak between tests)."""
+    from clawler import health
+    monkeypatch.setattr(health, "HEALTH_PATH", str(tmp_path / "health" / "health.json"))
+
+
+class _LocalHandler(BaseHTTPRequestHandler):
+    """Answers every GET with ``server.respond(handler)`` -> ``(status, body, headers)``."""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        status, body, headers = self.server.respond(self)
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Start throwaway HTTP servers: ``local_server(respond, host="127.0.0.1")``.
+
+    ``respond`` gets the request handler (``.path``, ``.headers``,
+    ``.client_address``) and returns ``(status, body bytes, extra headers)``.
+    The server's base URL is ``server.url``; every server started is shut
+    down after the test.
+    """
+    servers = []
+
+    def start(respond, host="127.0.0.1"):
+        srv = ThreadingHTTPServer((host, 0), _LocalHandler)
+        srv.respond = respond
+        srv.url = f"http://{host}:{srv.server_address[1]}"
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        servers.append(srv)
+        return srv
+
+    yield start
+    for srv in servers:
+        srv.shutdown()
+        srv.server_close()
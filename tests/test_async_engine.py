@@ -0,0 +1,237 @@
+"""Tests for AsyncCrawlEngine and the async fetch path."""
+import asyncio
+import json
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from clawler.engine import AsyncCrawlEngine
+from clawler.models import Article
+from clawler.sources.base import BaseSource, close_async_session, open_async_session
+from clawler.sources.hackernews import HackerNewsSource
+
+
+def _article(title, source="Stub"):
+    return Article(title=title, url=f"https://example.com/{title.replace(' ', '-')}", source=source,
+                   timestamp=datetime.now(tz=timezone.utc))
+
+
+class StubSource(BaseSource):
+    name = "stub"
+
+    def __init__(self, titles, delay=0.0):
+        self.titles = titles
+        self.delay = delay
+
+    def crawl(self):
+        time.sleep(self.delay)
+        return [_article(t, self.name) for t in self.titles]
+
+
+class NativeAsyncSource(BaseSource):
+    name = "native"
+
+    def crawl(self):
+        raise AssertionError("blocking crawl should not be used by the async engine")
+
+    async def acrawl(self):
+        await asyncio.sleep(0.01)
+        return [_article("Native async story", self.name)]
+
+
+class FlakySource(BaseSource):
+    name = "flaky"
+
+    def __init__(self):
+        self.calls = 0
+
+    def crawl(self):
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError("transient")
+        return [_article("Recovered story", self.name)]
+
+
+@pytest.fixture(autouse=True)
+def _no_health_writes(tmp_path):
+    with patch("clawler.health.HEALTH_PATH", str(tmp_path / "health.json")):
+        yield
+
+
+class TestAsyncCrawlEngine:
+    def test_thread_sources_run_through_adapter(self):
+        engine = AsyncCrawlEngine(sources=[StubSource(["Alpha story", "Beta story"])], retries=0)
+        articles, stats, dedup_stats = engine.crawl()
+        assert stats == {"stub": 2}
+        assert {a.title for a in articles} == {"Alpha story", "Beta story"}
+        assert dedup_stats.total_input == 2
+
+    def test_native_acrawl_used(self):
+        engine = AsyncCrawlEngine(sources=[NativeAsyncSource()], retries=0)
+        articles, stats, _ = engine.crawl()
+        assert stats == {"native": 1}
+        assert articles[0].title == "Native async story"
+
+    def test_duck_typed_source(self):
+        src = MagicMock()
+        src.name = "mock"
+        src.crawl.return_value = [_article("Mock story", "mock")]
+        articles, stats, _ = AsyncCrawlEngine(sources=[src], retries=0).crawl()
+        assert stats == {"mock": 1}
+        src.crawl.assert_called_once()
+
+    def test_sources_overlap(self):
+        sources = []
+        for i in range(4):
+            s = StubSource([f"Story number {i}"], delay=0.2)
+            s.name = f"s{i}"
+            sources.append(s)
+        t0 = time.monotonic()
+        _, stats, _ = AsyncCrawlEngine(sources=sources, max_workers=4, retries=0).crawl()
+        assert time.monotonic() - t0 < 0.6
+        assert all(v == 1 for v in stats.values())
+
+    def test_timeout_marks_failure(self):
+        slow = StubSource(["Slow story"], delay=2.0)
+        slow.name = "slow"
+        fast = StubSource(["Fast story"])
+        engine = AsyncCrawlEngine(sources=[slow, fast], retries=0, source_timeout=0.3)
+        articles, stats, _ = engine.crawl()
+        assert stats["slow"] == -1
+        assert stats["stub"] == 1
+        assert [a.title for a in articles] == ["Fast story"]
+
+    def test_timeout_counts_from_start_not_queueing(self):
+        sources = []
+        for i in range(4):
+            s = StubSource([f"Queued story {i}"], delay=0.4)
+            s.name = f"q{i}"
+            sources.append(s)
+        engine = AsyncCrawlEngine(sources=sources, max_workers=2, retries=0, source_timeout=0.5)
+        _, stats, _ = engine.crawl()
+        assert stats == {"q0": 1, "q1": 1, "q2": 1, "q3": 1}
+
+    def test_retry_recovers(self):
+        src = FlakySource()
+        with patch("clawler.engine.asyncio.sleep", new=_instant_sleep):
+            articles, stats, _ = AsyncCrawlEngine(sources=[src], retries=1).crawl()
+        assert stats == {"flaky": 1}
+        assert src.calls == 2
+
+    def test_retries_exhausted(self):
+        src = MagicMock()
+        src.name = "broken"
+        src.crawl.side_effect = RuntimeError("down")
+        with patch("clawler.engine.asyncio.sleep", new=_instant_sleep):
+            _, stats, _ = AsyncCrawlEngine(sources=[src], retries=2).crawl()
+        assert stats == {"broken": -1}
+        assert src.crawl.call_count == 3
+
+
+async def _instant_sleep(_seconds):
+    return None
+
+
+class TestAsyncFetch:
+    def test_falls_back_to_blocking_fetch_without_session(self):
+        src = StubSource([])
+        with patch.object(StubSource, "_fetch_with_retry", return_value={"ok": True}) as m:
+            result = asyncio.run(src.afetch_json("https://example.com/x.json"))
+        assert result == {"ok": True}
+        m.assert_called_once_with("https://example.com/x.json", parse_json=True)
+
+    def test_aiohttp_session_fetch(self, local_server):
+        pytest.importorskip("aiohttp")
+
+        def respond(request):
+            if request.path == "/missing":
+                return 404, b"", {}
+            body = json.dumps({"path": request.path, "pad": "x" * (1000 if request.path == "/big" else 0)})
+            return 200, body.encode(), {"Content-Type": "application/json"}
+
+        base = local_server(respond).url
+        src = StubSource([])
+        src.max_retries = 0
+        src.max_response_bytes = 500
+
+        async def run():
+            open_async_session(max_connections=10)
+            try:
+                with patch.object(StubSource, "_fetch_with_retry", side_effect=AssertionError("used thread path")):
+                    ok = await src.afetch_json(f"{base}/item")
+                    text = await src.afetch_url(f"{base}/page")
+                    missing = await src.afetch_json(f"{base}/missing")
+                    big = await src.afetch_json(f"{base}/big")
+            finally:
+                await close_async_session()
+            return ok, text, missing, big
+
+        ok, text, missing, big = asyncio.run(run())
+        assert ok == {"path": "/item", "pad": ""}
+        assert json.loads(text) == {"path": "/page", "pad": ""}
+        assert missing is None
+        assert big is None  # over max_response_bytes
+
+    def test_aiohttp_304_without_stored_body_refetches(self, local_server):
+        pytest.importorskip("aiohttp")
+        from clawler.http_cache import HttpCache
+        seen = []
+
+        def respond(request):
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match"):
+                return 304, b"", {}
+            return 200, b"feed body", {"ETag": '"v1"'}
+
+        url = f"{local_server(respond).url}/feed"
+        src = StubSource([])
+        src.max_retries = 0
+
+        async def run():
+            open_async_session(max_connections=10)
+            try:
+                first = await src.afetch_url(url)
+                with patch.object(HttpCache, "load", return_value=None):
+                    second = await src.afetch_url(url)
+            finally:
+                await close_async_session()
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == second == "feed body"
+        assert seen == [None, '"v1"', None]
+
+
+class TestHackerNewsAcrawl:
+    def test_acrawl_fetches_items_concurrently(self):
+        items = {
+            i: {"type": "story", "title": f"Story {i}", "url": f"https://e.com/{i}", "score": 100,
+                "by": "someone", "descendants": 3, "time": 1700000000}
+            for i in range(1, 6)
+        }
+        in_flight = {"now": 0, "peak": 0}
+
+        async def fake_afetch_json(url, **kw):
+            if url.endswith("topstories.json"):
+                return list(items)
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.02)
+            in_flight["now"] -= 1
+            return items[int(url.rsplit("/", 1)[1].split(".")[0])]
+
+        src = HackerNewsSource(limit=5)
+        src.afetch_json = fake_afetch_json
+        articles = asyncio.run(src.acrawl())
+        assert len(articles) == 5
+        assert in_flight["peak"] == 5
+
+    def test_acrawl_feed_failure(self):
+        async def failing(url, **kw):
+            raise RuntimeError("down")
+
+        src = HackerNewsSource()
+        src.afetch_json = failing
+        assert asyncio.run(src.acrawl()) == []
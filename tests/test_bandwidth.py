@@ -0,0 +1,130 @@
+"""Tests for per-source byte and timing accounting."""
+import gzip
+
+import pytest
+
+from clawler.engine import CrawlEngine
+from clawler.health import HealthTracker
+from clawler.models import Article
+from clawler.sources.bandwidth import TrafficMeter, Transfer, UrlTraffic, format_bytes
+from clawler.sources.base import BaseSource
+
+BODY = b"<rss><channel>" + b"<item><title>Repeated story</title></item>" * 200 + b"</channel></rss>"
+GZIPPED = gzip.compress(BODY)
+
+
+def _respond(request):
+    if request.path == "/gz":
+        return 200, GZIPPED, {"Content-Encoding": "gzip"}
+    if request.path == "/plain":
+        return 200, BODY, {}
+    if request.path == "/data.json":
+        return 200, b'{"ok": true}', {"Content-Type": "application/json"}
+    return 404, b"", {}
+
+
+@pytest.fixture
+def server(local_server):
+    return local_server(_respond).url
+
+
+class _Source(BaseSource):
+    name = "metered"
+    max_retries = 1
+    retry_backoff = 0
+
+    def crawl(self):
+        return []
+
+
+def test_wire_vs_decoded_bytes(server):
+    src = _Source()
+    src.track_traffic()
+    assert src.fetch_url(f"{server}/gz") == BODY.decode()
+    assert src.fetch_url(f"{server}/plain") == BODY.decode()
+    gz, plain = src.traffic.urls[f"{server}/gz"], src.traffic.urls[f"{server}/plain"]
+    assert gz.decoded_bytes == plain.decoded_bytes == len(BODY)
+    assert len(GZIPPED) < gz.wire_bytes < len(GZIPPED) + 500  # body as sent, plus headers
+    assert plain.wire_bytes > len(BODY)
+    assert gz.compression_ratio > 5
+    assert gz.statuses == {"200": 1}
+    assert 0 < gz.ttfb_ms <= gz.total_ms
+
+
+def test_every_attempt_counted(server):
+    src = _Source()
+    src.track_traffic()
+    assert src.fetch_url(f"{server}/missing") == ""
+    assert src.fetch_json(f"{server}/data.json") == {"ok": True}
+    missing = src.traffic.urls[f"{server}/missing"]
+    assert missing.requests == 2 and missing.statuses == {"404": 2}
+    assert missing.decoded_bytes == 0
+    assert src.traffic.urls[f"{server}/data.json"].decoded_bytes == len(b'{"ok": true}')
+    assert src.traffic.total.requests == 3
+
+
+def test_unreachable_host_counted_without_status():
+    src = _Source()
+    src.track_traffic()
+    assert src.fetch_url("http://127.0.0.1:9/feed") == ""
+    traffic = src.traffic.urls["http://127.0.0.1:9/feed"]
+    assert traffic.statuses == {"0": 2} and traffic.wire_bytes == 0
+    assert traffic.total_ms > 0
+
+
+def test_not_tracked_by_default(server):
+    src = _Source()
+    src.fetch_url(f"{server}/plain")
+    assert src.traffic is None
+
+
+def test_url_traffic_round_trip():
+    t = UrlTraffic()
+    t.add(Transfer("u", status=200, wire_bytes=100, decoded_bytes=400, ttfb_ms=20, total_ms=50))
+    t.add(Transfer("u", status=304, wire_bytes=60, ttfb_ms=10, total_ms=10))
+    loaded = UrlTraffic.from_dict(t.to_dict())
+    assert loaded == t
+    assert loaded.compression_ratio == 2.5 and loaded.avg_ttfb_ms == 15.0
+
+
+def test_health_keeps_totals_and_costliest_urls():
+    meter = TrafficMeter()
+    meter.add(Transfer("https://a/big", status=200, wire_bytes=9000, decoded_bytes=30000, ttfb_ms=40))
+    meter.add(Transfer("https://a/small", status=200, wire_bytes=1000, decoded_bytes=1000, ttfb_ms=20))
+    tracker = HealthTracker()
+    tracker.record_success("Src", 4, response_ms=100, traffic=meter)
+    tracker.record_failure("Src", traffic=meter)
+    tracker.save()
+
+    tracker = HealthTracker()
+    traffic = tracker.data["Src"]["traffic"]
+    assert traffic["wire_bytes"] == 20000 and traffic["requests"] == 4 and traffic["articles"] == 4
+    assert [url for url, _ in tracker.top_urls("Src")] == ["https://a/big", "https://a/small"]
+    entry = tracker.get_timing_report()[0]
+    assert entry["bytes_per_article"] == 5000
+    assert entry["avg_ttfb_ms"] == 30.0
+    assert tracker.get_traffic_report()[0]["source"] == "Src"
+
+
+class _Feed(BaseSource):
+    name = "Feed"
+    url = ""
+
+    def crawl(self):
+        text = self.fetch_url(self.url)
+        return [Article(title="Repeated story", url="https://example.com/1", source=self.name)] if text else []
+
+
+def test_engine_records_traffic(server):
+    src = _Feed()
+    src.url = f"{server}/gz"
+    engine = CrawlEngine(sources=[src], max_workers=1)
+    engine.crawl()
+    assert src.traffic.total.requests == 1
+    assert engine.health.data["Feed"]["traffic"]["decoded_bytes"] == len(BODY)
+
+
+def test_format_bytes():
+    assert format_bytes(512) == "512 B"
+    assert format_bytes(2048) == "2.0 KB"
+    assert format_bytes(3 * 1024 * 1024) == "3.0 MB"
@@ -0,0 +1,199 @@
+"""Tests for circuit breakers on sources, feed URLs and hosts."""
+import time
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from clawler.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, host_key, source_key, url_key
+from clawler.engine import CrawlEngine
+from clawler.health import HealthTracker
+from clawler.models import Article
+from clawler.sources.base import BaseSource
+
+URL = "https://dead.example.com/feed.xml"
+
+
+class _Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self):
+        clock = _Clock()
+        with patch("clawler.circuit.time.time", clock):
+            breaker = CircuitBreaker(threshold=3, base_cooldown=60)
+            for _ in range(2):
+                breaker.record_failure("k")
+            assert breaker.admit("k") == CLOSED
+            breaker.record_failure("k")
+            assert breaker.admit("k") == OPEN
+            assert breaker.circuits["k"].skipped == 1
+
+    def test_success_resets_count(self):
+        breaker = CircuitBreaker(threshold=2)
+        breaker.record_failure("k")
+        breaker.record_success("k")
+        breaker.record_failure("k")
+        assert breaker.admit("k") == CLOSED
+
+    def test_half_open_probe_and_backoff(self):
+        clock = _Clock()
+        with patch("clawler.circuit.time.time", clock):
+            breaker = CircuitBreaker(threshold=1, base_cooldown=60, max_cooldown=200)
+            breaker.record_failure("k")
+            clock.now += 61
+            assert breaker.admit("k") == HALF_OPEN
+            assert breaker.admit("k") == OPEN  # only one probe at a time
+            breaker.record_failure("k")
+            assert breaker.circuits["k"].cooldown == 120
+            clock.now += 100
+            assert breaker.admit("k") == OPEN
+            clock.now += 21
+            assert breaker.admit("k") == HALF_OPEN
+            breaker.record_failure("k")
+            assert breaker.circuits["k"].cooldown == 200  # capped
+            clock.now += 201
+            assert breaker.admit("k") == HALF_OPEN
+            breaker.record_success("k")
+            assert breaker.admit("k") == CLOSED and "k" not in breaker.circuits
+
+    def test_disabled(self):
+        breaker = CircuitBreaker(threshold=0)
+        for _ in range(10):
+            breaker.record_failure("k")
+        assert breaker.admit("k") == CLOSED and not breaker.circuits
+
+    def test_round_trip(self):
+        breaker = CircuitBreaker(threshold=1)
+        breaker.record_failure("k")
+        loaded = CircuitBreaker.from_dict({**breaker.to_dict(), "bad": {"nope": 1}})
+        assert loaded.admit("k") == OPEN
+        assert "bad" not in loaded.circuits
+
+    def test_persisted_with_health(self):
+        tracker = HealthTracker()
+        tracker.breaker.threshold = 1
+        tracker.breaker.record_failure(source_key("Dead"))
+        tracker.save()
+        assert HealthTracker().breaker.admit(source_key("Dead")) == OPEN
+
+
+class _Fetcher(BaseSource):
+    name = "fetcher"
+    max_retries = 2
+    retry_backoff = 0
+
+    def crawl(self):
+        return []
+
+
+def _session(error):
+    session = MagicMock()
+    session.get.side_effect = error
+    return session
+
+
+class TestFetchCircuits:
+    def test_dead_url_skipped_without_request(self):
+        src = _Fetcher()
+        src.set_breaker(CircuitBreaker(threshold=2))
+        session = _session(requests.HTTPError("404"))
+        with patch("clawler.sources.base._get_session", return_value=session):
+            for _ in range(4):
+                assert src.fetch_url(URL) == ""
+        assert session.get.call_count == 2 * 3  # two failed fetches with retries, then skipped
+        assert src._breaker.admit(url_key(URL)) == OPEN
+        assert src._breaker.admit(host_key(URL)) == CLOSED  # the host answered
+
+    def test_unreachable_host_blocks_other_urls(self):
+        src = _Fetcher()
+        src.set_breaker(CircuitBreaker(threshold=2))
+        session = _session(requests.ConnectionError("refused"))
+        with patch("clawler.sources.base._get_session", return_value=session):
+            src.fetch_url("https://dead.example.com/a")
+            src.fetch_url("https://dead.example.com/b")
+            calls = session.get.call_count
+            assert src.fetch_url("https://dead.example.com/c") == ""
+        assert session.get.call_count == calls
+
+    def test_budget_clamped_timeout_not_counted(self):
+        src = _Fetcher()
+        src.max_retries = 0
+        src.set_breaker(CircuitBreaker(threshold=1))
+        session = _session(requests.ReadTimeout("timed out"))
+        with patch("clawler.sources.base._get_session", return_value=session):
+            src.set_deadline(time.monotonic() + 1.0)  # shorter than src.timeout
+            src.fetch_url(URL)
+            src.set_deadline(None)
+            assert src._breaker.admit(host_key(URL)) == CLOSED
+            assert src._breaker.admit(url_key(URL)) == CLOSED
+            src.fetch_url(URL)  # full timeout: the host really didn't answer
+        assert src._breaker.admit(host_key(URL)) == OPEN
+
+    def test_probe_gets_one_attempt(self):
+        clock = _Clock()
+        with patch("clawler.circuit.time.time", clock):
+            breaker = CircuitBreaker(threshold=1, base_cooldown=60)
+            breaker.record_failure(url_key(URL))
+            clock.now += 61
+            src = _Fetcher()
+            src.set_breaker(breaker)
+            session = _session(requests.HTTPError("500"))
+            with patch("clawler.sources.base._get_session", return_value=session):
+                src.fetch_url(URL)
+            assert session.get.call_count == 1
+            assert breaker.circuits[url_key(URL)].cooldown == 120
+
+    def test_no_breaker_without_engine(self):
+        session = _session(requests.HTTPError("404"))
+        with patch("clawler.sources.base._get_session", return_value=session):
+            for _ in range(5):
+                _Fetcher().fetch_url(URL)
+        assert session.get.call_count == 15
+
+
+class _Dead(BaseSource):
+    name = "Dead"
+    calls = 0
+
+    def crawl(self):
+        type(self).calls += 1
+        raise RuntimeError("down")
+
+
+class _Alive(BaseSource):
+    name = "Alive"
+
+    def crawl(self):
+        return [Article(title="Up", url="https://example.com/up", source=self.name)]
+
+
+class TestEngineCircuits:
+    def test_source_skipped_after_consecutive_failures(self):
+        _Dead.calls = 0
+        for _ in range(2):
+            engine = CrawlEngine(sources=[_Dead(), _Alive()], retries=0, breaker_threshold=2)
+            engine.crawl()
+        assert _Dead.calls == 2
+        engine = CrawlEngine(sources=[_Dead(), _Alive()], retries=0, breaker_threshold=2)
+        articles, stats, _ = engine.crawl()
+        assert _Dead.calls == 2
+        assert engine.circuit_skipped == ["Dead"]
+        assert "Dead" not in stats and stats["Alive"] == 1
+
+    def test_probe_not_retried(self):
+        _Dead.calls = 0
+        engine = CrawlEngine(sources=[_Dead()], retries=2, breaker_threshold=1)
+        with patch.object(CrawlEngine, "_retry_delay", return_value=0):
+            engine.crawl()
+            assert _Dead.calls == 3
+            first_cooldown = engine.health.breaker.circuits[source_key("Dead")].cooldown
+            engine = CrawlEngine(sources=[_Dead()], retries=2, breaker_threshold=1)
+            engine.health.breaker.circuits[source_key("Dead")].open_until = 1  # cooldown over
+            engine.crawl()
+        assert _Dead.calls == 4
+        assert engine.health.breaker.circuits[source_key("Dead")].cooldown == 2 * first_cooldown
@@ -0,0 +1,119 @@
+"""Tests for in-crawl request coalescing (single-flight fetches)."""
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+from clawler.engine import CrawlEngine
+from clawler.models import Article
+from clawler.sources.base import BaseSource, FetchCoalescer, normalize_fetch_url
+
+FEED = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Example</title>
+<item><title>Only story</title><link>https://example.com/1</link></item>
+</channel></rss>"""
+
+
+class FeedSource(BaseSource):
+    def __init__(self, name, url):
+        super().__init__()
+        self.name = name
+        self.url = url
+
+    def crawl(self):
+        feed = self.parse_feed(self.fetch_url(self.url))
+        return [Article(title=e.title, url=e.link, source=self.name) for e in feed.entries]
+
+
+def test_normalize_fetch_url():
+    assert normalize_fetch_url("HTTPS://Example.COM:443/Feed?x=1#top") == "https://example.com/Feed?x=1"
+    assert normalize_fetch_url("http://example.com") == "http://example.com/"
+    assert normalize_fetch_url("http://example.com:8080/a") == "http://example.com:8080/a"
+
+
+def test_concurrent_callers_share_one_call():
+    coalescer = FetchCoalescer()
+    calls = []
+    gate = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        gate.wait(2)
+        return "body"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(coalescer.run("k", fetch))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    time.sleep(0.1)
+    gate.set()
+    for t in threads:
+        t.join()
+    assert results == ["body"] * 5
+    assert len(calls) == 1
+    assert (coalescer.requests, coalescer.saved) == (5, 4)
+
+
+def test_failures_are_not_shared():
+    coalescer = FetchCoalescer()
+    assert coalescer.run("k", lambda: "") == ""
+    assert coalescer.run("k", lambda: "second try") == "second try"
+    assert coalescer.saved == 0
+
+
+def test_json_results_are_copied():
+    coalescer = FetchCoalescer()
+    first = coalescer.run("k", lambda: {"items": [1]})
+    second = coalescer.run("k", lambda: {"items": [2]})
+    assert second == {"items": [1]} and second is not first
+
+
+def test_oldest_results_evicted_past_byte_cap():
+    coalescer = FetchCoalescer(max_bytes=10)
+    coalescer.run("a", lambda: "x" * 6)
+    coalescer.run("b", lambda: "y" * 6)
+    assert coalescer.run("b", lambda: "fresh") == "y" * 6
+    assert coalescer.run("a", lambda: "fresh") == "fresh"
+
+
+def test_same_url_fetched_once_per_crawl():
+    sources = [FeedSource("Ars (rss)", "https://feeds.arstechnica.com/arstechnica/index"),
+               FeedSource("Ars", "https://FEEDS.arstechnica.com/arstechnica/index#latest")]
+    with patch.object(BaseSource, "_fetch_with_retry", return_value=FEED) as fetch, \
+            patch("clawler.sources.parse_pool.ParsePool.run", side_effect=lambda fn, raw: fn(raw)) as parse:
+        engine = CrawlEngine(sources=sources, max_workers=2)
+        articles, stats, _ = engine.crawl(dedupe_enabled=False)
+    assert fetch.call_count == 1
+    assert parse.call_count == 1
+    assert stats == {"Ars (rss)": 1, "Ars": 1}
+    assert engine.coalescer.saved == 1
+    assert engine.coalescer.parses_saved == 1
+    assert all(src._coalescer is None for src in sources)
+
+
+def test_no_coalescing_outside_a_crawl():
+    src = FeedSource("solo", "https://example.com/feed")
+    with patch.object(BaseSource, "_fetch_with_retry", return_value=FEED) as fetch:
+        src.fetch_url(src.url)
+        src.fetch_url(src.url)
+    assert fetch.call_count == 2
+
+
+def test_async_callers_share_one_fetch():
+    coalescer = FetchCoalescer()
+    src = FeedSource("a", "https://example.com/feed")
+    src.set_coalescer(coalescer)
+
+    async def slow_fetch(url, parse_json=False, **kwargs):
+        await asyncio.sleep(0.1)
+        return FEED
+
+    async def run():
+        with patch.object(BaseSource, "_async_fetch_with_retry", side_effect=slow_fetch) as fetch:
+            results = await asyncio.gather(*(src.afetch_url(src.url) for _ in range(3)))
+        return results, fetch.call_count
+
+    results, calls = asyncio.run(run())
+    assert results == [FEED] * 3
+    assert calls == 1
+    assert coalescer.saved == 2
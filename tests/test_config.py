@@ -65,3 +65,15 @@ class TestApplyDefaults:
             result = apply_config_defaults(parser, args)
             assert result.format == "json"  # Explicitly set, not overridden
             assert result.limit == 25  # Was default, so config applies
+
+
+class TestRateLimits:
+    def test_load_rate_limits(self):
+        from clawler.config import load_rate_limits
+        limits = load_rate_limits({"rate_limits": {"hnrss.org": {"rate": 5, "burst": 10}, "default": 1}})
+        assert limits == {"hnrss.org": {"rate": 5, "burst": 10}, "default": 1}
+
+    def test_missing_or_invalid_rate_limits(self):
+        from clawler.config import load_rate_limits
+        assert load_rate_limits({}) == {}
+        assert load_rate_limits({"rate_limits": [1, 2]}) == {}
@@ -0,0 +1,199 @@
+"""Tests for streaming crawl (crawl_iter / crawl_stream) and incremental dedup."""
+import io
+import json
+import time
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from clawler.dedup import DedupStats, Deduplicator
+from clawler.engine import CrawlEngine
+from clawler.formatters.csv_out import CSVFormatter
+from clawler.formatters.jsonl_out import JSONLFormatter
+from clawler.models import Article
+from clawler.sources.base import BaseSource
+
+
+def _article(title, source="Stub", url=None, category="tech"):
+    return Article(title=title, url=url or f"https://example.com/{title.replace(' ', '-')}",
+                   source=source, timestamp=datetime.now(tz=timezone.utc), category=category)
+
+
+class DelayedSource(BaseSource):
+    def __init__(self, name, titles, delay=0.0, fail=False):
+        self.name = name
+        self.titles = titles
+        self.delay = delay
+        self.fail = fail
+
+    def crawl(self):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("down")
+        return [_article(t, self.name) for t in self.titles]
+
+
+@pytest.fixture(autouse=True)
+def _no_health_writes(tmp_path):
+    with patch("clawler.health.HEALTH_PATH", str(tmp_path / "health.json")):
+        yield
+
+
+class TestDeduplicator:
+    def test_tiers(self):
+        stats = DedupStats()
+        dd = Deduplicator(stats=stats)
+        first = _article("OpenAI releases a new model today")
+        assert dd.add(first)
+        assert not dd.add(_article("OpenAI releases a new model today"))  # exact
+        assert not dd.add(_article("Today OpenAI releases new model", url="https://other.com/a"))  # fingerprint
+        assert not dd.add(_article("OpenAI releases a new model today!", url="https://x.com/b"))  # fuzzy
+        assert dd.add(_article("Completely unrelated headline here"))
+        assert (stats.exact_dupes, stats.fingerprint_dupes, stats.fuzzy_dupes) == (1, 1, 1)
+        assert stats.total_input == 5 and stats.unique_output == 2
+        assert first.source_count == 3
+
+    def test_first_version_wins(self):
+        dd = Deduplicator()
+        low = _article("Rust 2.0 announced by the core team")
+        low.quality_score = 0.2
+        high = _article("Rust 2.0 announced by the core team", url="https://blog.rust-lang.org/x")
+        high.quality_score = 0.9
+        assert list(dd.filter([low, high])) == [low]
+
+    def test_disabled(self):
+        dd = Deduplicator(enabled=False)
+        a = _article("Same")
+        assert dd.add(a) and dd.add(a)
+        assert dd.stats.unique_output == 2
+
+
+class TestCrawlIter:
+    def test_yields_before_slow_source_finishes(self):
+        fast = DelayedSource("fast", ["Fast story"])
+        slow = DelayedSource("slow", ["Slow story"], delay=0.5)
+        engine = CrawlEngine(sources=[slow, fast], max_workers=2, retries=0)
+        t0 = time.monotonic()
+        it = engine.crawl_iter()
+        first = next(it)
+        assert first.title == "Fast story"
+        assert time.monotonic() - t0 < 0.4
+        assert [a.title for a in it] == ["Slow story"]
+
+    def test_dedups_across_sources(self):
+        a = DelayedSource("a", ["Shared headline about the economy", "Volcano erupts in Iceland"])
+        b = DelayedSource("b", ["Shared headline about the economy", "New Python release"], delay=0.1)
+        stats, dstats = {}, DedupStats()
+        engine = CrawlEngine(sources=[a, b], max_workers=2, retries=0)
+        titles = [x.title for x in engine.crawl_iter(stats=stats, dedup_stats=dstats)]
+        assert sorted(titles) == ["New Python release", "Shared headline about the economy",
+                                  "Volcano erupts in Iceland"]
+        assert stats == {"a": 2, "b": 2}
+        assert dstats.total_removed == 1
+
+    def test_failed_and_timed_out_sources_recorded(self):
+        ok = DelayedSource("ok", ["Fine story"])
+        bad = DelayedSource("bad", ["x"], fail=True)
+        hung = DelayedSource("hung", ["y"], delay=2.0)
+        stats = {}
+        engine = CrawlEngine(sources=[ok, bad, hung], max_workers=3, retries=0, source_timeout=0.3)
+        titles = [a.title for a in engine.crawl_iter(stats=stats)]
+        assert titles == ["Fine story"]
+        assert stats == {"ok": 1, "bad": -1, "hung": -1}
+
+    def test_retry_yields_recovered_articles(self):
+        src = DelayedSource("flaky", ["Recovered"], fail=True)
+        original = src.crawl
+
+        def crawl():
+            if src.fail:
+                src.fail = False
+                raise RuntimeError("transient")
+            return original()
+
+        src.crawl = crawl
+        stats = {}
+        with patch("clawler.engine.time.sleep"):
+            titles = [a.title for a in CrawlEngine(sources=[src], retries=1).crawl_iter(stats=stats)]
+        assert titles == ["Recovered"]
+        assert stats == {"flaky": 1}
+
+    def test_early_close_does_not_wait(self):
+        fast = DelayedSource("fast", ["Fast story"])
+        slow = DelayedSource("slow", ["Slow story"], delay=1.0)
+        it = CrawlEngine(sources=[fast, slow], max_workers=2, retries=0).crawl_iter()
+        next(it)
+        t0 = time.monotonic()
+        it.close()
+        assert time.monotonic() - t0 < 0.5
+
+
+class TestCrawlStreamApi:
+    def test_filters_and_limit(self):
+        from clawler import api
+        sources = [DelayedSource("one", [])]
+        sources[0].crawl = lambda: [
+            _article("AI story one", "one"),
+            _article("Football results", "one", category="sports"),
+            _article("AI chips are getting faster", "one"),
+            _article("AI regulation in Europe", "one"),
+        ]
+        with patch.object(api, "build_sources", return_value=sources):
+            got = list(api.crawl_stream(category="tech", search="ai", limit=2))
+        assert len(got) == 2
+        assert all(a.category == "tech" for a in got)
+
+    def test_no_sources(self):
+        from clawler import api
+        with patch.object(api, "build_sources", return_value=[]):
+            assert list(api.crawl_stream()) == []
+
+
+class TestStreamingFormatters:
+    def test_jsonl_write_stream_matches_format(self):
+        arts = [_article("One"), _article("Two")]
+        buf = io.StringIO()
+        n = JSONLFormatter().write_stream(iter(arts), buf)
+        assert n == 2
+        assert buf.getvalue() == JSONLFormatter().format(arts) + "\n"
+        assert json.loads(buf.getvalue().splitlines()[0])["title"] == "One"
+
+    def test_records_flushed_as_they_arrive(self):
+        buf = io.StringIO()
+        seen_before_second = []
+
+        def gen():
+            yield _article("One")
+            seen_before_second.append(buf.getvalue())
+            yield _article("Two")
+
+        JSONLFormatter().write_stream(gen(), buf)
+        assert '"One"' in seen_before_second[0]
+
+    def test_csv_write_stream_matches_format(self):
+        arts = [_article("One"), _article("Two, with comma")]
+        buf = io.StringIO()
+        assert CSVFormatter().write_stream(arts, buf) == 2
+        assert buf.getvalue() == CSVFormatter().format(arts)
+
+
+class TestCliStream:
+    def test_stream_jsonl(self, capsys):
+        from clawler.cli import main
+
+        def fake_iter(self, **kw):
+            kw["stats"]["stub"] = 2
+            yield _article("Streamed one")
+            yield _article("Streamed two")
+
+        with patch.object(CrawlEngine, "crawl_iter", fake_iter), \
+                patch.object(CrawlEngine, "crawl", side_effect=AssertionError("batch crawl used")):
+            main(["--stream", "-f", "jsonl", "--only", "hn", "-n", "1", "-q"])
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert [json.loads(l)["title"] for l in lines] == ["Streamed one"]
+
+    def test_stream_rejects_other_formats(self):
+        from clawler.cli import main
+        with pytest.raises(SystemExit):
+            main(["--stream", "-f", "json", "--only", "hn", "-q"])
@@ -0,0 +1,104 @@
+"""Tests for clawler.dedup_blocks — blocked, multi-process dedup."""
+import random
+
+from clawler import dedup_blocks
+from clawler.dedup import DedupStats, deduplicate
+from clawler.dedup_blocks import blocking_keys, deduplicate_blocked
+from clawler.models import Article
+
+
+def _a(title, url, quality=0.5):
+    return Article(title=title, url=url, source="Src", quality_score=quality)
+
+
+def _batch(n=600, seed=3):
+    rng = random.Random(seed)
+    vocab = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 9)))
+             for _ in range(3000)]
+    titles = []
+    for _ in range(n):
+        if titles and rng.random() < 0.3:
+            words = rng.choice(titles).split()
+            words[rng.randrange(len(words))] = rng.choice(vocab)
+            titles.append(" ".join(words))
+        else:
+            titles.append(" ".join(rng.choice(vocab) for _ in range(rng.randint(6, 10))))
+    return [_a(t, f"https://example.com/{i}", quality=rng.random()) for i, t in enumerate(titles)]
+
+
+def _cross_chunk_batch():
+    # A and B are copies, but B's rarest shared word ("summit", also in C) is
+    # rarer than any of A's (each also appears in a filler title)
+    a = _a("falcon harbor quantum zebra meadow", "https://a.com/1", quality=0.9)
+    b = _a("falcon harbor quantum zebra meadow summit", "https://b.com/1", quality=0.2)
+    c = _a("summit canyon", "https://c.com/1")
+    fillers = [_a(f"{w} orbit{i}x", f"https://f.com/{i}")
+               for i, w in enumerate(["falcon", "harbor", "quantum", "zebra", "meadow"])]
+    return [a, b, c] + fillers
+
+
+def test_blocking_key_is_rarest_shared_word():
+    articles = _cross_chunk_batch()
+    keys = blocking_keys(articles)
+    assert keys[0] == "falcon"
+    assert keys[1] == "summit"
+    # No word shared with another title: blocked by the whole title
+    assert blocking_keys([_a("Unique headline words", "https://u.com")]) == ["unique headline words"]
+
+
+def test_close_to_single_process_dedup():
+    expected = {a.url for a in deduplicate(_batch())}
+    stats = DedupStats()
+    result = deduplicate_blocked(_batch(), stats=stats, workers=1)
+    # Greedy order differs, so a title near the threshold of two stories may land differently
+    assert len({a.url for a in result} ^ expected) <= len(expected) // 100
+    assert stats.total_input - stats.total_removed == stats.unique_output == len(result)
+
+
+def test_merge_joins_copies_from_different_chunks():
+    articles = _cross_chunk_batch()
+    blocking = dedup_blocks._Blocking([a.normalized_title for a in articles], dedup_blocks.CHUNKS_PER_WORKER)
+    assert blocking.chunk("falcon") != blocking.chunk("summit")
+
+    stats = DedupStats()
+    result = deduplicate_blocked(articles, stats=stats, workers=1)
+    assert len(result) == len(articles) - 1
+    kept = next(a for a in result if a.title.startswith("falcon"))
+    assert kept.url == "https://a.com/1"
+    assert kept.source_count == 2
+    assert stats.fuzzy_dupes == 1
+
+
+def test_merge_keeps_better_article_and_adds_source_counts():
+    articles = _cross_chunk_batch()
+    # A second copy of B, caught in B's chunk by its fingerprint
+    articles.append(_a("summit falcon harbor quantum zebra meadow", "https://d.com/1", quality=0.1))
+    result = deduplicate_blocked(articles, workers=1)
+    kept = next(a for a in result if a.title.startswith("falcon"))
+    # B's chunk gathered two sources; merging into the better A adds both
+    assert kept.url == "https://a.com/1"
+    assert kept.source_count == 3
+
+
+def test_deduplicate_uses_blocks_for_large_batches(monkeypatch):
+    calls = []
+
+    def fake(articles, similarity_threshold, stats, workers, backend):
+        calls.append(workers)
+        return list(articles)
+
+    monkeypatch.setattr(dedup_blocks, "deduplicate_blocked", fake)
+    monkeypatch.setattr(dedup_blocks, "PARALLEL_MIN_ARTICLES", 10)
+    deduplicate(_batch(5), workers=4)
+    assert calls == []
+    deduplicate(_batch(20), workers=4)
+    assert calls == [4]
+    deduplicate(_batch(20), workers=1)
+    assert calls == [4]
+
+
+def test_process_pool(monkeypatch):
+    pooled = {a.url for a in deduplicate_blocked(_batch(), workers=2)}
+    # Same chunks, deduplicated in this process
+    monkeypatch.setattr(dedup_blocks, "CHUNKS_PER_WORKER", 2 * dedup_blocks.CHUNKS_PER_WORKER)
+    assert pooled == {a.url for a in deduplicate_blocked(_batch(), workers=1)}
@@ -0,0 +1,126 @@
+"""Tests for clawler.dedup_index — dedup against stories from earlier runs."""
+import json
+
+from clawler.dedup import DedupStats
+from clawler.dedup_index import DedupIndex, clear_dedup_index, open_dedup_index, INDEX_FILE
+from clawler.engine import CrawlEngine
+from clawler.models import Article
+
+T0 = 1_700_000_000.0
+
+
+def _a(title, url, source="Src", quality=0.5):
+    return Article(title=title, url=url, source=source, quality_score=quality)
+
+
+def test_first_run_matches_plain_dedup():
+    index = DedupIndex()
+    stats = DedupStats()
+    result = index.deduplicate([
+        _a("Rust 2.0 released with new borrow checker", "https://a.com/1"),
+        _a("Rust 2.0 released with shiny new borrow checker", "https://b.com/1"),
+        _a("Python packaging gets a lockfile standard", "https://c.com/1"),
+    ], stats=stats, now=T0)
+    assert len(result) == 2
+    assert result[0].source_count == 2
+    assert stats.fuzzy_dupes == 1
+    assert stats.unique_output == 2
+
+
+def test_cross_run_copy_joins_story():
+    index = DedupIndex()
+    index.deduplicate([_a("Rust 2.0 released with new borrow checker", "https://a.com/1")], now=T0)
+    stats = DedupStats()
+    result = index.deduplicate([_a("Rust 2.0 released with a new borrow checker", "https://b.com/9")],
+                               stats=stats, now=T0 + 3600)
+    assert len(result) == 1
+    assert result[0].source_count == 2
+    assert len(index) == 1
+    # The match was against an earlier run, not within this batch
+    assert stats.fuzzy_dupes == 0
+
+
+def test_recrawl_does_not_inflate_source_count():
+    index = DedupIndex()
+    batch = [_a("Rust 2.0 released with new borrow checker", "https://a.com/1"),
+             _a("Rust 2.0 released with a new borrow checker", "https://b.com/1")]
+    for hour in range(3):
+        result = index.deduplicate([_a(a.title, a.url) for a in batch], now=T0 + hour * 3600)
+    assert len(result) == 1
+    assert result[0].source_count == 2
+
+
+def test_better_article_from_later_run_leads():
+    index = DedupIndex()
+    index.deduplicate([_a("Rust 2.0 released with new borrow checker", "https://a.com/1", quality=0.3)], now=T0)
+    better = _a("Rust 2.0 is released with new borrow checker", "https://b.com/1", quality=0.9)
+    index.deduplicate([better], now=T0 + 60)
+    story = index.stories[0]
+    assert story.key == better.dedup_key
+    assert story.quality == 0.9
+
+
+def test_story_expires_after_window():
+    index = DedupIndex(window=3600)
+    index.deduplicate([_a("Rust 2.0 released with new borrow checker", "https://a.com/1")], now=T0)
+    result = index.deduplicate([_a("Rust 2.0 released with a new borrow checker", "https://b.com/1")],
+                               now=T0 + 7200)
+    assert result[0].source_count == 1
+    assert len(index) == 1
+
+
+def test_seen_story_stays_alive():
+    index = DedupIndex(window=3600)
+    article = _a("Rust 2.0 released with new borrow checker", "https://a.com/1")
+    for minutes in (0, 50, 100, 150):
+        index.deduplicate([_a(article.title, article.url)], now=T0 + minutes * 60)
+    result = index.deduplicate([_a("Rust 2.0 released with a new borrow checker", "https://b.com/1")],
+                               now=T0 + 200 * 60)
+    assert result[0].source_count == 2
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = tmp_path / INDEX_FILE
+    index = DedupIndex(path)
+    index.deduplicate([_a("Rust 2.0 released with new borrow checker", "https://a.com/1"),
+                       _a("Python packaging gets a lockfile standard", "https://c.com/1")])
+    index.save()
+    data = json.loads(path.read_text())
+    assert len(data["stories"]) == 2
+
+    again = DedupIndex(path)
+    again.load()
+    assert len(again) == 2
+    result = again.deduplicate([_a("Rust 2.0 released with a new borrow checker", "https://b.com/1")])
+    assert result[0].source_count == 2
+
+
+def test_corrupt_file_starts_empty(tmp_path):
+    path = tmp_path / INDEX_FILE
+    path.write_text("{not json")
+    index = DedupIndex(path)
+    index.load()
+    assert len(index) == 0
+
+
+def test_open_reuses_loaded_index(tmp_path):
+    first = open_dedup_index(index_dir=tmp_path)
+    first.deduplicate([_a("Rust 2.0 released with new borrow checker", "https://a.com/1")])
+    first.save()
+    assert open_dedup_index(index_dir=tmp_path) is first
+    # A different threshold needs a fresh title index
+    assert open_dedup_index(similarity_threshold=0.9, index_dir=tmp_path) is not first
+    assert clear_dedup_index(tmp_path) is True
+    assert clear_dedup_index(tmp_path) is False
+
+
+def test_engine_uses_dedup_index(tmp_path):
+    engine = CrawlEngine(sources=[])
+    engine.health.save = lambda: None
+    engine.dedup_index = DedupIndex(tmp_path / INDEX_FILE)
+    engine._finalize([_a("Rust 2.0 released with new borrow checker", "https://a.com/1")], 0.75, True,
+                     DedupStats())
+    unique = engine._finalize([_a("Rust 2.0 released with a new borrow checker", "https://b.com/1")], 0.75,
+                              True, DedupStats())
+    assert unique[0].source_count == 2
+    assert (tmp_path / INDEX_FILE).exists()
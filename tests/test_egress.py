@@ -0,0 +1,123 @@
+"""Tests for spreading fetches across an egress pool."""
+import socket
+
+import pytest
+
+from clawler.sources import rate_limit
+from clawler.sources.base import BaseSource
+from clawler.sources.egress import Egress, EgressPool, configure_egress, get_egress_pool
+from clawler.sources.rate_limit import HostRateLimiter, get_rate_limiter
+
+
+def _proxy(local_server, label):
+    """Stand-in forward proxy: answers proxied requests itself and records them."""
+    def respond(request):
+        srv = request.server
+        srv.seen.append((request.path, request.client_address[0]))
+        return srv.status, f"via {label}".encode(), {"Retry-After": "60"} if srv.status == 429 else {}
+
+    srv = local_server(respond)
+    srv.seen, srv.status = [], 200
+    return srv
+
+
+@pytest.fixture
+def proxies(local_server):
+    return [_proxy(local_server, "a"), _proxy(local_server, "b")]
+
+
+@pytest.fixture(autouse=True)
+def _direct_after():
+    yield
+    configure_egress()
+
+
+@pytest.fixture
+def fast_limits(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_rate_limiter", HostRateLimiter({"default": {"rate": 100, "burst": 2}}))
+
+
+class _Source(BaseSource):
+    name = "egress"
+    max_retries = 1
+    retry_backoff = 0
+
+    def crawl(self):
+        return []
+
+
+def test_requests_spread_across_proxies(proxies, fast_limits):
+    a, b = proxies
+    pool = configure_egress([a.url, b.url])
+    src = _Source()
+    bodies = [src.fetch_url(f"http://strict.test/r/{i}") for i in range(6)]
+    assert sorted(bodies) == ["via a"] * 3 + ["via b"] * 3
+    assert a.seen[0][0] == "http://strict.test/r/0"  # absolute URL: sent as a proxy request
+    assert pool.sent == {a.url: 3, b.url: 3}
+    buckets = get_rate_limiter().buckets
+    assert f"strict.test via {a.url}" in buckets and "strict.test" not in buckets
+
+
+def test_throttled_egress_is_avoided(proxies, fast_limits):
+    a, b = proxies
+    a.status = 429
+    configure_egress([a.url, b.url])
+    src = _Source()
+    assert src.fetch_url("http://strict.test/first") == "via b"  # a answered 429, the retry took b
+    assert len(a.seen) == 1
+    for i in range(3):
+        assert src.fetch_url(f"http://strict.test/{i}") == "via b"
+    assert len(a.seen) == 1
+    assert get_rate_limiter().delay("http://strict.test/", a.url) > 50
+    assert get_rate_limiter().delay("http://strict.test/", b.url) == 0
+
+
+def test_only_listed_hosts_use_the_pool(proxies, fast_limits, local_server):
+    a, b = proxies
+    origin = _proxy(local_server, "origin")
+    configure_egress([a.url], hosts=["strict.test"])
+    src = _Source()
+    assert src.fetch_url("http://feeds.strict.test/x") == "via a"
+    assert src.fetch_url(f"{origin.url}/direct") == "via origin"
+    assert origin.seen == [("/direct", "127.0.0.1")]
+
+
+def test_bind_address(local_server):
+    try:
+        probe = socket.create_connection(("127.0.0.1", 9), source_address=("127.0.0.2", 0), timeout=1)
+        probe.close()
+    except ConnectionRefusedError:
+        pass
+    except OSError:
+        pytest.skip("127.0.0.2 is not usable as a source address here")
+    origin = _proxy(local_server, "origin")
+    configure_egress(["127.0.0.2"])
+    assert _Source().fetch_url(f"{origin.url}/bound") == "via origin"
+    assert origin.seen == [("/bound", "127.0.0.2")]
+
+
+def test_reserve_any_keeps_separate_buckets():
+    limiter = HostRateLimiter({"strict.test": {"rate": 1, "burst": 1}})
+    url = "https://strict.test/x"
+    picks = [limiter.reserve_any(url, ["p1", "p2", "p3"]) for _ in range(3)]
+    assert sorted(e for e, _ in picks) == ["p1", "p2", "p3"]
+    assert all(wait == 0 for _, wait in picks)
+    egress, wait = limiter.reserve_any(url, ["p1", "p2", "p3"])
+    assert 0.9 < wait <= 1.0
+    limiter.throttled(url, "30", egress="p2")
+    assert limiter.delay_any(url, ["p1", "p2"]) == 0
+    assert limiter.delay_any(url, ["p2"]) > 25
+
+
+def test_pool_config():
+    pool = EgressPool(["socks5://10.0.0.1:1080", " 192.0.2.7 "], hosts=["Reddit.com"])
+    assert pool.egresses == [Egress(proxy="socks5://10.0.0.1:1080"), Egress(bind="192.0.2.7")]
+    assert pool.routes("https://old.reddit.com/r/x") == pool.names
+    assert pool.routes("https://example.com/") is None
+    assert pool.request_kwargs("192.0.2.7") == {}
+    assert pool.request_kwargs("socks5://10.0.0.1:1080")["proxies"]["https"] == "socks5://10.0.0.1:1080"
+    with pytest.raises(ValueError):
+        EgressPool(["not-an-address"])
+    with pytest.raises(ValueError):
+        EgressPool(["192.0.2.7", "192.0.2.7"])
+    assert configure_egress([]) is None and get_egress_pool() is None
@@ -0,0 +1,120 @@
+"""Tests for pool-scheduled source retries and the overall crawl budget."""
+import time
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from clawler.engine import AsyncCrawlEngine, CrawlEngine
+from clawler.models import Article
+from clawler.sources.base import BaseSource
+
+
+class FlakySource(BaseSource):
+    """Fails the first ``failures`` crawls, then returns one article."""
+
+    def __init__(self, name, failures=1, delay=0.0, title=None):
+        self.name = name
+        self.title = title or f"Story from {name}"
+        self.failures = failures
+        self.delay = delay
+        self.calls = []
+
+    def crawl(self):
+        self.calls.append(time.monotonic())
+        time.sleep(self.delay)
+        if len(self.calls) <= self.failures:
+            raise ConnectionError(f"{self.name} attempt {len(self.calls)} failed")
+        return [Article(title=self.title, url=f"https://{self.name}.example.com/1",
+                        source=self.name, timestamp=datetime.now(tz=timezone.utc))]
+
+
+@pytest.fixture(autouse=True)
+def _no_health_writes(tmp_path):
+    with patch("clawler.health.HEALTH_PATH", str(tmp_path / "health.json")):
+        yield
+
+
+def _fast_backoff(seconds=0.3):
+    return patch.object(CrawlEngine, "_retry_delay", staticmethod(lambda attempt: seconds))
+
+
+class TestPooledRetries:
+    def test_retries_run_in_parallel(self):
+        sources = [FlakySource(f"s{i}", delay=0.2) for i in range(3)]
+        engine = CrawlEngine(sources=sources, max_workers=3, retries=1)
+        t0 = time.monotonic()
+        with _fast_backoff(0.3):
+            _, stats, _ = engine.crawl()
+        elapsed = time.monotonic() - t0
+        assert stats == {"s0": 1, "s1": 1, "s2": 1}
+        # first attempt 0.2 + backoff 0.3 + retry 0.2, not three times the retry cost
+        assert elapsed < 1.2
+
+    def test_backoff_does_not_hold_a_worker(self):
+        flaky = FlakySource("flaky")
+        steady = FlakySource("steady", failures=0, delay=0.2)
+        engine = CrawlEngine(sources=[flaky, steady], max_workers=1, retries=1)
+        with _fast_backoff(0.5):
+            _, stats, _ = engine.crawl()
+        assert stats == {"flaky": 1, "steady": 1}
+        # steady ran while flaky was waiting out its backoff
+        assert steady.calls[0] < flaky.calls[1]
+
+    def test_healthy_results_not_delayed_by_retries(self):
+        flaky = FlakySource("flaky", title="Volcano erupts in Iceland")
+        steady = FlakySource("steady", failures=0, delay=0.1, title="New Python release ships")
+        it = CrawlEngine(sources=[flaky, steady], max_workers=2, retries=1).crawl_iter()
+        t0 = time.monotonic()
+        with _fast_backoff(1.0):
+            first = next(it)
+            assert first.source == "steady"
+            assert time.monotonic() - t0 < 0.8
+            assert next(it).source == "flaky"
+
+    def test_retries_used_recorded(self):
+        src = FlakySource("flaky", failures=2)
+        engine = CrawlEngine(sources=[src], retries=2)
+        with _fast_backoff(0.05):
+            _, stats, _ = engine.crawl()
+        assert stats == {"flaky": 1}
+        assert engine.health.data["flaky"]["retries_used"] == 2
+
+    def test_exhausted_retries_fail(self):
+        src = FlakySource("broken", failures=10)
+        engine = CrawlEngine(sources=[src], retries=2)
+        with _fast_backoff(0.05):
+            _, stats, _ = engine.crawl()
+        assert stats == {"broken": -1}
+        assert len(src.calls) == 3
+
+
+class TestCrawlBudget:
+    def test_retry_skipped_when_budget_exhausted(self):
+        src = FlakySource("flaky")
+        engine = CrawlEngine(sources=[src], retries=3, crawl_timeout=1.0)
+        t0 = time.monotonic()
+        _, stats, _ = engine.crawl()  # default backoff (2s) doesn't fit in 1s
+        assert stats == {"flaky": -1}
+        assert len(src.calls) == 1
+        assert time.monotonic() - t0 < 0.5
+
+    def test_crawl_timeout_caps_source_deadline(self):
+        seen = {}
+
+        class Probe(BaseSource):
+            name = "probe"
+
+            def crawl(self):
+                seen["remaining"] = self.remaining_budget()
+                return []
+
+        CrawlEngine(sources=[Probe()], source_timeout=60, crawl_timeout=0.5).crawl()
+        assert seen["remaining"] <= 0.5
+
+    def test_async_engine_respects_crawl_budget(self):
+        src = FlakySource("flaky")
+        engine = AsyncCrawlEngine(sources=[src], retries=3, crawl_timeout=1.0)
+        _, stats, _ = engine.crawl()
+        assert stats == {"flaky": -1}
+        assert len(src.calls) == 1
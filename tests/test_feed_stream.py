@@ -0,0 +1,141 @@
+"""Tests for streamed, size-capped reads and early-stop feed parsing."""
+import json
+from unittest.mock import MagicMock, patch
+
+import feedparser
+
+from clawler.http_cache import get_http_cache
+from clawler.sources.base import BaseSource, _read_text
+from clawler.sources.feed_stream import FeedItemScanner
+
+
+def _rss(n):
+    items = "".join(f"<item><title>Story {i}</title><link>https://example.com/{i}</link></item>\n"
+                    for i in range(n))
+    return f'<?xml version="1.0"?>\n<rss version="2.0"><channel><title>Big</title>\n{items}</channel></rss>'
+
+
+def _atom(n):
+    entries = "".join(f"<entry><title>Entry {i}</title><id>urn:{i}</id></entry>\n" for i in range(n))
+    return f'<?xml version="1.0"?>\n<feed xmlns="http://www.w3.org/2005/Atom"><title>A</title>\n{entries}</feed>'
+
+
+def _streamed(body: bytes, chunk=7, encoding="utf-8"):
+    resp = MagicMock()
+    chunks = [body[i:i + chunk] for i in range(0, len(body), chunk)]
+    resp.iter_content.return_value = iter(chunks)
+    resp.encoding = encoding
+    return resp
+
+
+class PlainSource(BaseSource):
+    name = "plain"
+
+    def crawl(self):
+        return []
+
+
+def test_scanner_counts_items_split_across_chunks():
+    body = _rss(10).encode()
+    scanner = FeedItemScanner(3)
+    received = bytearray()
+    for i in range(0, len(body), 5):
+        received.extend(body[i:i + 5])
+        if scanner.feed(received):
+            break
+    assert scanner.items == 3
+    parsed = feedparser.parse(scanner.truncate(bytes(received)))
+    assert not parsed.bozo
+    assert [e.title for e in parsed.entries] == ["Story 0", "Story 1", "Story 2"]
+
+
+def test_read_text_stops_after_max_items():
+    body = _rss(500).encode()
+    resp = _streamed(body, chunk=256)
+    text, complete = _read_text(resp, "https://example.com/feed", max_items=20)
+    assert complete
+    assert len(text) < len(body) / 10
+    parsed = feedparser.parse(text)
+    assert not parsed.bozo
+    assert len(parsed.entries) == 20
+    resp.close.assert_called_once()
+
+
+def test_atom_feed_is_closed_properly():
+    text, complete = _read_text(_streamed(_atom(50).encode()), "u", max_items=5)
+    parsed = feedparser.parse(text)
+    assert not parsed.bozo and len(parsed.entries) == 5
+    assert text.rstrip().endswith("</feed>")
+
+
+def test_byte_cap_cuts_after_last_complete_item():
+    body = _rss(200).encode()
+    text, complete = _read_text(_streamed(body, chunk=100), "u", max_bytes=2000, max_items=50)
+    assert not complete
+    parsed = feedparser.parse(text)
+    assert not parsed.bozo
+    assert 0 < len(parsed.entries) < 50
+
+
+def test_byte_cap_without_items():
+    text, complete = _read_text(_streamed(b"x" * 5000), "u", max_bytes=1000)
+    assert (len(text), complete) == (1000, False)
+
+
+def test_small_body_read_in_full():
+    body = "<p>café</p>".encode("latin-1")
+    text, complete = _read_text(_streamed(body, encoding="latin-1"), "u", max_bytes=1000, max_items=5)
+    assert (text, complete) == ("<p>café</p>", True)
+
+
+def _feed_response(body: bytes, status=200, headers=None):
+    resp = _streamed(body, chunk=512)
+    resp.status_code = status
+    resp.ok = status < 400
+    resp.headers = headers or {}
+    return resp
+
+
+def test_fetch_url_streams_and_skips_cache_for_truncated_bodies():
+    session = MagicMock()
+    session.get.return_value = _feed_response(_rss(100).encode(), headers={"ETag": '"big"'})
+    src = PlainSource()
+    src.max_response_bytes = 2000
+    with patch("clawler.sources.base._get_session", return_value=session), \
+            patch("clawler.http_cache.HttpCache.store") as store:
+        text = src.fetch_url("https://example.com/big.xml", max_items=50)
+    assert session.get.call_args.kwargs["stream"] is True
+    assert 0 < len(feedparser.parse(text).entries) < 50
+    store.assert_not_called()
+
+
+
+def test_fetch_json_reads_within_the_byte_cap():
+    body = json.dumps({"items": list(range(2000))}).encode()
+    session = MagicMock()
+    session.get.side_effect = [_feed_response(body, headers={"ETag": '"j"'}) for _ in range(2)]
+    src = PlainSource()
+    with patch("clawler.sources.base._get_session", return_value=session), \
+            patch("clawler.http_cache.HttpCache.store") as store:
+        assert src.fetch_json("https://example.com/small.json") == {"items": list(range(2000))}
+        src.max_response_bytes = 2000
+        assert src.fetch_json("https://example.com/big.json") is None
+    assert session.get.call_args.kwargs["stream"] is True
+    # The first body was cached; the cut one was neither parsed nor stored
+    assert store.call_count == 1
+
+
+def test_item_capped_feed_is_cached_and_revalidated():
+    url = "https://example.com/long.xml"
+    session = MagicMock()
+    session.get.side_effect = [_feed_response(_rss(25).encode(), headers={"ETag": '"v1"'}),
+                               _feed_response(b"", status=304)]
+    src = PlainSource()
+    with patch("clawler.sources.base._get_session", return_value=session):
+        first = src.fetch_url(url, max_items=20)
+        second = src.fetch_url(url, max_items=20)
+    assert len(feedparser.parse(first).entries) == 20
+    assert session.get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert second == first and second.not_modified
+    # The head of the feed is not served to a fetch that wants all of it
+    assert get_http_cache().validators(url) == {}
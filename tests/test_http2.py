@@ -0,0 +1,80 @@
+"""Tests for the pluggable HTTP/2 transport."""
+import pytest
+from requests.adapters import HTTPAdapter
+
+from clawler.sources import base, connections
+from clawler.sources.base import BaseSource, _get_session, configure_transport
+from clawler.sources.connections import ArchiveAdapter, Http2Adapter
+
+
+@pytest.fixture(autouse=True)
+def _http1_after():
+    yield
+    configure_transport(http2=False)
+
+
+class _FakeHttp2(Http2Adapter):
+    closed = 0
+
+    def __init__(self):
+        HTTPAdapter.__init__(self)
+        self.client = None
+
+    def close(self):
+        type(self).closed += 1
+
+
+def test_falls_back_without_httpx(monkeypatch):
+    monkeypatch.setattr(connections, "_httpx", lambda: None)
+    assert configure_transport(http2=True) is False
+    assert isinstance(_get_session().get_adapter("https://example.com/"), ArchiveAdapter)
+
+
+def test_mounts_and_unmounts(monkeypatch):
+    monkeypatch.setattr(base, "Http2Adapter", _FakeHttp2)
+    session = _get_session()
+    assert configure_transport(http2=True) is True
+    assert isinstance(session.get_adapter("https://example.com/feed"), _FakeHttp2)
+    assert isinstance(session.get_adapter("http://example.com/feed"), ArchiveAdapter)
+
+    assert configure_transport(http2=True, hosts=["Hacker-News.firebaseio.com"]) is True
+    assert isinstance(session.get_adapter("https://hacker-news.firebaseio.com/v0/item/1.json"), _FakeHttp2)
+    assert isinstance(session.get_adapter("https://example.com/feed"), ArchiveAdapter)
+
+    closed = _FakeHttp2.closed
+    assert configure_transport(http2=False) is False
+    assert _FakeHttp2.closed == closed + 1
+    assert not any(isinstance(a, Http2Adapter) for a in session.adapters.values())
+    assert isinstance(session.get_adapter("https://hacker-news.firebaseio.com/v0/item/1.json"), ArchiveAdapter)
+
+
+FEED = b"<rss><channel><item><title>One</title></item></channel></rss>"
+
+
+def _respond(request):
+    return (200, FEED, {}) if request.path == "/feed" else (500, b"", {})
+
+
+class _Source(BaseSource):
+    name = "h2"
+    max_retries = 1
+    retry_backoff = 0
+
+    def crawl(self):
+        return []
+
+
+def test_httpx_adapter_keeps_fetch_semantics(local_server):
+    pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    url = local_server(_respond).url
+    session = _get_session()
+    adapter = Http2Adapter()
+    session.mount(url, adapter)
+    try:
+        src = _Source()
+        assert src.fetch_url(f"{url}/feed") == FEED.decode()
+        assert src.fetch_url(f"{url}/broken") == ""  # 500 -> retried, then empty
+    finally:
+        del session.adapters[url]
+        adapter.close()
@@ -0,0 +1,109 @@
+"""Tests for recording and replaying HTTP traffic."""
+import gzip
+import json
+from unittest.mock import patch
+
+import pytest
+
+from clawler import http_archive
+from clawler.engine import CrawlEngine
+from clawler.http_archive import NotRecorded, configure_http_archive
+from clawler.sources.base import BaseSource
+from clawler.sources.rss import RSSSource
+
+FEED = """<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"><channel><title>Local</title>
+<item><title>Café opens downtown</title><link>https://example.com/1</link></item>
+<item><title>Second story</title><link>https://example.com/2</link></item>
+</channel></rss>""".encode("utf-8")
+
+
+def _respond(request):
+    request.server.hits += 1
+    if request.path == "/feed.xml":
+        return 200, FEED, {"Content-Type": "application/rss+xml; charset=utf-8"}
+    if request.path == "/data.json":
+        return 200, b'{"items": [1, 2, 3]}', {"Content-Type": "application/json"}
+    return 404, b"", {}
+
+
+@pytest.fixture
+def server(local_server):
+    srv = local_server(_respond)
+    srv.hits = 0
+    return srv
+
+
+@pytest.fixture(autouse=True)
+def _live_after(monkeypatch):
+    monkeypatch.setattr(http_archive, "_http_archive", None)
+    yield
+    configure_http_archive()
+
+
+class _Source(BaseSource):
+    name = "test"
+    max_retries = 0
+
+    def crawl(self):
+        return []
+
+
+def test_record_then_replay_offline(server, tmp_path):
+    archive = configure_http_archive(record=tmp_path)
+    src = _Source()
+    assert src.fetch_url(f"{server.url}/feed.xml") == FEED.decode("utf-8")
+    assert src.fetch_json(f"{server.url}/data.json") == {"items": [1, 2, 3]}
+    assert src.fetch_url(f"{server.url}/missing") == ""
+    assert archive.recorded == 3
+    files = list(tmp_path.glob("*.json.gz"))
+    assert len(files) == 3
+    gzip.open(files[0]).read()  # valid gzip
+
+    hits = server.hits
+    replay = configure_http_archive(replay=tmp_path)
+    assert src.fetch_url(f"{server.url}/feed.xml") == FEED.decode("utf-8")
+    assert src.fetch_json(f"{server.url}/data.json") == {"items": [1, 2, 3]}
+    assert src.fetch_url(f"{server.url}/missing") == ""
+    assert src.fetch_url(f"{server.url}/never-recorded") == ""
+    assert server.hits == hits
+    assert (replay.replayed, replay.missing) == (3, 1)
+
+
+def test_replay_latency(server, tmp_path):
+    configure_http_archive(record=tmp_path)
+    _Source().fetch_url(f"{server.url}/feed.xml")
+    entry_file = next(tmp_path.glob("*.json.gz"))
+    entry = json.loads(gzip.open(entry_file).read())
+    entry["elapsed_ms"] = 250.0
+    with gzip.open(entry_file, "wb") as f:
+        f.write(json.dumps(entry).encode())
+    configure_http_archive(replay=tmp_path, latency_scale=2.0)
+    with patch("clawler.http_archive.time.sleep") as sleep:
+        _Source().fetch_url(f"{server.url}/feed.xml")
+    assert 0.5 in [c.args[0] for c in sleep.call_args_list]
+
+
+def test_full_crawl_replays_identically(server, tmp_path):
+    feeds = [{"url": f"{server.url}/feed.xml", "source": "Local", "category": "tech"}]
+    configure_http_archive(record=tmp_path)
+    live, _, _ = CrawlEngine(sources=[RSSSource(feeds=feeds)], max_workers=1).crawl()
+    configure_http_archive(replay=tmp_path)
+    hits = server.hits
+    replayed, stats, _ = CrawlEngine(sources=[RSSSource(feeds=feeds)], max_workers=1).crawl()
+    assert server.hits == hits
+    assert [a.title for a in replayed] == [a.title for a in live]
+    assert "Café opens downtown" in [a.title for a in replayed]
+
+
+def test_configure_errors(tmp_path):
+    with pytest.raises(ValueError):
+        configure_http_archive(record=tmp_path, replay=tmp_path)
+    with pytest.raises(ValueError):
+        configure_http_archive(replay=tmp_path / "nope")
+    assert configure_http_archive() is None
+
+
+def test_not_recorded_is_a_connection_error():
+    import requests
+    assert issubclass(NotRecorded, requests.ConnectionError)
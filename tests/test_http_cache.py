@@ -0,0 +1,190 @@
+"""Tests for conditional GETs through the HTTP cache."""
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+from clawler import http_cache
+from clawler.http_cache import HttpCache, NotModified, configure_http_cache, get_http_cache
+from clawler.sources.base import BaseSource
+from clawler.sources.rss import RSSSource
+
+URL = "https://example.com/feed.xml"
+
+FEED = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Example</title>
+<item><title>First story</title><link>https://example.com/1</link></item>
+<item><title>Second story</title><link>https://example.com/2</link></item>
+</channel></rss>"""
+
+
+class _Source(BaseSource):
+    name = "test"
+
+    def crawl(self):
+        return []
+
+
+def _response(status=200, text="", headers=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.text = text
+    resp.iter_content.return_value = [text.encode("utf-8")]
+    resp.encoding = "utf-8"
+    resp.ok = status < 400
+    resp.headers = headers or {}
+    if status >= 400:
+        import requests
+        resp.raise_for_status.side_effect = requests.HTTPError(str(status))
+    return resp
+
+
+def _session(*responses):
+    session = MagicMock()
+    session.get.side_effect = list(responses)
+    return session
+
+
+def test_store_and_validators(tmp_path):
+    cache = HttpCache(tmp_path)
+    assert cache.validators(URL) == {}
+    assert cache.store(URL, {"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024 10:00:00 GMT"}, "body")
+    assert cache.validators(URL) == {"If-None-Match": '"abc"',
+                                     "If-Modified-Since": "Mon, 01 Jan 2024 10:00:00 GMT"}
+    body = cache.load(URL)
+    assert body == "body" and isinstance(body, NotModified)
+    assert cache.hits == 1
+
+
+def test_store_needs_a_validator(tmp_path):
+    cache = HttpCache(tmp_path)
+    assert not cache.store(URL, {}, "body")
+    assert not cache.store(URL, MagicMock(), "body")
+    assert not cache.store(URL, {"ETag": '"abc"'}, MagicMock())
+    assert cache.validators(URL) == {}
+
+
+def test_clear(tmp_path):
+    cache = HttpCache(tmp_path)
+    cache.store(URL, {"ETag": "x"}, "a")
+    cache.store(URL + "?2", {"ETag": "y"}, "b")
+    assert cache.clear() == 2
+    assert cache.load(URL) is None
+
+
+
+def _age(cache, url, seconds):
+    for path in cache._paths(url):
+        then = time.time() - seconds
+        os.utime(path, (then, then))
+
+
+def test_store_evicts_least_recently_used_over_max_bytes(tmp_path):
+    cache = HttpCache(tmp_path)
+    for i in range(3):
+        assert cache.store(f"{URL}?{i}", {"ETag": str(i)}, "x" * 1000)
+        _age(cache, f"{URL}?{i}", 100 - i)
+    cache.load(f"{URL}?0")  # served from the cache: most recently used
+    cache.max_bytes = 2500
+    assert cache.store(f"{URL}?3", {"ETag": "3"}, "x" * 1000)
+    assert cache.evicted == 2
+    assert cache.validators(f"{URL}?0") and cache.validators(f"{URL}?3")
+    assert cache.validators(f"{URL}?1") == {} and cache.validators(f"{URL}?2") == {}
+
+
+def test_prune_drops_entries_past_max_age(tmp_path):
+    cache = HttpCache(tmp_path, max_age=3600)
+    cache.store(URL, {"ETag": "old"}, "a")
+    cache.store(URL + "?new", {"ETag": "new"}, "b")
+    _age(cache, URL, 7200)
+    assert cache.prune() == 1
+    assert cache.validators(URL) == {}
+    assert cache.load(URL + "?new") == "b"
+
+
+def test_configure_off():
+    assert configure_http_cache(enabled=False) is None
+    assert get_http_cache() is None
+    assert configure_http_cache(enabled=True) is not None
+
+
+def test_fetch_sends_validators_and_uses_304():
+    session = _session(_response(200, FEED, {"ETag": '"v1"'}), _response(304))
+    src = _Source()
+    with patch("clawler.sources.base._get_session", return_value=session):
+        first = src.fetch_url(URL)
+        second = src.fetch_url(URL)
+    assert first == FEED and not getattr(first, "not_modified", False)
+    assert second == FEED and second.not_modified
+    sent = session.get.call_args_list[1].kwargs["headers"]
+    assert sent["If-None-Match"] == '"v1"'
+    assert "If-None-Match" not in session.get.call_args_list[0].kwargs["headers"]
+
+
+def test_fetch_json_304_returns_parsed_body():
+    session = _session(_response(200, '{"ok": true}', {"Last-Modified": "yesterday"}), _response(304))
+    src = _Source()
+    with patch("clawler.sources.base._get_session", return_value=session):
+        assert src.fetch_json(URL) == {"ok": True}
+        assert src.fetch_json(URL) == {"ok": True}
+    assert session.get.call_args_list[1].kwargs["headers"]["If-Modified-Since"] == "yesterday"
+
+
+def test_304_without_stored_body_refetches_unconditionally():
+    session = _session(_response(200, FEED, {"ETag": '"v1"'}), _response(304),
+                       _response(200, FEED, {"ETag": '"v2"'}))
+    src = _Source()
+    with patch("clawler.sources.base._get_session", return_value=session), \
+            patch.object(HttpCache, "load", return_value=None):
+        src.fetch_url(URL)
+        assert src.fetch_url(URL) == FEED
+    assert "If-None-Match" not in session.get.call_args_list[2].kwargs["headers"]
+    assert get_http_cache().validators(URL) == {"If-None-Match": '"v2"'}
+
+
+def test_fetch_json_304_without_stored_body_refetches():
+    session = _session(_response(200, '{"ok": true}', {"ETag": '"v1"'}), _response(304),
+                       _response(200, '{"ok": true}', {"ETag": '"v1"'}))
+    src = _Source()
+    with patch("clawler.sources.base._get_session", return_value=session), \
+            patch.object(HttpCache, "load", return_value=None):
+        src.fetch_json(URL)
+        assert src.fetch_json(URL) == {"ok": True}
+
+
+def test_unsolicited_304_is_a_failure_and_not_cached():
+    src = _Source()
+    src.max_retries = 0
+    with patch("clawler.sources.base._get_session", return_value=_session(_response(304))):
+        assert src.fetch_url(URL) == ""
+    with patch("clawler.sources.base._get_session", return_value=_session(_response(304))):
+        assert src.fetch_json(URL) is None
+    assert get_http_cache().validators(URL) == {}
+
+
+def test_disabled_cache_sends_plain_requests():
+    configure_http_cache(enabled=False)
+    session = _session(_response(200, FEED, {"ETag": '"v1"'}), _response(200, FEED, {"ETag": '"v1"'}))
+    with patch("clawler.sources.base._get_session", return_value=session):
+        _Source().fetch_url(URL)
+        _Source().fetch_url(URL)
+    assert "If-None-Match" not in session.get.call_args_list[1].kwargs["headers"]
+
+
+def test_rss_reuses_parse_when_not_modified():
+    src = RSSSource(feeds=[{"url": URL, "source": "Example", "category": "tech"}])
+    with patch.object(src, "fetch_url", return_value=FEED):
+        first = src.crawl()
+    with patch.object(src, "fetch_url", return_value=NotModified(FEED)), \
+            patch("clawler.sources.rss.submit_parse") as parse:
+        second = src.crawl()
+    parse.assert_not_called()
+    assert [a.title for a in second] == [a.title for a in first]
+    assert second[0] is not first[0]
+
+
+def test_parsed_feeds_are_capped():
+    from clawler.sources import rss
+    with patch.object(rss, "MAX_PARSED_FEEDS", 2), patch.object(rss, "_parsed_feeds", rss.OrderedDict()):
+        for i in range(3):
+            rss._remember_parsed(f"{URL}?{i}", "Example", "tech", FEED, 2, [])
+        assert [key[0] for key in rss._parsed_feeds] == [f"{URL}?1", f"{URL}?2"]
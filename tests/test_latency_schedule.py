@@ -0,0 +1,72 @@
+"""Tests for latency-aware source ordering and worker sizing."""
+from unittest.mock import patch
+
+import pytest
+
+from clawler.engine import AUTO_WORKERS_CAP, CrawlEngine
+from clawler.health import HealthTracker
+from clawler.sources.base import BaseSource
+
+
+class RecordingSource(BaseSource):
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def crawl(self):
+        self.log.append(self.name)
+        return []
+
+
+@pytest.fixture(autouse=True)
+def _no_health_writes(tmp_path):
+    with patch("clawler.health.HEALTH_PATH", str(tmp_path / "health.json")):
+        yield
+
+
+def _engine(timings, names, **kwargs):
+    log = []
+    engine = CrawlEngine(sources=[RecordingSource(n, log) for n in names], **kwargs)
+    for name, samples in timings.items():
+        for ms in samples:
+            engine.health.record_success(name, 1, response_ms=ms)
+    return engine, log
+
+
+def test_expected_ms_uses_p95():
+    ht = HealthTracker()
+    ht.data = {"a": {"response_times_ms": list(range(1, 101))}}
+    assert ht.expected_ms("a") == pytest.approx(95.05)
+    assert ht.expected_ms("a", percentile=50) == pytest.approx(50.5)
+    assert ht.expected_ms("missing") is None
+
+
+def test_sources_start_slowest_first():
+    engine, log = _engine({"fast": [100], "slow": [5000], "mid": [1000]},
+                          ["fast", "new", "slow", "mid"], max_workers=1)
+    ordered, workers = engine._schedule()
+    assert [s.name for s in ordered] == ["new", "slow", "mid", "fast"]
+    assert workers == 1
+    engine.crawl()
+    assert log == ["new", "slow", "mid", "fast"]
+
+
+def test_auto_workers_sized_from_expected_work():
+    timings = {"slow": [4000], "a": [2000], "b": [2000], "c": [1000]}
+    engine, _ = _engine(timings, list(timings), max_workers=1, auto_workers=True)
+    # 9000ms of work / 4000ms longest → 3 workers
+    assert engine._schedule()[1] == 3
+
+
+def test_auto_workers_respects_floor_and_cap():
+    engine, _ = _engine({"a": [100], "b": [100]}, ["a", "b"], max_workers=6, auto_workers=True)
+    assert engine._schedule()[1] == 6
+    names = [f"s{i}" for i in range(50)]
+    engine, _ = _engine({}, names, max_workers=1, auto_workers=True)
+    assert engine._schedule()[1] == AUTO_WORKERS_CAP
+
+
+def test_auto_workers_off_keeps_max_workers():
+    timings = {f"s{i}": [1000] for i in range(10)}
+    engine, _ = _engine(timings, list(timings), max_workers=2)
+    assert engine._schedule()[1] == 2
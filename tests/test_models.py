@@ -24,6 +24,34 @@ class TestArticle:
         b = _article(url="https://b.com")
         assert a.dedup_key != b.dedup_key
 
+    def test_normalized_fields(self):
+        a = _article(title="  Hello World ", url="https://www.example.com/post/?utm_source=rss")
+        assert a.normalized_title == "hello world"
+        assert a.normalized_url == "https://example.com/post"
+
+    def test_keys_follow_title_and_url_changes(self):
+        a = _article(title="Rust compiler gets faster", url="https://a.com/1")
+        key, fp = a.dedup_key, a.title_fingerprint
+        a.title = "Python packaging gets simpler"
+        assert a.title_fingerprint != fp
+        assert a.dedup_key == _article(title=a.title, url="https://a.com/1").dedup_key
+        key = a.dedup_key
+        a.url = "https://a.com/2"
+        assert a.dedup_key != key
+
+    def test_cached_keys_not_compared(self):
+        a = _article(title="Hello World")
+        b = _article(title="Hello World")
+        a.dedup_key
+        assert a == b
+        assert "_keys" not in repr(a)
+
+    def test_source_and_category_interned(self):
+        a = _article(source="".join(["Hacker", " News"]), category="".join(["te", "ch"]))
+        b = _article(source="".join(["Hacker ", "News"]), category="".join(["tec", "h"]))
+        assert a.source is b.source
+        assert a.category is b.category
+
 
 class TestDedup:
     def test_exact_dedup(self):
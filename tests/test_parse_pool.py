@@ -0,0 +1,112 @@
+"""Tests for the process-pool parse stage."""
+import os
+import threading
+from concurrent.futures import Future
+from unittest.mock import patch
+
+import pytest
+
+from clawler.sources import parse_pool as pool_mod
+from clawler.sources.parse_pool import ParsePool, configure_parse_pool, get_parse_pool
+from clawler.sources.rss import RSSSource, _parse_feed
+
+FEED = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Example</title>
+<item><title>First story</title><link>https://example.com/1</link>
+<description>&lt;p&gt;Some &lt;b&gt;bold&lt;/b&gt; text&lt;/p&gt;</description>
+<pubDate>Mon, 01 Jan 2024 10:00:00 GMT</pubDate></item>
+<item><title>Second story</title><link>https://example.com/2</link></item>
+<item><title></title><link>https://example.com/untitled</link></item>
+</channel></rss>"""
+
+
+@pytest.fixture
+def process_pool():
+    pool = ParsePool(workers=2)
+    with patch.object(pool_mod, "_parse_pool", pool):
+        yield pool
+    pool.shutdown()
+
+
+def test_parse_feed_builds_articles():
+    entries, articles = _parse_feed(FEED, "Example", "tech")
+    assert entries == 3
+    assert [a.title for a in articles] == ["First story", "Second story"]
+    assert articles[0].summary == "Some bold text"
+    assert articles[0].timestamp.year == 2024
+    assert articles[0].category == "tech"
+
+
+def test_inline_by_default():
+    assert ParsePool().run(os.getpid) == os.getpid()
+
+
+def test_runs_in_worker_process(process_pool):
+    assert process_pool.run(os.getpid) != os.getpid()
+
+
+def test_unpicklable_falls_back_inline(process_pool):
+    assert process_pool.run(lambda x: x * 2, 21) == 42
+
+
+def test_rss_crawl_parses_in_pool(process_pool):
+    src = RSSSource(feeds=[{"url": "https://example.com/feed", "source": "Example", "category": "tech"}])
+    with patch.object(src, "fetch_url", return_value=FEED):
+        articles = src.crawl()
+    assert [a.url for a in articles] == ["https://example.com/1", "https://example.com/2"]
+    assert process_pool._executor is not None
+
+
+def test_base_parse_feed_uses_pool(process_pool):
+    src = RSSSource(feeds=[])
+    assert len(src.parse_feed(FEED).entries) == 3
+
+
+def test_configure_reuses_matching_pool():
+    original = get_parse_pool()
+    try:
+        pool = configure_parse_pool(workers=3)
+        assert configure_parse_pool(workers=3) is pool
+        assert configure_parse_pool(workers=0).workers == 0
+    finally:
+        pool_mod._parse_pool = original
+
+
+def _raise_attribute_error(log):
+    with open(log, "a") as f:
+        f.write(f"{os.getpid()}\n")
+    raise AttributeError("parser bug")
+
+
+def test_parse_errors_propagate_from_worker(process_pool, tmp_path):
+    log = tmp_path / "calls"
+    with pytest.raises(AttributeError, match="parser bug"):
+        process_pool.run(_raise_attribute_error, str(log))
+    # Ran once in the worker, not retried inline
+    assert log.read_text().split() != [str(os.getpid())]
+    assert len(log.read_text().split()) == 1
+
+
+def test_fetch_threads_do_not_wait_for_parses():
+    release = threading.Event()
+    fetched = []
+
+    def slow_parse(fn, *args):
+        future = Future()
+        threading.Thread(target=lambda: (release.wait(5), future.set_result(fn(*args)))).start()
+        return future
+
+    def fetch(url, **kwargs):
+        fetched.append(url)
+        if len(fetched) == 2:
+            release.set()
+        return FEED
+
+    feeds = [{"url": f"https://example.com/{i}", "source": "Example", "category": "tech"} for i in range(2)]
+    src = RSSSource(feeds=feeds, max_workers=1)
+    with patch.object(src, "fetch_url", side_effect=fetch), \
+            patch("clawler.sources.rss.submit_parse", side_effect=slow_parse):
+        articles = src.crawl()
+    # With one fetch thread, the second fetch only happens if the first parse was handed off
+    assert len(fetched) == 2 and len(articles) == 4
+    assert all(t["ok"] for t in src.feed_timings.values())
@@ -105,7 +105,7 @@ class TestPoliticoCrawl:
         import feedparser
         feed = MagicMock()
         feed.entries = [self._make_entry()]
-        with patch("clawler.sources.politico.feedparser.parse", return_value=feed):
+        with patch("feedparser.parse", return_value=feed):
             mock_fetch.return_value = "<rss></rss>"
             src = PoliticoSource(sections=["politics"])
             articles = src.crawl()
@@ -117,7 +117,7 @@ class TestPoliticoCrawl:
         import feedparser
         feed = MagicMock()
         feed.entries = [self._make_entry(link="https://politico.com/same")]
-        with patch("clawler.sources.politico.feedparser.parse", return_value=feed):
+        with patch("feedparser.parse", return_value=feed):
             mock_fetch.return_value = "<rss></rss>"
             src = PoliticoSource()
             articles = src.crawl()
@@ -129,7 +129,7 @@ class TestPoliticoCrawl:
         import feedparser
         feed = MagicMock()
         feed.entries = [self._make_entry(author="Jonathan Martin")]
-        with patch("clawler.sources.politico.feedparser.parse", return_value=feed):
+        with patch("feedparser.parse", return_value=feed):
             mock_fetch.return_value = "<rss></rss>"
             src = PoliticoSource(sections=["politics"])
             articles = src.crawl()
@@ -140,7 +140,7 @@ class TestPoliticoCrawl:
         import feedparser
         feed = MagicMock()
         feed.entries = [self._make_entry(link=f"https://politico.com/{i}") for i in range(10)]
-        with patch("clawler.sources.politico.feedparser.parse", return_value=feed):
+        with patch("feedparser.parse", return_value=feed):
             mock_fetch.return_value = "<rss></rss>"
             src = PoliticoSource(sections=["politics"], min_quality=0.99)
             articles = src.crawl()
@@ -151,7 +151,7 @@ class TestPoliticoCrawl:
         import feedparser
         feed = MagicMock()
         feed.entries = [self._make_entry(link=f"https://politico.com/{i}") for i in range(10)]
-        with patch("clawler.sources.politico.feedparser.parse", return_value=feed):
+        with patch("feedparser.parse", return_value=feed):
             mock_fetch.return_value = "<rss></rss>"
             src = PoliticoSource(sections=["politics"], global_limit=3)
             articles = src.crawl()
@@ -222,7 +222,7 @@ class TestMarketWatchCrawl:
         import feedparser
         feed = MagicMock()
         feed.entries = [self._make_entry()]
-        with patch("clawler.sources.marketwatch.feedparser.parse", return_value=feed):
+        with patch("feedparser.parse", return_value=feed):
             mock_fetch.return_value = "<rss></rss>"
             src = MarketWatchSource(sections=["top stories"])
             articles = src.crawl()
@@ -234,7 +234,7 @@ class TestMarketWatchCrawl:
         import feedparser
         feed = MagicMock()
         feed.entries = [self._make_entry(link="https://marketwatch.com/same")]
-        with patch("clawler.sources.marketwatch.feedparser.parse", return_value=feed):
+        with patch("feedparser.parse", return_value=feed):
             mock_fetch.return_value = "<rss></rss>"
             src = MarketWatchSource()
             articles = src.crawl()
@@ -246,7 +246,7 @@ class TestMarketWatchCrawl:
         import feedparser
         feed = MagicMock()
         feed.entries = [self._make_entry(title="AI startup raises $1B")]
-        with patch("clawler.sources.marketwatch.feedparser.parse", return_value=feed):
+        with patch("feedparser.parse", return_value=feed):
             mock_fetch.return_value = "<rss></rss>"
             src = MarketWatchSource(sections=["top stories"])
             articles = src.crawl()
@@ -257,7 +257,7 @@ class TestMarketWatchCrawl:
         import feedparser
         feed = MagicMock()
         feed.entries = [self._make_entry(link=f"https://mw.com/{i}") for i in range(10)]
-        with patch("clawler.sources.marketwatch.feedparser.parse", return_value=feed):
+        with patch("feedparser.parse", return_value=feed):
             mock_fetch.return_value = "<rss></rss>"
             src = MarketWatchSource(sections=["top stories"], global_limit=2)
             articles = src.crawl()
@@ -268,7 +268,7 @@ class TestMarketWatchCrawl:
         import feedparser
         feed = MagicMock()
         feed.entries = [self._make_entry()]
-        with patch("clawler.sources.marketwatch.feedparser.parse", return_value=feed):
+        with patch("feedparser.parse", return_value=feed):
             mock_fetch.return_value = "<rss></rss>"
             src = MarketWatchSource(sections=["top stories"])
             articles = src.crawl()
@@ -0,0 +1,151 @@
+"""Tests for DNS caching, per-host pool sizing and connection pre-warming."""
+import socket
+import socketserver
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from clawler.engine import CrawlEngine
+from clawler.health import HealthTracker
+from clawler.models import Article
+from clawler.prewarm import PrewarmStats, plan_hosts, prewarm
+from clawler.sources.base import BaseSource
+from clawler.sources.connections import DnsCache, HostPoolAdapter, MAX_POOL_MAXSIZE, open_connections
+from clawler.sources.rss import RSSSource
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    def handle(self):
+        self.request.recv(1)  # hold the connection open until the client closes it
+
+
+@pytest.fixture
+def server():
+    srv = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _Handler)
+    srv.daemon_threads = True
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _health(tmp_path, data=None):
+    with patch("clawler.health.HEALTH_PATH", str(tmp_path / "health.json")):
+        tracker = HealthTracker()
+    tracker.data = data or {}
+    return tracker
+
+
+class TestDnsCache:
+    def test_caches_until_ttl(self):
+        calls = []
+
+        def resolver(*args):
+            calls.append(args)
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", args[1]))]
+
+        cache = DnsCache(ttl=60, resolver=resolver)
+        first = cache.getaddrinfo("example.com", 443)
+        assert cache.getaddrinfo("example.com", 443) == first
+        assert (len(calls), cache.hits, cache.misses) == (1, 1, 1)
+        cache.getaddrinfo("example.com", 80)
+        assert len(calls) == 2
+
+        with patch("clawler.sources.connections.time.monotonic", return_value=10 ** 9):
+            cache.getaddrinfo("example.com", 443)
+        assert len(calls) == 3
+
+    def test_failures_not_cached(self):
+        def resolver(*args):
+            raise socket.gaierror("nope")
+
+        cache = DnsCache(resolver=resolver)
+        for _ in range(2):
+            with pytest.raises(socket.gaierror):
+                cache.getaddrinfo("missing.invalid", 443)
+        assert cache.hits == 0
+
+
+class TestHostPools:
+    def test_pool_size_applies_per_host(self):
+        adapter = HostPoolAdapter(pool_maxsize=4)
+        adapter.set_pool_size("Feeds.Example.com", 12)
+        adapter.set_pool_size("huge.example.com", 1000)
+        sized = adapter.poolmanager.connection_from_host("feeds.example.com", 443, "https")
+        default = adapter.poolmanager.connection_from_host("other.example.com", 443, "https")
+        assert sized.pool.maxsize == 12
+        assert default.pool.maxsize == 4
+        assert adapter.pool_sizes["huge.example.com"] == MAX_POOL_MAXSIZE
+
+    def test_open_connections_pools_live_sockets(self, server):
+        adapter = HostPoolAdapter()
+        port = server.server_address[1]
+        opened, handshake_ms = open_connections(adapter, "http", "127.0.0.1", port, count=2)
+        assert opened == 2 and handshake_ms >= 0
+        pool = adapter.poolmanager.connection_from_host("127.0.0.1", port, "http")
+        live = [c for c in list(pool.pool.queue) if c is not None and c.sock is not None]
+        assert len(live) == 2
+
+    def test_open_connections_failure(self):
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]  # closed again: nothing listens here
+        opened, _ = open_connections(HostPoolAdapter(), "http", "127.0.0.1", port, count=2, timeout=1)
+        assert opened == 0
+
+
+class _Source(BaseSource):
+    name = "Fixed"
+    FEED_URL = "https://fixed.example.com/rss"
+
+    def crawl(self):
+        self.fetch_url("https://api.example.com/a")
+        self.fetch_url("https://api.example.com/b")
+        self.fetch_url("https://cdn.example.com/c")
+        return [Article(title="t", url="https://example.com/t", source=self.name)]
+
+
+class TestPlan:
+    def test_declared_and_learned_hosts(self, tmp_path):
+        rss = RSSSource(feeds=[{"url": "https://a.example.com/1.xml"}, {"url": "https://a.example.com/2.xml"},
+                               {"url": "http://b.example.com:8080/feed"}])
+        health = _health(tmp_path, {"Fixed": {"hosts": {"https://api.example.com": 5}}})
+        plan = plan_hosts([rss, _Source()], health)
+        assert plan == {"https://a.example.com": 2, "http://b.example.com:8080": 1,
+                        "https://fixed.example.com": 1, "https://api.example.com": 5}
+
+    def test_empty_plan(self):
+        stats = prewarm({})
+        assert stats == PrewarmStats()
+
+    def test_saved_ms(self):
+        assert PrewarmStats(handshake_ms=900, elapsed_ms=300).saved_ms == 600
+        assert PrewarmStats(handshake_ms=100, elapsed_ms=300).saved_ms == 0
+
+    def test_prewarm_local_server(self, server):
+        origin = f"http://127.0.0.1:{server.server_address[1]}"
+        stats = prewarm({origin: 3})
+        assert (stats.hosts, stats.connections, stats.failed) == (1, 2, 0)
+
+
+class TestEngine:
+    def test_records_hosts_contacted(self, tmp_path):
+        src = _Source()
+        engine = CrawlEngine(sources=[src], max_workers=1)
+        engine.health = _health(tmp_path)
+        with patch.object(BaseSource, "_fetch_with_retry", autospec=True,
+                          side_effect=lambda self, url, **kw: (self._note_request(url), "")[1]):
+            engine.crawl(dedupe_enabled=False)
+        assert engine.health.expected_hosts("Fixed") == {"https://api.example.com": 2,
+                                                         "https://cdn.example.com": 1}
+        assert engine.prewarm_stats is None
+
+    def test_prewarm_runs_before_sources(self, tmp_path):
+        engine = CrawlEngine(sources=[_Source()], max_workers=1, prewarm=True)
+        engine.health = _health(tmp_path)
+        with patch("clawler.engine.prewarm", return_value=PrewarmStats(hosts=1)) as warm, \
+                patch.object(BaseSource, "_fetch_with_retry", return_value=""):
+            engine.crawl(dedupe_enabled=False)
+        assert warm.call_args.args[0] == {"https://fixed.example.com": 1}
+        assert engine.prewarm_stats.hosts == 1
@@ -0,0 +1,116 @@
+"""Tests for pushing category/source/since filters down before crawling."""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import inspect
+import re
+from unittest.mock import patch
+
+import pytest
+
+from clawler.engine import CrawlEngine
+from clawler.pushdown import CrawlFilter
+from clawler.registry import SOURCES
+from clawler.sources.nejm import NEJMSource
+from clawler.sources.rss import RSSSource, _parse_feed
+
+FEEDS = [
+    {"url": "https://a.example.com/feed", "source": "Tech Daily", "category": "tech"},
+    {"url": "https://b.example.com/feed", "source": "Bonsai Weekly", "category": "bonsai"},
+    {"url": "https://c.example.com/feed", "source": "World Wire", "category": "world"},
+    {"url": "https://d.example.com/feed", "source": "Tech Monthly", "category": "tech"},
+]
+
+
+@pytest.fixture(autouse=True)
+def _no_health_writes(tmp_path):
+    with patch("clawler.health.HEALTH_PATH", str(tmp_path / "health.json")):
+        yield
+
+
+def _feed_xml(*ages_hours):
+    now = datetime.now(tz=timezone.utc)
+    items = "".join(
+        f"<item><title>Story {i}</title><link>https://example.com/{i}</link>"
+        f"<pubDate>{format_datetime(now - timedelta(hours=h))}</pubDate></item>"
+        for i, h in enumerate(ages_hours)
+    )
+    return f"<rss version='2.0'><channel><title>T</title>{items}</channel></rss>"
+
+
+class TestCrawlFilter:
+    def test_from_options(self):
+        f = CrawlFilter.from_options(category="Tech, science", source="Ars")
+        assert f.categories == {"tech", "science"}
+        assert f.source == "ars"
+        assert f.active
+        assert CrawlFilter.from_options(category="all").categories is None
+        assert not CrawlFilter.from_options(category="all").active
+
+    def test_category_may_match(self):
+        f = CrawlFilter.from_options(category="tech", exclude_category="world")
+        assert f.category_may_match({"tech", "world"})
+        assert not f.category_may_match({"health"})
+        assert not CrawlFilter.from_options(exclude_category="health").category_may_match({"health"})
+
+    def test_feed_matches_source(self):
+        f = CrawlFilter.from_options(source="tech", exclude_source="monthly")
+        assert f.feed_matches("tech", "Tech Daily")
+        assert not f.feed_matches("tech", "Tech Monthly")
+        assert not f.feed_matches("world", "World Wire")
+
+
+class TestPrune:
+    def test_rss_feeds_pruned_by_category(self):
+        rss = RSSSource(feeds=list(FEEDS))
+        kept, stats = CrawlFilter.from_options(category="tech").prune([rss])
+        assert kept == [rss]
+        assert [f["source"] for f in rss.feeds] == ["Tech Daily", "Tech Monthly"]
+        assert stats.feeds_skipped == 2
+
+    def test_static_category_source_skipped(self):
+        nejm, rss = NEJMSource(), RSSSource(feeds=list(FEEDS))
+        kept, stats = CrawlFilter.from_options(category="tech").prune([nejm, rss])
+        assert kept == [rss]
+        assert stats.sources_skipped == ["nejm"]
+        kept, _ = CrawlFilter.from_options(category="health").prune([NEJMSource()])
+        assert len(kept) == 1
+
+    @pytest.mark.parametrize("entry", [e for e in SOURCES if e.categories is not None], ids=lambda e: e.key)
+    def test_static_categories_match_source(self, entry):
+        code = inspect.getsource(inspect.getmodule(entry.load_class()))
+        emitted = set(re.findall(r'(?:category=|DEFAULT_CATEGORY = )"([^"]+)"', code))
+        assert emitted and emitted <= entry.categories
+        assert not re.search(r"category=(?!\"|self\.DEFAULT_CATEGORY)", code)
+
+    def test_source_with_no_matching_feeds_is_dropped(self):
+        kept, stats = CrawlFilter.from_options(category="sports").prune([RSSSource(feeds=list(FEEDS))])
+        assert kept == []
+        assert stats.sources_skipped == ["rss"]
+        assert stats.feeds_skipped == 4
+
+    def test_engine_never_fetches_pruned_feeds(self):
+        rss = RSSSource(feeds=list(FEEDS))
+        fetched = []
+        with patch.object(rss, "fetch_url", side_effect=lambda url, **kw: fetched.append(url) or ""):
+            engine = CrawlEngine(sources=[rss, NEJMSource()], max_workers=2,
+                                 crawl_filter=CrawlFilter.from_options(category="world"))
+            engine.crawl()
+        assert fetched == ["https://c.example.com/feed"]
+        assert engine.pushdown.sources_skipped == ["nejm"]
+        assert engine.pushdown.feeds_skipped == 3
+
+
+class TestSince:
+    def test_parse_feed_drops_old_entries(self):
+        since = datetime.now(tz=timezone.utc) - timedelta(hours=2)
+        entries, articles = _parse_feed(_feed_xml(1, 5, 0.5), "T", "tech", since)
+        assert entries == 3
+        assert [a.title for a in articles] == ["Story 0", "Story 2"]
+
+    def test_since_passed_to_sources(self):
+        since = datetime.now(tz=timezone.utc) - timedelta(hours=2)
+        rss = RSSSource(feeds=list(FEEDS[:1]))
+        CrawlFilter(since=since).prune([rss])
+        assert rss.since == since
+        with patch.object(rss, "fetch_url", return_value=_feed_xml(1, 5)):
+            assert [a.title for a in rss.crawl()] == ["Story 0"]
@@ -1,6 +1,9 @@
 """Tests for per-domain rate limiting in BaseSource."""
 import time
-from clawler.sources.base import _domain_last_request, _RATE_LIMIT_SECONDS, BaseSource
+from clawler.sources.base import BaseSource
+from clawler.sources.rate_limit import DEFAULT_RATE, get_rate_limiter
+
+_RATE_LIMIT_SECONDS = 1 / DEFAULT_RATE
 
 
 class DummySource(BaseSource):
@@ -10,14 +13,14 @@ class DummySource(BaseSource):
 
 
 def test_rate_limit_records_domain():
-    _domain_last_request.clear()
+    get_rate_limiter().reset()
     src = DummySource()
     src._rate_limit("https://example.com/page1")
-    assert "example.com" in _domain_last_request
+    assert "example.com" in get_rate_limiter().buckets
 
 
 def test_rate_limit_delays_same_domain():
-    _domain_last_request.clear()
+    get_rate_limiter().reset()
     src = DummySource()
     src._rate_limit("https://example.com/a")
     t0 = time.time()
@@ -28,7 +31,7 @@ def test_rate_limit_delays_same_domain():
 
 
 def test_rate_limit_no_delay_different_domain():
-    _domain_last_request.clear()
+    get_rate_limiter().reset()
     src = DummySource()
     src._rate_limit("https://example.com/a")
     t0 = time.time()
@@ -1,7 +1,10 @@
 """Tests for the improved rate limiter (v2.9.0 — lock-free sleep)."""
 import time
 import threading
-from clawler.sources.base import _domain_last_request, _RATE_LIMIT_SECONDS, BaseSource
+from clawler.sources.base import BaseSource
+from clawler.sources.rate_limit import DEFAULT_RATE, get_rate_limiter
+
+_RATE_LIMIT_SECONDS = 1 / DEFAULT_RATE
 
 
 class DummySource(BaseSource):
@@ -12,7 +15,7 @@ class DummySource(BaseSource):
 
 def test_different_domains_not_blocked():
     """Requests to different domains should proceed without waiting."""
-    _domain_last_request.clear()
+    get_rate_limiter().reset()
     src = DummySource()
     src._rate_limit("https://slow.com/a")
     t0 = time.time()
@@ -23,7 +26,7 @@ def test_different_domains_not_blocked():
 
 def test_concurrent_different_domains():
     """Two threads hitting different domains should both complete quickly."""
-    _domain_last_request.clear()
+    get_rate_limiter().reset()
     src = DummySource()
     results = {}
 
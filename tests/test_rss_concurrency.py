@@ -0,0 +1,166 @@
+"""Tests for concurrent per-feed fetching in RSSSource."""
+import threading
+import time
+from urllib.parse import urlparse
+
+from clawler.sources.rss import RSSSource, _interleave_by_host
+
+
+def _rss(title: str, link: str) -> str:
+    return f"""<?xml version="1.0"?>
+    <rss version="2.0"><channel>
+      <item><title>{title}</title><link>{link}</link></item>
+    </channel></rss>"""
+
+
+def _feeds(hosts, per_host=1):
+    return [
+        {"url": f"https://{h}/feed{i}.xml", "source": f"{h}-{i}", "category": "tech"}
+        for h in hosts for i in range(per_host)
+    ]
+
+
+class TestInterleave:
+    def test_round_robin_across_hosts(self):
+        feeds = _feeds(["a.com", "b.com"], per_host=2)
+        ordered = [urlparse(f["url"]).netloc for f in _interleave_by_host(feeds)]
+        assert ordered == ["a.com", "b.com", "a.com", "b.com"]
+
+    def test_keeps_every_feed(self):
+        feeds = _feeds(["a.com", "b.com", "c.com"], per_host=3)
+        assert len(_interleave_by_host(feeds)) == 9
+
+
+class TestConcurrentCrawl:
+    def test_feeds_fetched_in_parallel(self):
+        feeds = _feeds([f"h{i}.com" for i in range(8)])
+        src = RSSSource(feeds=feeds, max_workers=8)
+
+        def slow_fetch(url, **kw):
+            time.sleep(0.2)
+            return _rss("T " + url, url + "/post")
+
+        src.fetch_url = slow_fetch
+        t0 = time.monotonic()
+        articles = src.crawl()
+        elapsed = time.monotonic() - t0
+        assert len(articles) == 8
+        assert elapsed < 0.2 * 8 / 2
+
+    def test_per_host_limit_respected(self):
+        feeds = _feeds(["busy.com"], per_host=6)
+        src = RSSSource(feeds=feeds, max_workers=6, per_host_limit=2)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def fetch(url, **kw):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+            return _rss("T " + url, url + "/post")
+
+        src.fetch_url = fetch
+        src.crawl()
+        assert state["peak"] <= 2
+
+    def test_partial_results_when_feeds_fail(self):
+        feeds = _feeds(["ok.com", "bad.com", "empty.com"])
+        src = RSSSource(feeds=feeds)
+
+        def fetch(url, **kw):
+            if "bad.com" in url:
+                raise RuntimeError("boom")
+            if "empty.com" in url:
+                return ""
+            return _rss("Good story", "https://ok.com/story")
+
+        src.fetch_url = fetch
+        articles = src.crawl()
+        assert [a.title for a in articles] == ["Good story"]
+
+    def test_output_follows_feed_order(self):
+        feeds = _feeds(["a.com", "b.com", "c.com"])
+        src = RSSSource(feeds=feeds, max_workers=3)
+        delays = {"a.com": 0.15, "b.com": 0.05, "c.com": 0.0}
+
+        def fetch(url, **kw):
+            host = urlparse(url).netloc
+            time.sleep(delays[host])
+            return _rss(host, f"https://{host}/x")
+
+        src.fetch_url = fetch
+        assert [a.title for a in src.crawl()] == ["a.com", "b.com", "c.com"]
+
+    def test_duplicate_feed_urls_fetched_once(self):
+        feed = {"url": "https://a.com/feed", "source": "A", "category": "tech"}
+        src = RSSSource(feeds=[feed, dict(feed)])
+        calls = []
+
+        def fetch(url, **kw):
+            calls.append(url)
+            return _rss("A", "https://a.com/x")
+
+        src.fetch_url = fetch
+        assert len(src.crawl()) == 1
+        assert calls == ["https://a.com/feed"]
+
+
+class TestFeedTimings:
+    def test_timings_recorded_per_feed(self):
+        feeds = _feeds(["a.com", "b.com"])
+        src = RSSSource(feeds=feeds)
+
+        def fetch(url, **kw):
+            if "b.com" in url:
+                return ""
+            time.sleep(0.02)
+            return _rss("A", "https://a.com/x")
+
+        src.fetch_url = fetch
+        src.crawl()
+        assert set(src.feed_timings) == {f["url"] for f in feeds}
+        a = src.feed_timings["https://a.com/feed0.xml"]
+        assert a["ok"] is True and a["entries"] == 1 and a["elapsed_ms"] >= 15
+        assert src.feed_timings["https://b.com/feed0.xml"]["ok"] is False
+
+    def test_empty_feed_is_ok(self):
+        src = RSSSource(feeds=_feeds(["quiet.com"]))
+        src.fetch_url = lambda url, **kw: '<?xml version="1.0"?><rss version="2.0"><channel></channel></rss>'
+        assert src.crawl() == []
+        timing = src.feed_timings["https://quiet.com/feed0.xml"]
+        assert timing["ok"] is True and timing["entries"] == 0
+
+    def test_slowest_feeds(self):
+        feeds = _feeds(["fast.com", "slow.com"])
+        src = RSSSource(feeds=feeds)
+
+        def fetch(url, **kw):
+            time.sleep(0.05 if "slow" in url else 0)
+            return _rss("x", url + "/x")
+
+        src.fetch_url = fetch
+        src.crawl()
+        assert src.slowest_feeds(1)[0]["source"] == "slow.com-0"
+
+    def test_stats_show_slowest_feeds(self, capsys):
+        from unittest.mock import patch
+
+        from clawler.cli import main
+        from clawler.dedup import DedupStats
+        from clawler.engine import CrawlEngine
+
+        def fake_crawl(self, **kw):
+            (rss,) = self.sources
+            rss.feed_timings = {
+                "https://a.com/f": {"source": "Fast", "elapsed_ms": 12.0, "entries": 3, "ok": True},
+                "https://b.com/f": {"source": "Slow", "elapsed_ms": 900.0, "entries": 0, "ok": False},
+            }
+            return [], {"rss": 0}, DedupStats()
+
+        with patch.object(CrawlEngine, "crawl", fake_crawl):
+            main(["--only", "rss", "--stats", "--no-config"])
+        out = capsys.readouterr().out
+        assert "RSS feeds: 2 (1 failed), slowest: Slow (900ms), Fast (12ms)" in out
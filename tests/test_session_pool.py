@@ -1,6 +1,7 @@
 """Tests for connection pooling via shared requests.Session."""
 import threading
 from clawler.sources.base import _get_session, _session_lock
+from clawler.sources.connections import DEFAULT_POOL_MAXSIZE, POOL_HOSTS
 
 
 class TestSessionPool:
@@ -17,8 +18,8 @@ class TestSessionPool:
         session = _get_session()
         adapter = session.get_adapter("https://example.com")
         assert adapter is not None
-        assert adapter._pool_connections == 20
-        assert adapter._pool_maxsize == 20
+        assert adapter._pool_connections == POOL_HOSTS
+        assert adapter._pool_maxsize == DEFAULT_POOL_MAXSIZE
 
     def test_thread_safe(self):
         """Multiple threads should all get the same session."""
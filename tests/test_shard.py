@@ -0,0 +1,339 @@
+"""Tests for sharded crawls and the shard transports."""
+import threading
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from clawler.models import Article
+from clawler.pushdown import CrawlFilter
+from clawler.shard import (
+    LocalProcessTransport, ShardResult, ShardTask, ShardTransport, ShardedCrawlEngine,
+    SocketTransport, build_shard_sources, configure_shard_process, crawl_shard, make_shard_server,
+    shard_feeds, shard_keys, shard_of,
+)
+from clawler.sources.rss import DEFAULT_FEEDS
+
+
+@pytest.fixture(autouse=True)
+def _no_health_writes(tmp_path):
+    with patch("clawler.health.HEALTH_PATH", str(tmp_path / "health.json")):
+        yield
+
+
+def _article(title, source="src", n=1):
+    return Article(title=title, url=f"https://{source}.example.com/{n}", source=source,
+                   timestamp=datetime.now(tz=timezone.utc))
+
+
+_TOPICS = ["Rust compiler release notes", "Volcano erupts near Iceland town", "Central bank holds interest rates"]
+
+
+def _fake_crawl(task):
+    """Shard i returns one article from its own source and one shared story."""
+    return ShardResult(
+        index=task.index,
+        articles=[_article(_TOPICS[task.index], f"s{task.index}"),
+                  _article("Everyone covers this big announcement", "rss", n=task.index)],
+        stats={f"s{task.index}": 1, "rss": 1},
+        timings_ms={f"s{task.index}": 100.0 * (task.index + 1), "rss": 50.0 * (task.index + 1)},
+    )
+
+
+class FakeTransport(ShardTransport):
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.tasks = []
+
+    def run(self, tasks):
+        self.tasks = tasks
+        for task in tasks:
+            if task.index in self.fail:
+                yield ShardResult(index=task.index, error="boom")
+            else:
+                yield _fake_crawl(task)
+
+
+class TestSharding:
+    def test_shard_of_is_stable(self):
+        assert shard_of("https://example.com/feed", 8) == shard_of("https://example.com/feed", 8)
+        assert all(0 <= shard_of(f"key{i}", 5) < 5 for i in range(100))
+
+    def test_feeds_partitioned_exactly_once(self):
+        parts = [shard_feeds(DEFAULT_FEEDS, i, 4) for i in range(4)]
+        urls = [f["url"] for part in parts for f in part]
+        assert sorted(urls) == sorted(f["url"] for f in DEFAULT_FEEDS)
+        assert all(parts)
+
+    def test_rss_in_every_shard(self):
+        keys = ["rss", "hackernews", "reddit", "lobsters", "github"]
+        parts = [shard_keys(keys, i, 3) for i in range(3)]
+        assert all("rss" in p for p in parts)
+        others = sorted(k for p in parts for k in p if k != "rss")
+        assert others == sorted(keys[1:])
+
+    def test_build_shard_sources_splits_rss_feeds(self):
+        feeds = [{"url": f"https://host{i}.example.com/feed", "source": f"F{i}"} for i in range(20)]
+        seen = []
+        for i in range(3):
+            task = ShardTask(index=i, count=3, keys=["rss"], rss_feeds=feeds, timeout=7)
+            for src in build_shard_sources(task):
+                assert src.timeout == 7
+                seen.extend(f["url"] for f in src.feeds)
+        assert sorted(seen) == sorted(f["url"] for f in feeds)
+
+    def test_build_shard_sources_applies_source_settings(self):
+        task = ShardTask(index=0, count=1, keys=["rss", "hn"], fetch_retries=0,
+                         rss_workers=3, rss_per_host=1)
+        sources = {type(src).__name__: src for src in build_shard_sources(task)}
+        assert set(sources) == {"RSSSource", "HackerNewsSource"}
+        assert all(src.max_retries == 0 for src in sources.values())
+        assert sources["RSSSource"].max_workers == 3
+        assert sources["RSSSource"].per_host_limit == 1
+
+    def test_crawl_shard_applies_filter_pushdown(self):
+        feeds = [{"url": "https://sci.example.com/feed", "source": "Sci", "category": "science"}]
+        crawl_filter = CrawlFilter.from_options(category="tech")
+        task = ShardTask(index=0, count=1, keys=["rss"], rss_feeds=feeds,
+                         crawl_filter=crawl_filter.to_dict())
+        result = crawl_shard(task)
+        assert result.articles == []
+        assert result.feeds_skipped == 1
+        assert result.sources_skipped
+
+    def test_configure_shard_process_applies_settings(self, tmp_path):
+        from clawler.http_archive import configure_http_archive, get_http_archive
+        from clawler.sources.rate_limit import configure_rate_limits, get_rate_limiter
+
+        task = ShardTask(index=0, count=1, keys=[], replay=str(tmp_path), replay_latency=0.5,
+                         rate_limits={"example.com": 0.25})
+        try:
+            configure_shard_process(task)
+            archive = get_http_archive()
+            assert archive.replaying and archive.latency_scale == 0.5
+            assert get_rate_limiter().limit_for("example.com").rate == 0.25
+        finally:
+            configure_http_archive()
+            configure_rate_limits()
+
+    def test_configure_shard_process_resets_previous_task(self, tmp_path):
+        from clawler.http_archive import get_http_archive
+        from clawler.http_cache import get_http_cache
+        from clawler.sources.rate_limit import get_rate_limiter
+
+        configure_shard_process(ShardTask(index=0, count=1, keys=[], record=str(tmp_path / "arc"),
+                                          rate_limits={"example.com": 0.25}))
+        assert not get_http_archive().replaying and get_http_cache() is None
+        configure_shard_process(ShardTask(index=0, count=1, keys=[], http_cache_dir=str(tmp_path / "http")))
+        assert get_http_archive() is None
+        assert get_http_cache().cache_dir == tmp_path / "http"
+        assert get_rate_limiter().limit_for("example.com").rate != 0.25
+
+    def test_one_shard_crawl_at_a_time(self):
+        state = {"active": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def fake(task):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            threading.Event().wait(0.05)
+            with lock:
+                state["active"] -= 1
+            return ShardResult(index=task.index)
+
+        with patch("clawler.shard._crawl_shard", side_effect=fake):
+            threads = [threading.Thread(target=crawl_shard, args=(ShardTask(index=i, count=3, keys=[]),))
+                       for i in range(3)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        assert state["peak"] == 1
+
+    def test_build_shard_sources_passes_podcast_feeds(self):
+        from dataclasses import asdict
+        from clawler.models import PodcastFeed
+
+        feed = PodcastFeed(name="Show", rss_url="https://pod.example.com/feed.xml")
+        task = ShardTask(index=0, count=1, keys=["podcast_rss"], podcast_feeds=[asdict(feed)])
+        (src,) = build_shard_sources(task)
+        assert src.feeds == [feed]
+
+    def test_build_shard_sources_applies_response_cap(self):
+        task = ShardTask(index=0, count=1, keys=["hn"], max_response_mb=2)
+        assert build_shard_sources(task)[0].max_response_bytes == 2 * 1024 * 1024
+        task.max_response_mb = 0
+        assert build_shard_sources(task)[0].max_response_bytes is None
+
+    def test_crawl_filter_round_trip(self):
+        crawl_filter = CrawlFilter.from_options(category="tech,science", exclude_source="Spam",
+                                                since=datetime(2026, 1, 1, tzinfo=timezone.utc))
+        assert CrawlFilter.from_dict(crawl_filter.to_dict()) == crawl_filter
+
+
+class TestShardedEngine:
+    def test_merges_dedups_and_sums_stats(self):
+        transport = FakeTransport()
+        engine = ShardedCrawlEngine(shards=3, keys=["rss"], transport=transport)
+        articles, stats, dedup_stats = engine.crawl()
+        assert len(transport.tasks) == 3
+        assert stats == {"s0": 1, "s1": 1, "s2": 1, "rss": 3}
+        titles = [a.title for a in articles]
+        assert titles.count("Everyone covers this big announcement") == 1
+        assert len(articles) == 4
+        assert engine.health.data["rss"]["response_times_ms"] == [150.0]
+        assert engine.health.data["rss"]["total_crawls"] == 1
+
+    def test_failed_shard_is_skipped(self):
+        engine = ShardedCrawlEngine(shards=2, keys=["rss"], transport=FakeTransport(fail={1}))
+        articles, stats, _ = engine.crawl()
+        assert stats == {"s0": 1, "rss": 1}
+        assert len(articles) == 2
+
+    def test_tasks_carry_filter_and_source_settings(self):
+        transport = FakeTransport()
+        crawl_filter = CrawlFilter.from_options(category="tech")
+        engine = ShardedCrawlEngine(shards=2, keys=["rss"], transport=transport, fetch_retries=0,
+                                    rss_workers=4, crawl_filter=crawl_filter)
+        engine.crawl()
+        assert all(t.fetch_retries == 0 and t.rss_workers == 4 for t in transport.tasks)
+        assert all(CrawlFilter.from_dict(t.crawl_filter) == crawl_filter for t in transport.tasks)
+
+    def test_task_settings_sent_to_every_shard(self):
+        transport = FakeTransport()
+        engine = ShardedCrawlEngine(shards=2, keys=["rss"], transport=transport,
+                                    task_settings={"replay": "/tmp/archive", "breaker_threshold": 0})
+        engine.crawl()
+        assert all(t.replay == "/tmp/archive" and t.breaker_threshold == 0 for t in transport.tasks)
+        assert engine.health.breaker.threshold == 0
+
+    def test_shard_circuit_outcomes_are_saved(self, tmp_path):
+        from clawler import health
+        from clawler.circuit import OPEN, host_key, source_key
+
+        class FailingTransport(ShardTransport):
+            def run(self, tasks):
+                for task in tasks:
+                    yield ShardResult(index=task.index, circuit_events=[
+                        [host_key("https://dead.example.com/"), "failure"], [source_key("rss"), "success"]])
+
+        for _ in range(3):
+            ShardedCrawlEngine(shards=1, keys=["rss"], transport=FailingTransport()).crawl()
+        saved = health.HealthTracker().breaker
+        assert saved.admit(host_key("https://dead.example.com/")) == OPEN
+
+    def test_crawl_shard_reports_circuit_events(self):
+        from clawler.circuit import OPEN, CircuitBreaker, url_key
+
+        url = "https://down.example.com/feed"
+        breaker = CircuitBreaker(threshold=1)
+        breaker.record_failure(url_key(url))
+        task = ShardTask(index=0, count=1, keys=["rss"], circuits=breaker.to_dict(), breaker_threshold=1,
+                         rss_feeds=[{"url": url, "source": "Down", "category": "tech"}])
+        result = crawl_shard(task)
+        assert [url_key(url), "skipped"] in result.circuit_events
+        coordinator = CircuitBreaker.from_dict(breaker.to_dict(), threshold=1)
+        coordinator.replay(result.circuit_events)
+        assert coordinator.circuits[url_key(url)].skipped == 1
+        assert coordinator.admit(url_key(url)) == OPEN
+
+    def test_podcasts_and_prewarm_sent_to_shards(self):
+        from clawler.models import PodcastFeed
+
+        class WarmTransport(FakeTransport):
+            def run(self, tasks):
+                for result in super().run(tasks):
+                    result.prewarm = {"hosts": 2, "connections": 3, "failed": 0,
+                                      "handshake_ms": 40.0, "elapsed_ms": 25.0 + result.index}
+                    yield result
+
+        transport = WarmTransport()
+        engine = ShardedCrawlEngine(shards=2, keys=["podcast_rss"], transport=transport, prewarm=True,
+                                    podcast_feeds=[PodcastFeed(name="Show", rss_url="https://p.example.com/f")])
+        engine.crawl()
+        assert all(t.prewarm and t.podcast_feeds[0]["name"] == "Show" for t in transport.tasks)
+        warm = engine.prewarm_stats
+        assert (warm.hosts, warm.connections, warm.handshake_ms, warm.elapsed_ms) == (4, 6, 80.0, 26.0)
+
+    def test_invalid_task_setting_rejected(self):
+        with pytest.raises(ValueError):
+            ShardedCrawlEngine(shards=2, task_settings={"index": 1})
+
+    def test_crawl_iter_streams_shards(self):
+        engine = ShardedCrawlEngine(shards=2, keys=["rss"], transport=FakeTransport())
+        assert len(list(engine.crawl_iter())) == 3
+
+
+class TestTransports:
+    def test_socket_transport_round_trip(self, tmp_path):
+        address = str(tmp_path / "shard.sock")
+        server = make_shard_server(address, crawl=_fake_crawl)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            tasks = [ShardTask(index=i, count=2, keys=[]) for i in range(2)]
+            results = sorted(SocketTransport([address], timeout=10).run(tasks), key=lambda r: r.index)
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert [r.index for r in results] == [0, 1]
+        assert results[1].articles[0].title == _TOPICS[1]
+        assert results[1].articles[0].timestamp is not None
+        assert results[0].timings_ms == {"s0": 100.0, "rss": 50.0}
+
+    def _serve(self, address, **kwargs):
+        server = make_shard_server(address, crawl=_fake_crawl, **kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    def test_token_required_when_set(self):
+        server = self._serve("127.0.0.1:0", token="s3cret")
+        address = "127.0.0.1:%d" % server.server_address[1]
+        try:
+            task = [ShardTask(index=0, count=1, keys=[])]
+            assert "bad token" in list(SocketTransport([address], timeout=10).run(task))[0].error
+            assert "bad token" in list(SocketTransport([address], timeout=10, token="nope").run(task))[0].error
+            ok = list(SocketTransport([address], timeout=10, token="s3cret").run(task))[0]
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert ok.error is None and ok.articles
+
+    def test_public_tcp_needs_token(self):
+        with pytest.raises(ValueError, match="token"):
+            make_shard_server("0.0.0.0:0")
+        make_shard_server("0.0.0.0:0", token="s3cret").server_close()
+
+    def test_paths_refused_over_the_network(self, tmp_path):
+        address = str(tmp_path / "shard.sock")
+        server = self._serve(address)
+        try:
+            tasks = [ShardTask(index=0, count=3, keys=[], record=str(tmp_path / "arc")),
+                     ShardTask(index=1, count=3, keys=[], http_cache_dir="/etc"),
+                     ShardTask(index=2, count=3, keys=[])]
+            results = sorted(SocketTransport([address], timeout=10).run(tasks), key=lambda r: r.index)
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert "can't be set over the network" in results[0].error
+        assert "can't be set over the network" in results[1].error
+        assert results[2].error is None
+        assert not (tmp_path / "arc").exists()
+
+    def test_socket_transport_reports_unreachable_worker(self, tmp_path):
+        results = list(SocketTransport([str(tmp_path / "missing.sock")], timeout=1).run(
+            [ShardTask(index=0, count=1, keys=[])]))
+        assert results[0].error
+
+    def test_local_process_transport(self):
+        tasks = [ShardTask(index=i, count=2, keys=[]) for i in range(2)]
+        results = list(LocalProcessTransport().run(tasks))
+        assert sorted(r.index for r in results) == [0, 1]
+        assert all(r.error is None and r.articles == [] for r in results)
+
+    def test_local_process_transport_applies_task_settings(self, tmp_path):
+        # Spawned workers start unconfigured; a bad replay dir proves the setting arrived
+        tasks = [ShardTask(index=0, count=1, keys=[], replay=str(tmp_path / "missing"))]
+        results = list(LocalProcessTransport().run(tasks))
+        assert "No archive" in results[0].error
@@ -0,0 +1,150 @@
+"""Tests for cooperative per-source deadlines and partial-result salvage."""
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from clawler.engine import CrawlEngine
+from clawler.models import Article
+from clawler.sources.base import BaseSource
+from clawler.sources.reddit import RedditSource
+from clawler.sources.rss import RSSSource
+
+
+class PlainSource(BaseSource):
+    name = "plain"
+
+    def crawl(self):
+        return []
+
+
+class HungSource(BaseSource):
+    """Ignores its deadline entirely (e.g. stuck in a C call)."""
+    name = "hung"
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def crawl(self):
+        self.release.wait(5)
+        return [Article(title="Too late", url="https://hung.example.com/1", source=self.name,
+                        timestamp=datetime.now(tz=timezone.utc))]
+
+
+def _reddit_listing(sub):
+    return {"data": {"children": [{"data": {
+        "title": f"Post from {sub}", "url": f"https://example.com/{sub}", "permalink": f"/r/{sub}/1",
+        "score": 100, "num_comments": 10, "upvote_ratio": 0.9, "created_utc": 1700000000,
+    }}]}}
+
+
+@pytest.fixture(autouse=True)
+def _no_health_writes(tmp_path):
+    with patch("clawler.health.HEALTH_PATH", str(tmp_path / "health.json")):
+        yield
+
+
+class TestBudget:
+    def test_no_deadline_by_default(self):
+        src = PlainSource()
+        assert src.remaining_budget() is None
+        assert src.budget_expired is False
+        assert src._request_timeout() == src.timeout
+
+    def test_expired_deadline_skips_fetch(self):
+        src = PlainSource()
+        src.set_deadline(time.monotonic() - 1)
+        with patch("clawler.sources.base._get_session") as get_session:
+            assert src.fetch_url("https://example.com/") == ""
+            assert src.fetch_json("https://example.com/x.json") is None
+        get_session.assert_not_called()
+
+    def test_request_timeout_clamped_to_budget(self):
+        src = PlainSource()
+        src.timeout = 15
+        src.set_deadline(time.monotonic() + 2)
+        session = MagicMock()
+        session.get.return_value.iter_content.return_value = [b"ok"]
+        session.get.return_value.encoding = "utf-8"
+        with patch("clawler.sources.base._get_session", return_value=session):
+            assert src.fetch_url("https://clamp.example.com/") == "ok"
+        assert session.get.call_args.kwargs["timeout"] <= 2
+
+    def test_no_retry_when_backoff_exceeds_budget(self):
+        src = PlainSource()
+        src.max_retries = 3
+        src.retry_backoff = 5.0
+        src.set_deadline(time.monotonic() + 1)
+        session = MagicMock()
+        session.get.side_effect = requests.ConnectionError("refused")
+        with patch("clawler.sources.base._get_session", return_value=session):
+            t0 = time.monotonic()
+            assert src.fetch_url("https://retry.example.com/") == ""
+        assert session.get.call_count == 1
+        assert time.monotonic() - t0 < 1
+
+
+class TestEngineDeadlines:
+    def test_multi_url_source_returns_partial_results(self):
+        subs = [f"sub{i}" for i in range(40)]
+        src = RedditSource(subreddits=subs)
+
+        def slow_fetch(url, **kw):
+            time.sleep(0.15)
+            return _reddit_listing(url.split("/r/")[1].split("/")[0])
+
+        src.fetch_json = slow_fetch
+        engine = CrawlEngine(sources=[src], retries=0, source_timeout=0.5)
+        articles, stats, _ = engine.crawl()
+        assert 1 <= stats["reddit"] < len(subs)
+        assert articles
+        assert src._deadline is None  # cleared once the source returns
+
+    def test_rss_feeds_stop_after_deadline(self):
+        feeds = [{"url": f"https://h{i}.com/feed", "source": f"h{i}", "category": "tech"} for i in range(12)]
+        src = RSSSource(feeds=feeds, max_workers=2)
+        calls = []
+
+        def fetch(url, **kw):
+            calls.append(url)
+            time.sleep(0.15)
+            return f"""<?xml version="1.0"?><rss version="2.0"><channel>
+                <item><title>Story {url}</title><link>{url}/post</link></item></channel></rss>"""
+
+        src.fetch_url = fetch
+        _, stats, _ = CrawlEngine(sources=[src], retries=0, source_timeout=0.4).crawl()
+        assert 1 <= stats["rss"] < len(feeds)
+        assert len(calls) < len(feeds)
+
+    def test_unresponsive_source_abandoned_without_blocking(self):
+        hung = HungSource()
+        engine = CrawlEngine(sources=[hung, PlainSource()], retries=0, source_timeout=0.4)
+        t0 = time.monotonic()
+        _, stats, _ = engine.crawl()
+        elapsed = time.monotonic() - t0
+        hung.release.set()
+        assert stats == {"plain": 0, "hung": -1}
+        assert elapsed < 1.5
+
+    def test_worker_threads_are_daemons(self):
+        hung = HungSource()
+        CrawlEngine(sources=[hung], retries=0, source_timeout=0.2).crawl()
+        workers = [t for t in threading.enumerate() if t.name.startswith("clawler-worker")]
+        hung.release.set()
+        assert workers and all(t.daemon for t in workers)
+
+    def test_queued_sources_get_their_own_budget(self):
+        class Sleepy(BaseSource):
+            def __init__(self, name):
+                self.name = name
+
+            def crawl(self):
+                time.sleep(0.25)
+                return []
+
+        sources = [Sleepy(f"s{i}") for i in range(3)]
+        _, stats, _ = CrawlEngine(sources=sources, max_workers=1, retries=0, source_timeout=0.4).crawl()
+        assert stats == {"s0": 0, "s1": 0, "s2": 0}
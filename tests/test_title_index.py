@@ -0,0 +1,115 @@
+"""Tests for the fuzzy-title candidate index behind dedup tier 3."""
+import random
+import string
+from difflib import SequenceMatcher
+
+from clawler.dedup import Deduplicator, deduplicate
+from clawler.models import Article
+from clawler.title_index import SKETCH_SIZE, TitleIndex, title_sketch
+
+def _titles(n, seed=3):
+    rng = random.Random(seed)
+    words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9))) for _ in range(400)]
+    out = []
+    for _ in range(n):
+        if out and rng.random() < 0.3:
+            title = rng.choice(out).split()
+            title[rng.randrange(len(title))] = rng.choice(words)
+            out.append(" ".join(title) + rng.choice(["", " - reuters", " (update)"]))
+        else:
+            out.append(" ".join(rng.choice(words) for _ in range(rng.randint(6, 11))))
+    return out
+
+
+def _full_scan(titles, threshold=0.75):
+    kept, found = [], []
+    for t in titles:
+        for slot, prev in enumerate(kept):
+            if abs(len(t) - len(prev)) > max(len(t), len(prev)) * (1 - threshold):
+                continue
+            if SequenceMatcher(None, t, prev).ratio() > threshold:
+                found.append(slot)
+                break
+        else:
+            found.append(None)
+            kept.append(t)
+    return found
+
+
+def _run(index, titles):
+    found = []
+    for t in titles:
+        slot = index.find(t)
+        found.append(slot)
+        if slot is None:
+            index.add(t)
+    return found
+
+
+def test_small_index_matches_full_scan_exactly():
+    titles = _titles(300)
+    index = TitleIndex(0.75, lsh_min_titles=1000)
+    assert _run(index, titles) == _full_scan(titles)
+    assert not index.uses_lsh
+    assert index.comparisons < 300 * 299 / 2  # the prefilters skip most pairs
+
+
+def test_lsh_index_finds_the_same_first_matches():
+    titles = _titles(600)
+    index = TitleIndex(0.75, lsh_min_titles=50)
+    found = _run(index, titles)
+    assert index.uses_lsh
+    expected = _full_scan(titles)
+    assert sum(a != b for a, b in zip(found, expected)) <= 2
+    assert index.comparisons < len(titles) * 20
+
+
+def test_loose_thresholds_keep_the_full_scan():
+    titles = _titles(100)
+    index = TitleIndex(0.6, lsh_min_titles=10)
+    assert _run(index, titles) == _full_scan(titles, 0.6)
+    assert not index.uses_lsh
+
+
+def test_replace_moves_the_title():
+    index = TitleIndex(0.75, lsh_min_titles=1)
+    index.add("senate passes the budget bill after long debate")
+    index.add("rocket launch delayed by storm over the coast")
+    assert index.uses_lsh
+    index.replace(0, "chip maker reports record quarterly revenue")
+    assert index.find("senate passes the budget bill after a long debate") is None
+    assert index.find("chip maker reports record quarterly revenue - reuters") == 0
+    assert index.find("rocket launch delayed by a storm over the coast") == 1
+
+
+def test_sketch_is_stable_and_full():
+    sketch = title_sketch("rocket  launch delayed")
+    assert len(sketch) == SKETCH_SIZE
+    assert sketch == title_sketch("rocket launch delayed")  # whitespace is normalized
+    assert len(title_sketch("")) == len(title_sketch("ab")) == SKETCH_SIZE  # empty bins are filled
+
+
+def _article(title, i, quality=0.5):
+    return Article(title=title, url=f"https://example.com/{i}", source="Test", quality_score=quality)
+
+
+def test_deduplicate_on_a_large_batch():
+    titles = _titles(700)
+    articles = [_article(t.lower(), i) for i, t in enumerate(titles)]
+    kept = deduplicate(articles)
+    dd = Deduplicator()
+    streamed = [a for a in articles if dd.add(a)]
+    assert [a.url for a in kept] == [a.url for a in streamed]
+    assert dd._titles.uses_lsh
+
+
+def test_quality_upgrade_updates_the_index():
+    base = "storm knocks out power across the city for hours"
+    articles = [_article(t, i) for i, t in enumerate(_titles(520, seed=9))]
+    articles.append(_article(base, 900, quality=0.3))
+    articles.append(_article(base + " - reuters", 901, quality=0.9))
+    articles.append(_article(base + " - reuters live", 902, quality=0.1))
+    kept = deduplicate(articles)
+    winner = [a for a in kept if a.title.startswith(base)]
+    assert [a.url for a in winner] == ["https://example.com/901"]
+    assert winner[0].source_count == 2  # 902 matched the replacement title
@@ -0,0 +1,171 @@
+"""Tests for per-host token buckets, Retry-After and adaptive throttling."""
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from clawler.sources.base import BaseSource
+from clawler.sources.rate_limit import (
+    DEFAULT_THROTTLE_PAUSE, HostLimit, HostRateLimiter, configure_rate_limits, get_rate_limiter,
+    parse_retry_after,
+)
+
+
+class DummySource(BaseSource):
+    name = "dummy"
+
+    def crawl(self):
+        return []
+
+
+def _response(status, text="ok", headers=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.text = text
+    resp.iter_content.return_value = [text.encode("utf-8")]
+    resp.encoding = "utf-8"
+    resp.ok = status < 400
+    resp.headers = headers or {}
+    if status >= 400:
+        resp.raise_for_status.side_effect = requests.HTTPError(str(status))
+    return resp
+
+
+def test_host_limit_parse():
+    assert HostLimit.parse(5) == HostLimit(rate=5.0, burst=1)
+    assert HostLimit.parse({"rate": 3, "burst": 6}) == HostLimit(rate=3.0, burst=6)
+
+
+def test_host_limit_rejects_nonpositive_rate_and_burst():
+    for value in (0, -1, float("nan"), {"rate": 0}, {"rate": 2, "burst": 0}):
+        with pytest.raises(ValueError):
+            HostLimit.parse(value)
+    with pytest.raises(ValueError):
+        configure_rate_limits({"example.com": {"rate": -2}})
+
+
+def test_limit_for_matches_subdomains():
+    limiter = HostRateLimiter({"example.com": {"rate": 10, "burst": 5}, "default": 1})
+    assert limiter.limit_for("example.com").rate == 10
+    assert limiter.limit_for("feeds.example.com").burst == 5
+    assert limiter.limit_for("notexample.com").rate == 1
+    # Built-in entries for the big multi-feed hosts
+    assert limiter.limit_for("hnrss.org").burst > 1
+
+
+def test_burst_then_rate():
+    limiter = HostRateLimiter({"fast.test": {"rate": 10, "burst": 3}})
+    waits = [limiter.reserve("https://fast.test/x") for _ in range(5)]
+    assert waits[:3] == [0, 0, 0]
+    assert 0.05 < waits[3] <= 0.1
+    assert 0.15 < waits[4] <= 0.2
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(None) is None
+    assert parse_retry_after(MagicMock()) is None
+    assert parse_retry_after("garbage") is None
+    future = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 60))
+    assert 50 < parse_retry_after(future) <= 60
+
+
+def test_throttle_pauses_and_halves_rate():
+    limiter = HostRateLimiter({"busy.test": {"rate": 8, "burst": 8}})
+    url = "https://busy.test/feed"
+    limiter.reserve(url)
+    limiter.throttled(url, "3")
+    bucket = limiter.buckets["busy.test"]
+    assert bucket.rate == 4
+    assert 2.5 < limiter.delay(url) <= 3
+    assert limiter.reserve(url) >= 3
+    for _ in range(20):
+        limiter.succeeded(url)
+    assert bucket.rate == 8
+
+
+def test_throttle_without_retry_after_uses_default_pause():
+    limiter = HostRateLimiter()
+    limiter.throttled("https://x.test/", None)
+    assert DEFAULT_THROTTLE_PAUSE - 1 < limiter.delay("https://x.test/") <= DEFAULT_THROTTLE_PAUSE
+
+
+def test_fetch_retries_after_429_honouring_retry_after():
+    configure_rate_limits({"default": {"rate": 100, "burst": 10}})
+    session = MagicMock()
+    session.get.side_effect = [_response(429, headers={"Retry-After": "0.3"}), _response(200, "body")]
+    src = DummySource()
+    src.retry_backoff = 30  # would dominate if the normal backoff were used
+    with patch("clawler.sources.base._get_session", return_value=session):
+        t0 = time.monotonic()
+        assert src.fetch_url("https://limited.test/feed") == "body"
+        elapsed = time.monotonic() - t0
+    assert 0.25 <= elapsed < 5
+    assert get_rate_limiter().buckets["limited.test"].throttled == 1
+
+
+def test_fetch_gives_up_when_pause_exceeds_budget():
+    get_rate_limiter().throttled("https://limited.test/", "120")
+    session = MagicMock()
+    src = DummySource()
+    src.set_deadline(time.monotonic() + 2)
+    with patch("clawler.sources.base._get_session", return_value=session):
+        assert src.fetch_url("https://limited.test/feed") == ""
+    session.get.assert_not_called()
+
+
+def test_async_rate_limit_shares_buckets():
+    configure_rate_limits({"default": {"rate": 5, "burst": 1}})
+
+    async def run():
+        t0 = time.monotonic()
+        await BaseSource._async_rate_limit("https://a.test/1")
+        await BaseSource._async_rate_limit("https://a.test/2")
+        return time.monotonic() - t0
+
+    assert asyncio.run(run()) >= 0.15
+    assert "a.test" in get_rate_limiter().buckets
+
+
+
+def test_pause_while_waiting_keeps_the_same_token():
+    limiter = configure_rate_limits({"default": {"rate": 10, "burst": 1}})
+    url = "https://paused.test/feed"
+    limiter.reserve(url)
+    real_sleep = time.sleep
+    calls = []
+
+    def fake_sleep(seconds):
+        if not calls:
+            limiter.throttled(url, "0.2")
+        calls.append(seconds)
+        real_sleep(seconds)
+
+    with patch("clawler.sources.base.time.sleep", side_effect=fake_sleep):
+        BaseSource._rate_limit(url)
+    assert len(calls) == 2
+    assert limiter.delay(url) == 0
+    # One token for the call above, one for _rate_limit; a second reservation would reach -2
+    assert -1.5 < limiter.buckets["paused.test"].tokens <= -0.9
+
+
+def test_async_pause_while_waiting_keeps_the_same_token():
+    limiter = configure_rate_limits({"default": {"rate": 10, "burst": 1}})
+    url = "https://paused.test/feed"
+    limiter.reserve(url)
+    real_sleep = asyncio.sleep
+    calls = []
+
+    async def fake_sleep(seconds):
+        if not calls:
+            limiter.throttled(url, "0.2")
+        calls.append(seconds)
+        await real_sleep(seconds)
+
+    with patch("clawler.sources.base.asyncio.sleep", side_effect=fake_sleep):
+        asyncio.run(BaseSource._async_rate_limit(url))
+    assert len(calls) == 2
+    assert limiter.delay(url) == 0
+    assert -1.5 < limiter.buckets["paused.test"].tokens <= -0.9
@@ -120,9 +120,9 @@ class TestCountFlag:
 class TestRSSRateLimiting:
     def test_rss_uses_fetch_url(self):
         """RSS source should call fetch_url (which applies rate limiting)."""
-        from clawler.sources.rss import RSSSource
+        from clawler.sources.rss import MAX_ENTRIES_PER_FEED, RSSSource
 
         src = RSSSource(feeds=[{"url": "https://example.com/feed.xml", "source": "Test", "category": "tech"}])
         with patch.object(src, "fetch_url", return_value="<rss><channel></channel></rss>") as mock_fetch:
             src.crawl()
-            mock_fetch.assert_called_once_with("https://example.com/feed.xml")
+            mock_fetch.assert_called_once_with("https://example.com/feed.xml", max_items=MAX_ENTRIES_PER_FEED)
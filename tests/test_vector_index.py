@@ -0,0 +1,114 @@
+"""Tests for the NumPy title-similarity backend."""
+import random
+import string
+
+import pytest
+
+from clawler import title_index
+from clawler.dedup import Deduplicator, deduplicate
+from clawler.models import Article
+from clawler.stories import cluster_stories
+from clawler.title_index import TitleIndex, configure_dedup_backend, get_dedup_backend, title_index_for
+
+np = pytest.importorskip("numpy")
+
+from clawler.vector_index import VectorTitleIndex, title_vectors  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _difflib_after():
+    yield
+    configure_dedup_backend()
+
+
+def _titles(n, seed=5):
+    rng = random.Random(seed)
+    words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9))) for _ in range(400)]
+    out = []
+    for _ in range(n):
+        if out and rng.random() < 0.3:
+            title = rng.choice(out).split()
+            title[rng.randrange(len(title))] = rng.choice(words)
+            out.append(" ".join(title) + rng.choice(["", " - reuters", " (update)"]))
+        else:
+            out.append(" ".join(rng.choice(words) for _ in range(rng.randint(6, 11))))
+    return out
+
+
+def _run(index, titles):
+    index.prepare(titles)
+    found = []
+    for t in titles:
+        slot = index.find(t)
+        found.append(slot)
+        if slot is None:
+            index.add(t)
+    return found
+
+
+def test_vectors_are_unit_rows():
+    vectors = title_vectors(["rocket launch delayed", "rocket launch delayed", "", "x"])
+    assert vectors.shape[0] == 4
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+    assert float(vectors[0] @ vectors[1]) == pytest.approx(1.0)
+
+
+def test_same_answers_as_difflib():
+    titles = _titles(400)
+    vector = VectorTitleIndex(0.75)
+    assert _run(vector, titles) == _run(TitleIndex(0.75, lsh_min_titles=10_000), titles)
+    assert vector.comparisons < 400
+
+
+def test_batches_and_single_lookups_agree():
+    titles = _titles(200, seed=8)
+    batched = _run(VectorTitleIndex(0.75), titles)
+    index = VectorTitleIndex(0.75)
+    index.prepare(titles[:50])
+    found = []
+    for t in titles:  # the rest are indexed one at a time
+        slot = index.find(t)
+        found.append(slot)
+        if slot is None:
+            index.add(t)
+    assert found == batched
+
+
+def test_replace_and_admit():
+    index = VectorTitleIndex(0.75)
+    index.add("senate passes the budget bill after long debate")
+    index.add("senate passes the budget bill after a long debate today")
+    assert index.find("senate passes the budget bill after long debates") == 0
+    assert index.find("senate passes the budget bill after long debates", admit=lambda slot: slot != 0) == 1
+    index.replace(0, "chip maker reports record quarterly revenue")
+    assert index.find("senate passes the budget bill after long debates") == 1
+    assert index.find("chip maker reports record quarterly revenue - reuters") == 0
+
+
+def _article(title, i):
+    return Article(title=title, url=f"https://example.com/{i}", source=f"S{i % 3}")
+
+
+def test_dedup_and_stories_match_across_backends():
+    articles = [_article(t, i) for i, t in enumerate(_titles(300, seed=11))]
+    assert ([a.url for a in deduplicate(articles, backend="vector")]
+            == [a.url for a in deduplicate(articles, backend="difflib")])
+    dd = Deduplicator(backend="vector")
+    dd.prepare(articles)
+    assert [a.url for a in articles if dd.add(a)] == [a.url for a in deduplicate(articles)]
+    vector = cluster_stories(articles, backend="vector")
+    plain = cluster_stories(articles, backend="difflib")
+    assert [[a.url for a in s.articles] for s in vector] == [[a.url for a in s.articles] for s in plain]
+
+
+def test_configure_backend(monkeypatch):
+    assert configure_dedup_backend("vector") is True
+    assert get_dedup_backend() == "vector"
+    assert isinstance(title_index_for(0.75), VectorTitleIndex)
+    assert isinstance(title_index_for(0.75, "difflib"), TitleIndex)
+    with pytest.raises(ValueError):
+        configure_dedup_backend("cosine")
+    monkeypatch.setattr(title_index, "_numpy", lambda: None)
+    assert configure_dedup_backend("vector") is False
+    assert get_dedup_backend() == "difflib"
+    assert isinstance(title_index_for(0.75, "vector"), TitleIndex)